@@ -1,17 +1,22 @@
 from __future__ import annotations
 
+import time
 from typing import Any
 
-from flask import Flask, jsonify, render_template
+from flask import Flask, Response, g, jsonify, render_template, request, send_file
 from flask_cors import CORS
 
 from models.sources import normalize_article_source
+from services.api_metrics import METRICS_PATH, install_api_metrics, metrics_enabled, observe_request, render_metrics
 from services.article_service import get_cached_article_service
+from services.card_fragments import render_cards
+from services.static_site import resolve_static_file, static_site_dir, static_site_serving_enabled
 from template_utils import safe_date
 
 app = Flask(__name__)
 CORS(app)
 app.jinja_env.filters["safe_date"] = safe_date
+install_api_metrics()
 
 
 @app.context_processor
@@ -30,26 +35,68 @@ def _normalize_source_for_response(raw_source: str) -> str:
         return raw_source
 
 
-def get_latest_articles(limit: int = 10) -> list[dict[str, Any]]:
+def get_latest_articles(limit: int = 10, *, include_text: bool = True) -> list[dict[str, Any]]:
     """Fetch latest articles sorted by date_added DESC."""
     serialized: list[dict[str, Any]] = []
     service = get_cached_article_service()
-    for article in service.get_latest_articles(limit=limit):
+    for article in service.get_latest_articles(limit=limit, include_text=include_text):
         payload = article.model_dump(mode="json")
         payload["source"] = _normalize_source_for_response(str(payload["source"]))
         serialized.append(payload)
     return serialized
 
 
+@app.before_request
+def start_request_timer() -> None:
+    # Registered before serve_static_site so exported pages are timed too.
+    g.request_started = time.perf_counter()
+
+
+@app.after_request
+def record_request_metrics(response: Response) -> Response:
+    started = g.pop("request_started", None)
+    if started is not None and request.path != METRICS_PATH:
+        observe_request(
+            "flask",
+            request.method,
+            request.url_rule.rule if request.url_rule is not None else None,
+            response.status_code,
+            time.perf_counter() - started,
+            response.content_length,
+        )
+    return response
+
+
+@app.before_request
+def serve_static_site() -> Any:
+    """With STATIC_SITE_SERVE=1, answer exported pages and JSON straight from disk."""
+    if request.method not in ("GET", "HEAD") or not static_site_serving_enabled():
+        return None
+    static_file = resolve_static_file(static_site_dir(), request.path, request.headers.get("Accept-Encoding", ""))
+    if static_file is None:
+        return None
+    response = send_file(static_file.path, mimetype=static_file.media_type)
+    response.headers.update(static_file.headers)
+    return response
+
+
 @app.get("/health")
 def health() -> Any:
     return jsonify({"status": "healthy"})
 
 
+@app.get(METRICS_PATH)
+def metrics() -> Any:
+    if not metrics_enabled():
+        return jsonify({"error": "metrics are disabled or prometheus_client is not installed"}), 404
+    body, content_type = render_metrics()
+    return Response(body, content_type=content_type)
+
+
 @app.get("/")
 def home() -> str:
-    articles = get_latest_articles(limit=20)
-    return render_template("index.html", articles=articles)
+    articles = get_latest_articles(limit=20, include_text=False)
+    return render_template("index.html", articles=articles, cards=render_cards(articles))
 
 
 @app.get("/api/articles")
@@ -0,0 +1,263 @@
+#!/usr/bin/env python3
+"""Offline end-to-end ingestion benchmark: both summarizers against fake sites and a fake Gemini.
+
+Serves FP and FA listings with N articles from local stub servers, each article page a
+copy of the recorded fixture with its own paragraph text. Replaces genai.Client with
+benchmarks.fake_genai.FakeGenAIClient and runs summarize_fp.main(),
+summarize_fa_hardened.main() and the staged pipeline (ingest.main(), both sources) into a
+fresh SQLite database. Reports wall time, LLM calls and tokens, bytes fetched, DB
+round-trips and the time spent in each stage.
+"""
+from __future__ import annotations
+
+import argparse
+import contextlib
+import hashlib
+import io
+import json
+import os
+import random
+import re
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Callable
+from unittest import mock
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from google import genai
+
+import ingest
+import summarize_fa_hardened
+import summarize_fp
+from benchmarks.fake_genai import FakeGenAIClient
+from benchmarks.stub_server import FixtureServer, load_fixture, serve_https_urls_over_http
+from services.article_repository import ArticleRepository
+from services import instrumentation
+from services.instrumentation import registry
+
+DEFAULT_ARTICLES = 10
+DEFAULT_LLM_LATENCY_S = 0.5
+DEFAULT_TOKENS_PER_SECOND = 200.0
+FP_LISTING_PATH = "/category/latest/"
+FA_LISTING_PATH = "/most-recent"
+# flow -> (entry module, sources it ingests); source -> (module, listing URL attribute, path)
+FLOWS = {
+    "fp": (summarize_fp, ("fp",)),
+    "fa": (summarize_fa_hardened, ("fa",)),
+    "pipeline": (ingest, ("fp", "fa")),
+}
+SITES = {
+    "fp": (summarize_fp, "FP_LISTING_URL", FP_LISTING_PATH),
+    "fa": (summarize_fa_hardened, "START_URL", FA_LISTING_PATH),
+}
+STAGE_GROUPS = ("fetch", "parse", "llm", "db")
+
+_PARAGRAPH_RE = re.compile(r"<p>([^<]*)</p>")
+_CARD_RES = {
+    "fp": re.compile(r'<div class="blog-list-layout">.*?\n</div>\n', re.DOTALL),
+    "fa": re.compile(r'<div class="card card--large">.*?\n</div>\n', re.DOTALL),
+}
+_HREF_RE = re.compile(r'href="(/[^"?]+?)/?(?:\?[^"]*)?"')
+
+
+def render_listing(fixture: bytes, source: str, count: int) -> bytes:
+    """Repeat the fixture's first card ``count`` times with distinct article paths."""
+    html = fixture.decode("utf-8")
+    cards = list(_CARD_RES[source].finditer(html))
+    template = cards[0].group(0)
+    original_path = _HREF_RE.search(template).group(1)
+    rendered = "".join(template.replace(original_path, f"{original_path}-bench-{index}") for index in range(count))
+    return (html[: cards[0].start()] + rendered + html[cards[-1].end() :]).encode("utf-8")
+
+
+def article_renderer(fixture: bytes) -> Callable[[str], bytes]:
+    """Fixture markup with every body paragraph reworded from a seed derived from the path.
+
+    Distinct text keeps near-duplicate detection from discarding all but the first article.
+    """
+    html = fixture.decode("utf-8")
+    vocabulary = sorted({word.lower() for match in _PARAGRAPH_RE.finditer(html) for word in match.group(1).split()})
+
+    def render(path: str) -> bytes:
+        rng = random.Random(hashlib.blake2b(path.encode("utf-8"), digest_size=8).digest())
+
+        def reword(match: re.Match[str]) -> str:
+            words = rng.choices(vocabulary, k=len(match.group(1).split()))
+            return f"<p>{' '.join(words).capitalize()}</p>"
+
+        return _PARAGRAPH_RE.sub(reword, html).encode("utf-8")
+
+    return render
+
+
+def _stage_totals(snapshot: dict[str, Any]) -> dict[str, dict[str, float]]:
+    totals = {group: {"count": 0, "total_s": 0.0} for group in STAGE_GROUPS}
+    for stage, stats in snapshot["stages"].items():
+        group = stage.split(".", 1)[0]
+        if group in totals:
+            totals[group]["count"] += stats["count"]
+            totals[group]["total_s"] = round(totals[group]["total_s"] + stats["total_s"], 6)
+    return totals
+
+
+def run_flow(
+    flow: str,
+    count: int,
+    *,
+    db_path: Path,
+    latency_s: float = 0.0,
+    tokens_per_second: float = 0.0,
+    verbose: bool = False,
+) -> dict[str, Any]:
+    """Run one flow's main() for ``count`` articles per source and return its measurements."""
+    if flow not in FLOWS:
+        raise ValueError(f"unknown flow {flow!r}; expected one of {tuple(FLOWS)}")
+    entry, sources = FLOWS[flow]
+    sites = {
+        source: FixtureServer(
+            # FP over-fetches candidates (3x), so the listing always has enough of them.
+            {SITES[source][2]: render_listing(load_fixture(f"{source}_listing.html"), source, count * 3)},
+            default=article_renderer(load_fixture(f"{source}_article.html")),
+        )
+        for source in sources
+    }
+    clients: list[FakeGenAIClient] = []
+
+    def client_factory(*args: Any, **kwargs: Any) -> FakeGenAIClient:
+        client = FakeGenAIClient(latency_s=latency_s, tokens_per_second=tokens_per_second)
+        clients.append(client)
+        return client
+
+    environment = {
+        "ARTICLES_DB_PATH": str(db_path),
+        "GEMINI_API_KEY": "fake-key",
+        # The fake has no quota; throttling it would only measure the limiter.
+        "GEMINI_REQUESTS_PER_MINUTE": "0",
+        "GEMINI_TOKENS_PER_MINUTE": "0",
+    }
+    output = contextlib.nullcontext() if verbose else contextlib.redirect_stdout(io.StringIO())
+    with contextlib.ExitStack() as stack:
+        for site in sites.values():
+            stack.enter_context(site)
+        stack.enter_context(serve_https_urls_over_http(*sites.values()))
+        for source, site in sites.items():
+            module, listing_attr, listing_path = SITES[source]
+            stack.enter_context(mock.patch.object(module, listing_attr, site.url(listing_path)))
+        stack.enter_context(mock.patch.dict(os.environ, environment))
+        os.environ.pop("DATABASE_URL", None)  # restored with the rest of the environment
+        stack.enter_context(mock.patch.object(genai, "Client", client_factory))
+        # summarize_fa_hardened binds its database path as init_db's default at import time.
+        stack.enter_context(mock.patch.object(summarize_fa_hardened.init_db, "__defaults__", (str(db_path),)))
+        stack.enter_context(mock.patch.object(sys, "argv", [f"{entry.__name__}.py", str(count)]))
+        stack.enter_context(output)
+        # report_run()'s JSON run summary repeats what this benchmark reports.
+        stack.enter_context(mock.patch.object(instrumentation.logger, "disabled", not verbose))
+
+        started = time.perf_counter()
+        exit_code = 0
+        try:
+            entry.main()
+        except SystemExit as exc:
+            exit_code = exc.code if isinstance(exc.code, int) else 1
+        wall_s = time.perf_counter() - started
+        snapshot = registry.snapshot()
+
+    repo = ArticleRepository(sqlite_path=str(db_path))
+    try:
+        stored = len(repo.get_latest_articles(limit=count * len(sources) * 2, include_text=False))
+    finally:
+        repo.close()
+    stages = _stage_totals(snapshot)
+    return {
+        "flow": flow,
+        "articles": count,
+        "exit_code": exit_code,
+        "stored": stored,
+        "wall_s": round(wall_s, 3),
+        "llm_calls": sum(client.calls for client in clients),
+        "prompt_tokens": sum(client.prompt_tokens for client in clients),
+        "output_tokens": sum(client.output_tokens for client in clients),
+        "http_requests": sum(sum(site.requests.values()) for site in sites.values()),
+        "bytes_fetched": sum(site.bytes_served for site in sites.values()),
+        "db_round_trips": stages["db"]["count"],
+        "stages": stages,
+    }
+
+
+def run_benchmarks(
+    count: int,
+    *,
+    flows: tuple[str, ...] = tuple(FLOWS),
+    latency_s: float = 0.0,
+    tokens_per_second: float = 0.0,
+    verbose: bool = False,
+) -> list[dict[str, Any]]:
+    results = []
+    for flow in flows:
+        with tempfile.TemporaryDirectory(prefix="fpfa-bench-ingestion-") as workdir:
+            results.append(
+                run_flow(
+                    flow,
+                    count,
+                    db_path=Path(workdir) / "articles.db",
+                    latency_s=latency_s,
+                    tokens_per_second=tokens_per_second,
+                    verbose=verbose,
+                )
+            )
+    return results
+
+
+def format_results(results: list[dict[str, Any]]) -> str:
+    lines = [
+        f"{'flow':<9} {'stored':>6} {'wall s':>8} {'llm calls':>9} {'tokens in/out':>15} {'KiB fetched':>11} "
+        f"{'db trips':>8}  " + "  ".join(f"{group + ' s':>8}" for group in STAGE_GROUPS)
+    ]
+    for result in results:
+        tokens = f"{result['prompt_tokens']}/{result['output_tokens']}"
+        lines.append(
+            f"{result['flow']:<9} {result['stored']:>6} {result['wall_s']:>8.2f} {result['llm_calls']:>9} "
+            f"{tokens:>15} {result['bytes_fetched'] / 1024:>11.0f} {result['db_round_trips']:>8}  "
+            + "  ".join(f"{result['stages'][group]['total_s']:>8.2f}" for group in STAGE_GROUPS)
+        )
+    return "\n".join(lines)
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--articles", type=int, default=DEFAULT_ARTICLES, help="Articles per source.")
+    parser.add_argument("--flows", nargs="+", choices=list(FLOWS), default=list(FLOWS))
+    parser.add_argument(
+        "--llm-latency", type=float, default=DEFAULT_LLM_LATENCY_S, help="Fixed seconds per Gemini call."
+    )
+    parser.add_argument(
+        "--tokens-per-second",
+        type=float,
+        default=DEFAULT_TOKENS_PER_SECOND,
+        help="Simulated output throughput; 0 makes output instantaneous.",
+    )
+    parser.add_argument("--verbose", action="store_true", help="Show the summarizers' own output.")
+    parser.add_argument("--json", action="store_true", help="Print results as JSON instead of a table.")
+    return parser.parse_args()
+
+
+def main() -> int:
+    args = parse_args()
+    results = run_benchmarks(
+        args.articles,
+        flows=tuple(args.flows),
+        latency_s=args.llm_latency,
+        tokens_per_second=args.tokens_per_second,
+        verbose=args.verbose,
+    )
+    print(json.dumps(results, indent=2) if args.json else format_results(results))
+    return 1 if any(result["exit_code"] for result in results) else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""Offline scraping/parsing benchmark against recorded FP and FA pages.
+
+Times the listing scrapers, article extractors and publication-date lookup on the
+fixtures in benchmarks/fixtures/, reports time and peak traced memory per page, and
+compares best-of-N time and memory against benchmarks/baseline_parsing.json.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import statistics
+import sys
+import time
+import tracemalloc
+from datetime import date
+from pathlib import Path
+from typing import Any, Callable
+from unittest import mock
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from bs4 import BeautifulSoup
+
+import summarize_fa_hardened
+import summarize_fp
+from benchmarks.stub_server import FixtureServer, load_fixture
+from services.publication_dates import extract_publication_date_from_soup
+
+BASELINE_PATH = Path(__file__).resolve().parent / "baseline_parsing.json"
+DEFAULT_ITERATIONS = 20
+DEFAULT_TOLERANCE = 0.3
+# Differences below this are scheduler noise, whatever the ratio.
+NOISE_FLOOR_S = 0.001
+FP_LISTING_PATH = "/category/latest/"
+FA_LISTING_PATH = "/most-recent"
+# Fixed "today" so the recorded publication dates never look like future dates.
+REFERENCE_NOW = "2026-10-15"
+
+
+def _cases(fa_site: FixtureServer) -> dict[str, Callable[[], Any]]:
+    fp_article = load_fixture("fp_article.html").decode("utf-8")
+    fa_article = load_fixture("fa_article.html").decode("utf-8")
+    fp_soup = BeautifulSoup(fp_article, "html.parser")
+    fa_soup = BeautifulSoup(fa_article, "html.parser")
+    now = date.fromisoformat(REFERENCE_NOW)
+    return {
+        "fp.listing": lambda: summarize_fp.scrape_foreignpolicy_article_list(num_links=20),
+        "fp.article_body": lambda: summarize_fp._extract_fp_article_body(BeautifulSoup(fp_article, "html.parser")),
+        "fa.listing": lambda: summarize_fa_hardened.extract_latest_article_urls(num_links=20),
+        "fa.article": lambda: summarize_fa_hardened.extract_foreign_affairs_article(fa_site.url("/world/article")),
+        "publication_date.fp": lambda: extract_publication_date_from_soup(fp_soup, now=now),
+        "publication_date.fa": lambda: extract_publication_date_from_soup(fa_soup, now=now),
+    }
+
+
+def _measure(case: Callable[[], Any], iterations: int) -> dict[str, Any]:
+    case()  # warm-up: imports, regex compilation, connection setup
+    durations = []
+    for _ in range(iterations):
+        started = time.perf_counter()
+        result = case()
+        durations.append(time.perf_counter() - started)
+    if not result:
+        raise RuntimeError("benchmark case returned nothing; fixtures and parser are out of sync")
+
+    tracemalloc.start()
+    try:
+        case()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return {
+        "median_s": round(statistics.median(durations), 6),
+        "min_s": round(min(durations), 6),
+        "max_s": round(max(durations), 6),
+        "peak_kib": round(peak / 1024, 1),
+    }
+
+
+def run_benchmarks(iterations: int = DEFAULT_ITERATIONS) -> dict[str, dict[str, Any]]:
+    fp_site = FixtureServer({FP_LISTING_PATH: load_fixture("fp_listing.html")}, default=load_fixture("fp_article.html"))
+    fa_site = FixtureServer({FA_LISTING_PATH: load_fixture("fa_listing.html")}, default=load_fixture("fa_article.html"))
+    with fp_site, fa_site, mock.patch.multiple(
+        summarize_fp, FP_LISTING_URL=fp_site.url(FP_LISTING_PATH)
+    ), mock.patch.multiple(summarize_fa_hardened, START_URL=fa_site.url(FA_LISTING_PATH)):
+        return {name: _measure(case, iterations) for name, case in _cases(fa_site).items()}
+
+
+def compare_to_baseline(
+    results: dict[str, dict[str, Any]],
+    baseline: dict[str, dict[str, Any]],
+    *,
+    tolerance: float = DEFAULT_TOLERANCE,
+) -> list[str]:
+    """Return one message per case whose best time or peak memory grew past tolerance.
+
+    Best-of-N is compared rather than the median because it is the least disturbed by
+    other load on the machine.
+    """
+    regressions = []
+    for name, result in results.items():
+        reference = baseline.get(name)
+        if not reference:
+            continue
+        if result["min_s"] - reference["min_s"] < NOISE_FLOOR_S:
+            result = {**result, "min_s": reference["min_s"]}
+        for metric in ("min_s", "peak_kib"):
+            if result[metric] > reference[metric] * (1 + tolerance):
+                regressions.append(
+                    f"{name}: {metric} {result[metric]} vs baseline {reference[metric]} (+{tolerance:.0%} allowed)"
+                )
+    return regressions
+
+
+def format_results(results: dict[str, dict[str, Any]], baseline: dict[str, dict[str, Any]]) -> str:
+    lines = [f"{'case':<22} {'median ms':>10} {'min ms':>8} {'max ms':>8} {'peak KiB':>9} {'vs base':>8}"]
+    for name, result in results.items():
+        reference = baseline.get(name, {}).get("min_s")
+        ratio = f"{result['min_s'] / reference:.2f}x" if reference else "-"
+        lines.append(
+            f"{name:<22} {result['median_s'] * 1000:>10.2f} {result['min_s'] * 1000:>8.2f} "
+            f"{result['max_s'] * 1000:>8.2f} {result['peak_kib']:>9.1f} {ratio:>8}"
+        )
+    return "\n".join(lines)
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--iterations", type=int, default=DEFAULT_ITERATIONS)
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE, help="Allowed growth, e.g. 0.3 = +30%%.")
+    parser.add_argument("--baseline", type=Path, default=BASELINE_PATH)
+    parser.add_argument("--update-baseline", action="store_true", help="Write this run as the new baseline.")
+    parser.add_argument("--json", action="store_true", help="Print results as JSON instead of a table.")
+    return parser.parse_args()
+
+
+def main() -> int:
+    args = parse_args()
+    # Timer bookkeeping would be measured along with the parsers.
+    with mock.patch.dict("os.environ", {"INSTRUMENTATION": "0"}):
+        results = run_benchmarks(args.iterations)
+    baseline = json.loads(args.baseline.read_text()) if args.baseline.is_file() else {}
+
+    print(json.dumps(results, indent=2) if args.json else format_results(results, baseline))
+    if args.update_baseline:
+        args.baseline.write_text(json.dumps(results, indent=2, sort_keys=True) + "\n")
+        print(f"Wrote baseline to {args.baseline}.")
+        return 0
+
+    regressions = compare_to_baseline(results, baseline, tolerance=args.tolerance)
+    for message in regressions:
+        print(f"[REGRESSION] {message}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,179 @@
+"""Deterministic stand-in for ``google.genai.Client`` with simulated latency and throughput.
+
+Also stubs the Batch API (``client.batches.create`` / ``get``) with inline requests.
+"""
+from __future__ import annotations
+
+import hashlib
+import random
+import threading
+import itertools
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable
+
+# Rough Gemini tokenizer ratio for English prose.
+CHARS_PER_TOKEN = 4
+# Output lengths the real prompts tend to produce, keyed by a phrase in each task line.
+OUTPUT_TOKENS = {
+    "quotes": 160,
+    "paragraphs": 320,
+    "sentences": 60,
+}
+DEFAULT_OUTPUT_TOKENS = 120
+_WORDS = (
+    "alliance deterrence sanctions diplomacy tariff ceasefire election coalition treaty nuclear "
+    "minister parliament insurgency export strategy region security economy summit negotiation"
+).split()
+
+
+@dataclass
+class FakeUsage:
+    prompt_token_count: int
+    candidates_token_count: int
+
+    @property
+    def total_token_count(self) -> int:
+        return self.prompt_token_count + self.candidates_token_count
+
+
+@dataclass
+class FakeResponse:
+    text: str
+    usage_metadata: FakeUsage
+
+
+def _output_tokens(prompt: str) -> int:
+    task = prompt.lower().split("title:", 1)[0]
+    for phrase, tokens in OUTPUT_TOKENS.items():
+        if phrase in task:
+            return tokens
+    return DEFAULT_OUTPUT_TOKENS
+
+
+def _response_text(prompt: str, tokens: int) -> str:
+    rng = random.Random(hashlib.blake2b(prompt.encode("utf-8"), digest_size=8).digest())
+    words = rng.choices(_WORDS, k=max(1, tokens * CHARS_PER_TOKEN // 7))
+    if "quotes" in prompt.lower().split("title:", 1)[0]:
+        return "\n".join(f"* {' '.join(words[start : start + 12])}" for start in range(0, len(words), 12))
+    return " ".join(words).capitalize() + "."
+
+
+@dataclass
+class FakeInlinedResponse:
+    response: FakeResponse | None = None
+    metadata: dict[str, str] | None = None
+    error: str | None = None
+
+
+@dataclass
+class FakeBatchDestination:
+    inlined_responses: list[FakeInlinedResponse] = field(default_factory=list)
+
+
+@dataclass
+class FakeBatchJob:
+    name: str
+    state: str
+    model: str
+    src: list[dict[str, Any]]
+    dest: FakeBatchDestination | None = None
+    error: str | None = None
+    polls: int = 0
+
+
+def _request_prompt(request: dict[str, Any]) -> str:
+    contents = request["contents"]
+    if isinstance(contents, str):
+        return contents
+    return "".join(part.get("text", "") for content in contents for part in content.get("parts", []))
+
+
+class _FakeBatches:
+    """Jobs finish after ``client.batch_polls`` calls to ``get``; answers match generate_content."""
+
+    def __init__(self, client: "FakeGenAIClient"):
+        self._client = client
+        self._ids = itertools.count(1)
+        self.jobs: dict[str, FakeBatchJob] = {}
+
+    def create(self, *, model: str, src: list[dict[str, Any]], config: Any = None) -> FakeBatchJob:
+        job = FakeBatchJob(name=f"batches/fake-{next(self._ids)}", state="JOB_STATE_PENDING", model=model, src=src)
+        self.jobs[job.name] = job
+        return job
+
+    def get(self, *, name: str, config: Any = None) -> FakeBatchJob:
+        job = self.jobs[name]
+        job.polls += 1
+        if job.state not in ("JOB_STATE_PENDING", "JOB_STATE_RUNNING"):
+            return job
+        if job.polls >= self._client.batch_polls:
+            responses = []
+            for request in job.src:
+                prompt = _request_prompt(request)
+                error = self._client.batch_error(prompt) if self._client.batch_error else None
+                if error:
+                    responses.append(FakeInlinedResponse(metadata=request.get("metadata"), error=error))
+                else:
+                    responses.append(
+                        FakeInlinedResponse(
+                            response=self._client._respond(prompt), metadata=request.get("metadata")
+                        )
+                    )
+            job.dest = FakeBatchDestination(responses)
+            job.state = "JOB_STATE_SUCCEEDED"
+        else:
+            job.state = "JOB_STATE_RUNNING"
+        return job
+
+
+class _FakeModels:
+    def __init__(self, client: "FakeGenAIClient"):
+        self._client = client
+
+    def generate_content(self, *, model: str, contents: Any, config: Any = None) -> FakeResponse:
+        return self._client._generate(model, str(contents))
+
+
+class FakeGenAIClient:
+    """Answers ``client.models.generate_content`` after ``latency_s`` plus output time.
+
+    Output time is output tokens / ``tokens_per_second``. Responses depend only on the
+    prompt, so reruns store identical summaries. Call and token counts are thread-safe.
+    """
+
+    def __init__(
+        self,
+        *,
+        latency_s: float = 0.0,
+        tokens_per_second: float = 0.0,
+        batch_polls: int = 2,
+        batch_error: Callable[[str], str | None] | None = None,
+        **_: Any,
+    ):
+        self.latency_s = latency_s
+        self.tokens_per_second = tokens_per_second
+        self.batch_polls = batch_polls
+        self.batch_error = batch_error
+        self.models = _FakeModels(self)
+        self.batches = _FakeBatches(self)
+        self.calls = 0
+        self.prompt_tokens = 0
+        self.output_tokens = 0
+        self._lock = threading.Lock()
+
+    def _respond(self, prompt: str) -> FakeResponse:
+        prompt_tokens = max(1, len(prompt) // CHARS_PER_TOKEN)
+        output_tokens = _output_tokens(prompt)
+        with self._lock:
+            self.calls += 1
+            self.prompt_tokens += prompt_tokens
+            self.output_tokens += output_tokens
+        return FakeResponse(_response_text(prompt, output_tokens), FakeUsage(prompt_tokens, output_tokens))
+
+    def _generate(self, model: str, prompt: str) -> FakeResponse:
+        output_tokens = _output_tokens(prompt)
+        delay = self.latency_s + (output_tokens / self.tokens_per_second if self.tokens_per_second else 0.0)
+        if delay:
+            time.sleep(delay)
+        return self._respond(prompt)
@@ -0,0 +1,312 @@
+#!/usr/bin/env python3
+"""Load-test the Flask (gunicorn) and FastAPI (uvicorn) servers against a large database.
+
+Seeds a synthetic SQLite database through ArticleRepository (reused across runs of the
+same size), starts each server locally for each backend configuration, drives `/` and
+`/api/articles` with a concurrent HTTP client, and reports throughput, latency
+percentiles and resident memory per worker.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import hashlib
+import json
+import math
+import os
+import signal
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Iterator
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+import httpx
+
+from benchmarks.synthetic_articles import generate_articles
+from services.article_repository import ArticleRepository
+from services.feed_snapshot import write_feed_snapshot
+from services.near_duplicates import MINHASH_PERMUTATIONS
+
+DEFAULT_ARTICLES = 10_000
+DEFAULT_REQUESTS = 2_000
+DEFAULT_CONCURRENCY = 32
+DEFAULT_WORKERS = 2
+DEFAULT_PATHS = ("/api/articles", "/")
+DATA_DIR = Path(__file__).resolve().parent / ".loadtest"
+STARTUP_TIMEOUT_S = 60.0
+SERVERS = ("flask", "fastapi")
+
+# Environment overrides per backend configuration; "{snapshot}" is the exported feed file.
+BACKEND_CONFIGS: dict[str, dict[str, str]] = {
+    "sqlite": {},
+    "sqlite-read-only": {"API_READ_ONLY": "1"},
+    "sqlite-no-pragmas": {"SQLITE_PERFORMANCE_PROFILE": "0"},
+    "feed-snapshot": {"FEED_SNAPSHOT_SERVE": "1", "FEED_SNAPSHOT_PATH": "{snapshot}"},
+}
+
+
+def _placeholder_signature(text: str | None) -> tuple[int, ...]:
+    digest = hashlib.blake2b((text or "").encode("utf-8"), digest_size=64).digest()
+    return tuple(digest[index % len(digest)] << 24 | index for index in range(MINHASH_PERMUTATIONS))
+
+
+def seed_database(db_path: Path, count: int, *, seed: int = 0, chunk_size: int = 10_000) -> int:
+    """Create ``db_path`` with ``count`` synthetic articles; returns rows inserted.
+
+    Real MinHash costs ~150 ms per body and the API never reads signatures, so seeding
+    stores a same-width placeholder instead.
+    """
+    repo = ArticleRepository(sqlite_path=str(db_path))
+    try:
+        inserted = 0
+        started = time.perf_counter()
+        articles = (
+            {**article, "minhash_signature": _placeholder_signature(article["article_text"])}
+            for article in generate_articles(count, seed=seed)
+        )
+        for chunk_start in range(0, count, chunk_size):
+            chunk = (next(articles) for _ in range(min(chunk_size, count - chunk_start)))
+            inserted += repo.insert_articles(chunk)
+            print(f"  seeded {inserted}/{count} articles ({time.perf_counter() - started:.0f}s)", flush=True)
+        write_feed_snapshot(repo, db_path.with_suffix(".feed.json"))
+    finally:
+        repo.close()
+    return inserted
+
+
+def percentile(samples: list[float], fraction: float) -> float:
+    """Nearest-rank percentile; 0.0 for no samples."""
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    rank = max(1, math.ceil(fraction * len(ordered)))
+    return ordered[rank - 1]
+
+
+def summarize_latencies(latencies: list[float], errors: int, elapsed_s: float) -> dict[str, Any]:
+    return {
+        "requests": len(latencies) + errors,
+        "errors": errors,
+        "rps": round(len(latencies) / elapsed_s, 1) if elapsed_s else 0.0,
+        "p50_ms": round(percentile(latencies, 0.50) * 1000, 2),
+        "p90_ms": round(percentile(latencies, 0.90) * 1000, 2),
+        "p99_ms": round(percentile(latencies, 0.99) * 1000, 2),
+        "max_ms": round(max(latencies, default=0.0) * 1000, 2),
+    }
+
+
+async def drive(base_url: str, path: str, *, requests: int, concurrency: int) -> dict[str, Any]:
+    """Issue ``requests`` GETs for ``path`` from ``concurrency`` clients sharing one pool."""
+    latencies: list[float] = []
+    errors = 0
+    remaining = requests
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+
+    async def client_loop(client: httpx.AsyncClient) -> None:
+        nonlocal remaining, errors
+        while remaining > 0:
+            remaining -= 1
+            started = time.perf_counter()
+            try:
+                response = await client.get(path)
+                await response.aread()
+            except httpx.HTTPError:
+                errors += 1
+                continue
+            if response.status_code != 200:
+                errors += 1
+                continue
+            latencies.append(time.perf_counter() - started)
+
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=30.0) as client:
+        await client.get(path)  # warm caches and connections before timing
+        started = time.perf_counter()
+        await asyncio.gather(*(client_loop(client) for _ in range(concurrency)))
+        elapsed = time.perf_counter() - started
+    return summarize_latencies(latencies, errors, elapsed)
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def server_command(server: str, port: int, workers: int) -> list[str]:
+    if server == "flask":
+        return [sys.executable, "-m", "gunicorn", "app:app", "--bind", f"127.0.0.1:{port}", "--workers", str(workers)]
+    if server == "fastapi":
+        return [
+            sys.executable, "-m", "uvicorn", "main:app",
+            "--host", "127.0.0.1", "--port", str(port), "--workers", str(workers), "--log-level", "warning",
+        ]  # fmt: skip
+    raise ValueError(f"unknown server {server!r}; expected one of {SERVERS}")
+
+
+def server_environment(db_path: Path, config: str, metrics_dir: str) -> dict[str, str]:
+    env = {key: value for key, value in os.environ.items() if key != "DATABASE_URL"}
+    env.update(
+        ARTICLES_DB_PATH=str(db_path),
+        PROMETHEUS_MULTIPROC_DIR=metrics_dir,
+        PYTHONPATH=str(ROOT),
+    )
+    snapshot = str(db_path.with_suffix(".feed.json"))
+    env.update({key: value.format(snapshot=snapshot) for key, value in BACKEND_CONFIGS[config].items()})
+    return env
+
+
+def _wait_until_healthy(base_url: str, process: subprocess.Popen) -> None:
+    deadline = time.monotonic() + STARTUP_TIMEOUT_S
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError(f"server exited with status {process.returncode} during startup")
+        try:
+            if httpx.get(base_url + "/health", timeout=1.0).status_code == 200:
+                return
+        except httpx.HTTPError:
+            pass
+        time.sleep(0.2)
+    raise RuntimeError(f"server at {base_url} did not become healthy within {STARTUP_TIMEOUT_S:.0f}s")
+
+
+@contextmanager
+def running_server(server: str, db_path: Path, config: str, *, workers: int) -> Iterator[tuple[str, int]]:
+    """Start ``server`` in its own process group; yields (base URL, master pid)."""
+    port = _free_port()
+    with tempfile.TemporaryDirectory(prefix="fpfa-loadtest-metrics-") as metrics_dir:
+        process = subprocess.Popen(
+            server_command(server, port, workers),
+            cwd=ROOT,
+            env=server_environment(db_path, config, metrics_dir),
+            start_new_session=True,
+        )
+        base_url = f"http://127.0.0.1:{port}"
+        try:
+            _wait_until_healthy(base_url, process)
+            yield base_url, process.pid
+        finally:
+            os.killpg(process.pid, signal.SIGTERM)
+            try:
+                process.wait(timeout=15)
+            except subprocess.TimeoutExpired:
+                os.killpg(process.pid, signal.SIGKILL)
+                process.wait()
+
+
+def _proc_status_kib(pid: int, field: str) -> int | None:
+    try:
+        for line in Path(f"/proc/{pid}/status").read_text().splitlines():
+            if line.startswith(field + ":"):
+                return int(line.split()[1])
+    except (OSError, ValueError):
+        return None
+    return None
+
+
+def worker_memory(master_pid: int) -> list[dict[str, Any]]:
+    """Current and peak RSS of the master's child processes (Linux /proc only)."""
+    workers = []
+    for stat_path in Path("/proc").glob("[0-9]*/stat"):
+        try:
+            # The command name may contain spaces; fields after ")" are fixed-position.
+            fields = stat_path.read_text().rsplit(")", 1)[1].split()
+        except OSError:
+            continue
+        if int(fields[1]) != master_pid:
+            continue
+        pid = int(stat_path.parent.name)
+        rss = _proc_status_kib(pid, "VmRSS")
+        peak = _proc_status_kib(pid, "VmHWM")
+        if rss is not None:
+            workers.append({"pid": pid, "rss_mib": round(rss / 1024, 1), "peak_mib": round((peak or rss) / 1024, 1)})
+    return sorted(workers, key=lambda worker: worker["pid"])
+
+
+def run_load_test(
+    db_path: Path,
+    *,
+    servers: list[str],
+    configs: list[str],
+    paths: list[str],
+    workers: int,
+    requests: int,
+    concurrency: int,
+) -> list[dict[str, Any]]:
+    results = []
+    for config in configs:
+        for server in servers:
+            with running_server(server, db_path, config, workers=workers) as (base_url, master_pid):
+                runs = [
+                    {"server": server, "config": config, "path": path}
+                    | asyncio.run(drive(base_url, path, requests=requests, concurrency=concurrency))
+                    for path in paths
+                ]
+                memory = worker_memory(master_pid)
+            results.extend(run | {"workers": memory} for run in runs)
+    return results
+
+
+def format_results(results: list[dict[str, Any]]) -> str:
+    lines = [
+        f"{'server':<8} {'config':<18} {'path':<14} {'req/s':>8} {'p50 ms':>8} {'p90 ms':>8} "
+        f"{'p99 ms':>8} {'errors':>6}  worker RSS MiB (peak)"
+    ]
+    for result in results:
+        memory = ", ".join(f"{worker['rss_mib']:.0f} ({worker['peak_mib']:.0f})" for worker in result.get("workers", []))
+        lines.append(
+            f"{result['server']:<8} {result['config']:<18} {result['path']:<14} {result['rps']:>8.1f} "
+            f"{result['p50_ms']:>8.2f} {result['p90_ms']:>8.2f} {result['p99_ms']:>8.2f} {result['errors']:>6}  "
+            f"{memory or '-'}"
+        )
+    return "\n".join(lines)
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--articles", type=int, default=DEFAULT_ARTICLES, help="Synthetic articles to seed.")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--db-path", type=Path, help="Database to use. Defaults to benchmarks/.loadtest/.")
+    parser.add_argument("--reseed", action="store_true", help="Rebuild the database even if it exists.")
+    parser.add_argument("--servers", nargs="+", choices=SERVERS, default=list(SERVERS))
+    parser.add_argument("--configs", nargs="+", choices=sorted(BACKEND_CONFIGS), default=["sqlite"])
+    parser.add_argument("--paths", nargs="+", default=list(DEFAULT_PATHS))
+    parser.add_argument("--workers", type=int, default=DEFAULT_WORKERS)
+    parser.add_argument("--requests", type=int, default=DEFAULT_REQUESTS, help="Requests per path.")
+    parser.add_argument("--concurrency", type=int, default=DEFAULT_CONCURRENCY)
+    parser.add_argument("--json", action="store_true", help="Print results as JSON instead of a table.")
+    return parser.parse_args()
+
+
+def main() -> int:
+    args = parse_args()
+    db_path = args.db_path or DATA_DIR / f"articles-{args.articles}-seed{args.seed}.db"
+    if args.reseed or not db_path.exists():
+        db_path.parent.mkdir(parents=True, exist_ok=True)
+        for stale in db_path.parent.glob(db_path.name + "*"):
+            stale.unlink()
+        print(f"Seeding {args.articles} articles into {db_path}...", flush=True)
+        seed_database(db_path, args.articles, seed=args.seed)
+
+    results = run_load_test(
+        db_path,
+        servers=args.servers,
+        configs=args.configs,
+        paths=args.paths,
+        workers=args.workers,
+        requests=args.requests,
+        concurrency=args.concurrency,
+    )
+    print(json.dumps(results, indent=2) if args.json else format_results(results))
+    return 1 if any(result["errors"] for result in results) else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,102 @@
+"""Local HTTP server that plays back recorded site fixtures for offline benchmarks."""
+from __future__ import annotations
+
+import threading
+from collections import Counter
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Callable, Iterator, Union
+from unittest import mock
+
+import requests
+
+FIXTURES_DIR = Path(__file__).resolve().parent / "fixtures"
+
+# Fixed bytes, or a function of the request path returning bytes (None for a 404).
+Page = Union[bytes, Callable[[str], Union[bytes, None]]]
+
+
+def load_fixture(name: str) -> bytes:
+    return (FIXTURES_DIR / name).read_bytes()
+
+
+class FixtureServer:
+    """Serve ``routes`` (path -> page) and ``default`` for any other path.
+
+    A page is fixture bytes or a callable that renders bytes for the path. Counts
+    requests and bytes so benchmarks can report network volume.
+    """
+
+    def __init__(self, routes: dict[str, Page], default: Page | None = None):
+        self.routes = routes
+        self.default = default
+        self.requests: Counter[str] = Counter()
+        self.bytes_served = 0
+        self._lock = threading.Lock()
+        self._server: ThreadingHTTPServer | None = None
+        self._thread: threading.Thread | None = None
+
+    def _handler(self) -> type[BaseHTTPRequestHandler]:
+        fixture_server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self) -> None:  # noqa: N802
+                path = self.path.split("?", 1)[0]
+                body = fixture_server.routes.get(path, fixture_server.default)
+                if callable(body):
+                    body = body(path)
+                if body is None:
+                    self.send_error(404)
+                    return
+                with fixture_server._lock:
+                    fixture_server.requests[path] += 1
+                    fixture_server.bytes_served += len(body)
+                self.send_response(200)
+                self.send_header("Content-Type", "text/html; charset=utf-8")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format: str, *args) -> None:  # noqa: A002
+                return None
+
+        return Handler
+
+    @property
+    def base_url(self) -> str:
+        assert self._server is not None, "server is not running"
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def url(self, path: str) -> str:
+        return self.base_url + path
+
+    def __enter__(self) -> "FixtureServer":
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._handler())
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+        self._server = None
+
+
+@contextmanager
+def serve_https_urls_over_http(*servers: FixtureServer) -> Iterator[None]:
+    """canonicalize_url() upgrades links to https; send those back to the plain-HTTP stubs."""
+    secure_prefixes = {server.base_url.replace("http://", "https://", 1): server.base_url for server in servers}
+    original_request = requests.Session.request
+
+    def request(session, method, url, *args, **kwargs):
+        for secure_prefix, plain_prefix in secure_prefixes.items():
+            if isinstance(url, str) and url.startswith(secure_prefix):
+                url = plain_prefix + url[len(secure_prefix) :]
+                break
+        return original_request(session, method, url, *args, **kwargs)
+
+    with mock.patch.object(requests.Session, "request", request):
+        yield
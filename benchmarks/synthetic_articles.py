@@ -0,0 +1,61 @@
+"""Deterministic synthetic articles sized like real FP/FA pieces, for load tests."""
+from __future__ import annotations
+
+import random
+from datetime import datetime, timedelta
+from typing import Any, Iterator
+
+# Stored FA essays run 4-8k words and FP pieces 1-2k, so bodies average ~30 KiB.
+BODY_WORDS = (1_200, 8_000)
+ABSTRACT_WORDS = (180, 320)
+THESIS_WORDS = (30, 60)
+QUOTES_PER_ARTICLE = (3, 6)
+QUOTE_WORDS = (15, 40)
+START_DATE = datetime(2020, 1, 1)
+
+_VOCABULARY = (
+    "alliance ambassador anarchy arms balance bargaining border ceasefire coalition coercion "
+    "conflict cooperation corridor crisis currency defense deterrence diplomacy doctrine economy "
+    "election embargo empire energy escalation federation finance frontier government hegemony "
+    "humanitarian industry influence insurgency institution intelligence investment leverage "
+    "market migration military minister missile negotiation network nuclear order parliament "
+    "partnership pipeline policy power president province rebellion reform regime region "
+    "republic reserves resilience sanctions security sovereignty strategy summit supply tariff "
+    "territory trade treaty troops uncertainty union velocity volatility war withdrawal"
+).split()
+_SOURCES = (
+    ("Foreign Policy", "https://foreignpolicy.com/synthetic/{index}/"),
+    ("Foreign Affairs", "https://www.foreignaffairs.com/world/synthetic-{index}"),
+)
+
+
+def _words(rng: random.Random, bounds: tuple[int, int]) -> str:
+    return " ".join(rng.choices(_VOCABULARY, k=rng.randint(*bounds)))
+
+
+def _body(rng: random.Random) -> str:
+    words = rng.choices(_VOCABULARY, k=rng.randint(*BODY_WORDS))
+    paragraphs = [" ".join(words[start : start + 120]) for start in range(0, len(words), 120)]
+    return "\n\n".join(paragraphs)
+
+
+def generate_articles(count: int, *, seed: int = 0, start: datetime = START_DATE) -> Iterator[dict[str, Any]]:
+    """Yield ``count`` insert_article() keyword dicts, one article per minute from ``start``."""
+    rng = random.Random(seed)
+    for index in range(count):
+        source, url_template = _SOURCES[index % len(_SOURCES)]
+        quotes = [_words(rng, QUOTE_WORDS) for _ in range(rng.randint(*QUOTES_PER_ARTICLE))]
+        published = start + timedelta(minutes=index)
+        yield {
+            "source": source,
+            "url": url_template.format(index=index),
+            "title": _words(rng, (5, 12)).title(),
+            "author": f"{rng.choice(_VOCABULARY).title()} {rng.choice(_VOCABULARY).title()}",
+            "article_text": _body(rng),
+            "core_thesis": _words(rng, THESIS_WORDS),
+            "detailed_abstract": _words(rng, ABSTRACT_WORDS),
+            "supporting_data_quotes": "".join(f"*{quote}" for quote in quotes),
+            "supporting_quotes": quotes,
+            "publication_date": published.date().isoformat(),
+            "date_added": published,
+        }
@@ -21,13 +21,23 @@ class ArticleModel extends Article {
       date: json['date_added'] as String,
       coreThesis: json['core_thesis'] as String,
       detailedAbstract: json['detailed_abstract'] as String,
-      quotes: (json['supporting_data_quotes'] as String)
-          .split('*')
-          .where((q) => q.trim().isNotEmpty)
-          .toList(),
+      quotes: _quotesFromJson(json),
     );
   }
 
+  // The API sends the quotes as a list; the '*'-delimited string is only for old servers.
+  static List<String> _quotesFromJson(Map<String, dynamic> json) {
+    final structured = json['supporting_quotes'];
+    if (structured is List) {
+      return structured.map((q) => q as String).toList();
+    }
+    return ((json['supporting_data_quotes'] as String?) ?? '')
+        .split('*')
+        .map((q) => q.trim())
+        .where((q) => q.isNotEmpty)
+        .toList();
+  }
+
   Map<String, dynamic> toJson() {
     return {
       'source': source,
@@ -38,6 +48,7 @@ class ArticleModel extends Article {
       'core_thesis': coreThesis,
       'detailed_abstract': detailedAbstract,
       'supporting_data_quotes': quotes.join('*'),
+      'supporting_quotes': quotes,
     };
   }
 }
@@ -0,0 +1,28 @@
+"""Gunicorn settings picked up automatically from the working directory.
+
+Workers share Prometheus samples through PROMETHEUS_MULTIPROC_DIR, so /metrics reports
+the whole server no matter which worker answers the scrape.
+"""
+from __future__ import annotations
+
+import os
+import shutil
+from pathlib import Path
+
+# Must be in the environment before any worker imports prometheus_client.
+os.environ.setdefault("PROMETHEUS_MULTIPROC_DIR", "/tmp/fpfa-prometheus")
+
+
+def on_starting(server) -> None:
+    # Samples from a previous server run would otherwise be added to the new totals.
+    metrics_dir = Path(os.environ["PROMETHEUS_MULTIPROC_DIR"])
+    shutil.rmtree(metrics_dir, ignore_errors=True)
+    metrics_dir.mkdir(parents=True, exist_ok=True)
+
+
+def child_exit(server, worker) -> None:
+    try:
+        from prometheus_client import multiprocess
+    except Exception:
+        return
+    multiprocess.mark_process_dead(worker.pid)
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Usage:
+    python ingest.py [ARTICLES_PER_SOURCE] [--sources fp fa]
+
+Description:
+    - Ingests Foreign Policy and Foreign Affairs concurrently in one process.
+    - Runs discovery, fetching, summarization and storage as pipeline stages
+      (services/ingestion_pipeline.py) so page loads overlap Gemini calls.
+    - Checkpoints each URL in the ingestion_jobs table (services/ingestion_jobs.py), so a
+      run that dies part-way is resumed by the next one. INGEST_JOBS=0 turns this off.
+    - Strips boilerplate before prompting and map-reduces long articles
+      (services/summary_budget.py); stores each article's Gemini token usage.
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+
+import summarize_fa_hardened
+import summarize_fp
+from services.article_repository import ArticleRepository, resolve_articles_db_path
+from services.feed_exports import run_post_ingestion_exports
+from services.ingestion_jobs import IngestionJobStore, ingestion_jobs_enabled
+from services.ingestion_pipeline import IngestionPipeline
+from services.instrumentation import report_run
+from services.llm_client import create_llm_client
+from services.near_duplicates import load_near_duplicate_index, near_duplicate_detection_enabled
+from services.summary_budget import SummaryBudget
+
+ADAPTERS = {
+    "fp": summarize_fp.fp_adapter,
+    "fa": summarize_fa_hardened.fa_adapter,
+}
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Ingest FP and FA articles through the staged pipeline.")
+    parser.add_argument("articles", nargs="?", type=int, default=7, help="New articles to store per source.")
+    parser.add_argument("--sources", nargs="+", choices=sorted(ADAPTERS), default=list(ADAPTERS))
+    args = parser.parse_args()
+    if args.articles <= 0:
+        parser.error("ARTICLES_PER_SOURCE must be positive.")
+    return args
+
+
+def main():
+    with report_run("ingest"):
+        _run()
+
+
+def _run():
+    args = parse_args()
+    api_key = os.environ.get("GEMINI_API_KEY")
+    if not api_key:
+        print("[ERROR] GEMINI_API_KEY env var not set.")
+        sys.exit(1)
+
+    repo = ArticleRepository(database_url=os.getenv("DATABASE_URL"), sqlite_path=resolve_articles_db_path())
+    try:
+        pipeline = IngestionPipeline(
+            [ADAPTERS[name]() for name in args.sources],
+            repo,
+            create_llm_client(api_key),
+            near_duplicate_index=(
+                load_near_duplicate_index(repo) if near_duplicate_detection_enabled() else None
+            ),
+            jobs=IngestionJobStore.for_repository(repo) if ingestion_jobs_enabled() else None,
+            budget=SummaryBudget(),
+        )
+        results = pipeline.run(args.articles)
+        for name, counts in results.items():
+            print(f"[INFO] {name}: " + ", ".join(f"{outcome}={count}" for outcome, count in sorted(counts.items())))
+
+        if any(counts.get("stored") for counts in results.values()):
+            for name, result in run_post_ingestion_exports(repo).items():
+                print(f"[INFO] Refreshed feed {name}: {result}")
+    finally:
+        repo.close()
+
+    if not any(counts.get("discovered") or counts.get("resumed") for counts in results.values()):
+        print("[ERROR] No article URLs found for any source. Aborting.")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
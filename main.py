@@ -1,15 +1,19 @@
 from __future__ import annotations
 
+import time
 from typing import List
 
 from fastapi import Depends, FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import HTMLResponse, JSONResponse
+from fastapi.responses import FileResponse, HTMLResponse, JSONResponse, Response
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
 
 from models.article import Article
-from services.article_service import ArticleService, get_cached_article_service
+from services.api_metrics import METRICS_PATH, install_api_metrics, metrics_enabled, observe_request, render_metrics
+from services.article_service import AsyncArticleService, get_cached_async_article_service
+from services.card_fragments import render_cards
+from services.static_site import resolve_static_file, static_site_dir, static_site_serving_enabled
 from template_utils import safe_date
 
 app = FastAPI(
@@ -29,6 +33,7 @@ def static_url(path: str) -> str:
 
 templates.env.globals["static_url"] = static_url
 templates.env.filters["safe_date"] = safe_date
+install_api_metrics()
 
 app.add_middleware(
     CORSMiddleware,
@@ -42,8 +47,41 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-def get_article_service() -> ArticleService:
-    return get_cached_article_service()
+@app.middleware("http")
+async def serve_static_site(request: Request, call_next):
+    """With STATIC_SITE_SERVE=1, answer exported pages and JSON straight from disk."""
+    if request.method in ("GET", "HEAD") and static_site_serving_enabled():
+        static_file = resolve_static_file(
+            static_site_dir(),
+            request.url.path,
+            request.headers.get("accept-encoding", ""),
+        )
+        if static_file is not None:
+            return FileResponse(static_file.path, media_type=static_file.media_type, headers=static_file.headers)
+    return await call_next(request)
+
+
+# Declared after serve_static_site, so it wraps it and times exported pages as well.
+@app.middleware("http")
+async def record_request_metrics(request: Request, call_next):
+    started = time.perf_counter()
+    response = await call_next(request)
+    if request.url.path != METRICS_PATH:
+        route = request.scope.get("route")
+        content_length = response.headers.get("content-length")
+        observe_request(
+            "fastapi",
+            request.method,
+            getattr(route, "path", None),
+            response.status_code,
+            time.perf_counter() - started,
+            int(content_length) if content_length is not None else None,
+        )
+    return response
+
+
+def get_article_service() -> AsyncArticleService:
+    return get_cached_async_article_service()
 
 
 @app.get("/health")
@@ -51,15 +89,30 @@ async def health_check() -> JSONResponse:
     return JSONResponse(content={"status": "healthy"}, status_code=200)
 
 
+@app.get(METRICS_PATH, include_in_schema=False)
+async def metrics() -> Response:
+    if not metrics_enabled():
+        return JSONResponse(
+            content={"error": "metrics are disabled or prometheus_client is not installed"},
+            status_code=404,
+        )
+    body, content_type = render_metrics()
+    return Response(content=body, media_type=content_type)
+
+
 @app.get("/api/articles", response_model=List[Article])
-async def get_articles(service: ArticleService = Depends(get_article_service)) -> list[Article]:
-    return service.get_latest_articles(limit=20)
+async def get_articles(service: AsyncArticleService = Depends(get_article_service)) -> list[Article]:
+    return await service.get_latest_articles(limit=20)
 
 
 @app.get("/", response_class=HTMLResponse)
-async def home(request: Request, service: ArticleService = Depends(get_article_service)) -> HTMLResponse:
-    articles = service.get_latest_articles(limit=20)
-    return templates.TemplateResponse(request, "index.html", {"articles": articles})
+async def home(request: Request, service: AsyncArticleService = Depends(get_article_service)) -> HTMLResponse:
+    articles = await service.get_latest_articles(limit=20, include_text=False)
+    return templates.TemplateResponse(
+        request,
+        "index.html",
+        {"articles": articles, "cards": render_cards(articles)},
+    )
 
 
 if __name__ == "__main__":
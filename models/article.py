@@ -1,7 +1,10 @@
-from pydantic import BaseModel, HttpUrl, ConfigDict, field_validator
+from functools import cached_property
 from typing import Optional
 
+from pydantic import BaseModel, HttpUrl, ConfigDict, Field, field_validator, model_validator
+
 from models.sources import normalize_article_source
+from template_utils import safe_date, split_quotes
 
 
 class Article(BaseModel):
@@ -12,10 +15,11 @@ class Article(BaseModel):
     url: HttpUrl
     title: str
     author: str
-    article_text: str
+    article_text: str = ""  # Omitted by list views that skip article bodies
     core_thesis: str
     detailed_abstract: str
     supporting_data_quotes: str
+    supporting_quotes: list[str] = Field(default_factory=list)
     publication_date: Optional[str] = None
     date_added: Optional[str] = None  # SQLite usually stores this as string
 
@@ -23,3 +27,15 @@ class Article(BaseModel):
     @classmethod
     def validate_source(cls, value: str) -> str:
         return normalize_article_source(value)
+
+    @model_validator(mode="after")
+    def fill_supporting_quotes(self) -> "Article":
+        # Rows and snapshots written before the structured column only carry the string.
+        if not self.supporting_quotes:
+            self.supporting_quotes = split_quotes(self.supporting_data_quotes)
+        return self
+
+    # Display-only value for the card templates; cached per instance, never serialized.
+    @cached_property
+    def display_date(self) -> str:
+        return safe_date(self.publication_date or self.date_added)
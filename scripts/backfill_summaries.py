@@ -0,0 +1,202 @@
+#!/usr/bin/env python3
+"""Re-summarize stored articles whose summaries failed or were written with old prompts.
+
+Candidates come from the indexed summary_status / prompt_version columns, page by page.
+They are re-summarized from the stored article_text (nothing is re-fetched), several
+articles at a time, and written back in batches with update_article_summaries().
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from itertools import islice
+from pathlib import Path
+from typing import Any, Callable, Iterator
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from scripts.batch_resummarize import batch_summarizer, source_adapters
+from services.article_repository import (
+    DEFAULT_RESUMMARIZE_PAGE_SIZE,
+    DEFAULT_SUMMARY_UPDATE_BATCH_SIZE,
+    ArticleRepository,
+    resolve_articles_db_path,
+)
+from services.ingestion_pipeline import SourceAdapter
+from services.instrumentation import increment, report_run
+from services.llm_client import create_llm_client, track_usage
+from services.summary_budget import SummaryBudget
+from services.text_codec import SUMMARY_FIELDS
+
+DEFAULT_WORKERS = 4
+
+
+@dataclass
+class BackfillRun:
+    candidates: int = 0
+    updated: int = 0
+    failed: list[str] = field(default_factory=list)
+
+
+def iter_candidates(
+    repo: Any,
+    *,
+    failed: bool = True,
+    prompt_versions: tuple[str | None, ...] = (),
+    page_size: int = DEFAULT_RESUMMARIZE_PAGE_SIZE,
+) -> Iterator[dict[str, Any]]:
+    """Articles to redo, in id order; the id cursor keeps rewritten rows from coming back."""
+    after_id = 0
+    while True:
+        page = repo.list_articles_to_resummarize(
+            failed=failed, prompt_versions=prompt_versions, after_id=after_id, limit=page_size
+        )
+        yield from page
+        if len(page) < page_size:
+            return
+        after_id = page[-1]["id"]
+
+
+def resummarize(client: Any, adapter: SourceAdapter, article: dict[str, Any], budget: Any = None) -> dict[str, Any]:
+    """New summaries for a stored article, as an update_article_summaries() entry."""
+    prompt_article = {"title": article["title"], "author": article["author"], "text": article["article_text"]}
+    with track_usage() as usage:
+        if budget is not None:
+            prompt_article = budget.prepare(client, prompt_article)
+        summary = {
+            name: summarizer(client, prompt_article) for name, summarizer in zip(SUMMARY_FIELDS, adapter.summarizers)
+        }
+    return {
+        "url": article["url"],
+        **summary,
+        "prompt_tokens": usage.prompt_tokens if usage.calls else None,
+        "output_tokens": usage.output_tokens if usage.calls else None,
+        "prompt_version": adapter.prompt_version,
+    }
+
+
+def backfill(
+    repo: Any,
+    client: Any,
+    articles: Iterator[dict[str, Any]],
+    *,
+    adapters: dict[str, SourceAdapter],
+    budget: Any = None,
+    workers: int = DEFAULT_WORKERS,
+    batch_size: int = DEFAULT_SUMMARY_UPDATE_BATCH_SIZE,
+    log: Callable[[str], None] = print,
+) -> BackfillRun:
+    """Re-summarize ``articles`` on ``workers`` threads, writing every ``batch_size`` results."""
+    run = BackfillRun()
+
+    def redo(article: dict[str, Any]) -> dict[str, Any] | None:
+        adapter = adapters.get(article.get("source"))
+        if adapter is None:
+            log(f"[SKIP] No summarizers for source {article.get('source')!r}: {article['url']}")
+            return None
+        try:
+            return resummarize(client, adapter, article, budget)
+        except Exception as exc:  # noqa: BLE001
+            log(f"[WARN] Re-summarization failed for {article['url']}: {exc}")
+            return None
+
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
+        while chunk := list(islice(articles, batch_size)):
+            run.candidates += len(chunk)
+            results = list(executor.map(redo, chunk))
+            updates = [result for result in results if result is not None]
+            run.updated += repo.update_article_summaries(updates, batch_size=batch_size)
+            run.failed += [article["url"] for article, result in zip(chunk, results) if result is None]
+            increment("backfill.resummarized", len(updates))
+            log(f"[INFO] Re-summarized {run.updated} of {run.candidates} article(s) so far.")
+    return run
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--failed",
+        action=argparse.BooleanOptionalAction,
+        default=True,
+        help="Redo rows whose summaries are the failure placeholder (default: on).",
+    )
+    parser.add_argument(
+        "--prompt-version",
+        action="append",
+        default=[],
+        help="Also redo rows written with this prompt version (repeatable).",
+    )
+    parser.add_argument("--untagged", action="store_true", help="Also redo rows with no recorded prompt version.")
+    parser.add_argument("--limit", type=int, help="Stop after this many articles.")
+    parser.add_argument("--workers", type=int, default=DEFAULT_WORKERS, help="Articles summarized at once.")
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_SUMMARY_UPDATE_BATCH_SIZE)
+    parser.add_argument("--batch", action="store_true", help="Use a Gemini Batch API job instead of live calls.")
+    parser.add_argument("--dry-run", action="store_true", help="List the matching articles and exit.")
+    parser.add_argument("--db-path", default=resolve_articles_db_path())
+    parser.add_argument(
+        "--database-url",
+        default=os.getenv("DATABASE_URL"),
+        help="Target database URL. If omitted, uses DATABASE_URL or the local SQLite path.",
+    )
+    args = parser.parse_args()
+    args.prompt_versions = tuple(args.prompt_version) + ((None,) if args.untagged else ())
+    if not args.failed and not args.prompt_versions:
+        parser.error("nothing to select: give --prompt-version or --untagged with --no-failed")
+    return args
+
+
+def main() -> int:
+    args = parse_args()
+    api_key = os.environ.get("GEMINI_API_KEY")
+    if not api_key and not args.dry_run:
+        print("[ERROR] GEMINI_API_KEY env var not set.")
+        return 1
+
+    repo = ArticleRepository(database_url=args.database_url, sqlite_path=args.db_path)
+    try:
+        tagged = repo.backfill_summary_status()
+        if tagged:
+            print(f"[INFO] Set summary_status on {tagged} older row(s).")
+        articles = iter_candidates(repo, failed=args.failed, prompt_versions=args.prompt_versions)
+        if args.limit is not None:
+            articles = islice(articles, args.limit)
+
+        if args.dry_run:
+            count = 0
+            for article in articles:
+                print(f"{article['id']}\t{article.get('prompt_version') or '-'}\t{article['url']}")
+                count += 1
+            print(f"{count} article(s) would be re-summarized.")
+            return 0
+
+        client = create_llm_client(api_key)
+        with report_run("backfill_summaries"):
+            if args.batch:
+                batch_run = batch_summarizer(client).run(list(articles), repo)
+                run = BackfillRun(candidates=batch_run.requested, updated=batch_run.updated, failed=batch_run.failed)
+            else:
+                run = backfill(
+                    repo,
+                    client,
+                    articles,
+                    adapters=source_adapters(),
+                    budget=SummaryBudget(),
+                    workers=args.workers,
+                    batch_size=args.batch_size,
+                )
+    finally:
+        repo.close()
+
+    print(f"Re-summarized {run.updated} of {run.candidates} article(s).")
+    for url in run.failed:
+        print(f"[WARN] Not updated: {url}")
+    return 1 if run.failed else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
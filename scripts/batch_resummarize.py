@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""Re-summarize stored articles through a Gemini Batch API job instead of one call per summary."""
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+from pathlib import Path
+from typing import Any
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+import summarize_fa_hardened
+import summarize_fp
+from services.article_repository import ArticleRepository, resolve_articles_db_path
+from services.batch_summaries import DEFAULT_TIMEOUT_S, BatchSummarizer, resolve_poll_interval_s
+from services.ingestion_pipeline import SourceAdapter
+from services.llm_client import create_llm_client
+
+ADAPTERS = (summarize_fp.fp_adapter, summarize_fa_hardened.fa_adapter)
+
+
+def source_adapters() -> dict[str, SourceAdapter]:
+    """Each source's pipeline adapter, keyed by the stored ``source`` value."""
+    return {adapter.source: adapter for adapter in (factory() for factory in ADAPTERS)}
+
+
+def batch_summarizer(client: Any, **kwargs: Any) -> BatchSummarizer:
+    """A BatchSummarizer that prompts each article with its own source's prompts."""
+    adapters = source_adapters()
+    return BatchSummarizer(
+        client,
+        lambda article: adapters[article["source"]].prompts if article.get("source") in adapters else None,
+        prompt_version_for=lambda article: adapters[article["source"]].prompt_version,
+        **kwargs,
+    )
+
+
+def load_articles(repo: Any, urls: list[str]) -> list[dict[str, Any]]:
+    articles = []
+    for url in urls:
+        article = repo.get_article_by_url(url)
+        if article is None:
+            print(f"[WARN] Not in the database, skipping: {url}")
+            continue
+        articles.append(dict(article))
+    return articles
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("urls", nargs="*", help="Article URLs to re-summarize.")
+    parser.add_argument("--urls-file", type=Path, help="File with one article URL per line.")
+    parser.add_argument("--poll-interval", type=float, default=resolve_poll_interval_s())
+    parser.add_argument("--timeout", type=float, default=DEFAULT_TIMEOUT_S, help="Seconds to wait per job.")
+    parser.add_argument("--db-path", default=resolve_articles_db_path())
+    parser.add_argument(
+        "--database-url",
+        default=os.getenv("DATABASE_URL"),
+        help="Target database URL. If omitted, uses DATABASE_URL or the local SQLite path.",
+    )
+    args = parser.parse_args()
+    if args.urls_file:
+        args.urls += [line.strip() for line in args.urls_file.read_text().splitlines() if line.strip()]
+    if not args.urls:
+        parser.error("give article URLs or --urls-file")
+    return args
+
+
+def main() -> int:
+    args = parse_args()
+    api_key = os.environ.get("GEMINI_API_KEY")
+    if not api_key:
+        print("[ERROR] GEMINI_API_KEY env var not set.")
+        return 1
+
+    repo = ArticleRepository(database_url=args.database_url, sqlite_path=args.db_path)
+    try:
+        summarizer = batch_summarizer(
+            create_llm_client(api_key), poll_interval_s=args.poll_interval, timeout_s=args.timeout
+        )
+        run = summarizer.run(load_articles(repo, args.urls), repo)
+    finally:
+        repo.close()
+
+    print(f"Re-summarized {run.updated} of {run.requested} article(s) in {len(run.jobs)} batch job(s).")
+    for url in run.failed:
+        print(f"[WARN] Not updated: {url}")
+    return 1 if run.failed else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
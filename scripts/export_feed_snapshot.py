@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""Write the latest-articles feed snapshot served when FEED_SNAPSHOT_SERVE=1."""
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from services.article_repository import ArticleRepository, resolve_articles_db_path
+from services.feed_snapshot import feed_snapshot_path, resolve_feed_snapshot_size, write_feed_snapshot
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--output",
+        default=feed_snapshot_path(),
+        help="Snapshot file to write. Defaults to FEED_SNAPSHOT_PATH.",
+    )
+    parser.add_argument("--limit", type=int, default=resolve_feed_snapshot_size())
+    parser.add_argument("--db-path", default=resolve_articles_db_path())
+    parser.add_argument(
+        "--database-url",
+        default=os.getenv("DATABASE_URL"),
+        help="Source database URL. If omitted, uses DATABASE_URL or the local SQLite path.",
+    )
+    return parser.parse_args()
+
+
+def main() -> int:
+    args = parse_args()
+    if not args.output:
+        print("No snapshot path: pass --output or set FEED_SNAPSHOT_PATH.")
+        return 2
+
+    repo = ArticleRepository(database_url=args.database_url, sqlite_path=args.db_path)
+    try:
+        header = write_feed_snapshot(repo, args.output, limit=args.limit)
+    finally:
+        repo.close()
+
+    print(f"Wrote {header['count']} article(s) to {args.output} (content {header['content_hash'][:12]}).")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+"""Render the card deck and /api/articles JSON into a precompressed static directory."""
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from services.article_repository import ArticleRepository, resolve_articles_db_path
+from services.feed_exports import export_static_site_from_repository
+from services.static_site import resolve_static_site_size, static_site_dir
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--output-dir",
+        default=static_site_dir(),
+        help="Directory to write. Defaults to STATIC_SITE_DIR.",
+    )
+    parser.add_argument("--limit", type=int, default=resolve_static_site_size())
+    parser.add_argument("--db-path", default=resolve_articles_db_path())
+    parser.add_argument(
+        "--database-url",
+        default=os.getenv("DATABASE_URL"),
+        help="Source database URL. If omitted, uses DATABASE_URL or the local SQLite path.",
+    )
+    return parser.parse_args()
+
+
+def main() -> int:
+    args = parse_args()
+    if not args.output_dir:
+        print("No output directory: pass --output-dir or set STATIC_SITE_DIR.")
+        return 2
+
+    repo = ArticleRepository(database_url=args.database_url, sqlite_path=args.db_path)
+    try:
+        summary = export_static_site_from_repository(repo, args.output_dir, limit=args.limit)
+    finally:
+        repo.close()
+
+    print(
+        f"Exported {summary['articles']} article(s) as {summary['pages']} page(s), "
+        f"{summary['files']} file(s) in {summary['path']}."
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -15,23 +15,31 @@ if str(ROOT) not in sys.path:
 
 from services.article_repository import ArticleRepository, resolve_articles_db_path
 from services.publication_dates import coerce_publication_date
+from services.text_codec import CODEC_NONE, decode_text, parse_codec_marker
 
 
 SELECT_BASE = """
 SELECT
-    source,
-    url,
-    title,
-    author,
-    article_text,
-    core_thesis,
-    detailed_abstract,
-    supporting_data_quotes,
+    articles.source,
+    articles.url,
+    articles.title,
+    articles.author,
+    articles.article_text,
+    articles.core_thesis,
+    articles.detailed_abstract,
+    articles.supporting_data_quotes,
     {publication_date_expr},
-    {date_added_expr}
+    {date_added_expr},
+    {text_codec_expr},
+    {optional_exprs},
+    {body_exprs}
 FROM articles
+{body_join}
 """
 
+# Columns added after the first schema; older source databases read them as NULL.
+OPTIONAL_COLUMNS = ("prompt_version", "prompt_tokens", "output_tokens", "minhash_signature")
+
 
 def read_sqlite_rows(source_path: str) -> list[dict[str, Any]]:
     conn = sqlite3.connect(source_path)
@@ -40,20 +48,50 @@ def read_sqlite_rows(source_path: str) -> list[dict[str, Any]]:
 
     cursor.execute("PRAGMA table_info(articles)")
     columns = {row[1] for row in cursor.fetchall()}
-    publication_date_expr = "publication_date" if "publication_date" in columns else "NULL AS publication_date"
-    date_added_expr = "date_added" if "date_added" in columns else "CURRENT_TIMESTAMP AS date_added"
+    publication_date_expr = (
+        "articles.publication_date" if "publication_date" in columns else "NULL AS publication_date"
+    )
+    date_added_expr = "articles.date_added" if "date_added" in columns else "CURRENT_TIMESTAMP AS date_added"
+    text_codec_expr = "articles.text_codec" if "text_codec" in columns else "NULL AS text_codec"
+    optional_exprs = ", ".join(
+        f"articles.{column}" if column in columns else f"NULL AS {column}" for column in OPTIONAL_COLUMNS
+    )
+
+    cursor.execute("SELECT name FROM sqlite_master WHERE type = 'table' AND name = 'article_bodies'")
+    if cursor.fetchone():
+        body_exprs = "article_bodies.article_text AS body_text, article_bodies.text_codec AS body_codec"
+        body_join = "LEFT JOIN article_bodies ON article_bodies.article_id = articles.id"
+    else:
+        body_exprs = "NULL AS body_text, NULL AS body_codec"
+        body_join = ""
 
     cursor.execute(
         SELECT_BASE.format(
             publication_date_expr=publication_date_expr,
             date_added_expr=date_added_expr,
+            text_codec_expr=text_codec_expr,
+            optional_exprs=optional_exprs,
+            body_exprs=body_exprs,
+            body_join=body_join,
         )
     )
-    rows = [dict(row) for row in cursor.fetchall()]
+    rows = [_decode_stored_text(dict(row)) for row in cursor.fetchall()]
     conn.close()
     return rows
 
 
+def _decode_stored_text(row: dict[str, Any]) -> dict[str, Any]:
+    """Undo per-row compression and the article_bodies split of newer source databases."""
+    codec, fields = parse_codec_marker(row.pop("text_codec", None))
+    for field in fields:
+        row[field] = decode_text(row.get(field), codec)
+    body_text = row.pop("body_text", None)
+    body_codec = row.pop("body_codec", None)
+    if body_text is not None:
+        row["article_text"] = decode_text(body_text, body_codec or CODEC_NONE)
+    return row
+
+
 def _coerce_date_added(raw_value: Any) -> datetime | None:
     if raw_value in (None, ""):
         return None
@@ -86,6 +124,10 @@ def _normalize_row(row: dict[str, Any]) -> dict[str, Any]:
             url=str(row.get("url") or ""),
         ),
         "date_added": _coerce_date_added(row.get("date_added")),
+        "prompt_version": row.get("prompt_version") or None,
+        "prompt_tokens": row.get("prompt_tokens"),
+        "output_tokens": row.get("output_tokens"),
+        "minhash_signature": row.get("minhash_signature") or None,
     }
 
 
@@ -108,6 +150,10 @@ def migrate_rows(rows: list[dict[str, Any]], repo: ArticleRepository, batch_size
             supporting_data_quotes=payload["supporting_data_quotes"],
             publication_date=payload["publication_date"],
             date_added=payload["date_added"],
+            prompt_version=payload["prompt_version"],
+            prompt_tokens=payload["prompt_tokens"],
+            output_tokens=payload["output_tokens"],
+            minhash_signature=payload["minhash_signature"],
         )
         if was_inserted:
             inserted += 1
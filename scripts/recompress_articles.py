@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""Re-encode stored article text (and optionally summaries) with a storage codec."""
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from services.article_repository import (
+    DEFAULT_RECOMPRESS_BATCH_SIZE,
+    ArticleRepository,
+    resolve_articles_db_path,
+)
+from services.text_codec import SUPPORTED_CODECS
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--codec", choices=SUPPORTED_CODECS, required=True)
+    parser.add_argument(
+        "--include-summaries",
+        action="store_true",
+        help="Also compress core_thesis, detailed_abstract and supporting_data_quotes.",
+    )
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_RECOMPRESS_BATCH_SIZE)
+    parser.add_argument("--db-path", default=resolve_articles_db_path())
+    parser.add_argument(
+        "--database-url",
+        default=os.getenv("DATABASE_URL"),
+        help="Target database URL. If omitted, uses DATABASE_URL or the local SQLite path.",
+    )
+    return parser.parse_args()
+
+
+def main() -> int:
+    args = parse_args()
+    repo = ArticleRepository(database_url=args.database_url, sqlite_path=args.db_path)
+    try:
+        rewritten = repo.recompress_articles(
+            args.codec,
+            compress_summaries=args.include_summaries,
+            batch_size=args.batch_size,
+        )
+    finally:
+        repo.close()
+
+    print(f"Recompressed {rewritten} article row(s) in {repo.database_url} with codec={args.codec}.")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
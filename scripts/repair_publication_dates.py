@@ -121,7 +121,9 @@ def main() -> int:
 
         if args.apply:
             for update_row in updates:
-                repo.update_article_publication_date(update_row.article_id, update_row.new_value)
+                repo.update_article_publication_date(update_row.article_id, update_row.new_value, refresh_feed=False)
+            if updates:
+                repo.refresh_latest_feed()
             print(f"Applied updates: {len(updates)}")
     finally:
         repo.close()
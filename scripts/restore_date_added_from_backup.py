@@ -92,13 +92,15 @@ def restore_sqlite(*, backup_rows: list[dict[str, Any]], target_path: Path) -> t
 def restore_remote(*, backup_rows: list[dict[str, Any]], target_url: str) -> tuple[int, int]:
     repo = ArticleRepository(database_url=target_url)
     try:
-        total_rows = len(repo.get_latest_articles(limit=100000))
+        total_rows = len(repo.get_latest_articles(limit=100000, include_text=False))
         matched = 0
         for row in backup_rows:
             if repo.get_article_by_url(row['url']) is None:
                 continue
             matched += 1
-            repo.update_article_date_added_by_url(row['url'], row['date_added_dt'])
+            repo.update_article_date_added_by_url(row['url'], row['date_added_dt'], refresh_feed=False)
+        if matched:
+            repo.refresh_latest_feed()
         return matched, total_rows
     finally:
         repo.close()
@@ -18,6 +18,7 @@ REQUIRED_ARTICLE_KEYS = {
     "core_thesis",
     "detailed_abstract",
     "supporting_data_quotes",
+    "supporting_quotes",
     "publication_date",
     "date_added",
 }
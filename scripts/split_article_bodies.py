@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+"""Move article text stored inline on legacy rows into the article_bodies store."""
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from services.article_repository import (
+    DEFAULT_BODY_MIGRATION_BATCH_SIZE,
+    ArticleRepository,
+    resolve_articles_db_path,
+)
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BODY_MIGRATION_BATCH_SIZE)
+    parser.add_argument("--db-path", default=resolve_articles_db_path())
+    parser.add_argument(
+        "--database-url",
+        default=os.getenv("DATABASE_URL"),
+        help="Target database URL. If omitted, uses DATABASE_URL or the local SQLite path.",
+    )
+    return parser.parse_args()
+
+
+def main() -> int:
+    args = parse_args()
+    repo = ArticleRepository(database_url=args.database_url, sqlite_path=args.db_path)
+    try:
+        moved = repo.move_article_bodies(batch_size=args.batch_size)
+    finally:
+        repo.close()
+
+    print(f"Moved {moved} article bod(y/ies) out of the articles table in {repo.database_url}.")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
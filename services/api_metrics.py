@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+import os
+import threading
+from dataclasses import dataclass
+from typing import Any
+
+from services.instrumentation import add_counter_observer, add_timing_observer
+
+
+METRICS_PATH = "/metrics"
+REQUEST_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+RESPONSE_BYTES_BUCKETS = (256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304)
+# Route label for requests that matched no route, so scanners cannot explode label cardinality.
+UNMATCHED_ROUTE = "<unmatched>"
+
+
+def _prometheus_module():
+    try:
+        import prometheus_client
+    except Exception:
+        return None
+    return prometheus_client
+
+
+def metrics_enabled() -> bool:
+    """/metrics is served when prometheus_client is installed, unless METRICS_ENABLED=0."""
+    return os.getenv("METRICS_ENABLED", "1") != "0" and _prometheus_module() is not None
+
+
+@dataclass(frozen=True)
+class _ApiMetrics:
+    request_duration: Any
+    response_bytes: Any
+    repository_duration: Any
+    cache_requests: Any
+
+
+_metrics: _ApiMetrics | None = None
+_metrics_lock = threading.Lock()
+
+
+def _observe_repository_timing(stage: str, seconds: float, ok: bool, labels: dict[str, str]) -> None:
+    if not stage.startswith("db.") or _metrics is None:
+        return
+    _metrics.repository_duration.labels(
+        backend=labels.get("backend", "unknown"),
+        operation=stage[len("db.") :],
+        outcome="ok" if ok else "error",
+    ).observe(seconds)
+
+
+def _observe_cache_count(name: str, value: float) -> None:
+    # Cache counters are named cache.<cache>.<hit|miss>.
+    parts = name.split(".")
+    if len(parts) != 3 or parts[0] != "cache" or _metrics is None:
+        return
+    _metrics.cache_requests.labels(cache=parts[1], result=parts[2]).inc(value)
+
+
+def _api_metrics() -> _ApiMetrics | None:
+    """Create the process's collectors once and subscribe them to instrumentation events."""
+    global _metrics
+    if _metrics is not None or not metrics_enabled():
+        return _metrics
+    prometheus = _prometheus_module()
+    with _metrics_lock:
+        if _metrics is None:
+            _metrics = _ApiMetrics(
+                request_duration=prometheus.Histogram(
+                    "fpfa_http_request_duration_seconds",
+                    "API request latency by route.",
+                    ["app", "method", "route", "status"],
+                    buckets=REQUEST_BUCKETS,
+                ),
+                response_bytes=prometheus.Histogram(
+                    "fpfa_http_response_bytes",
+                    "API response body size by route.",
+                    ["app", "route"],
+                    buckets=RESPONSE_BYTES_BUCKETS,
+                ),
+                repository_duration=prometheus.Histogram(
+                    "fpfa_repository_query_duration_seconds",
+                    "ArticleRepository call latency by backend and operation.",
+                    ["backend", "operation", "outcome"],
+                    buckets=REQUEST_BUCKETS,
+                ),
+                cache_requests=prometheus.Counter(
+                    "fpfa_cache_requests",
+                    "Feed cache lookups by cache and result (hit or miss).",
+                    ["cache", "result"],
+                ),
+            )
+            add_timing_observer(_observe_repository_timing)
+            add_counter_observer(_observe_cache_count)
+    return _metrics
+
+
+def install_api_metrics() -> None:
+    """Register the collectors at app start so repository and cache events are counted."""
+    _api_metrics()
+
+
+def observe_request(
+    app: str,
+    method: str,
+    route: str | None,
+    status: int,
+    seconds: float,
+    response_bytes: int | None,
+) -> None:
+    metrics = _api_metrics()
+    if metrics is None:
+        return
+    route = route or UNMATCHED_ROUTE
+    metrics.request_duration.labels(app=app, method=method, route=route, status=str(status)).observe(seconds)
+    if response_bytes is not None:
+        metrics.response_bytes.labels(app=app, route=route).observe(response_bytes)
+
+
+def render_metrics() -> tuple[bytes, str]:
+    """Return (exposition body, content type).
+
+    With PROMETHEUS_MULTIPROC_DIR set (gunicorn.conf.py sets it), every worker writes its
+    samples there and the scrape aggregates all of them, whichever worker answers it.
+    """
+    prometheus = _prometheus_module()
+    if os.getenv("PROMETHEUS_MULTIPROC_DIR"):
+        from prometheus_client import multiprocess
+
+        registry = prometheus.CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    else:
+        registry = prometheus.REGISTRY
+    return prometheus.generate_latest(registry), prometheus.CONTENT_TYPE_LATEST
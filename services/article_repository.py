@@ -1,18 +1,40 @@
 from __future__ import annotations
 
 import hashlib
+import json
 import os
+import time
+from dataclasses import dataclass
 from datetime import datetime, timezone
+from functools import partial
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterable, Iterator
 from urllib.parse import parse_qs, quote, quote_plus, unquote_plus, urlparse
 
-from sqlalchemy import DateTime, Index, Integer, MetaData, String, Table, Text
-from sqlalchemy import Column, create_engine, func, insert, inspect, select, text, update
+from sqlalchemy import DateTime, ForeignKey, Index, Integer, MetaData, String, Table, Text
+from sqlalchemy import Column, bindparam, func, insert, inspect, or_, select, text, update
 from sqlalchemy.engine import Engine
 from sqlalchemy.exc import IntegrityError
 
+from services.article_urls import URL_KEY_LENGTH, canonicalize_url, url_key
+from services.database_engine import create_article_engine, is_read_only_sqlite, sqlite_read_only_url
+from services.instrumentation import increment, instrument_methods
+from services.near_duplicates import encode_signature, minhash_signature, near_duplicate_detection_enabled
 from services.publication_dates import coerce_publication_date
+from services.text_codec import (
+    CODEC_NONE,
+    COMPRESSIBLE_FIELDS,
+    SUMMARY_FIELDS,
+    codec_marker,
+    compress_summaries_enabled,
+    decode_text,
+    decoded_row,
+    encode_fields,
+    encode_text,
+    parse_codec_marker,
+    resolve_text_codec,
+)
+from template_utils import split_quotes
 
 
 metadata = MetaData()
@@ -22,18 +44,105 @@ articles_table = Table(
     metadata,
     Column("id", Integer, primary_key=True, autoincrement=True),
     Column("source", String(128), nullable=False),
-    Column("url", String(2048), nullable=False, unique=True),
+    Column("url", String(2048), nullable=False),
+    Column(
+        "url_key",
+        String(URL_KEY_LENGTH),
+        nullable=True,
+        default=lambda context: url_key(context.get_current_parameters()["url"]),
+    ),
     Column("title", Text, nullable=False),
     Column("author", Text, nullable=False),
     Column("article_text", Text, nullable=False),
     Column("core_thesis", Text, nullable=False),
     Column("detailed_abstract", Text, nullable=False),
     Column("supporting_data_quotes", Text, nullable=False),
+    # JSON array of the quotes, split once at write time; NULL on rows not yet backfilled.
+    Column("supporting_quotes", Text, nullable=True),
     Column("publication_date", String(128), nullable=True),
+    Column("minhash_signature", Text, nullable=True),
+    Column("text_codec", String(32), nullable=True),
+    # Gemini tokens spent summarizing the article; NULL when not measured.
+    Column("prompt_tokens", Integer, nullable=True),
+    Column("output_tokens", Integer, nullable=True),
+    # "ok" or "failed" (see summary_status()); NULL on rows not yet backfilled.
+    Column("summary_status", String(16), nullable=True),
+    # Version of the summary prompts the row was written with; NULL when unknown.
+    Column("prompt_version", String(32), nullable=True),
     Column("date_added", DateTime, nullable=False, server_default=func.current_timestamp()),
     sqlite_autoincrement=True,
 )
 Index("idx_articles_date", articles_table.c.date_added)
+url_key_index = Index(
+    "uq_articles_url_key",
+    articles_table.c.url_key,
+    unique=True,
+    mssql_where=articles_table.c.url_key.is_not(None),
+)
+# Back list_articles_to_resummarize(): equality on the tag, then keyset paging by id.
+summary_status_index = Index("idx_articles_summary_status", articles_table.c.summary_status, articles_table.c.id)
+prompt_version_index = Index("idx_articles_prompt_version", articles_table.c.prompt_version, articles_table.c.id)
+
+# Article bodies live in their own table so the feed's date_added scans stay on narrow rows.
+# Rows inserted before the split keep their text in articles.article_text until
+# move_article_bodies() migrates them.
+article_bodies_table = Table(
+    "article_bodies",
+    metadata,
+    Column("article_id", Integer, ForeignKey("articles.id", ondelete="CASCADE"), primary_key=True),
+    Column("article_text", Text, nullable=False),
+    Column("text_codec", String(32), nullable=True),
+)
+
+# Columns added after the first deployments; ensure_schema() adds them to older tables.
+# Values are (generic DDL type, SQL Server DDL type).
+_LATE_COLUMNS: dict[str, tuple[str, str]] = {
+    "publication_date": ("TEXT NULL", "NVARCHAR(128) NULL"),
+    "minhash_signature": ("TEXT NULL", "NVARCHAR(MAX) NULL"),
+    "url_key": (f"VARCHAR({URL_KEY_LENGTH}) NULL", f"VARCHAR({URL_KEY_LENGTH}) NULL"),
+    "text_codec": ("VARCHAR(32) NULL", "VARCHAR(32) NULL"),
+    "supporting_quotes": ("TEXT NULL", "NVARCHAR(MAX) NULL"),
+    "prompt_tokens": ("INTEGER NULL", "INT NULL"),
+    "output_tokens": ("INTEGER NULL", "INT NULL"),
+    "summary_status": ("VARCHAR(16) NULL", "VARCHAR(16) NULL"),
+    "prompt_version": ("VARCHAR(32) NULL", "VARCHAR(32) NULL"),
+}
+_URL_KEY_BACKFILL_BATCH = 500
+DEFAULT_RECOMPRESS_BATCH_SIZE = 200
+DEFAULT_BODY_MIGRATION_BATCH_SIZE = 200
+DEFAULT_QUOTES_BACKFILL_BATCH_SIZE = 500
+DEFAULT_BULK_INSERT_BATCH_SIZE = 500
+DEFAULT_SUMMARY_UPDATE_BATCH_SIZE = 200
+DEFAULT_SUMMARY_STATUS_BACKFILL_BATCH_SIZE = 500
+DEFAULT_RESUMMARIZE_PAGE_SIZE = 100
+FIRESTORE_BATCH_WRITE_LIMIT = 500
+DEFAULT_FIRESTORE_FEED_SIZE = 50
+DEFAULT_FIRESTORE_PAGE_SIZE = 500
+DEFAULT_DATED_ARTICLES_PAGE_SIZE = 500
+DEFAULT_READ_YOUR_WRITES_SECONDS = 5.0
+
+# What the summarizers stored when Gemini failed, before failures were left unstored.
+SUMMARY_FAILED_TEXT = "Summary generation failed."
+SUMMARY_STATUS_OK = "ok"
+SUMMARY_STATUS_FAILED = "failed"
+
+# Field mask for Firestore list views: everything a card needs, nothing it does not
+# (inline legacy article_text, MinHash signatures, dedupe keys).
+_FIRESTORE_LIST_FIELDS = (
+    "id",
+    "source",
+    "url",
+    "title",
+    "author",
+    "core_thesis",
+    "detailed_abstract",
+    "supporting_data_quotes",
+    "supporting_quotes",
+    "publication_date",
+    "date_added",
+    "date_added_ts",
+    "text_codec",
+)
 
 
 def resolve_articles_db_path() -> str:
@@ -218,6 +327,12 @@ def resolve_database_url(sqlite_path: str | None = None) -> str:
     return f"sqlite:///{Path(db_path).resolve()}"
 
 
+def resolve_read_your_writes_window() -> float:
+    """Seconds after a write during which reads stay on the primary (DB_READ_YOUR_WRITES_SECONDS)."""
+    raw_value = os.getenv("DB_READ_YOUR_WRITES_SECONDS", "").strip()
+    return float(raw_value) if raw_value else DEFAULT_READ_YOUR_WRITES_SECONDS
+
+
 def _serialize_value(value: Any, *, field: str) -> Any:
     if value is None:
         return None
@@ -261,15 +376,77 @@ def _format_date_added(value: Any) -> str | None:
     return parsed.strftime("%Y-%m-%d %H:%M:%S")
 
 
+def _stored_signature(article: dict[str, Any]) -> str | None:
+    # Callers that already ran the dedupe check pass its signature in; hashing a long
+    # body again costs hundreds of milliseconds.
+    signature = article.get("minhash_signature")
+    if signature is None:
+        if not near_duplicate_detection_enabled():
+            return None
+        signature = minhash_signature(article["article_text"])
+    return signature if isinstance(signature, str) else encode_signature(tuple(signature))
+
+
 def _stable_article_id(url: str) -> int:
     # Keep IDs JSON-safe for JS clients by staying under 53 bits.
     return int(hashlib.sha256(url.encode("utf-8")).hexdigest()[:13], 16)
 
 
 def _firestore_document_id(url: str) -> str:
+    return url_key(url)
+
+
+def _legacy_firestore_document_id(url: str) -> str:
+    # Documents written before URL canonicalization were keyed by the raw URL.
     return hashlib.sha256(url.encode("utf-8")).hexdigest()
 
 
+def _resolve_codec_marker(text_codec: str | None, compress_summaries: bool | None) -> str | None:
+    return codec_marker(
+        text_codec or resolve_text_codec(),
+        include_summaries=compress_summaries_enabled() if compress_summaries is None else compress_summaries,
+    )
+
+
+def _body_codec(marker: str | None) -> str | None:
+    codec, _ = parse_codec_marker(marker)
+    return None if codec == CODEC_NONE else codec
+
+
+def summary_status(summaries: dict[str, Any]) -> str:
+    """``failed`` when any of the (decoded) summaries is the failure placeholder."""
+    if any((summaries.get(field) or "").strip() == SUMMARY_FAILED_TEXT for field in SUMMARY_FIELDS):
+        return SUMMARY_STATUS_FAILED
+    return SUMMARY_STATUS_OK
+
+
+def _decoded_summaries(data: Any, marker: str | None) -> dict[str, Any]:
+    codec, fields = parse_codec_marker(marker)
+    return {
+        field: decode_text(data.get(field), codec if field in fields else CODEC_NONE) for field in SUMMARY_FIELDS
+    }
+
+
+def _reencode_fields(values: dict[str, Any], old_marker: str | None, new_marker: str | None) -> dict[str, Any]:
+    old_codec, old_fields = parse_codec_marker(old_marker)
+    plain = {
+        field: decode_text(values.get(field), old_codec) if field in old_fields else values.get(field)
+        for field in COMPRESSIBLE_FIELDS
+    }
+    return encode_fields(plain, new_marker)
+
+
+def _resolve_firestore_feed_size() -> int:
+    raw_value = os.getenv("FIRESTORE_FEED_SIZE", "").strip()
+    return int(raw_value) if raw_value else DEFAULT_FIRESTORE_FEED_SIZE
+
+
+def _decode_body_doc(data: dict[str, Any] | None) -> str:
+    if not data:
+        return ""
+    return decode_text(data.get("article_text") or "", data.get("text_codec") or CODEC_NONE)
+
+
 def _create_firestore_client(project_id: str) -> tuple[Any, Any]:
     from google.cloud import firestore
 
@@ -282,14 +459,135 @@ def _get_firestore_already_exists_exception():
     return AlreadyExists
 
 
+def _latest_articles_statement(limit: int, *, include_text: bool = True):
+    """Build the feed query shared by the sync and async SQL repositories."""
+    columns = [
+        articles_table.c.id,
+        articles_table.c.source,
+        articles_table.c.url,
+        articles_table.c.title,
+        articles_table.c.author,
+        articles_table.c.core_thesis,
+        articles_table.c.detailed_abstract,
+        articles_table.c.supporting_data_quotes,
+        articles_table.c.supporting_quotes,
+        articles_table.c.publication_date,
+        articles_table.c.date_added,
+        articles_table.c.text_codec,
+    ]
+    source = articles_table
+    if include_text:
+        columns += [
+            articles_table.c.article_text,
+            article_bodies_table.c.article_text.label("body_text"),
+            article_bodies_table.c.text_codec.label("body_codec"),
+        ]
+        source = articles_table.outerjoin(
+            article_bodies_table,
+            article_bodies_table.c.article_id == articles_table.c.id,
+        )
+    return (
+        select(*columns)
+        .select_from(source)
+        .order_by(articles_table.c.date_added.desc())
+        .limit(limit)
+    )
+
+
+def _quotes_from_stored(stored: Any, raw_quotes: Any, marker: str | None) -> list[str]:
+    """Return the structured quote list, splitting the legacy string for rows not yet backfilled."""
+    if stored:
+        # SQL keeps the list as JSON text; Firestore stores a native array.
+        return json.loads(stored) if isinstance(stored, str) else [str(quote) for quote in stored]
+    codec, fields = parse_codec_marker(marker)
+    if "supporting_data_quotes" not in fields:
+        codec = CODEC_NONE
+    return split_quotes(decode_text(raw_quotes, codec))
+
+
+def _sql_row_payload(row: Any, *, body_loader: Any = None) -> dict[str, Any]:
+    """Turn a SQL result mapping into an article payload.
+
+    ``body_loader(fallback)`` fetches text from article_bodies on first access when
+    the row was not already joined against it.
+    """
+    payload = dict(row)
+    marker = payload.pop("text_codec", None)
+    payload["supporting_quotes"] = _quotes_from_stored(
+        payload.get("supporting_quotes"),
+        payload.get("supporting_data_quotes"),
+        marker,
+    )
+    payload["date_added"] = _serialize_value(payload.get("date_added"), field="date_added")
+    payload["publication_date"] = coerce_publication_date(
+        _serialize_value(payload.get("publication_date"), field="publication_date"),
+        url=payload.get("url"),
+    )
+
+    loaders: dict[str, Any] = {}
+    if "body_text" in payload:
+        body_text = payload.pop("body_text")
+        body_codec = payload.pop("body_codec")
+        if body_text is not None:
+            loaders["article_text"] = partial(decode_text, body_text, body_codec or CODEC_NONE)
+    elif body_loader is not None:
+        codec, fields = parse_codec_marker(marker)
+        legacy_text = partial(
+            decode_text,
+            payload.get("article_text"),
+            codec if "article_text" in fields else CODEC_NONE,
+        )
+        loaders["article_text"] = partial(body_loader, legacy_text)
+    return decoded_row(payload, marker, loaders=loaders)
+
+
 class _SqlArticleRepository:
-    def __init__(self, database_url: str):
+    def __init__(
+        self,
+        database_url: str,
+        *,
+        text_codec_marker: str | None = None,
+        read_database_url: str | None = None,
+    ):
         self.database_url = database_url
-        self.engine: Engine = create_engine(database_url, future=True, pool_pre_ping=True)
-        self.ensure_schema()
+        self.read_database_url = read_database_url or database_url
+        self.text_codec_marker = text_codec_marker
+        self.engine: Engine
+        self.engine, self.pool_stats = create_article_engine(database_url)
+        self.read_engine: Engine = self.engine
+        self.read_pool_stats = None
+        if read_database_url and read_database_url != database_url:
+            self.read_engine, self.read_pool_stats = create_article_engine(read_database_url)
+        self.read_your_writes_window = resolve_read_your_writes_window()
+        self._last_write_at: float | None = None
+        # Read-only workers serve an existing schema; migrations belong to writers.
+        if not is_read_only_sqlite(database_url):
+            self.ensure_schema()
 
     def close(self) -> None:
         self.engine.dispose()
+        if self.read_engine is not self.engine:
+            self.read_engine.dispose()
+
+    def get_pool_stats(self) -> dict[str, Any]:
+        stats = self.pool_stats.snapshot()
+        if self.read_pool_stats is not None:
+            stats["read"] = self.read_pool_stats.snapshot()
+        return stats
+
+    def _reader(self) -> Engine:
+        """Engine for reads: the replica, unless this process wrote within the window."""
+        if self.read_engine is self.engine:
+            return self.engine
+        last_write = self._last_write_at
+        if last_write is not None and time.monotonic() - last_write < self.read_your_writes_window:
+            return self.engine
+        return self.read_engine
+
+    def _writer(self):
+        """Begin a primary transaction and pin this process's reads to the primary for a while."""
+        self._last_write_at = time.monotonic()
+        return self.engine.begin()
 
     def ensure_schema(self) -> None:
         metadata.create_all(self.engine, checkfirst=True)
@@ -298,65 +596,129 @@ class _SqlArticleRepository:
             return
 
         existing_columns = {column["name"] for column in inspector.get_columns("articles")}
-        if "publication_date" in existing_columns:
-            return
-
-        dialect = self.engine.dialect.name
-        alter_sql = "ALTER TABLE articles ADD COLUMN publication_date TEXT NULL"
-        if dialect.startswith("mssql"):
-            alter_sql = "ALTER TABLE articles ADD publication_date NVARCHAR(128) NULL"
+        missing_columns = [name for name in _LATE_COLUMNS if name not in existing_columns]
+        if missing_columns:
+            is_mssql = self.engine.dialect.name.startswith("mssql")
+            with self.engine.begin() as conn:
+                for name in missing_columns:
+                    generic_type, mssql_type = _LATE_COLUMNS[name]
+                    if is_mssql:
+                        alter_sql = f"ALTER TABLE articles ADD {name} {mssql_type}"
+                    else:
+                        alter_sql = f"ALTER TABLE articles ADD COLUMN {name} {generic_type}"
+                    conn.execute(text(alter_sql))
+
+        existing_indexes = {index["name"] for index in inspect(self.engine).get_indexes("articles")}
+        if url_key_index.name not in existing_indexes:
+            self._backfill_url_keys()
+            with self.engine.begin() as conn:
+                url_key_index.create(conn)
+        for index in (summary_status_index, prompt_version_index):
+            if index.name not in existing_indexes:
+                with self.engine.begin() as conn:
+                    index.create(conn)
+
+    def _backfill_url_keys(self) -> None:
+        """Fill url_key for legacy rows; later spellings of an already-keyed URL stay NULL."""
+        with self.engine.connect() as conn:
+            seen_keys = {
+                row[0]
+                for row in conn.execute(
+                    select(articles_table.c.url_key).where(articles_table.c.url_key.is_not(None))
+                )
+            }
+            pending = conn.execute(
+                select(articles_table.c.id, articles_table.c.url)
+                .where(articles_table.c.url_key.is_(None))
+                .order_by(articles_table.c.id.asc())
+            ).all()
+
+        updates: list[dict[str, Any]] = []
+        for article_id, url in pending:
+            key = url_key(str(url))
+            if key in seen_keys:
+                continue
+            seen_keys.add(key)
+            updates.append({"article_id": article_id, "key": key})
 
-        with self.engine.begin() as conn:
-            conn.execute(text(alter_sql))
+        stmt = (
+            update(articles_table)
+            .where(articles_table.c.id == bindparam("article_id"))
+            .values(url_key=bindparam("key"))
+        )
+        for start in range(0, len(updates), _URL_KEY_BACKFILL_BATCH):
+            with self.engine.begin() as conn:
+                conn.execute(stmt, updates[start : start + _URL_KEY_BACKFILL_BATCH])
 
-    def get_latest_articles(self, limit: int = 20) -> list[dict[str, Any]]:
+    def get_latest_articles(self, limit: int = 20, *, include_text: bool = True) -> list[dict[str, Any]]:
         if limit <= 0:
             return []
-        stmt = (
-            select(
-                articles_table.c.id,
-                articles_table.c.source,
-                articles_table.c.url,
-                articles_table.c.title,
-                articles_table.c.author,
-                articles_table.c.article_text,
-                articles_table.c.core_thesis,
-                articles_table.c.detailed_abstract,
-                articles_table.c.supporting_data_quotes,
-                articles_table.c.publication_date,
-                articles_table.c.date_added,
-            )
-            .order_by(articles_table.c.date_added.desc())
-            .limit(limit)
-        )
-        with self.engine.connect() as conn:
+        stmt = _latest_articles_statement(limit, include_text=include_text)
+        with self._reader().connect() as conn:
             rows = conn.execute(stmt).mappings().all()
+        return [self._payload_from_row(row) for row in rows]
 
-        serialized: list[dict[str, Any]] = []
-        for row in rows:
-            payload = dict(row)
-            payload["date_added"] = _serialize_value(payload.get("date_added"), field="date_added")
-            payload["publication_date"] = coerce_publication_date(
-                _serialize_value(payload.get("publication_date"), field="publication_date"),
-                url=payload.get("url"),
-            )
-            serialized.append(payload)
-        return serialized
+    def _payload_from_row(self, row: Any, *, fetch_body: bool = False) -> dict[str, Any]:
+        body_loader = partial(self._load_article_body, row["id"]) if fetch_body else None
+        return _sql_row_payload(row, body_loader=body_loader)
+
+    def _load_article_body(self, article_id: int, fallback: Any) -> str:
+        stmt = select(article_bodies_table.c.article_text, article_bodies_table.c.text_codec).where(
+            article_bodies_table.c.article_id == article_id
+        )
+        with self._reader().connect() as conn:
+            row = conn.execute(stmt).first()
+        if row is None:
+            return fallback()
+        return decode_text(row.article_text, row.text_codec or CODEC_NONE)
 
     def get_article_by_url(self, url: str) -> dict[str, Any] | None:
-        stmt = select(articles_table).where(articles_table.c.url == url).limit(1)
-        with self.engine.connect() as conn:
+        stmt = select(articles_table).where(articles_table.c.url_key == url_key(url)).limit(1)
+        with self._reader().connect() as conn:
             row = conn.execute(stmt).mappings().first()
         if row is None:
             return None
-        payload = dict(row)
-        payload["date_added"] = _serialize_value(payload.get("date_added"), field="date_added")
-        payload["publication_date"] = coerce_publication_date(
-            _serialize_value(payload.get("publication_date"), field="publication_date"),
-            url=payload.get("url"),
-        )
+        return self._payload_from_row(row, fetch_body=True)
+
+    def _article_row(self, article: dict[str, Any]) -> dict[str, Any]:
+        url = canonicalize_url(article["url"])
+        supporting_quotes = article.get("supporting_quotes")
+        payload = {
+            "source": article["source"],
+            "url": url,
+            "url_key": url_key(url),
+            "title": article["title"],
+            "author": article["author"],
+            "article_text": "",
+            "core_thesis": article["core_thesis"],
+            "detailed_abstract": article["detailed_abstract"],
+            "supporting_data_quotes": article["supporting_data_quotes"],
+            "supporting_quotes": json.dumps(
+                split_quotes(article["supporting_data_quotes"]) if supporting_quotes is None else supporting_quotes,
+                ensure_ascii=False,
+            ),
+            "publication_date": coerce_publication_date(article.get("publication_date"), url=url),
+            "minhash_signature": _stored_signature(article),
+            "text_codec": self.text_codec_marker,
+            "prompt_tokens": article.get("prompt_tokens"),
+            "output_tokens": article.get("output_tokens"),
+            "summary_status": summary_status(article),
+            "prompt_version": article.get("prompt_version"),
+        }
+        payload = encode_fields(payload, self.text_codec_marker)
+        parsed_date_added = _parse_date_added(article.get("date_added"))
+        if parsed_date_added is not None:
+            payload["date_added"] = parsed_date_added
         return payload
 
+    def _body_row(self, article_id: int, article_text: str) -> dict[str, Any]:
+        body_codec = _body_codec(self.text_codec_marker)
+        return {
+            "article_id": article_id,
+            "article_text": encode_text(article_text, body_codec or CODEC_NONE),
+            "text_codec": body_codec,
+        }
+
     def insert_article(
         self,
         *,
@@ -370,82 +732,525 @@ class _SqlArticleRepository:
         supporting_data_quotes: str,
         publication_date: str | None = None,
         date_added: Any = None,
+        supporting_quotes: list[str] | None = None,
+        prompt_tokens: int | None = None,
+        output_tokens: int | None = None,
+        prompt_version: str | None = None,
+        minhash_signature: tuple[int, ...] | str | None = None,
     ) -> bool:
-        payload = {
-            "source": source,
-            "url": url,
-            "title": title,
-            "author": author,
-            "article_text": article_text,
-            "core_thesis": core_thesis,
-            "detailed_abstract": detailed_abstract,
-            "supporting_data_quotes": supporting_data_quotes,
-            "publication_date": coerce_publication_date(publication_date, url=url),
-        }
-        parsed_date_added = _parse_date_added(date_added)
-        if parsed_date_added is not None:
-            payload["date_added"] = parsed_date_added
+        payload = self._article_row(
+            {
+                "source": source,
+                "url": url,
+                "title": title,
+                "author": author,
+                "article_text": article_text,
+                "core_thesis": core_thesis,
+                "detailed_abstract": detailed_abstract,
+                "supporting_data_quotes": supporting_data_quotes,
+                "publication_date": publication_date,
+                "date_added": date_added,
+                "supporting_quotes": supporting_quotes,
+                "prompt_tokens": prompt_tokens,
+                "output_tokens": output_tokens,
+                "prompt_version": prompt_version,
+                "minhash_signature": minhash_signature,
+            }
+        )
         try:
-            with self.engine.begin() as conn:
-                conn.execute(insert(articles_table).values(**payload))
+            with self._writer() as conn:
+                result = conn.execute(insert(articles_table).values(**payload))
+                conn.execute(
+                    insert(article_bodies_table).values(**self._body_row(result.inserted_primary_key[0], article_text))
+                )
         except IntegrityError:
             return False
         return True
 
-    def list_articles_with_publication_dates(self) -> list[dict[str, Any]]:
-        stmt = (
-            select(
-                articles_table.c.id,
-                articles_table.c.source,
-                articles_table.c.url,
-                articles_table.c.title,
-                articles_table.c.publication_date,
-            )
-            .where(articles_table.c.publication_date.is_not(None))
-            .order_by(articles_table.c.id.asc())
+    def insert_articles(
+        self, articles: Iterable[dict[str, Any]], *, batch_size: int = DEFAULT_BULK_INSERT_BATCH_SIZE
+    ) -> int:
+        inserted = 0
+        batch: list[dict[str, Any]] = []
+        for article in articles:
+            batch.append(article)
+            if len(batch) >= batch_size:
+                inserted += self._insert_article_batch(batch)
+                batch = []
+        if batch:
+            inserted += self._insert_article_batch(batch)
+        return inserted
+
+    def _insert_article_batch(self, batch: list[dict[str, Any]]) -> int:
+        rows = [self._article_row(article) for article in batch]
+        # executemany needs one parameter shape; rows without a date get "now" like the server default.
+        now = datetime.now(timezone.utc).replace(tzinfo=None, microsecond=0)
+        for row in rows:
+            row.setdefault("date_added", now)
+        texts = {row["url_key"]: article["article_text"] for row, article in zip(rows, batch)}
+        try:
+            with self._writer() as conn:
+                conn.execute(insert(articles_table), rows)
+                ids = conn.execute(
+                    select(articles_table.c.id, articles_table.c.url_key).where(
+                        articles_table.c.url_key.in_(list(texts))
+                    )
+                ).all()
+                conn.execute(
+                    insert(article_bodies_table),
+                    [self._body_row(article_id, texts[key]) for article_id, key in ids],
+                )
+        except IntegrityError:
+            # A duplicate somewhere in the batch: retry row by row so the rest still land.
+            return sum(self.insert_article(**article) for article in batch)
+        return len(rows)
+
+    def list_minhash_signatures(self, since: Any = None) -> list[dict[str, Any]]:
+        stmt = select(articles_table.c.url, articles_table.c.minhash_signature).where(
+            articles_table.c.minhash_signature.is_not(None)
         )
-        with self.engine.connect() as conn:
+        parsed_since = _parse_date_added(since)
+        if parsed_since is not None:
+            stmt = stmt.where(articles_table.c.date_added > parsed_since)
+        with self._reader().connect() as conn:
             rows = conn.execute(stmt).mappings().all()
         return [dict(row) for row in rows]
 
-    def update_article_publication_date(self, article_id: int, publication_date: str | None) -> None:
-        with self.engine.begin() as conn:
+    def list_articles_with_publication_dates(
+        self,
+        *,
+        page_size: int = DEFAULT_DATED_ARTICLES_PAGE_SIZE,
+    ) -> Iterator[dict[str, Any]]:
+        last_id = 0
+        while True:
+            stmt = (
+                select(
+                    articles_table.c.id,
+                    articles_table.c.source,
+                    articles_table.c.url,
+                    articles_table.c.title,
+                    articles_table.c.publication_date,
+                )
+                .where(articles_table.c.publication_date.is_not(None), articles_table.c.id > last_id)
+                .order_by(articles_table.c.id.asc())
+                .limit(page_size)
+            )
+            with self._reader().connect() as conn:
+                page = [dict(row) for row in conn.execute(stmt).mappings().all()]
+            yield from page
+            if len(page) < page_size:
+                return
+            last_id = page[-1]["id"]
+
+    def update_article_publication_date(
+        self, article_id: int, publication_date: str | None, *, refresh_feed: bool = True
+    ) -> None:
+        with self._writer() as conn:
             conn.execute(
                 update(articles_table)
                 .where(articles_table.c.id == article_id)
                 .values(publication_date=publication_date)
             )
 
-    def update_article_date_added_by_url(self, url: str, date_added: Any) -> None:
+    def recompress_articles(
+        self,
+        text_codec_marker: str | None,
+        *,
+        batch_size: int = DEFAULT_RECOMPRESS_BATCH_SIZE,
+    ) -> int:
+        """Re-encode stored rows with ``text_codec_marker``; returns rows rewritten."""
+        columns = [articles_table.c[field] for field in COMPRESSIBLE_FIELDS]
+        last_id = 0
+        rewritten = 0
+        while True:
+            stmt = (
+                select(articles_table.c.id, articles_table.c.text_codec, *columns)
+                .where(articles_table.c.id > last_id)
+                .order_by(articles_table.c.id.asc())
+                .limit(batch_size)
+            )
+            with self.engine.connect() as conn:
+                rows = conn.execute(stmt).mappings().all()
+            if not rows:
+                self._recompress_article_bodies(_body_codec(text_codec_marker), batch_size=batch_size)
+                return rewritten
+
+            updates: list[dict[str, Any]] = []
+            for row in rows:
+                last_id = row["id"]
+                if (row["text_codec"] or None) == text_codec_marker:
+                    continue
+                values = _reencode_fields(dict(row), row["text_codec"], text_codec_marker)
+                updates.append({"article_id": row["id"], "new_codec": text_codec_marker, **values})
+
+            if updates:
+                stmt = (
+                    update(articles_table)
+                    .where(articles_table.c.id == bindparam("article_id"))
+                    .values(
+                        text_codec=bindparam("new_codec"),
+                        **{field: bindparam(field) for field in COMPRESSIBLE_FIELDS},
+                    )
+                )
+                with self._writer() as conn:
+                    conn.execute(stmt, updates)
+                rewritten += len(updates)
+
+    def _recompress_article_bodies(self, body_codec: str | None, *, batch_size: int) -> None:
+        last_id = 0
+        while True:
+            stmt = (
+                select(article_bodies_table)
+                .where(article_bodies_table.c.article_id > last_id)
+                .order_by(article_bodies_table.c.article_id.asc())
+                .limit(batch_size)
+            )
+            with self.engine.connect() as conn:
+                rows = conn.execute(stmt).mappings().all()
+            if not rows:
+                return
+
+            updates: list[dict[str, Any]] = []
+            for row in rows:
+                last_id = row["article_id"]
+                if (row["text_codec"] or None) == body_codec:
+                    continue
+                plain_text = decode_text(row["article_text"], row["text_codec"] or CODEC_NONE)
+                updates.append(
+                    {
+                        "body_id": row["article_id"],
+                        "body_text": encode_text(plain_text, body_codec or CODEC_NONE),
+                        "body_codec": body_codec,
+                    }
+                )
+            if updates:
+                with self._writer() as conn:
+                    conn.execute(
+                        update(article_bodies_table)
+                        .where(article_bodies_table.c.article_id == bindparam("body_id"))
+                        .values(article_text=bindparam("body_text"), text_codec=bindparam("body_codec")),
+                        updates,
+                    )
+
+    def move_article_bodies(self, *, batch_size: int = DEFAULT_BODY_MIGRATION_BATCH_SIZE) -> int:
+        """Move legacy articles.article_text values into article_bodies; returns rows moved."""
+        moved = 0
+        while True:
+            stmt = (
+                select(articles_table.c.id, articles_table.c.article_text, articles_table.c.text_codec)
+                .select_from(
+                    articles_table.outerjoin(
+                        article_bodies_table,
+                        article_bodies_table.c.article_id == articles_table.c.id,
+                    )
+                )
+                .where(article_bodies_table.c.article_id.is_(None))
+                .order_by(articles_table.c.id.asc())
+                .limit(batch_size)
+            )
+            with self.engine.connect() as conn:
+                rows = conn.execute(stmt).mappings().all()
+            if not rows:
+                return moved
+
+            bodies: list[dict[str, Any]] = []
+            emptied: list[dict[str, Any]] = []
+            for row in rows:
+                codec, fields = parse_codec_marker(row["text_codec"])
+                if "article_text" not in fields:
+                    codec = CODEC_NONE
+                bodies.append(
+                    {
+                        "article_id": row["id"],
+                        "article_text": row["article_text"],
+                        "text_codec": None if codec == CODEC_NONE else codec,
+                    }
+                )
+                emptied.append({"body_id": row["id"], "empty_text": encode_text("", codec)})
+
+            with self._writer() as conn:
+                conn.execute(insert(article_bodies_table), bodies)
+                conn.execute(
+                    update(articles_table)
+                    .where(articles_table.c.id == bindparam("body_id"))
+                    .values(article_text=bindparam("empty_text")),
+                    emptied,
+                )
+            moved += len(rows)
+
+    def backfill_supporting_quotes(self, *, batch_size: int = DEFAULT_QUOTES_BACKFILL_BATCH_SIZE) -> int:
+        """Fill supporting_quotes on rows written before the column existed; returns rows updated."""
+        updated = 0
+        while True:
+            stmt = (
+                select(articles_table.c.id, articles_table.c.supporting_data_quotes, articles_table.c.text_codec)
+                .where(articles_table.c.supporting_quotes.is_(None))
+                .order_by(articles_table.c.id.asc())
+                .limit(batch_size)
+            )
+            with self.engine.connect() as conn:
+                rows = conn.execute(stmt).mappings().all()
+            if not rows:
+                return updated
+
+            updates = [
+                {
+                    "article_id": row["id"],
+                    "quotes": json.dumps(
+                        _quotes_from_stored(None, row["supporting_data_quotes"], row["text_codec"]),
+                        ensure_ascii=False,
+                    ),
+                }
+                for row in rows
+            ]
+            with self._writer() as conn:
+                conn.execute(
+                    update(articles_table)
+                    .where(articles_table.c.id == bindparam("article_id"))
+                    .values(supporting_quotes=bindparam("quotes")),
+                    updates,
+                )
+            updated += len(updates)
+
+    def update_article_summaries(
+        self, updates: Iterable[dict[str, Any]], *, batch_size: int = DEFAULT_SUMMARY_UPDATE_BATCH_SIZE
+    ) -> int:
+        updated = 0
+        pending: list[dict[str, Any]] = []
+        for summary in updates:
+            pending.append(summary)
+            if len(pending) >= batch_size:
+                updated += self._update_summary_batch(pending)
+                pending = []
+        if pending:
+            updated += self._update_summary_batch(pending)
+        return updated
+
+    def _update_summary_batch(self, batch: list[dict[str, Any]]) -> int:
+        by_key = {url_key(canonicalize_url(summary["url"])): summary for summary in batch}
+        with self.engine.connect() as conn:
+            rows = conn.execute(
+                select(articles_table.c.id, articles_table.c.url_key, articles_table.c.text_codec).where(
+                    articles_table.c.url_key.in_(list(by_key))
+                )
+            ).all()
+        params = []
+        for article_id, key, marker in rows:
+            summary = by_key[key]
+            # Encoded like the rest of the row, whatever codec it was written with.
+            values = encode_fields({field: summary[field] for field in SUMMARY_FIELDS}, marker)
+            params.append(
+                {
+                    "article_id": article_id,
+                    **values,
+                    "quotes": json.dumps(split_quotes(summary["supporting_data_quotes"]), ensure_ascii=False),
+                    "prompt_tokens_value": summary.get("prompt_tokens"),
+                    "output_tokens_value": summary.get("output_tokens"),
+                    "status_value": summary_status(summary),
+                    "prompt_version_value": summary.get("prompt_version"),
+                }
+            )
+        if not params:
+            return 0
+        stmt = (
+            update(articles_table)
+            .where(articles_table.c.id == bindparam("article_id"))
+            .values(
+                **{field: bindparam(field) for field in SUMMARY_FIELDS},
+                supporting_quotes=bindparam("quotes"),
+                prompt_tokens=bindparam("prompt_tokens_value"),
+                output_tokens=bindparam("output_tokens_value"),
+                summary_status=bindparam("status_value"),
+                prompt_version=bindparam("prompt_version_value"),
+            )
+        )
+        with self._writer() as conn:
+            conn.execute(stmt, params)
+        return len(params)
+
+    def backfill_summary_status(self, *, batch_size: int = DEFAULT_SUMMARY_STATUS_BACKFILL_BATCH_SIZE) -> int:
+        """Tag rows written before summary_status existed; returns rows updated."""
+        updated = 0
+        while True:
+            stmt = (
+                select(articles_table.c.id, articles_table.c.text_codec, *(articles_table.c[f] for f in SUMMARY_FIELDS))
+                .where(articles_table.c.summary_status.is_(None))
+                .order_by(articles_table.c.id.asc())
+                .limit(batch_size)
+            )
+            with self.engine.connect() as conn:
+                rows = conn.execute(stmt).mappings().all()
+            if not rows:
+                return updated
+
+            updates = [
+                {"article_id": row["id"], "status": summary_status(_decoded_summaries(row, row["text_codec"]))}
+                for row in rows
+            ]
+            with self._writer() as conn:
+                conn.execute(
+                    update(articles_table)
+                    .where(articles_table.c.id == bindparam("article_id"))
+                    .values(summary_status=bindparam("status")),
+                    updates,
+                )
+            updated += len(updates)
+
+    def list_articles_to_resummarize(
+        self,
+        *,
+        failed: bool = True,
+        prompt_versions: Iterable[str | None] = (),
+        after_id: int = 0,
+        limit: int = DEFAULT_RESUMMARIZE_PAGE_SIZE,
+    ) -> list[dict[str, Any]]:
+        prompt_versions = list(prompt_versions)
+        conditions = []
+        if failed:
+            conditions.append(articles_table.c.summary_status == SUMMARY_STATUS_FAILED)
+        tagged = [version for version in prompt_versions if version is not None]
+        if tagged:
+            conditions.append(articles_table.c.prompt_version.in_(tagged))
+        if None in prompt_versions:
+            conditions.append(articles_table.c.prompt_version.is_(None))
+        if not conditions or limit <= 0:
+            return []
+        stmt = (
+            select(articles_table)
+            .where(or_(*conditions), articles_table.c.id > after_id)
+            .order_by(articles_table.c.id.asc())
+            .limit(limit)
+        )
+        with self.engine.connect() as conn:
+            rows = conn.execute(stmt).mappings().all()
+        return [self._payload_from_row(row, fetch_body=True) for row in rows]
+
+    def refresh_latest_feed(self) -> None:
+        return None
+
+    def update_article_date_added_by_url(self, url: str, date_added: Any, *, refresh_feed: bool = True) -> None:
         parsed_date_added = _parse_date_added(date_added)
         if parsed_date_added is None:
             return
-        with self.engine.begin() as conn:
+        with self._writer() as conn:
             conn.execute(
                 update(articles_table)
-                .where(articles_table.c.url == url)
+                .where(articles_table.c.url_key == url_key(url))
                 .values(date_added=parsed_date_added)
             )
 
 
+@dataclass(frozen=True)
+class FirestoreHandle:
+    """What code keeping its own documents next to the articles needs from the backend."""
+
+    client: Any
+    # The google.cloud.firestore module, for ``transactional``.
+    module: Any
+    already_exists: type[Exception]
+    collection_name: str
+
+
 class _FirestoreArticleRepository:
-    def __init__(self, *, project_id: str, collection_name: str):
+    def __init__(self, *, project_id: str, collection_name: str, text_codec_marker: str | None = None):
         self.project_id = project_id
+        self.text_codec_marker = text_codec_marker
         self.collection_name = collection_name
         self.client, self._firestore = _create_firestore_client(project_id)
         self.collection = self.client.collection(collection_name)
+        self.bodies = self.client.collection(f"{collection_name}_bodies")
+        # Denormalized copy of the newest cards so a list view costs one document read.
+        self.feed_document = self.client.collection(f"{collection_name}_feed").document("latest")
+        self.feed_size = _resolve_firestore_feed_size()
+        # article id -> document id, so id-addressed updates are a direct get, not a query.
+        self.article_ids = self.client.collection(f"{collection_name}_ids")
         self._already_exists = _get_firestore_already_exists_exception()
 
     def close(self) -> None:
         return None
 
+    def get_pool_stats(self) -> dict[str, Any]:
+        return {}
+
     def ensure_schema(self) -> None:
         return None
 
-    def _payload_from_doc(self, data: dict[str, Any]) -> dict[str, Any]:
+    def _latest_docs_query(self, limit: int, *, include_inline_text: bool = False, collection: Any = None):
+        fields = list(_FIRESTORE_LIST_FIELDS)
+        if include_inline_text:
+            fields.append("article_text")
+        return (
+            (self.collection if collection is None else collection)
+            .order_by("date_added_ts", direction=self._firestore.Query.DESCENDING)
+            .select(fields)
+            .limit(limit)
+        )
+
+    def _query_latest_docs(self, limit: int, *, include_inline_text: bool = False) -> list[dict[str, Any]]:
+        query = self._latest_docs_query(limit, include_inline_text=include_inline_text)
+        return [doc.to_dict() or {} for doc in query.stream()]
+
+    @staticmethod
+    def _feed_entries(snapshot: Any, limit: int) -> list[dict[str, Any]] | None:
+        if not snapshot.exists:
+            return None
+        entries = (snapshot.to_dict() or {}).get("articles") or []
+        return [dict(entry) for entry in entries[:limit]]
+
+    def _read_latest_feed(self, limit: int) -> list[dict[str, Any]] | None:
+        if limit > self.feed_size:
+            return None
+        entries = self._feed_entries(self.feed_document.get(), limit)
+        increment("cache.firestore_feed.miss" if entries is None else "cache.firestore_feed.hit")
+        return entries
+
+    def _feed_data(self, entries: list[dict[str, Any]]) -> dict[str, Any]:
+        return {
+            "articles": entries[: self.feed_size],
+            "generated_at": datetime.now(timezone.utc),
+        }
+
+    def _write_latest_feed(self, entries: list[dict[str, Any]]) -> None:
+        self.feed_document.set(self._feed_data(entries))
+
+    def refresh_latest_feed(self) -> None:
+        """Rebuild the denormalized feed document from the collection."""
+        self._write_latest_feed(self._query_latest_docs(self.feed_size))
+
+    def _merge_into_latest_feed(self, payload: dict[str, Any]) -> None:
+        entry = {field: payload.get(field) for field in _FIRESTORE_LIST_FIELDS}
+
+        # Read-modify-write in a transaction: concurrent writers (the pipeline next to a
+        # backfill, say) are retried on contention instead of dropping each other's entries.
+        @self._firestore.transactional
+        def merge(transaction: Any) -> bool:
+            snapshot = self.feed_document.get(transaction=transaction)
+            if not snapshot.exists:
+                return False
+            entries = [
+                existing
+                for existing in (snapshot.to_dict() or {}).get("articles") or []
+                if existing.get("url") != entry["url"]
+            ]
+            entries.append(entry)
+            entries.sort(key=lambda item: str(item.get("date_added") or ""), reverse=True)
+            transaction.set(self.feed_document, self._feed_data(entries))
+            return True
+
+        if not merge(self.client.transaction()):
+            self.refresh_latest_feed()
+
+    def _payload_from_doc(self, data: dict[str, Any], *, body: dict[str, Any] | None = None) -> dict[str, Any]:
         url = str(data.get("url") or "")
+        article_id = data.get("id") or _stable_article_id(url)
+        loaders: dict[str, Any] = {}
+        if "article_text" not in data:
+            if body is not None:
+                loaders["article_text"] = partial(_decode_body_doc, body)
+            else:
+                loaders["article_text"] = partial(self._load_article_body, article_id)
         payload = {
-            "id": data.get("id") or _stable_article_id(url),
+            "id": article_id,
             "source": data.get("source"),
             "url": url,
             "title": data.get("title"),
@@ -454,33 +1259,128 @@ class _FirestoreArticleRepository:
             "core_thesis": data.get("core_thesis"),
             "detailed_abstract": data.get("detailed_abstract"),
             "supporting_data_quotes": data.get("supporting_data_quotes"),
+            "supporting_quotes": _quotes_from_stored(
+                data.get("supporting_quotes"),
+                data.get("supporting_data_quotes"),
+                data.get("text_codec"),
+            ),
             "publication_date": coerce_publication_date(data.get("publication_date"), url=url),
             "date_added": data.get("date_added") or _format_date_added(data.get("date_added_ts")),
+            "prompt_tokens": data.get("prompt_tokens"),
+            "output_tokens": data.get("output_tokens"),
+            "summary_status": data.get("summary_status"),
+            "prompt_version": data.get("prompt_version"),
         }
-        return payload
+        return decoded_row(payload, data.get("text_codec"), loaders=loaders)
 
-    def get_latest_articles(self, limit: int = 20) -> list[dict[str, Any]]:
+    def _load_article_body(self, article_id: int) -> str:
+        snapshot = self.bodies.document(str(article_id)).get()
+        return _decode_body_doc(snapshot.to_dict() if snapshot.exists else None)
+
+    def get_latest_articles(self, limit: int = 20, *, include_text: bool = True) -> list[dict[str, Any]]:
         if limit <= 0:
             return []
 
-        docs = (
-            self.collection
-            .order_by("date_added_ts", direction=self._firestore.Query.DESCENDING)
-            .limit(limit)
-            .stream()
-        )
-        return [self._payload_from_doc(doc.to_dict() or {}) for doc in docs]
+        docs = None if include_text else self._read_latest_feed(limit)
+        if docs is None:
+            docs = self._query_latest_docs(limit, include_inline_text=include_text)
+        bodies: dict[str, dict[str, Any]] = {}
+        body_refs = self._body_refs(docs) if include_text else []
+        if body_refs:
+            # One batched read for the page instead of a lookup per card.
+            bodies = {
+                snapshot.id: snapshot.to_dict() or {}
+                for snapshot in self.client.get_all(body_refs)
+                if snapshot.exists
+            }
+        return self._assemble_latest(docs, bodies, include_text=include_text)
 
-    def get_article_by_url(self, url: str) -> dict[str, Any] | None:
-        doc = self.collection.document(_firestore_document_id(url)).get()
-        if doc.exists:
-            return self._payload_from_doc(doc.to_dict() or {})
+    def _body_refs(self, docs: list[dict[str, Any]], *, bodies: Any = None) -> list[Any]:
+        return [
+            (self.bodies if bodies is None else bodies).document(str(data.get("id") or _stable_article_id(str(data.get("url") or ""))))
+            for data in docs
+            if "article_text" not in data
+        ]
+
+    def _assemble_latest(
+        self,
+        docs: list[dict[str, Any]],
+        bodies: dict[str, dict[str, Any]],
+        *,
+        include_text: bool,
+    ) -> list[dict[str, Any]]:
+        payloads = []
+        for data in docs:
+            body = None
+            if include_text and "article_text" not in data:
+                body = bodies.get(str(data.get("id") or _stable_article_id(str(data.get("url") or ""))), {})
+            payload = self._payload_from_doc(data, body=body)
+            if not include_text:
+                del payload["article_text"]
+            payloads.append(payload)
+        return payloads
+
+    def _existing_doc_ref(self, url: str):
+        for document_id in dict.fromkeys(
+            (_firestore_document_id(url), _legacy_firestore_document_id(url))
+        ):
+            doc_ref = self.collection.document(document_id)
+            if doc_ref.get().exists:
+                return doc_ref
+        return None
 
-        matches = list(self.collection.where("url", "==", url).limit(1).stream())
+    def get_article_by_url(self, url: str) -> dict[str, Any] | None:
+        for document_id in dict.fromkeys(
+            (_firestore_document_id(url), _legacy_firestore_document_id(url))
+        ):
+            doc = self.collection.document(document_id).get()
+            if doc.exists:
+                return self._payload_from_doc(doc.to_dict() or {})
+
+        matches = list(self.collection.where("url_key", "==", url_key(url)).limit(1).stream())
+        if not matches:
+            matches = list(self.collection.where("url", "==", url).limit(1).stream())
         if not matches:
             return None
         return self._payload_from_doc(matches[0].to_dict() or {})
 
+    def _article_document(self, article: dict[str, Any]) -> dict[str, Any]:
+        url = canonicalize_url(article["url"])
+        supporting_quotes = article.get("supporting_quotes")
+        date_added = article.get("date_added")
+        payload = {
+            "id": _stable_article_id(url),
+            "source": article["source"],
+            "url": url,
+            "url_key": url_key(url),
+            "title": article["title"],
+            "author": article["author"],
+            "core_thesis": article["core_thesis"],
+            "detailed_abstract": article["detailed_abstract"],
+            "supporting_data_quotes": article["supporting_data_quotes"],
+            "supporting_quotes": (
+                split_quotes(article["supporting_data_quotes"]) if supporting_quotes is None else supporting_quotes
+            ),
+            "publication_date": coerce_publication_date(article.get("publication_date"), url=url),
+            "minhash_signature": _stored_signature(article),
+            "date_added": _format_date_added(date_added)
+            or _format_date_added(datetime.now(timezone.utc)),
+            "date_added_ts": _firestore_timestamp(date_added),
+            "text_codec": self.text_codec_marker,
+            "prompt_tokens": article.get("prompt_tokens"),
+            "output_tokens": article.get("output_tokens"),
+            "summary_status": summary_status(article),
+            "prompt_version": article.get("prompt_version"),
+        }
+        return encode_fields(payload, self.text_codec_marker)
+
+    def _body_document(self, article_text: str) -> dict[str, Any]:
+        body_codec = _body_codec(self.text_codec_marker)
+        return {
+            "article_text": encode_text(article_text, body_codec or CODEC_NONE),
+            "text_codec": body_codec,
+        }
+
     def insert_article(
         self,
         *,
@@ -494,61 +1394,346 @@ class _FirestoreArticleRepository:
         supporting_data_quotes: str,
         publication_date: str | None = None,
         date_added: Any = None,
+        supporting_quotes: list[str] | None = None,
+        prompt_tokens: int | None = None,
+        output_tokens: int | None = None,
+        prompt_version: str | None = None,
+        minhash_signature: tuple[int, ...] | str | None = None,
     ) -> bool:
-        payload = {
-            "id": _stable_article_id(url),
-            "source": source,
-            "url": url,
-            "title": title,
-            "author": author,
-            "article_text": article_text,
-            "core_thesis": core_thesis,
-            "detailed_abstract": detailed_abstract,
-            "supporting_data_quotes": supporting_data_quotes,
-            "publication_date": coerce_publication_date(publication_date, url=url),
-            "date_added": _format_date_added(date_added)
-            or _format_date_added(datetime.now(timezone.utc)),
-            "date_added_ts": _firestore_timestamp(date_added),
-        }
+        url = canonicalize_url(url)
+        if _legacy_firestore_document_id(url) != _firestore_document_id(url):
+            if self.collection.document(_legacy_firestore_document_id(url)).get().exists:
+                return False
+        payload = self._article_document(
+            {
+                "source": source,
+                "url": url,
+                "title": title,
+                "author": author,
+                "article_text": article_text,
+                "core_thesis": core_thesis,
+                "detailed_abstract": detailed_abstract,
+                "supporting_data_quotes": supporting_data_quotes,
+                "publication_date": publication_date,
+                "date_added": date_added,
+                "supporting_quotes": supporting_quotes,
+                "prompt_tokens": prompt_tokens,
+                "output_tokens": output_tokens,
+                "prompt_version": prompt_version,
+                "minhash_signature": minhash_signature,
+            }
+        )
+        # Document, id mapping and body land together or not at all, so a crash cannot
+        # leave an article whose URL blocks re-insertion but whose body is missing.
+        batch = self.client.batch()
+        self._add_article_writes(batch, payload, article_text)
         try:
-            self.collection.document(_firestore_document_id(url)).create(payload)
+            batch.commit()
         except self._already_exists:
             return False
+        self._merge_into_latest_feed(payload)
         return True
 
-    def list_articles_with_publication_dates(self) -> list[dict[str, Any]]:
+    def _add_article_writes(self, batch: Any, payload: dict[str, Any], article_text: str) -> None:
+        document_id = _firestore_document_id(payload["url"])
+        batch.create(self.collection.document(document_id), payload)
+        batch.set(self.article_ids.document(str(payload["id"])), {"document_id": document_id})
+        batch.set(self.bodies.document(str(payload["id"])), self._body_document(article_text))
+
+    def insert_articles(
+        self, articles: Iterable[dict[str, Any]], *, batch_size: int = DEFAULT_BULK_INSERT_BATCH_SIZE
+    ) -> int:
+        # Each article is three writes (document, id mapping, body); a batch holds at most 500.
+        batch_size = max(1, min(batch_size, FIRESTORE_BATCH_WRITE_LIMIT // 3))
+        inserted = 0
+        pending: list[dict[str, Any]] = []
+        for article in articles:
+            pending.append(article)
+            if len(pending) >= batch_size:
+                inserted += self._insert_article_batch(pending)
+                pending = []
+        if pending:
+            inserted += self._insert_article_batch(pending)
+        if inserted:
+            self.refresh_latest_feed()
+        return inserted
+
+    def _insert_article_batch(self, articles: list[dict[str, Any]]) -> int:
+        batch = self.client.batch()
+        for article in articles:
+            self._add_article_writes(batch, self._article_document(article), article["article_text"])
+        try:
+            batch.commit()
+        except self._already_exists:
+            # The whole batch was rejected; insert one by one so only duplicates are skipped.
+            return sum(self.insert_article(**article) for article in articles)
+        return len(articles)
+
+    def list_minhash_signatures(self, since: Any = None) -> list[dict[str, Any]]:
+        query = self.collection
+        if since is not None:
+            query = query.where("date_added_ts", ">", _firestore_timestamp(since))
         rows: list[dict[str, Any]] = []
+        for doc in query.select(["url", "minhash_signature"]).stream():
+            data = doc.to_dict() or {}
+            if not data.get("minhash_signature"):
+                continue
+            rows.append({"url": data.get("url"), "minhash_signature": data["minhash_signature"]})
+        return rows
+
+    def list_articles_with_publication_dates(
+        self,
+        *,
+        page_size: int = DEFAULT_DATED_ARTICLES_PAGE_SIZE,
+    ) -> Iterator[dict[str, Any]]:
+        # A range filter on publication_date would force ordering by it first, so pages
+        # follow the single-field id index and undated documents are dropped here.
+        query = self.collection.order_by("id").select(["id", "source", "url", "title", "publication_date"])
+        cursor: dict[str, Any] | None = None
+        while True:
+            page_query = query.start_after(cursor) if cursor is not None else query
+            page = [doc.to_dict() or {} for doc in page_query.limit(page_size).stream()]
+            for data in page:
+                if not data.get("publication_date"):
+                    continue
+                url = str(data.get("url") or "")
+                yield {
+                    "id": data.get("id") or _stable_article_id(url),
+                    "source": data.get("source"),
+                    "url": url,
+                    "title": data.get("title"),
+                    "publication_date": coerce_publication_date(data.get("publication_date"), url=url),
+                }
+            if len(page) < page_size:
+                return
+            cursor = {"id": page[-1].get("id")}
+
+    def recompress_articles(
+        self,
+        text_codec_marker: str | None,
+        *,
+        batch_size: int = DEFAULT_RECOMPRESS_BATCH_SIZE,
+    ) -> int:
+        rewritten = 0
+        batch = self.client.batch()
+        pending = 0
         for doc in self.collection.stream():
-            payload = self._payload_from_doc(doc.to_dict() or {})
-            if payload.get("publication_date") is None:
+            data = doc.to_dict() or {}
+            if (data.get("text_codec") or None) == text_codec_marker:
                 continue
-            rows.append(
+            values = _reencode_fields(data, data.get("text_codec"), text_codec_marker)
+            values = {field: value for field, value in values.items() if field in data}
+            batch.update(doc.reference, {**values, "text_codec": text_codec_marker})
+            pending += 1
+            if pending >= batch_size:
+                batch.commit()
+                rewritten += pending
+                batch = self.client.batch()
+                pending = 0
+        if pending:
+            batch.commit()
+            rewritten += pending
+
+        body_codec = _body_codec(text_codec_marker)
+        batch = self.client.batch()
+        pending = 0
+        for doc in self.bodies.stream():
+            data = doc.to_dict() or {}
+            if (data.get("text_codec") or None) == body_codec:
+                continue
+            batch.update(
+                doc.reference,
                 {
-                    "id": payload["id"],
-                    "source": payload["source"],
-                    "url": payload["url"],
-                    "title": payload["title"],
-                    "publication_date": payload["publication_date"],
-                }
+                    "article_text": encode_text(_decode_body_doc(data), body_codec or CODEC_NONE),
+                    "text_codec": body_codec,
+                },
             )
-        rows.sort(key=lambda item: int(item["id"]))
-        return rows
+            pending += 1
+            if pending >= batch_size:
+                batch.commit()
+                batch = self.client.batch()
+                pending = 0
+        if pending:
+            batch.commit()
+        return rewritten
+
+    def move_article_bodies(self, *, batch_size: int = DEFAULT_BODY_MIGRATION_BATCH_SIZE) -> int:
+        moved = 0
+        batch = self.client.batch()
+        pending = 0
+        for doc in self.collection.stream():
+            data = doc.to_dict() or {}
+            if "article_text" not in data:
+                continue
+            codec, fields = parse_codec_marker(data.get("text_codec"))
+            if "article_text" not in fields:
+                codec = CODEC_NONE
+            article_id = data.get("id") or _stable_article_id(str(data.get("url") or ""))
+            batch.set(
+                self.bodies.document(str(article_id)),
+                {
+                    "article_text": data.get("article_text") or "",
+                    "text_codec": None if codec == CODEC_NONE else codec,
+                },
+            )
+            batch.update(doc.reference, {"article_text": self._firestore.DELETE_FIELD})
+            pending += 1
+            # Each moved document is two writes; Firestore caps a batch at 500.
+            if pending >= min(batch_size, 250):
+                batch.commit()
+                moved += pending
+                batch = self.client.batch()
+                pending = 0
+        if pending:
+            batch.commit()
+            moved += pending
+        return moved
+
+    def backfill_supporting_quotes(self, *, batch_size: int = DEFAULT_QUOTES_BACKFILL_BATCH_SIZE) -> int:
+        updated = 0
+        batch = self.client.batch()
+        pending = 0
+        query = self.collection.select(["supporting_data_quotes", "supporting_quotes", "text_codec"])
+        for doc in query.stream():
+            data = doc.to_dict() or {}
+            if "supporting_quotes" in data:
+                continue
+            quotes = _quotes_from_stored(None, data.get("supporting_data_quotes"), data.get("text_codec"))
+            batch.update(doc.reference, {"supporting_quotes": quotes})
+            pending += 1
+            if pending >= batch_size:
+                batch.commit()
+                updated += pending
+                batch = self.client.batch()
+                pending = 0
+        if pending:
+            batch.commit()
+            updated += pending
+        if updated:
+            self.refresh_latest_feed()
+        return updated
 
     def _doc_for_article_id(self, article_id: int):
+        mapping = self.article_ids.document(str(article_id)).get()
+        document_id = (mapping.to_dict() or {}).get("document_id") if mapping.exists else None
+        if document_id:
+            return self.collection.document(document_id)
+        # Documents written before the id mapping existed: query once, then remember.
         matches = list(self.collection.where("id", "==", article_id).limit(1).stream())
         if not matches:
             return None
-        return matches[0].reference
+        doc_ref = matches[0].reference
+        self.article_ids.document(str(article_id)).set({"document_id": doc_ref.id})
+        return doc_ref
 
-    def update_article_publication_date(self, article_id: int, publication_date: str | None) -> None:
+    def update_article_publication_date(
+        self, article_id: int, publication_date: str | None, *, refresh_feed: bool = True
+    ) -> None:
         doc_ref = self._doc_for_article_id(article_id)
         if doc_ref is None:
             return
         doc_ref.update({"publication_date": publication_date})
-
-    def update_article_date_added_by_url(self, url: str, date_added: Any) -> None:
-        doc_ref = self.collection.document(_firestore_document_id(url))
-        if not doc_ref.get().exists:
+        if refresh_feed:
+            self.refresh_latest_feed()
+
+    def update_article_summaries(
+        self, updates: Iterable[dict[str, Any]], *, batch_size: int = DEFAULT_SUMMARY_UPDATE_BATCH_SIZE
+    ) -> int:
+        batch_size = max(1, min(batch_size, FIRESTORE_BATCH_WRITE_LIMIT))
+        updated = 0
+        batch = self.client.batch()
+        pending = 0
+        for summary in updates:
+            url = canonicalize_url(summary["url"])
+            snapshot = None
+            for document_id in dict.fromkeys((_firestore_document_id(url), _legacy_firestore_document_id(url))):
+                snapshot = self.collection.document(document_id).get()
+                if snapshot.exists:
+                    break
+            if snapshot is None or not snapshot.exists:
+                continue
+            marker = (snapshot.to_dict() or {}).get("text_codec")
+            values = encode_fields({field: summary[field] for field in SUMMARY_FIELDS}, marker)
+            batch.update(
+                snapshot.reference,
+                {
+                    **values,
+                    "supporting_quotes": split_quotes(summary["supporting_data_quotes"]),
+                    "prompt_tokens": summary.get("prompt_tokens"),
+                    "output_tokens": summary.get("output_tokens"),
+                    "summary_status": summary_status(summary),
+                    "prompt_version": summary.get("prompt_version"),
+                },
+            )
+            pending += 1
+            if pending >= batch_size:
+                batch.commit()
+                updated += pending
+                batch = self.client.batch()
+                pending = 0
+        if pending:
+            batch.commit()
+            updated += pending
+        if updated:
+            self.refresh_latest_feed()
+        return updated
+
+    def backfill_summary_status(self, *, batch_size: int = DEFAULT_SUMMARY_STATUS_BACKFILL_BATCH_SIZE) -> int:
+        batch_size = max(1, min(batch_size, FIRESTORE_BATCH_WRITE_LIMIT))
+        updated = 0
+        batch = self.client.batch()
+        pending = 0
+        query = self.collection.select([*SUMMARY_FIELDS, "text_codec", "summary_status", "prompt_version"])
+        for doc in query.stream():
+            data = doc.to_dict() or {}
+            if data.get("summary_status"):
+                continue
+            values = {"summary_status": summary_status(_decoded_summaries(data, data.get("text_codec")))}
+            if "prompt_version" not in data:
+                # Firestore only matches == None on fields that exist, so untagged rows get an explicit null.
+                values["prompt_version"] = None
+            batch.update(doc.reference, values)
+            pending += 1
+            if pending >= batch_size:
+                batch.commit()
+                updated += pending
+                batch = self.client.batch()
+                pending = 0
+        if pending:
+            batch.commit()
+            updated += pending
+        return updated
+
+    def list_articles_to_resummarize(
+        self,
+        *,
+        failed: bool = True,
+        prompt_versions: Iterable[str | None] = (),
+        after_id: int = 0,
+        limit: int = DEFAULT_RESUMMARIZE_PAGE_SIZE,
+    ) -> list[dict[str, Any]]:
+        """One page of matches, merged from one indexed query per condition (Firestore has no OR here)."""
+        prompt_versions = list(prompt_versions)
+        queries = []
+        if failed:
+            queries.append(self.collection.where("summary_status", "==", SUMMARY_STATUS_FAILED))
+        tagged = [version for version in prompt_versions if version is not None]
+        if tagged:
+            queries.append(self.collection.where("prompt_version", "in", tagged))
+        if None in prompt_versions:
+            queries.append(self.collection.where("prompt_version", "==", None))
+        if limit <= 0:
+            return []
+        docs: dict[int, dict[str, Any]] = {}
+        for query in queries:
+            for doc in query.order_by("id").start_after({"id": after_id}).limit(limit).stream():
+                data = doc.to_dict() or {}
+                docs[data["id"]] = data
+        return [self._payload_from_doc(docs[article_id]) for article_id in sorted(docs)[:limit]]
+
+    def update_article_date_added_by_url(self, url: str, date_added: Any, *, refresh_feed: bool = True) -> None:
+        doc_ref = self._existing_doc_ref(url)
+        if doc_ref is None:
             return
         doc_ref.update(
             {
@@ -556,34 +1741,77 @@ class _FirestoreArticleRepository:
                 "date_added_ts": _firestore_timestamp(date_added),
             }
         )
+        if refresh_feed:
+            self.refresh_latest_feed()
 
 
+@instrument_methods("db")
 class ArticleRepository:
-    def __init__(self, database_url: str | None = None, sqlite_path: str | None = None):
+    def __init__(
+        self,
+        database_url: str | None = None,
+        sqlite_path: str | None = None,
+        *,
+        text_codec: str | None = None,
+        compress_summaries: bool | None = None,
+        read_only: bool = False,
+        read_database_url: str | None = None,
+    ):
+        """Open the article store.
+
+        Reads go to ``read_database_url`` (default: DATABASE_READ_URL when the primary
+        comes from the environment) and writes to the primary. After a write, this
+        repository keeps reading from the primary for DB_READ_YOUR_WRITES_SECONDS.
+        """
+        text_codec_marker = _resolve_codec_marker(text_codec, compress_summaries)
         if _should_use_firestore(database_url):
             project_id, collection_name = _resolve_firestore_target(database_url)
             self.database_url = f"firestore://{project_id}/{collection_name}"
             self.engine: Engine | None = None
+            self.metric_labels = {"backend": "firestore"}
             self._backend: _SqlArticleRepository | _FirestoreArticleRepository = _FirestoreArticleRepository(
                 project_id=project_id,
                 collection_name=collection_name,
+                text_codec_marker=text_codec_marker,
             )
             self.ensure_schema()
             return
 
         resolved_url = normalize_database_url(database_url) if database_url else resolve_database_url(sqlite_path)
+        if read_only:
+            resolved_url = sqlite_read_only_url(resolved_url)
+        if read_database_url is None and database_url is None:
+            read_database_url = os.getenv("DATABASE_READ_URL") or None
         self.database_url = resolved_url
-        self._backend = _SqlArticleRepository(resolved_url)
+        self._backend = _SqlArticleRepository(
+            resolved_url,
+            text_codec_marker=text_codec_marker,
+            read_database_url=normalize_database_url(read_database_url) if read_database_url else None,
+        )
         self.engine = self._backend.engine
+        self.metric_labels = {"backend": self.engine.dialect.name}
 
     def close(self) -> None:
         self._backend.close()
 
+    @property
+    def firestore_handle(self) -> FirestoreHandle | None:
+        """The Firestore client and articles collection name; None on a SQL backend."""
+        backend = self._backend
+        if not isinstance(backend, _FirestoreArticleRepository):
+            return None
+        return FirestoreHandle(backend.client, backend._firestore, backend._already_exists, backend.collection_name)
+
+    def get_pool_stats(self) -> dict[str, Any]:
+        """Connection-pool counters and gauges (empty for Firestore)."""
+        return self._backend.get_pool_stats()
+
     def ensure_schema(self) -> None:
         self._backend.ensure_schema()
 
-    def get_latest_articles(self, limit: int = 20) -> list[dict[str, Any]]:
-        return self._backend.get_latest_articles(limit=limit)
+    def get_latest_articles(self, limit: int = 20, *, include_text: bool = True) -> list[dict[str, Any]]:
+        """Return the newest articles; include_text=False skips fetching article bodies."""
+        return self._backend.get_latest_articles(limit=limit, include_text=include_text)
 
     def get_article_by_url(self, url: str) -> dict[str, Any] | None:
         return self._backend.get_article_by_url(url)
@@ -601,7 +1829,17 @@ class ArticleRepository:
         supporting_data_quotes: str,
         publication_date: str | None = None,
         date_added: Any = None,
+        supporting_quotes: list[str] | None = None,
+        prompt_tokens: int | None = None,
+        output_tokens: int | None = None,
+        prompt_version: str | None = None,
+        minhash_signature: tuple[int, ...] | str | None = None,
     ) -> bool:
+        """Store one article; False if its URL is already there.
+
+        Pass ``minhash_signature`` when the near-duplicate check already computed it.
+        Otherwise it is computed here, unless NEAR_DUPLICATE_DETECTION=0.
+        """
         return self._backend.insert_article(
             source=source,
             url=url,
@@ -613,13 +1851,105 @@ class ArticleRepository:
             supporting_data_quotes=supporting_data_quotes,
             publication_date=publication_date,
             date_added=date_added,
+            supporting_quotes=supporting_quotes,
+            prompt_tokens=prompt_tokens,
+            output_tokens=output_tokens,
+            prompt_version=prompt_version,
+            minhash_signature=minhash_signature,
         )
 
-    def list_articles_with_publication_dates(self) -> list[dict[str, Any]]:
+    def insert_articles(
+        self, articles: Iterable[dict[str, Any]], *, batch_size: int = DEFAULT_BULK_INSERT_BATCH_SIZE
+    ) -> int:
+        """Bulk-insert articles (dicts of insert_article's keyword arguments); returns rows inserted.
+
+        Batches are written in one transaction or Firestore batch each; a batch containing a
+        duplicate falls back to per-article inserts so duplicates are skipped, not fatal.
+        """
+        return self._backend.insert_articles(articles, batch_size=batch_size)
+
+    def list_minhash_signatures(self, since: Any = None) -> list[dict[str, Any]]:
+        """URL and stored MinHash signature of each article, only those added after ``since`` if given."""
+        return self._backend.list_minhash_signatures(since)
+
+    def list_articles_with_publication_dates(self) -> Iterator[dict[str, Any]]:
+        """Yield every dated article (id, source, url, title, publication_date) in id order.
+
+        Both backends read a page at a time, so callers that stop early read no further.
+        """
         return self._backend.list_articles_with_publication_dates()
 
-    def update_article_publication_date(self, article_id: int, publication_date: str | None) -> None:
-        self._backend.update_article_publication_date(article_id, publication_date)
+    def update_article_publication_date(
+        self, article_id: int, publication_date: str | None, *, refresh_feed: bool = True
+    ) -> None:
+        """Set one article's publication date.
+
+        Firestore rebuilds the feed document after the write; loops over many rows pass
+        ``refresh_feed=False`` and call refresh_latest_feed() once at the end.
+        """
+        self._backend.update_article_publication_date(article_id, publication_date, refresh_feed=refresh_feed)
+
+    def update_article_summaries(
+        self, updates: Iterable[dict[str, Any]], *, batch_size: int = DEFAULT_SUMMARY_UPDATE_BATCH_SIZE
+    ) -> int:
+        """Replace the three summaries (and token counts) of existing articles; returns rows updated.
+
+        Each update is a dict with ``url``, ``core_thesis``, ``detailed_abstract``,
+        ``supporting_data_quotes`` and optionally ``prompt_tokens``/``output_tokens`` and
+        ``prompt_version``. The row's summary_status is recomputed. Unknown URLs are skipped.
+        Writes go out ``batch_size`` rows per statement or batch.
+        """
+        return self._backend.update_article_summaries(updates, batch_size=batch_size)
+
+    def backfill_summary_status(self, *, batch_size: int = DEFAULT_SUMMARY_STATUS_BACKFILL_BATCH_SIZE) -> int:
+        """Set summary_status on rows written before it existed, so they show up in the indexed queries."""
+        return self._backend.backfill_summary_status(batch_size=batch_size)
+
+    def list_articles_to_resummarize(
+        self,
+        *,
+        failed: bool = True,
+        prompt_versions: Iterable[str | None] = (),
+        after_id: int = 0,
+        limit: int = DEFAULT_RESUMMARIZE_PAGE_SIZE,
+    ) -> list[dict[str, Any]]:
+        """Return up to ``limit`` articles (with article_text) whose summaries need redoing.
+
+        Matches rows whose summaries failed (``failed``) or that were written with one of
+        ``prompt_versions`` (None matches untagged rows), ordered by id after ``after_id``.
+        Rows are found by the summary_status/prompt_version indexes, so run
+        backfill_summary_status() once on data written before those columns existed.
+        """
+        return self._backend.list_articles_to_resummarize(
+            failed=failed, prompt_versions=prompt_versions, after_id=after_id, limit=limit
+        )
+
+    def update_article_date_added_by_url(self, url: str, date_added: Any, *, refresh_feed: bool = True) -> None:
+        """Set one article's date_added; ``refresh_feed`` works as in update_article_publication_date()."""
+        self._backend.update_article_date_added_by_url(url, date_added, refresh_feed=refresh_feed)
 
-    def update_article_date_added_by_url(self, url: str, date_added: Any) -> None:
-        self._backend.update_article_date_added_by_url(url, date_added)
+    def refresh_latest_feed(self) -> None:
+        """Rebuild the denormalized latest-feed document (Firestore only; no-op for SQL)."""
+        self._backend.refresh_latest_feed()
+
+    def move_article_bodies(self, *, batch_size: int = DEFAULT_BODY_MIGRATION_BATCH_SIZE) -> int:
+        """Move article text stored inline on legacy rows into the article bodies store."""
+        return self._backend.move_article_bodies(batch_size=batch_size)
+
+    def backfill_supporting_quotes(self, *, batch_size: int = DEFAULT_QUOTES_BACKFILL_BATCH_SIZE) -> int:
+        """Store the structured quote list on rows that only have the '*'-delimited string."""
+        return self._backend.backfill_supporting_quotes(batch_size=batch_size)
+
+    def recompress_articles(
+        self,
+        text_codec: str | None = None,
+        *,
+        compress_summaries: bool | None = None,
+        batch_size: int = DEFAULT_RECOMPRESS_BATCH_SIZE,
+    ) -> int:
+        """Rewrite stored rows with the requested codec (defaults to the repository's)."""
+        if text_codec is None and compress_summaries is None:
+            marker = self._backend.text_codec_marker
+        else:
+            marker = _resolve_codec_marker(text_codec, compress_summaries)
+        return self._backend.recompress_articles(marker, batch_size=batch_size)
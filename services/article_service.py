@@ -5,48 +5,113 @@ import os
 from models.article import Article
 from models.sources import normalize_article_source
 from services.article_repository import ArticleRepository, resolve_articles_db_path as _resolve_articles_db_path
+from services.async_article_repository import AsyncArticleRepository
+from services.feed_snapshot import FeedSnapshot, feed_snapshot_path, feed_snapshot_serving_enabled
 
 
 def resolve_articles_db_path() -> str:
     return _resolve_articles_db_path()
 
 
+def api_read_only_enabled() -> bool:
+    """API workers open SQLite with mode=ro when API_READ_ONLY=1."""
+    return os.getenv("API_READ_ONLY", "0") == "1"
+
+
 class ArticleService:
-    def __init__(self, db_path: str | None = None, database_url: str | None = None):
-        self.repository = ArticleRepository(database_url=database_url, sqlite_path=db_path)
+    def __init__(self, db_path: str | None = None, database_url: str | None = None, *, read_only: bool | None = None):
+        if feed_snapshot_serving_enabled():
+            # Serve the prebuilt feed file; no database connection at all.
+            self.repository: ArticleRepository | FeedSnapshot = FeedSnapshot(feed_snapshot_path())
+            return
+        self.repository = ArticleRepository(
+            database_url=database_url,
+            sqlite_path=db_path,
+            read_only=api_read_only_enabled() if read_only is None else read_only,
+        )
 
-    def get_latest_articles(self, limit: int = 10) -> list[Article]:
+    def get_latest_articles(self, limit: int = 10, *, include_text: bool = True) -> list[Article]:
         """Fetch latest articles sorted by date_added DESC."""
-        rows = self.repository.get_latest_articles(limit=limit)
+        rows = self.repository.get_latest_articles(limit=limit, include_text=include_text)
+        return articles_from_rows(rows)
+
+
+class AsyncArticleService:
+    """ArticleService for the FastAPI app; reads never block the event loop."""
+
+    def __init__(self, db_path: str | None = None, database_url: str | None = None, *, read_only: bool | None = None):
+        self.snapshot: FeedSnapshot | None = None
+        self.repository: AsyncArticleRepository | None = None
+        if feed_snapshot_serving_enabled():
+            self.snapshot = FeedSnapshot(feed_snapshot_path())
+            return
+        self.repository = AsyncArticleRepository(
+            database_url=database_url,
+            sqlite_path=db_path,
+            read_only=api_read_only_enabled() if read_only is None else read_only,
+        )
+
+    async def get_latest_articles(self, limit: int = 10, *, include_text: bool = True) -> list[Article]:
+        """Fetch latest articles sorted by date_added DESC."""
+        if self.snapshot is not None:
+            # In-memory after the first load; only a throttled stat() touches the disk.
+            rows = self.snapshot.get_latest_articles(limit=limit, include_text=include_text)
+        else:
+            rows = await self.repository.get_latest_articles(limit=limit, include_text=include_text)
+        return articles_from_rows(rows)
+
+
+def articles_from_rows(rows: list[dict]) -> list[Article]:
+    """Build Article models from repository rows, normalizing legacy source names."""
+    articles: list[Article] = []
+    for row in rows:
+        data = dict(row)
+        try:
+            data["source"] = normalize_article_source(data["source"])
+        except ValueError:
+            # Leave unknown source values untouched so one bad row doesn't break the API.
+            pass
+        articles.append(Article(**data))
 
-        articles: list[Article] = []
-        for row in rows:
-            data = dict(row)
-            try:
-                data["source"] = normalize_article_source(data["source"])
-            except ValueError:
-                # Leave unknown source values untouched so one bad row doesn't break the API.
-                pass
-            articles.append(Article(**data))
+    return articles
 
-        return articles
 
+_ServiceKey = tuple[str | None, ...]
 
 _cached_service: ArticleService | None = None
-_cached_key: tuple[str | None, str | None, str | None, str | None, str | None, str | None] | None = None
+_cached_key: _ServiceKey | None = None
+_cached_async_service: AsyncArticleService | None = None
+_cached_async_key: _ServiceKey | None = None
 
 
-def get_cached_article_service() -> ArticleService:
-    global _cached_key, _cached_service
-    key = (
+def _service_cache_key() -> _ServiceKey:
+    return (
         os.getenv("DATABASE_URL"),
+        os.getenv("DATABASE_READ_URL"),
         os.getenv("ARTICLES_DB_PATH"),
         os.getenv("FPFA_DB_PATH"),
         os.getenv("ARTICLE_STORE"),
         os.getenv("FIRESTORE_PROJECT_ID"),
         os.getenv("ARTICLES_COLLECTION"),
+        os.getenv("API_READ_ONLY"),
+        os.getenv("FEED_SNAPSHOT_SERVE"),
+        os.getenv("FEED_SNAPSHOT_PATH"),
     )
+
+
+def get_cached_article_service() -> ArticleService:
+    global _cached_key, _cached_service
+    key = _service_cache_key()
     if _cached_service is None or _cached_key != key:
         _cached_service = ArticleService()
         _cached_key = key
     return _cached_service
+
+
+def get_cached_async_article_service() -> AsyncArticleService:
+    global _cached_async_key, _cached_async_service
+    key = _service_cache_key()
+    if _cached_async_service is None or _cached_async_key != key:
+        _cached_async_service = AsyncArticleService()
+        _cached_async_key = key
+    return _cached_async_service
@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+import hashlib
+import re
+from urllib.parse import parse_qsl, urlencode, urljoin, urlsplit, urlunsplit
+
+
+URL_KEY_LENGTH = 64
+TRACKING_PARAM_PREFIXES = ("utm_",)
+TRACKING_PARAMS = frozenset(
+    {
+        "fbclid",
+        "gclid",
+        "dclid",
+        "msclkid",
+        "igshid",
+        "mc_cid",
+        "mc_eid",
+        "_ga",
+        "_gl",
+        "cmpid",
+        "s_cid",
+        "tpcc",
+        "ref",
+        "ref_src",
+        "check_logged_in",
+    }
+)
+_DEFAULT_PORTS = {"http": 80, "https": 443}
+_DUPLICATE_SLASHES_RE = re.compile(r"/{2,}")
+
+
+def _is_tracking_param(name: str) -> bool:
+    lowered = name.lower()
+    return lowered in TRACKING_PARAMS or lowered.startswith(TRACKING_PARAM_PREFIXES)
+
+
+def canonicalize_url(url: str, *, base_url: str | None = None) -> str:
+    """Return a stable form of an article URL.
+
+    Relative hrefs are resolved against ``base_url``; the scheme is upgraded to
+    https, the host is lowercased, default ports, fragments and tracking query
+    parameters are dropped and the remaining query parameters are sorted.
+    """
+    value = (url or "").strip()
+    if base_url:
+        value = urljoin(base_url, value)
+
+    parts = urlsplit(value)
+    scheme = parts.scheme.lower()
+    if scheme not in _DEFAULT_PORTS or not parts.hostname:
+        return value
+
+    host = parts.hostname.lower()
+    if parts.port and parts.port not in _DEFAULT_PORTS.values():
+        host = f"{host}:{parts.port}"
+
+    path = _DUPLICATE_SLASHES_RE.sub("/", parts.path or "/")
+    query_pairs = [
+        (name, param_value)
+        for name, param_value in parse_qsl(parts.query, keep_blank_values=True)
+        if not _is_tracking_param(name)
+    ]
+    query = urlencode(sorted(query_pairs))
+    return urlunsplit(("https", host, path, query, ""))
+
+
+def url_key(url: str) -> str:
+    """Return the fixed-width dedupe key for an article URL.
+
+    The key also ignores a leading ``www.`` and a trailing slash, so every
+    spelling of the same article collapses onto one indexed value.
+    """
+    canonical = canonicalize_url(url)
+    parts = urlsplit(canonical)
+    host = parts.netloc
+    if host.startswith("www."):
+        host = host[len("www.") :]
+    path = parts.path.rstrip("/") or "/"
+    key_source = urlunsplit((parts.scheme, host, path, parts.query, ""))
+    return hashlib.sha256(key_source.encode("utf-8")).hexdigest()
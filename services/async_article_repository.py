@@ -0,0 +1,148 @@
+from __future__ import annotations
+
+import asyncio
+import importlib.util
+from typing import Any
+
+from sqlalchemy.engine import make_url
+
+from services.article_repository import (
+    ArticleRepository,
+    _FirestoreArticleRepository,
+    _latest_articles_statement,
+    _sql_row_payload,
+)
+from services.database_engine import attach_sqlite_pragmas, engine_options
+from services.instrumentation import timed
+
+
+# Asyncio driver (which is also the module it imports) for each SQL backend that has one.
+_ASYNC_DRIVERS = {
+    "sqlite": "aiosqlite",
+    "postgresql": "asyncpg",
+    "mysql": "aiomysql",
+}
+
+
+def async_database_url(database_url: str) -> str | None:
+    """Return the async-driver form of a SQLAlchemy URL, or None when none is usable.
+
+    SQL Server (pymssql/pyodbc) has no asyncio driver, so those URLs return None and
+    the caller offloads the sync repository to a worker thread instead.
+    """
+    url = make_url(database_url)
+    backend = url.get_backend_name()
+    driver = _ASYNC_DRIVERS.get(backend)
+    if driver is None or importlib.util.find_spec(driver) is None:
+        return None
+    return url.set(drivername=f"{backend}+{driver}").render_as_string(hide_password=False)
+
+
+def _create_async_engine(async_url: str, database_url: str) -> Any:
+    try:
+        from sqlalchemy.ext.asyncio import create_async_engine
+    except ImportError:
+        # SQLAlchemy's asyncio layer needs greenlet; without it reads fall back to threads.
+        return None
+    engine = create_async_engine(async_url, **engine_options(database_url))
+    attach_sqlite_pragmas(engine.sync_engine, database_url)
+    return engine
+
+
+def _create_firestore_async_client(project_id: str) -> Any:
+    from google.cloud import firestore
+
+    return firestore.AsyncClient(project=project_id)
+
+
+class _AsyncFirestoreReader:
+    """Feed reads through the Firestore AsyncClient; payloads are assembled by the sync backend."""
+
+    def __init__(self, backend: _FirestoreArticleRepository):
+        self._backend = backend
+        self.client = _create_firestore_async_client(backend.project_id)
+        self.collection = self.client.collection(backend.collection_name)
+        self.bodies = self.client.collection(f"{backend.collection_name}_bodies")
+        self.feed_document = self.client.collection(f"{backend.collection_name}_feed").document("latest")
+
+    def close(self) -> None:
+        self.client.close()
+
+    async def get_latest_articles(self, limit: int, *, include_text: bool) -> list[dict[str, Any]]:
+        if limit <= 0:
+            return []
+        docs = None
+        if not include_text and limit <= self._backend.feed_size:
+            docs = self._backend._feed_entries(await self.feed_document.get(), limit)
+        if docs is None:
+            query = self._backend._latest_docs_query(
+                limit,
+                include_inline_text=include_text,
+                collection=self.collection,
+            )
+            docs = [doc.to_dict() or {} async for doc in query.stream()]
+        bodies: dict[str, dict[str, Any]] = {}
+        body_refs = self._backend._body_refs(docs, bodies=self.bodies) if include_text else []
+        if body_refs:
+            bodies = {
+                snapshot.id: snapshot.to_dict() or {}
+                async for snapshot in self.client.get_all(body_refs)
+                if snapshot.exists
+            }
+        return self._backend._assemble_latest(docs, bodies, include_text=include_text)
+
+
+class AsyncArticleRepository:
+    """Awaitable feed reads for the FastAPI app.
+
+    SQL backends with an asyncio driver (aiosqlite, asyncpg, aiomysql) query through
+    SQLAlchemy's async engine; Firestore goes through ``AsyncClient``. Anything else,
+    notably SQL Server via pymssql, runs the sync repository in a worker thread so the
+    event loop is never blocked. Schema setup and configuration are shared with
+    :class:`ArticleRepository`.
+    """
+
+    def __init__(self, database_url: str | None = None, sqlite_path: str | None = None, *, read_only: bool = False):
+        self._sync = ArticleRepository(database_url=database_url, sqlite_path=sqlite_path, read_only=read_only)
+        self.database_url = self._sync.database_url
+        self.engine: Any = None
+        self._firestore: _AsyncFirestoreReader | None = None
+
+        backend = self._sync._backend
+        if isinstance(backend, _FirestoreArticleRepository):
+            self._firestore = _AsyncFirestoreReader(backend)
+            return
+        # The API only reads, so the async engine targets the replica when one is configured.
+        read_url = backend.read_database_url
+        async_url = async_database_url(read_url)
+        if async_url is not None:
+            self.engine = _create_async_engine(async_url, read_url)
+
+    @property
+    def mode(self) -> str:
+        """Which read path is in use: ``firestore``, ``async`` or ``thread``."""
+        if self._firestore is not None:
+            return "firestore"
+        return "async" if self.engine is not None else "thread"
+
+    async def aclose(self) -> None:
+        if self.engine is not None:
+            await self.engine.dispose()
+        if self._firestore is not None:
+            self._firestore.close()
+        await asyncio.to_thread(self._sync.close)
+
+    async def get_latest_articles(self, limit: int = 20, *, include_text: bool = True) -> list[dict[str, Any]]:
+        """Return the newest articles; include_text=False skips fetching article bodies."""
+        if self.engine is None and self._firestore is None:
+            # The sync repository times this call itself.
+            return await asyncio.to_thread(self._sync.get_latest_articles, limit, include_text=include_text)
+        with timed("db.get_latest_articles", **self._sync.metric_labels):
+            if self._firestore is not None:
+                return await self._firestore.get_latest_articles(limit, include_text=include_text)
+            if limit <= 0:
+                return []
+            stmt = _latest_articles_statement(limit, include_text=include_text)
+            async with self.engine.connect() as conn:
+                rows = (await conn.execute(stmt)).mappings().all()
+            return [_sql_row_payload(row) for row in rows]
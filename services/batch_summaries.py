@@ -0,0 +1,207 @@
+"""Re-summarize many stored articles through Gemini Batch API jobs.
+
+Interactive re-summarization costs three synchronous ``generate_content`` calls per
+article and competes with ingestion for the rate limit. Here the three prompts of every
+article go into one asynchronous batch job (split into several only when the inline
+payload limit requires it). The jobs are polled until they finish, and the results are
+written back in bulk with ``ArticleRepository.update_article_summaries``. An article is
+only updated when all three of its summaries came back, so a partial failure never mixes
+old and new summaries.
+"""
+from __future__ import annotations
+
+import json
+import os
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Iterable
+
+from services.instrumentation import increment, timed
+from services.llm_client import SUMMARY_MODEL
+from services.summary_budget import strip_boilerplate
+from services.text_codec import SUMMARY_FIELDS
+
+DEFAULT_POLL_INTERVAL_S = 30.0
+DEFAULT_TIMEOUT_S = 24 * 3600.0
+# Inline batch requests are capped at 20 MB per job; leave room for the JSON envelope.
+DEFAULT_MAX_JOB_BYTES = 15_000_000
+SUCCEEDED_STATES = frozenset({"JOB_STATE_SUCCEEDED", "JOB_STATE_PARTIALLY_SUCCEEDED"})
+FAILED_STATES = frozenset({"JOB_STATE_FAILED", "JOB_STATE_CANCELLED", "JOB_STATE_EXPIRED"})
+
+PromptBuilders = tuple[Callable[[dict[str, Any]], str], ...]
+
+
+class BatchJobError(RuntimeError):
+    """A batch job ended without results, or did not finish before the timeout."""
+
+
+def resolve_poll_interval_s() -> float:
+    raw_value = os.getenv("GEMINI_BATCH_POLL_SECONDS", "").strip()
+    return max(0.0, float(raw_value)) if raw_value else DEFAULT_POLL_INTERVAL_S
+
+
+def _state_name(job: Any) -> str:
+    state = getattr(job, "state", None)
+    return str(getattr(state, "name", None) or state)
+
+
+@dataclass
+class BatchRun:
+    jobs: list[str] = field(default_factory=list)
+    requested: int = 0
+    updated: int = 0
+    failed: list[str] = field(default_factory=list)
+
+
+@dataclass
+class _Entry:
+    url: str
+    field: str
+    request: dict[str, Any]
+    prompt_version: str | None = None
+
+
+class BatchSummarizer:
+    """Submit, poll and collect summary batch jobs.
+
+    ``prompts_for(article)`` returns the article's core-thesis, abstract and quotes
+    prompt builders (``SourceAdapter.prompts`` of its source), or None to skip it;
+    ``prompt_version_for(article)`` names the version stored with the new summaries.
+    """
+
+    def __init__(
+        self,
+        client: Any,
+        prompts_for: Callable[[dict[str, Any]], PromptBuilders | None],
+        *,
+        prompt_version_for: Callable[[dict[str, Any]], str | None] = lambda article: None,
+        model: str = SUMMARY_MODEL,
+        poll_interval_s: float | None = None,
+        timeout_s: float = DEFAULT_TIMEOUT_S,
+        max_job_bytes: int = DEFAULT_MAX_JOB_BYTES,
+        sleep: Callable[[float], None] = time.sleep,
+        clock: Callable[[], float] = time.monotonic,
+        log: Callable[[str], None] = print,
+    ):
+        self.client = client
+        self.prompts_for = prompts_for
+        self.prompt_version_for = prompt_version_for
+        self.model = model
+        self.poll_interval_s = resolve_poll_interval_s() if poll_interval_s is None else poll_interval_s
+        self.timeout_s = timeout_s
+        self.max_job_bytes = max_job_bytes
+        self._sleep = sleep
+        self._clock = clock
+        self.log = log
+
+    def build_requests(self, articles: Iterable[dict[str, Any]]) -> list[_Entry]:
+        entries = []
+        for article in articles:
+            builders = self.prompts_for(article)
+            if not builders:
+                self.log(f"[SKIP] No prompts for source {article.get('source')!r}: {article['url']}")
+                continue
+            prompt_article = {
+                "title": article["title"],
+                "author": article["author"],
+                "text": strip_boilerplate(article["article_text"]),
+            }
+            prompt_version = self.prompt_version_for(article)
+            for name, build in zip(SUMMARY_FIELDS, builders):
+                entries.append(
+                    _Entry(
+                        url=article["url"],
+                        field=name,
+                        request={
+                            "contents": [{"role": "user", "parts": [{"text": build(prompt_article)}]}],
+                            "metadata": {"url": article["url"], "field": name},
+                        },
+                        prompt_version=prompt_version,
+                    )
+                )
+        return entries
+
+    def _split(self, entries: list[_Entry]) -> list[list[_Entry]]:
+        """Group entries into jobs under the payload limit, keeping each article in one job."""
+        jobs: list[list[_Entry]] = []
+        current: list[_Entry] = []
+        size = 0
+        for start in range(0, len(entries), len(SUMMARY_FIELDS)):
+            article_entries = entries[start : start + len(SUMMARY_FIELDS)]
+            article_size = sum(len(json.dumps(entry.request)) for entry in article_entries)
+            if current and size + article_size > self.max_job_bytes:
+                jobs.append(current)
+                current, size = [], 0
+            current += article_entries
+            size += article_size
+        if current:
+            jobs.append(current)
+        return jobs
+
+    def submit(self, entries: list[_Entry]) -> str:
+        job = self.client.batches.create(
+            model=self.model,
+            src=[entry.request for entry in entries],
+            config={"display_name": f"fpfa-resummarize-{len(entries) // len(SUMMARY_FIELDS)}"},
+        )
+        increment("llm.batch_jobs")
+        increment("llm.batch_requests", len(entries))
+        self.log(f"[INFO] Submitted batch job {job.name} with {len(entries)} request(s).")
+        return job.name
+
+    @timed("llm.batch_wait")
+    def wait(self, name: str) -> Any:
+        deadline = self._clock() + self.timeout_s
+        while True:
+            job = self.client.batches.get(name=name)
+            state = _state_name(job)
+            if state in SUCCEEDED_STATES:
+                return job
+            if state in FAILED_STATES:
+                raise BatchJobError(f"Batch job {name} ended in {state}: {getattr(job, 'error', None)}")
+            if self._clock() >= deadline:
+                raise BatchJobError(f"Batch job {name} still {state} after {self.timeout_s:.0f}s")
+            self._sleep(self.poll_interval_s)
+
+    @staticmethod
+    def collect(job: Any, entries: list[_Entry]) -> dict[str, dict[str, Any]]:
+        """Summaries per URL from a finished job; failed requests are left out."""
+        responses = list(getattr(getattr(job, "dest", None), "inlined_responses", None) or [])
+        results: dict[str, dict[str, Any]] = {}
+        for index, entry in enumerate(entries):
+            inlined = responses[index] if index < len(responses) else None
+            response = getattr(inlined, "response", None)
+            text = getattr(response, "text", None) if response is not None else None
+            if getattr(inlined, "error", None) or not text:
+                increment("llm.batch_failures")
+                continue
+            usage = getattr(response, "usage_metadata", None)
+            result = results.setdefault(
+                entry.url,
+                {"url": entry.url, "prompt_tokens": 0, "output_tokens": 0, "prompt_version": entry.prompt_version},
+            )
+            result[entry.field] = text.strip()
+            result["prompt_tokens"] += getattr(usage, "prompt_token_count", None) or 0
+            result["output_tokens"] += getattr(usage, "candidates_token_count", None) or 0
+        return results
+
+    def run(self, articles: Iterable[dict[str, Any]], repo: Any) -> BatchRun:
+        """Re-summarize ``articles`` (repository payloads with article_text) and store the results."""
+        entries = self.build_requests(articles)
+        run = BatchRun(requested=len(entries) // len(SUMMARY_FIELDS))
+        if not entries:
+            return run
+        # Submit every job first so they run concurrently on Google's side.
+        submitted = [(self.submit(chunk), chunk) for chunk in self._split(entries)]
+        run.jobs = [name for name, _ in submitted]
+        for name, chunk in submitted:
+            try:
+                results = self.collect(self.wait(name), chunk)
+            except BatchJobError as exc:
+                self.log(f"[ERROR] {exc}")
+                results = {}
+            complete = [result for result in results.values() if all(key in result for key in SUMMARY_FIELDS)]
+            run.updated += repo.update_article_summaries(complete)
+            done = {result["url"] for result in complete}
+            run.failed += list(dict.fromkeys(entry.url for entry in chunk if entry.url not in done))
+        return run
@@ -0,0 +1,131 @@
+from __future__ import annotations
+
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from collections.abc import Mapping
+from pathlib import Path
+from typing import Any, Iterable
+
+from jinja2 import Environment, FileSystemLoader, select_autoescape
+from markupsafe import Markup
+
+from models.article import Article
+from models.sources import ArticleSource
+from services.instrumentation import increment
+from template_utils import safe_date, split_quotes
+
+
+CARD_TEMPLATE = "_card.html"
+DEFAULT_CARD_CACHE_SIZE = 2048
+TEMPLATES_DIR = Path(__file__).resolve().parents[1] / "templates"
+# Inputs that change what a card looks like; anything else (article_text) is ignored.
+_CARD_INPUT_FIELDS = (
+    "source",
+    "url",
+    "title",
+    "author",
+    "core_thesis",
+    "detailed_abstract",
+    "supporting_data_quotes",
+    "supporting_quotes",
+    "publication_date",
+    "date_added",
+)
+
+
+def resolve_card_cache_size() -> int:
+    raw_value = os.getenv("CARD_CACHE_SIZE", "").strip()
+    return int(raw_value) if raw_value else DEFAULT_CARD_CACHE_SIZE
+
+
+def _card_inputs(article: Article | Mapping[str, Any]) -> dict[str, Any]:
+    if isinstance(article, Mapping):
+        return {name: article.get(name) for name in ("id", *_CARD_INPUT_FIELDS)}
+    return {name: getattr(article, name, None) for name in ("id", *_CARD_INPUT_FIELDS)}
+
+
+def card_cache_key(article: Article | Mapping[str, Any]) -> tuple[Any, str]:
+    """Return (article id, content hash) for a card's visible inputs."""
+    inputs = _card_inputs(article)
+    digest = hashlib.blake2b(digest_size=16)
+    for name in _CARD_INPUT_FIELDS:
+        value = inputs[name]
+        if isinstance(value, (list, tuple)):
+            value = "*".join(str(item) for item in value)
+        digest.update(b"\x00" if value is None else str(value).encode("utf-8"))
+        digest.update(b"\x1f")
+    return inputs["id"], digest.hexdigest()
+
+
+def card_display_fields(article: Article | Mapping[str, Any]) -> dict[str, Any]:
+    """Everything _card.html needs, computed once per card instead of in the template."""
+    inputs = _card_inputs(article)
+    if isinstance(article, Article):
+        display_date, quotes = article.display_date, article.supporting_quotes
+    else:
+        display_date = safe_date(inputs["publication_date"] or inputs["date_added"])
+        quotes = inputs["supporting_quotes"] or split_quotes(inputs["supporting_data_quotes"])
+    is_foreign_policy = str(inputs["source"] or "") == ArticleSource.FOREIGN_POLICY.value
+    return {
+        **inputs,
+        "url": str(inputs["url"] or ""),
+        "display_date": display_date,
+        "quotes": quotes,
+        "title_class": "fp-title" if is_foreign_policy else "fa-title",
+        "site_label": "foreignpolicy.com" if is_foreign_policy else "foreignaffairs.com",
+    }
+
+
+class CardFragmentCache:
+    """LRU cache of rendered card HTML keyed by article id and content hash.
+
+    An edited article hashes differently, so stale fragments are never served; they
+    simply age out of the LRU.
+    """
+
+    def __init__(self, max_entries: int | None = None):
+        self.max_entries = resolve_card_cache_size() if max_entries is None else max_entries
+        self._environment = Environment(loader=FileSystemLoader(TEMPLATES_DIR), autoescape=select_autoescape(["html"]))
+        self._template = self._environment.get_template(CARD_TEMPLATE)
+        self._fragments: OrderedDict[tuple[Any, str], Markup] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._fragments)
+
+    def render(self, article: Article | Mapping[str, Any]) -> Markup:
+        key = card_cache_key(article)
+        with self._lock:
+            fragment = self._fragments.get(key)
+            if fragment is not None:
+                self._fragments.move_to_end(key)
+                self.hits += 1
+                increment("cache.card_fragments.hit")
+                return fragment
+        fragment = Markup(self._template.render(card=card_display_fields(article)))
+        increment("cache.card_fragments.miss")
+        with self._lock:
+            self.misses += 1
+            self._fragments[key] = fragment
+            self._fragments.move_to_end(key)
+            while len(self._fragments) > self.max_entries:
+                self._fragments.popitem(last=False)
+        return fragment
+
+    def render_many(self, articles: Iterable[Article | Mapping[str, Any]]) -> list[Markup]:
+        return [self.render(article) for article in articles]
+
+
+_default_cache: CardFragmentCache | None = None
+
+
+def render_cards(articles: Iterable[Article | Mapping[str, Any]]) -> list[Markup]:
+    """Render cards through the process-wide fragment cache."""
+    global _default_cache
+    if _default_cache is None:
+        _default_cache = CardFragmentCache()
+    return _default_cache.render_many(articles)
@@ -0,0 +1,211 @@
+from __future__ import annotations
+
+import os
+import threading
+from dataclasses import dataclass
+from typing import Any
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.pool import StaticPool
+
+
+DEFAULT_POOL_SIZE = 5
+DEFAULT_MAX_OVERFLOW = 10
+DEFAULT_POOL_TIMEOUT = 30.0
+# Azure SQL drops idle connections after ~30 minutes; recycle before that.
+DEFAULT_MSSQL_POOL_RECYCLE = 1800
+DEFAULT_SQLITE_MMAP_SIZE = 256 * 1024 * 1024
+DEFAULT_SQLITE_CACHE_SIZE_KB = 64 * 1024
+
+
+@dataclass(frozen=True)
+class PoolSettings:
+    pool_size: int = DEFAULT_POOL_SIZE
+    max_overflow: int = DEFAULT_MAX_OVERFLOW
+    pool_timeout: float = DEFAULT_POOL_TIMEOUT
+    pool_recycle: int = -1
+    pre_ping: bool = True
+
+
+def _env_int(name: str, default: int) -> int:
+    raw_value = os.getenv(name, "").strip()
+    return int(raw_value) if raw_value else default
+
+
+def resolve_pool_settings(database_url: str) -> PoolSettings:
+    """Read pool tuning from DB_POOL_SIZE, DB_MAX_OVERFLOW, DB_POOL_TIMEOUT,
+    DB_POOL_RECYCLE and DB_POOL_PRE_PING (``0`` disables the checkout ping)."""
+    is_mssql = make_url(database_url).get_backend_name() == "mssql"
+    timeout = os.getenv("DB_POOL_TIMEOUT", "").strip()
+    return PoolSettings(
+        pool_size=_env_int("DB_POOL_SIZE", DEFAULT_POOL_SIZE),
+        max_overflow=_env_int("DB_MAX_OVERFLOW", DEFAULT_MAX_OVERFLOW),
+        pool_timeout=float(timeout) if timeout else DEFAULT_POOL_TIMEOUT,
+        pool_recycle=_env_int("DB_POOL_RECYCLE", DEFAULT_MSSQL_POOL_RECYCLE if is_mssql else -1),
+        pre_ping=os.getenv("DB_POOL_PRE_PING", "1") != "0",
+    )
+
+
+def _is_memory_sqlite(database_url: str) -> bool:
+    url = make_url(database_url)
+    return url.get_backend_name() == "sqlite" and (url.database or ":memory:") == ":memory:"
+
+
+def is_read_only_sqlite(database_url: str) -> bool:
+    url = make_url(database_url)
+    return url.get_backend_name() == "sqlite" and url.query.get("mode") == "ro"
+
+
+def sqlite_read_only_url(database_url: str) -> str:
+    """Return a ``mode=ro`` URI form of a file SQLite URL; other URLs pass through."""
+    url = make_url(database_url)
+    if url.get_backend_name() != "sqlite" or _is_memory_sqlite(database_url) or is_read_only_sqlite(database_url):
+        return database_url
+    database = url.database or ""
+    if not database.startswith("file:"):
+        database = f"file:{database}"
+    return url.set(database=database, query={**url.query, "mode": "ro", "uri": "true"}).render_as_string(
+        hide_password=False
+    )
+
+
+def sqlite_pragmas(*, read_only: bool = False) -> list[str]:
+    """Per-connection SQLite pragmas for read-heavy serving.
+
+    Disabled with SQLITE_PERFORMANCE_PROFILE=0; SQLITE_MMAP_SIZE (bytes) and
+    SQLITE_CACHE_SIZE_KB size the memory map and page cache. Read-only connections
+    skip the pragmas that would need a write lock.
+    """
+    if os.getenv("SQLITE_PERFORMANCE_PROFILE", "1") == "0":
+        return []
+    pragmas = [
+        f"PRAGMA mmap_size={_env_int('SQLITE_MMAP_SIZE', DEFAULT_SQLITE_MMAP_SIZE)}",
+        # Negative cache_size is in KiB rather than pages.
+        f"PRAGMA cache_size=-{_env_int('SQLITE_CACHE_SIZE_KB', DEFAULT_SQLITE_CACHE_SIZE_KB)}",
+        "PRAGMA temp_store=MEMORY",
+    ]
+    if read_only:
+        return [*pragmas, "PRAGMA query_only=ON"]
+    # WAL lets API readers proceed while the summarizer is writing; NORMAL is durable
+    # across application crashes in WAL mode and skips an fsync per commit.
+    return ["PRAGMA journal_mode=WAL", "PRAGMA synchronous=NORMAL", *pragmas]
+
+
+def engine_options(database_url: str, settings: PoolSettings | None = None) -> dict[str, Any]:
+    """Return create_engine()/create_async_engine() keyword arguments for a URL."""
+    settings = settings or resolve_pool_settings(database_url)
+    options: dict[str, Any] = {"pool_pre_ping": settings.pre_ping}
+    if make_url(database_url).get_backend_name() == "sqlite":
+        # Pooled SQLite connections move between gunicorn threads.
+        options["connect_args"] = {"check_same_thread": False}
+        if _is_memory_sqlite(database_url):
+            # Every checkout must see the same in-memory database.
+            options["poolclass"] = StaticPool
+            return options
+    options.update(
+        pool_size=settings.pool_size,
+        max_overflow=settings.max_overflow,
+        pool_timeout=settings.pool_timeout,
+        pool_recycle=settings.pool_recycle,
+    )
+    return options
+
+
+class PoolStats:
+    """Counters fed by pool events; ``snapshot()`` adds the pool's live gauges."""
+
+    def __init__(self, engine: Engine):
+        self._engine = engine
+        self._lock = threading.Lock()
+        self.connects = 0
+        self.checkouts = 0
+        self.overflow_checkouts = 0
+        self.saturated_checkouts = 0
+        self.invalidations = 0
+        self.checked_out = 0
+        self.peak_checked_out = 0
+        event.listen(engine, "connect", self._on_connect)
+        event.listen(engine, "checkout", self._on_checkout)
+        event.listen(engine, "checkin", self._on_checkin)
+        event.listen(engine, "invalidate", self._on_invalidate)
+
+    def _capacity(self) -> tuple[int | None, int | None]:
+        pool = self._engine.pool
+        size = pool.size() if hasattr(pool, "size") else None
+        overflow = getattr(pool, "_max_overflow", None)
+        return size, overflow
+
+    def _on_connect(self, dbapi_connection: Any, connection_record: Any) -> None:
+        with self._lock:
+            self.connects += 1
+
+    def _on_checkout(self, dbapi_connection: Any, connection_record: Any, connection_proxy: Any) -> None:
+        size, max_overflow = self._capacity()
+        with self._lock:
+            self.checkouts += 1
+            self.checked_out += 1
+            self.peak_checked_out = max(self.peak_checked_out, self.checked_out)
+            if size is not None and self.checked_out > size:
+                self.overflow_checkouts += 1
+            # With every slot in use the next caller blocks for up to pool_timeout.
+            if size is not None and max_overflow is not None and max_overflow >= 0:
+                if self.checked_out >= size + max_overflow:
+                    self.saturated_checkouts += 1
+
+    def _on_checkin(self, dbapi_connection: Any, connection_record: Any) -> None:
+        with self._lock:
+            self.checked_out = max(0, self.checked_out - 1)
+
+    def _on_invalidate(self, dbapi_connection: Any, connection_record: Any, exception: Any) -> None:
+        with self._lock:
+            self.invalidations += 1
+
+    def snapshot(self) -> dict[str, Any]:
+        pool = self._engine.pool
+        size, max_overflow = self._capacity()
+        with self._lock:
+            stats: dict[str, Any] = {
+                "pool_class": type(pool).__name__,
+                "pool_size": size,
+                "max_overflow": max_overflow,
+                "connects": self.connects,
+                "checkouts": self.checkouts,
+                "checked_out": self.checked_out,
+                "peak_checked_out": self.peak_checked_out,
+                "overflow_checkouts": self.overflow_checkouts,
+                "saturated_checkouts": self.saturated_checkouts,
+                "invalidations": self.invalidations,
+            }
+        if hasattr(pool, "overflow"):
+            stats["overflow"] = pool.overflow()
+        if hasattr(pool, "checkedin"):
+            stats["idle"] = pool.checkedin()
+        return stats
+
+
+def _sqlite_pragma_listener(pragmas: list[str]):
+    def apply_pragmas(dbapi_connection: Any, connection_record: Any) -> None:
+        cursor = dbapi_connection.cursor()
+        try:
+            for pragma in pragmas:
+                cursor.execute(pragma)
+        finally:
+            cursor.close()
+
+    return apply_pragmas
+
+
+def attach_sqlite_pragmas(engine: Engine, database_url: str) -> None:
+    """Apply sqlite_pragmas() to every new connection of a file SQLite engine."""
+    if make_url(database_url).get_backend_name() != "sqlite" or _is_memory_sqlite(database_url):
+        return
+    pragmas = sqlite_pragmas(read_only=is_read_only_sqlite(database_url))
+    if pragmas:
+        event.listen(engine, "connect", _sqlite_pragma_listener(pragmas))
+
+
+def create_article_engine(database_url: str, settings: PoolSettings | None = None) -> tuple[Engine, PoolStats]:
+    engine = create_engine(database_url, future=True, **engine_options(database_url, settings))
+    attach_sqlite_pragmas(engine, database_url)
+    return engine, PoolStats(engine)
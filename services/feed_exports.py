@@ -0,0 +1,29 @@
+from __future__ import annotations
+
+from typing import Any
+
+from services.article_service import articles_from_rows
+from services.feed_snapshot import feed_snapshot_path, write_feed_snapshot
+from services.static_site import export_static_site, resolve_static_site_size, static_site_dir
+
+
+def run_post_ingestion_exports(repo: Any) -> dict[str, Any]:
+    """Refresh the derived feed artifacts that are enabled by environment.
+
+    Called by the summarizers after a run that stored new articles. Returns a
+    description of each artifact written, keyed by artifact name.
+    """
+    results: dict[str, Any] = {}
+    snapshot_path = feed_snapshot_path()
+    if snapshot_path:
+        results["snapshot"] = {"path": snapshot_path, **write_feed_snapshot(repo, snapshot_path)}
+    site_dir = static_site_dir()
+    if site_dir:
+        results["static_site"] = export_static_site_from_repository(repo, site_dir)
+    return results
+
+
+def export_static_site_from_repository(repo: Any, output_dir: str, *, limit: int | None = None) -> dict[str, Any]:
+    rows = repo.get_latest_articles(limit=limit or resolve_static_site_size())
+    articles = [article.model_dump(mode="json") for article in articles_from_rows(rows)]
+    return export_static_site(articles, output_dir)
@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+
+SNAPSHOT_FORMAT_VERSION = 1
+DEFAULT_FEED_SNAPSHOT_SIZE = 300
+DEFAULT_RELOAD_CHECK_SECONDS = 1.0
+
+
+def feed_snapshot_path() -> str | None:
+    """Where ingestion writes the feed snapshot (FEED_SNAPSHOT_PATH); None disables it."""
+    return os.getenv("FEED_SNAPSHOT_PATH", "").strip() or None
+
+
+def feed_snapshot_serving_enabled() -> bool:
+    """API workers serve from the snapshot instead of the database when FEED_SNAPSHOT_SERVE=1."""
+    return os.getenv("FEED_SNAPSHOT_SERVE", "0") == "1" and feed_snapshot_path() is not None
+
+
+def resolve_feed_snapshot_size() -> int:
+    raw_value = os.getenv("FEED_SNAPSHOT_SIZE", "").strip()
+    return int(raw_value) if raw_value else DEFAULT_FEED_SNAPSHOT_SIZE
+
+
+def atomic_write_bytes(path: str | Path, data: bytes) -> None:
+    """Replace ``path`` with ``data`` so readers see either the old or the new file."""
+    target = Path(path)
+    target.parent.mkdir(parents=True, exist_ok=True)
+    fd, temp_path = tempfile.mkstemp(prefix=f".{target.name}.", dir=target.parent)
+    try:
+        with os.fdopen(fd, "wb") as handle:
+            handle.write(data)
+        os.replace(temp_path, target)
+    except BaseException:
+        Path(temp_path).unlink(missing_ok=True)
+        raise
+
+
+def write_feed_snapshot(repo: Any, path: str | Path, *, limit: int | None = None) -> dict[str, Any]:
+    """Write the newest articles to ``path`` atomically and return the snapshot header."""
+    articles = [dict(row) for row in repo.get_latest_articles(limit=limit or resolve_feed_snapshot_size())]
+    body = json.dumps(articles, ensure_ascii=False, separators=(",", ":"), default=str)
+    header = {
+        "format_version": SNAPSHOT_FORMAT_VERSION,
+        "generated_at": datetime.now(timezone.utc).isoformat(),
+        "content_hash": hashlib.sha256(body.encode("utf-8")).hexdigest(),
+        "count": len(articles),
+    }
+    payload = json.dumps({**header, "articles": articles}, ensure_ascii=False, separators=(",", ":"), default=str)
+    atomic_write_bytes(path, payload.encode("utf-8"))
+    return header
+
+
+class FeedSnapshot:
+    """Read-side view of a snapshot file that reloads itself when the file changes."""
+
+    def __init__(self, path: str | Path, *, check_interval: float = DEFAULT_RELOAD_CHECK_SECONDS):
+        self.path = Path(path)
+        self.check_interval = check_interval
+        self._lock = threading.Lock()
+        self._stat_key: tuple[int, int, int] | None = None
+        self._checked_at = float("-inf")
+        self._articles: list[dict[str, Any]] = []
+        self.header: dict[str, Any] = {}
+
+    def _current_stat_key(self) -> tuple[int, int, int] | None:
+        try:
+            stat = self.path.stat()
+        except FileNotFoundError:
+            return None
+        return stat.st_mtime_ns, stat.st_size, stat.st_ino
+
+    def _load(self) -> None:
+        # The whole document is parsed into memory anyway, so a plain read is all it needs.
+        raw = self.path.read_bytes()
+        if not raw:
+            return
+        data = json.loads(raw)
+        if data.get("format_version") != SNAPSHOT_FORMAT_VERSION:
+            raise ValueError(f"Unsupported feed snapshot format {data.get('format_version')!r} in {self.path}.")
+        articles = data.pop("articles", [])
+        # Swap both references together; readers hold the old list until they finish.
+        self._articles, self.header = articles, data
+
+    def refresh(self, *, force: bool = False) -> None:
+        now = time.monotonic()
+        if not force and now - self._checked_at < self.check_interval:
+            return
+        with self._lock:
+            self._checked_at = now
+            stat_key = self._current_stat_key()
+            if stat_key is None or stat_key == self._stat_key:
+                return
+            self._load()
+            self._stat_key = stat_key
+
+    def get_latest_articles(self, limit: int = 20, *, include_text: bool = True) -> list[dict[str, Any]]:
+        self.refresh()
+        rows = [dict(article) for article in self._articles[: max(limit, 0)]]
+        if not include_text:
+            for row in rows:
+                row.pop("article_text", None)
+        return rows
@@ -0,0 +1,409 @@
+"""Durable per-URL ingestion jobs, so an interrupted run resumes instead of starting over.
+
+Each discovered URL gets a row that moves discovered -> fetched -> summarized -> stored,
+carrying the scraped article and any summaries finished so far. Workers claim rows with
+a time-limited lease (a conditional UPDATE, so two workers can never both win) and
+renew it on every state change; leases left by a crashed run simply expire.
+
+With Firestore the jobs are documents in ``<articles collection>_ingestion_jobs`` and
+every lease check-and-set runs in a transaction, so they survive an ephemeral runner.
+"""
+from __future__ import annotations
+
+import json
+import os
+import socket
+import uuid
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import Any, Iterable
+
+from sqlalchemy import Column, DateTime, Index, Integer, MetaData, String, Table, Text
+from sqlalchemy import and_, func, insert, or_, select, update
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import IntegrityError
+
+from services.article_repository import FIRESTORE_BATCH_WRITE_LIMIT, FirestoreHandle
+from services.article_urls import URL_KEY_LENGTH, canonicalize_url, url_key
+
+DISCOVERED = "discovered"
+FETCHED = "fetched"
+SUMMARIZED = "summarized"
+STORED = "stored"
+SKIPPED = "skipped"
+FAILED = "failed"
+# Unfinished states, most advanced first: resuming those wastes the least work.
+RESUMABLE_STATES = (SUMMARIZED, FETCHED, DISCOVERED)
+
+DEFAULT_LEASE_SECONDS = 900
+DEFAULT_MAX_ATTEMPTS = 3
+
+metadata = MetaData()
+
+ingestion_jobs_table = Table(
+    "ingestion_jobs",
+    metadata,
+    Column("id", Integer, primary_key=True, autoincrement=True),
+    Column("source", String(32), nullable=False),
+    Column("url", String(2048), nullable=False),
+    Column("url_key", String(URL_KEY_LENGTH), nullable=False),
+    Column("state", String(16), nullable=False),
+    # JSON: the scraped article once fetched, then the summaries finished so far.
+    Column("article", Text, nullable=True),
+    Column("summary", Text, nullable=True),
+    Column("attempts", Integer, nullable=False, default=0),
+    Column("last_error", Text, nullable=True),
+    Column("lease_owner", String(128), nullable=True),
+    Column("lease_expires_at", DateTime, nullable=True),
+    Column("created_at", DateTime, nullable=False),
+    Column("updated_at", DateTime, nullable=False),
+)
+Index("uq_ingestion_jobs_url_key", ingestion_jobs_table.c.url_key, unique=True)
+Index("idx_ingestion_jobs_source_state", ingestion_jobs_table.c.source, ingestion_jobs_table.c.state)
+
+
+def ingestion_jobs_enabled() -> bool:
+    return os.getenv("INGEST_JOBS", "1") != "0"
+
+
+def resolve_lease_seconds() -> int:
+    raw_value = os.getenv("INGEST_JOB_LEASE_SECONDS", "").strip()
+    return int(raw_value) if raw_value else DEFAULT_LEASE_SECONDS
+
+
+def resolve_max_attempts() -> int:
+    raw_value = os.getenv("INGEST_JOB_MAX_ATTEMPTS", "").strip()
+    return max(1, int(raw_value)) if raw_value else DEFAULT_MAX_ATTEMPTS
+
+
+def _utcnow() -> datetime:
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+def _new_worker_id() -> str:
+    return f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+
+
+@dataclass
+class IngestionJob:
+    id: int | str
+    source: str
+    url: str
+    state: str
+    article: dict[str, Any] | None = None
+    summary: dict[str, str] = field(default_factory=dict)
+    attempts: int = 0
+
+
+class IngestionJobStore:
+    """The ingestion_jobs table plus lease-guarded state transitions for one worker."""
+
+    def __init__(
+        self,
+        engine: Engine,
+        *,
+        worker_id: str | None = None,
+        lease_seconds: int | None = None,
+        max_attempts: int | None = None,
+    ):
+        self.engine = engine
+        self.worker_id = worker_id or _new_worker_id()
+        self.lease_seconds = resolve_lease_seconds() if lease_seconds is None else lease_seconds
+        self.max_attempts = max_attempts or resolve_max_attempts()
+        metadata.create_all(engine, checkfirst=True)
+
+    @classmethod
+    def for_repository(cls, repo: Any, **kwargs: Any) -> "IngestionJobStore":
+        """Keep jobs next to the articles: in the article database, or in Firestore."""
+        firestore = getattr(repo, "firestore_handle", None)
+        if firestore is not None:
+            return FirestoreIngestionJobStore(firestore, **kwargs)
+        return cls(repo.engine, **kwargs)
+
+    def _now(self) -> datetime:
+        return _utcnow()
+
+    def _lease_expiry(self) -> datetime:
+        return self._now() + timedelta(seconds=self.lease_seconds)
+
+    @staticmethod
+    def _job(row: Any) -> IngestionJob:
+        return IngestionJob(
+            id=row["id"],
+            source=row["source"],
+            url=row["url"],
+            state=row["state"],
+            article=json.loads(row["article"]) if row["article"] else None,
+            summary=json.loads(row["summary"]) if row["summary"] else {},
+            attempts=row["attempts"],
+        )
+
+    def enqueue(self, source: str, urls: Iterable[str]) -> int:
+        """Record newly discovered URLs; URLs that already have a job are left as they are."""
+        now = _utcnow()
+        added = 0
+        for url in urls:
+            url = canonicalize_url(url)
+            try:
+                with self.engine.begin() as conn:
+                    conn.execute(
+                        insert(ingestion_jobs_table).values(
+                            source=source,
+                            url=url,
+                            url_key=url_key(url),
+                            state=DISCOVERED,
+                            attempts=0,
+                            created_at=now,
+                            updated_at=now,
+                        )
+                    )
+            except IntegrityError:
+                continue
+            added += 1
+        return added
+
+    def claim(self, source: str, *, urls: Iterable[str] = ()) -> list[IngestionJob]:
+        """Lease this source's unfinished jobs: every fetched or summarized one, and the
+        discovered ones among ``urls`` (the current listing), in that order.
+
+        A job is only returned if this worker's conditional UPDATE won the lease.
+        """
+        listing = {url_key(canonicalize_url(url)): index for index, url in enumerate(urls)}
+        table = ingestion_jobs_table
+        now = _utcnow()
+        stmt = select(table).where(
+            table.c.source == source,
+            or_(
+                table.c.state.in_((FETCHED, SUMMARIZED)),
+                and_(table.c.state == DISCOVERED, table.c.url_key.in_(list(listing))),
+            ),
+            or_(table.c.lease_expires_at.is_(None), table.c.lease_expires_at < now),
+        )
+        with self.engine.connect() as conn:
+            rows = conn.execute(stmt).mappings().all()
+        rows = sorted(rows, key=lambda row: (RESUMABLE_STATES.index(row["state"]), listing.get(row["url_key"], -1)))
+
+        claimed = []
+        for row in rows:
+            with self.engine.begin() as conn:
+                won = conn.execute(
+                    update(table)
+                    .where(
+                        table.c.id == row["id"],
+                        # Another worker may have claimed and advanced it since the select.
+                        table.c.state == row["state"],
+                        or_(table.c.lease_expires_at.is_(None), table.c.lease_expires_at < now),
+                    )
+                    .values(lease_owner=self.worker_id, lease_expires_at=self._lease_expiry())
+                ).rowcount
+            if won:
+                claimed.append(self._job(row))
+        return claimed
+
+    def _update_owned(self, job: IngestionJob, **values: Any) -> bool:
+        table = ingestion_jobs_table
+        with self.engine.begin() as conn:
+            return bool(
+                conn.execute(
+                    update(table)
+                    .where(table.c.id == job.id, table.c.lease_owner == self.worker_id)
+                    .values(updated_at=_utcnow(), **values)
+                ).rowcount
+            )
+
+    def advance(
+        self,
+        job: IngestionJob,
+        state: str,
+        *,
+        article: dict[str, Any] | None = None,
+        summary: dict[str, str] | None = None,
+    ) -> bool:
+        """Move a leased job to ``state`` and renew the lease; False if the lease was lost."""
+        values: dict[str, Any] = {"state": state, "lease_expires_at": self._lease_expiry()}
+        if article is not None:
+            values["article"] = json.dumps(article, ensure_ascii=False)
+        if summary is not None:
+            values["summary"] = json.dumps(summary, ensure_ascii=False)
+        if not self._update_owned(job, **values):
+            return False
+        job.state = state
+        job.article = article if article is not None else job.article
+        job.summary = summary if summary is not None else job.summary
+        return True
+
+    def save_summary(self, job: IngestionJob, summary: dict[str, str]) -> bool:
+        """Checkpoint summaries finished so far without changing state."""
+        job.summary = dict(summary)
+        return self._update_owned(
+            job, summary=json.dumps(summary, ensure_ascii=False), lease_expires_at=self._lease_expiry()
+        )
+
+    def fail(self, job: IngestionJob, error: str) -> None:
+        """Release the lease after an error; the job is retried until max_attempts."""
+        job.attempts += 1
+        self._update_owned(
+            job,
+            attempts=job.attempts,
+            last_error=error[:2000],
+            state=FAILED if job.attempts >= self.max_attempts else job.state,
+            lease_owner=None,
+            lease_expires_at=None,
+        )
+
+    def finish(self, job: IngestionJob, state: str = STORED) -> None:
+        """Close a job that needs no further work (stored, or skipped as a duplicate).
+
+        The payloads are dropped; the article row has them.
+        """
+        job.state = state
+        self._update_owned(
+            job,
+            state=state,
+            article=None,
+            summary=None,
+            last_error=None,
+            lease_owner=None,
+            lease_expires_at=None,
+        )
+
+    def release_all(self) -> int:
+        """Hand back every lease this worker still holds (jobs it claimed but did not reach)."""
+        table = ingestion_jobs_table
+        with self.engine.begin() as conn:
+            return conn.execute(
+                update(table)
+                .where(table.c.lease_owner == self.worker_id)
+                .values(lease_owner=None, lease_expires_at=None)
+            ).rowcount
+
+    def counts(self, source: str | None = None) -> dict[str, int]:
+        table = ingestion_jobs_table
+        stmt = select(table.c.state, func.count()).group_by(table.c.state)
+        if source is not None:
+            stmt = stmt.where(table.c.source == source)
+        with self.engine.connect() as conn:
+            return {state: count for state, count in conn.execute(stmt).all()}
+
+
+class FirestoreIngestionJobStore(IngestionJobStore):
+    """The same jobs as documents keyed by url_key, with leases taken in transactions."""
+
+    def __init__(
+        self,
+        firestore: FirestoreHandle,
+        *,
+        worker_id: str | None = None,
+        lease_seconds: int | None = None,
+        max_attempts: int | None = None,
+    ):
+        self.client = firestore.client
+        self._firestore = firestore.module
+        self._already_exists = firestore.already_exists
+        self.collection = self.client.collection(f"{firestore.collection_name}_ingestion_jobs")
+        self.worker_id = worker_id or _new_worker_id()
+        self.lease_seconds = resolve_lease_seconds() if lease_seconds is None else lease_seconds
+        self.max_attempts = max_attempts or resolve_max_attempts()
+
+    def _now(self) -> datetime:
+        # Firestore hands timestamps back timezone-aware.
+        return datetime.now(timezone.utc)
+
+    @staticmethod
+    def _lease_free(data: dict[str, Any], now: datetime) -> bool:
+        expires_at = data.get("lease_expires_at")
+        return expires_at is None or expires_at < now
+
+    def enqueue(self, source: str, urls: Iterable[str]) -> int:
+        """Record newly discovered URLs; URLs that already have a job are left as they are."""
+        now = self._now()
+        added = 0
+        for url in urls:
+            url = canonicalize_url(url)
+            try:
+                self.collection.document(url_key(url)).create(
+                    {
+                        "source": source,
+                        "url": url,
+                        "url_key": url_key(url),
+                        "state": DISCOVERED,
+                        "article": None,
+                        "summary": None,
+                        "attempts": 0,
+                        "last_error": None,
+                        "lease_owner": None,
+                        "lease_expires_at": None,
+                        "created_at": now,
+                        "updated_at": now,
+                    }
+                )
+            except self._already_exists:
+                continue
+            added += 1
+        return added
+
+    def claim(self, source: str, *, urls: Iterable[str] = ()) -> list[IngestionJob]:
+        """Lease this source's unfinished jobs, as :meth:`IngestionJobStore.claim` does.
+
+        Each lease is re-checked and written in one transaction, so two workers can never
+        both win a job.
+        """
+        listing = {url_key(canonicalize_url(url)): index for index, url in enumerate(urls)}
+        now = self._now()
+        query = self.collection.where("source", "==", source).where("state", "in", list(RESUMABLE_STATES))
+        candidates = []
+        for snapshot in query.stream():
+            data = snapshot.to_dict()
+            if data["state"] == DISCOVERED and snapshot.id not in listing:
+                continue
+            if self._lease_free(data, now):
+                candidates.append((snapshot.reference, data["state"]))
+        candidates.sort(key=lambda item: (RESUMABLE_STATES.index(item[1]), listing.get(item[0].id, -1)))
+
+        @self._firestore.transactional
+        def take(transaction: Any, reference: Any, state: str) -> dict[str, Any] | None:
+            snapshot = reference.get(transaction=transaction)
+            data = snapshot.to_dict() if snapshot.exists else None
+            # Another worker may have claimed and advanced it since the query.
+            if data is None or data["state"] != state or not self._lease_free(data, now):
+                return None
+            lease = {"lease_owner": self.worker_id, "lease_expires_at": self._lease_expiry()}
+            transaction.update(reference, lease)
+            return {**data, **lease, "id": reference.id}
+
+        claimed = []
+        for reference, state in candidates:
+            data = take(self.client.transaction(), reference, state)
+            if data is not None:
+                claimed.append(self._job(data))
+        return claimed
+
+    def _update_owned(self, job: IngestionJob, **values: Any) -> bool:
+        @self._firestore.transactional
+        def write(transaction: Any, reference: Any) -> bool:
+            snapshot = reference.get(transaction=transaction)
+            if not snapshot.exists or snapshot.to_dict().get("lease_owner") != self.worker_id:
+                return False
+            transaction.update(reference, {"updated_at": self._now(), **values})
+            return True
+
+        return write(self.client.transaction(), self.collection.document(str(job.id)))
+
+    def release_all(self) -> int:
+        """Hand back every lease this worker still holds (jobs it claimed but did not reach)."""
+        leased = self.collection.where("lease_owner", "==", self.worker_id)
+        references = [snapshot.reference for snapshot in leased.stream()]
+        for start in range(0, len(references), FIRESTORE_BATCH_WRITE_LIMIT):
+            batch = self.client.batch()
+            for reference in references[start : start + FIRESTORE_BATCH_WRITE_LIMIT]:
+                batch.update(reference, {"lease_owner": None, "lease_expires_at": None})
+            batch.commit()
+        return len(references)
+
+    def counts(self, source: str | None = None) -> dict[str, int]:
+        query = self.collection if source is None else self.collection.where("source", "==", source)
+        counts: dict[str, int] = {}
+        for snapshot in query.select(["state"]).stream():
+            state = snapshot.to_dict()["state"]
+            counts[state] = counts.get(state, 0) + 1
+        return counts
@@ -0,0 +1,365 @@
+"""Staged ingestion engine: discover -> fetch -> summarize -> persist over bounded queues.
+
+Each source plugs in as a SourceAdapter built from its scraper module. Stages run in
+their own thread pools, so fetching article k+1 overlaps summarizing article k, several
+sources ingest at once, and a full queue makes upstream stages wait (backpressure).
+
+With an IngestionJobStore, every URL's progress (fetched article, finished summaries) is
+checkpointed, and a rerun picks up unfinished jobs where the last run stopped.
+"""
+from __future__ import annotations
+
+import os
+import queue
+import threading
+from collections import Counter
+from dataclasses import dataclass
+from typing import Any, Callable
+
+from services.ingestion_jobs import DISCOVERED, FETCHED, SKIPPED, SUMMARIZED, IngestionJob, IngestionJobStore
+from services.instrumentation import increment, timed
+from services.llm_client import track_usage
+from services.near_duplicates import MinHashLSHIndex, encode_signature, minhash_signature
+from services.summary_budget import SummaryBudget
+
+DEFAULT_FETCH_WORKERS = 4
+DEFAULT_SUMMARIZE_WORKERS = 2
+DEFAULT_QUEUE_SIZE = 8
+# insert_article() keywords filled by SourceAdapter.summarizers, in order.
+SUMMARY_FIELDS = ("core_thesis", "detailed_abstract", "supporting_data_quotes")
+
+_DONE = object()
+
+
+@dataclass(frozen=True)
+class SourceAdapter:
+    """How the pipeline talks to one site.
+
+    ``discover(n)`` returns candidate article URLs; ``fetch(url)`` returns the scraped
+    article dict (title, author, text, publication_date, optional content_warning) or
+    None; ``summarizers`` are the core-thesis, abstract and quotes generators, each called
+    as ``fn(client, article)``, and ``prompts`` build the same three prompts without calling
+    Gemini (for batch jobs). ``prompt_version`` is stored with every summary written.
+    """
+
+    name: str
+    source: str
+    discover: Callable[[int], list[str]]
+    fetch: Callable[[str], dict[str, Any] | None]
+    summarizers: tuple[Callable[[Any, dict[str, Any]], str], ...]
+    prompts: tuple[Callable[[dict[str, Any]], str], ...] = ()
+    prompt_version: str | None = None
+    candidate_count: Callable[[int], int] = lambda target: target
+    allow_truncated: bool = False
+
+
+def _env_int(name: str, default: int) -> int:
+    raw_value = os.getenv(name, "").strip()
+    return max(1, int(raw_value)) if raw_value else default
+
+
+def resolve_fetch_workers() -> int:
+    return _env_int("INGEST_FETCH_WORKERS", DEFAULT_FETCH_WORKERS)
+
+
+def resolve_summarize_workers() -> int:
+    return _env_int("INGEST_SUMMARIZE_WORKERS", DEFAULT_SUMMARIZE_WORKERS)
+
+
+def resolve_queue_size() -> int:
+    return _env_int("INGEST_QUEUE_SIZE", DEFAULT_QUEUE_SIZE)
+
+
+def _with_usage(summary: dict[str, Any], usage: Any) -> dict[str, Any]:
+    """``summary`` plus its token counts so far, kept as insert_article() keywords."""
+    if not usage.calls:
+        return summary
+    return {
+        **summary,
+        "prompt_tokens": summary.get("prompt_tokens", 0) + usage.prompt_tokens,
+        "output_tokens": summary.get("output_tokens", 0) + usage.output_tokens,
+    }
+
+
+class IngestionPipeline:
+    """Run adapters through the four stages against one repository and LLM client.
+
+    Persisting stays on a single thread: SQLite has one writer anyway, and a single
+    writer keeps insert order deterministic per source.
+    """
+
+    def __init__(
+        self,
+        adapters: list[SourceAdapter],
+        repo: Any,
+        client: Any,
+        *,
+        near_duplicate_index: MinHashLSHIndex | None = None,
+        jobs: IngestionJobStore | None = None,
+        budget: SummaryBudget | None = None,
+        fetch_workers: int | None = None,
+        summarize_workers: int | None = None,
+        queue_size: int | None = None,
+        log: Callable[[str], None] = print,
+    ):
+        self.adapters = adapters
+        self.repo = repo
+        self.client = client
+        self.near_duplicate_index = near_duplicate_index
+        self.jobs = jobs
+        self.budget = budget
+        self.fetch_workers = fetch_workers or resolve_fetch_workers()
+        self.summarize_workers = summarize_workers or resolve_summarize_workers()
+        queue_size = queue_size or resolve_queue_size()
+        self.log = log
+        self._fetch_queue: queue.Queue = queue.Queue(maxsize=queue_size)
+        self._summarize_queue: queue.Queue = queue.Queue(maxsize=queue_size)
+        self._persist_queue: queue.Queue = queue.Queue(maxsize=queue_size)
+        self._lock = threading.Lock()
+        # Signalled whenever a reserved article is stored or gives its slot back.
+        self._slots = threading.Condition(self._lock)
+        self._targets: dict[str, int] = {}
+        self._accepted: Counter[str] = Counter()
+        self._stored: Counter[str] = Counter()
+        self._reserved: set[str] = set()
+        self.stats: dict[str, Counter[str]] = {adapter.name: Counter() for adapter in adapters}
+
+    def _count(self, adapter: SourceAdapter, outcome: str) -> None:
+        with self._lock:
+            self.stats[adapter.name][outcome] += 1
+        increment(f"pipeline.{outcome}")
+
+    def _slot_open(self, adapter: SourceAdapter) -> bool:
+        """True when a slot is free; False once the target is met by stored articles.
+
+        While every slot is held by articles still being summarized or stored, this waits:
+        one of them may fail and hand its slot to the next candidate.
+        """
+        name = adapter.name
+        with self._slots:
+            while self._accepted[name] >= self._targets[name]:
+                if self._stored[name] >= self._targets[name]:
+                    return False
+                self._slots.wait()
+            return True
+
+    def _reserve(self, adapter: SourceAdapter, url: str) -> bool:
+        """Claim one of the adapter's article slots for ``url``; False once the target is met."""
+        while self._slot_open(adapter):
+            with self._slots:
+                if self._accepted[adapter.name] < self._targets[adapter.name]:
+                    self._accepted[adapter.name] += 1
+                    self._reserved.add(url)
+                    return True
+        return False
+
+    def _settle(self, adapter: SourceAdapter, url: str, *, stored: bool) -> None:
+        """Count a reserved article as stored, or give its slot back to the candidates."""
+        with self._slots:
+            if url not in self._reserved:
+                return  # resumed work never held a slot
+            self._reserved.discard(url)
+            if stored:
+                self._stored[adapter.name] += 1
+            else:
+                self._accepted[adapter.name] -= 1
+            self._slots.notify_all()
+
+    # -- stages ---------------------------------------------------------------------
+
+    def _discover(self, adapter: SourceAdapter) -> None:
+        try:
+            urls = adapter.discover(adapter.candidate_count(self._targets[adapter.name]))
+        except Exception as exc:  # noqa: BLE001
+            self.log(f"[{adapter.name}] Discovery failed: {exc}")
+            urls = []
+        with self._lock:
+            self.stats[adapter.name]["discovered"] += len(urls)
+        if self.jobs is not None:
+            self._resume_jobs(adapter, urls)
+            return
+        for url in urls:
+            if not self._slot_open(adapter):
+                break
+            # Checked before fetching so known articles cost no page load.
+            if self.repo.get_article_by_url(url):
+                self._count(adapter, "cached")
+                continue
+            self._fetch_queue.put((adapter, url, None))
+
+    def _resume_jobs(self, adapter: SourceAdapter, urls: list[str]) -> None:
+        """Record the listing as jobs, then route every claimed job to the stage it stopped at.
+
+        Jobs already fetched or summarized by an earlier run are finished whatever the
+        target: that work is paid for.
+        """
+        fresh = []
+        for url in urls:
+            if self.repo.get_article_by_url(url):
+                self._count(adapter, "cached")
+            else:
+                fresh.append(url)
+        self.jobs.enqueue(adapter.name, fresh)
+        for job in self.jobs.claim(adapter.name, urls=fresh):
+            if job.state == DISCOVERED:
+                self._fetch_queue.put((adapter, job.url, job))
+                continue
+            self._count(adapter, "resumed")
+            if job.state == FETCHED:
+                self._summarize_queue.put((adapter, job.article, job))
+            elif job.state == SUMMARIZED:
+                self._persist_queue.put((adapter, job.article, job.summary, job))
+
+    def _fetch(self, adapter: SourceAdapter, url: str, job: IngestionJob | None) -> None:
+        if not self._slot_open(adapter):
+            return
+        article = adapter.fetch(url)
+        if not article:
+            self._count(adapter, "fetch_failures")
+            self.log(f"[{adapter.name}] Failed to scrape article from: {url}")
+            if job is not None:
+                self.jobs.fail(job, "fetch returned no article")
+            return
+        article["url"] = url
+        if article.get("content_warning") and not adapter.allow_truncated:
+            self._count(adapter, "truncated")
+            self.log(f"[{adapter.name}] [SKIP] Skipping potentially truncated article: {url}")
+            if job is not None:
+                self.jobs.fail(job, "possibly truncated")
+            return
+        if self.near_duplicate_index is not None:
+            signature = minhash_signature(article.get("text"))
+            with self._lock:
+                match = self.near_duplicate_index.query(signature, exclude=url)
+                if not match:
+                    self.near_duplicate_index.add(url, signature)
+            if match:
+                self._count(adapter, "near_duplicates")
+                self.log(f"[{adapter.name}] [SKIP] Near-duplicate of {match[0]} (similarity {match[1]:.2f}): {url}")
+                if job is not None:
+                    self.jobs.finish(job, SKIPPED)
+                return
+            # Stored with the row, so the persist thread does not hash the body again.
+            article["minhash_signature"] = encode_signature(signature)
+        if not self._reserve(adapter, url):
+            return
+        if job is not None and not self.jobs.advance(job, FETCHED, article=article):
+            self._settle(adapter, url, stored=False)
+            return  # lease lost to another worker
+        self._count(adapter, "fetched")
+        self._summarize_queue.put((adapter, article, job))
+
+    def _summarize(self, adapter: SourceAdapter, article: dict[str, Any], job: IngestionJob | None) -> None:
+        summary = dict(job.summary) if job is not None else {}
+        pending = [
+            # Fields finished before an earlier run stopped are not requested again.
+            (name, summarizer)
+            for name, summarizer in zip(SUMMARY_FIELDS, adapter.summarizers)
+            if name not in summary
+        ]
+        with track_usage() as usage:
+            try:
+                prompt_article = self.budget.prepare(self.client, article) if self.budget and pending else article
+                for name, summarizer in pending:
+                    summary[name] = summarizer(self.client, prompt_article)
+                    if job is not None and not self.jobs.save_summary(job, _with_usage(summary, usage)):
+                        self._settle(adapter, article["url"], stored=False)
+                        return
+            except Exception:
+                # Tokens spent before the failure still count; the resumed run adds its own.
+                if job is not None and usage.calls:
+                    self.jobs.save_summary(job, _with_usage(summary, usage))
+                raise
+        summary = _with_usage(summary, usage)
+        if job is not None and not self.jobs.advance(job, SUMMARIZED, summary=summary):
+            self._settle(adapter, article["url"], stored=False)
+            return
+        self._count(adapter, "summarized")
+        self._persist_queue.put((adapter, article, summary, job))
+
+    def _persist(
+        self,
+        adapter: SourceAdapter,
+        article: dict[str, Any],
+        summary: dict[str, str],
+        job: IngestionJob | None,
+    ) -> None:
+        inserted = self.repo.insert_article(
+            source=adapter.source,
+            url=article["url"],
+            title=article["title"],
+            author=article["author"],
+            article_text=article["text"],
+            publication_date=article.get("publication_date"),
+            prompt_version=adapter.prompt_version,
+            minhash_signature=article.get("minhash_signature"),
+            **summary,
+        )
+        if job is not None:
+            self.jobs.finish(job)
+        # A duplicate insert frees the slot for another candidate.
+        self._settle(adapter, article["url"], stored=inserted)
+        if inserted:
+            self._count(adapter, "stored")
+            self.log(f"[{adapter.name}] [OK] Stored summary for {article['title']}")
+
+    # -- plumbing -------------------------------------------------------------------
+
+    def _worker(self, stage: str, inbox: queue.Queue, handle: Callable[..., None]) -> None:
+        while True:
+            item = inbox.get()
+            if item is _DONE:
+                return
+            adapter, job = item[0], item[-1]
+            try:
+                with timed(f"pipeline.{stage}", source=adapter.name):
+                    handle(*item)
+            except Exception as exc:  # noqa: BLE001
+                self._count(adapter, f"{stage}_errors")
+                self.log(f"[{adapter.name}] {stage} failed: {exc}")
+                if job is not None:
+                    self.jobs.fail(job, f"{stage}: {exc}")
+                # A reserved article that failed hands its slot to the next candidate.
+                subject = item[1]
+                self._settle(adapter, subject if isinstance(subject, str) else subject["url"], stored=False)
+
+    def _pool(self, stage: str, count: int, target: Callable[..., None], *args: Any) -> list[threading.Thread]:
+        threads = [
+            threading.Thread(target=target, args=args, name=f"ingest-{stage}-{index}", daemon=True)
+            for index in range(count)
+        ]
+        for thread in threads:
+            thread.start()
+        return threads
+
+    @staticmethod
+    def _close(threads: list[threading.Thread], downstream: queue.Queue, consumers: int) -> None:
+        """Wait for a stage to drain, then tell each downstream worker to stop."""
+        for thread in threads:
+            thread.join()
+        for _ in range(consumers):
+            downstream.put(_DONE)
+
+    def run(self, articles_per_source: int | dict[str, int]) -> dict[str, dict[str, int]]:
+        """Ingest up to ``articles_per_source`` new articles per adapter; returns per-source counts."""
+        for adapter in self.adapters:
+            self._targets[adapter.name] = (
+                articles_per_source[adapter.name] if isinstance(articles_per_source, dict) else articles_per_source
+            )
+        discoverers = []
+        for adapter in self.adapters:
+            discoverers += self._pool(f"discover-{adapter.name}", 1, self._discover, adapter)
+        fetchers = self._pool("fetch", self.fetch_workers, self._worker, "fetch", self._fetch_queue, self._fetch)
+        summarizers = self._pool(
+            "summarize", self.summarize_workers, self._worker, "summarize", self._summarize_queue, self._summarize
+        )
+        persisters = self._pool("persist", 1, self._worker, "persist", self._persist_queue, self._persist)
+
+        self._close(discoverers, self._fetch_queue, self.fetch_workers)
+        self._close(fetchers, self._summarize_queue, self.summarize_workers)
+        self._close(summarizers, self._persist_queue, 1)
+        for thread in persisters:
+            thread.join()
+        if self.jobs is not None:
+            self.jobs.release_all()
+        return {name: dict(counts) for name, counts in self.stats.items()}
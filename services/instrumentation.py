@@ -0,0 +1,213 @@
+from __future__ import annotations
+
+import functools
+import inspect
+import json
+import logging
+import os
+import sys
+import threading
+import time
+from bisect import bisect_left
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from typing import Any, TypeVar
+
+
+logger = logging.getLogger("fpfa.instrumentation")
+
+# Upper bounds in seconds; they span an in-process cache hit up to a slow Playwright render.
+HISTOGRAM_BUCKETS = (0.001, 0.005, 0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+_T = TypeVar("_T")
+TimingObserver = Callable[[str, float, bool, dict[str, str]], None]
+CounterObserver = Callable[[str, float], None]
+_timing_observers: list[TimingObserver] = []
+_counter_observers: list[CounterObserver] = []
+
+
+def instrumentation_enabled() -> bool:
+    """Timers are on unless INSTRUMENTATION=0."""
+    return os.getenv("INSTRUMENTATION", "1") != "0"
+
+
+class StageStats:
+    """Running count/total/min/max plus a cumulative-bucket histogram for one stage."""
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.errors = 0
+        self.total = 0.0
+        self.min = float("inf")
+        self.max = 0.0
+        self.buckets = [0] * (len(HISTOGRAM_BUCKETS) + 1)
+
+    def observe(self, seconds: float, *, ok: bool = True) -> None:
+        self.count += 1
+        self.errors += 0 if ok else 1
+        self.total += seconds
+        self.min = min(self.min, seconds)
+        self.max = max(self.max, seconds)
+        self.buckets[bisect_left(HISTOGRAM_BUCKETS, seconds)] += 1
+
+    def snapshot(self) -> dict[str, Any]:
+        histogram: dict[str, int] = {}
+        running = 0
+        for bound, hits in zip((*HISTOGRAM_BUCKETS, float("inf")), self.buckets):
+            running += hits
+            histogram["+Inf" if bound == float("inf") else f"{bound:g}"] = running
+        return {
+            "count": self.count,
+            "errors": self.errors,
+            "total_s": round(self.total, 6),
+            "mean_s": round(self.total / self.count, 6) if self.count else 0.0,
+            "min_s": round(self.min, 6) if self.count else 0.0,
+            "max_s": round(self.max, 6),
+            "histogram": histogram,
+        }
+
+
+class MetricsRegistry:
+    """Process-wide stage timings and counters."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._stages: dict[str, StageStats] = {}
+        self._counters: dict[str, float] = {}
+
+    def observe(self, stage: str, seconds: float, *, ok: bool = True) -> None:
+        with self._lock:
+            stats = self._stages.get(stage)
+            if stats is None:
+                stats = self._stages[stage] = StageStats()
+            stats.observe(seconds, ok=ok)
+
+    def increment(self, name: str, value: float = 1) -> None:
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + value
+
+    def snapshot(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "stages": {stage: stats.snapshot() for stage, stats in sorted(self._stages.items())},
+                "counters": dict(sorted(self._counters.items())),
+            }
+
+    def reset(self) -> None:
+        with self._lock:
+            self._stages.clear()
+            self._counters.clear()
+
+
+registry = MetricsRegistry()
+
+
+def add_timing_observer(observer: TimingObserver) -> None:
+    """Also send every timing to ``observer(stage, seconds, ok, labels)`` (e.g. Prometheus)."""
+    if observer not in _timing_observers:
+        _timing_observers.append(observer)
+
+
+def add_counter_observer(observer: CounterObserver) -> None:
+    if observer not in _counter_observers:
+        _counter_observers.append(observer)
+
+
+def _emit(event: str, level: int = logging.DEBUG, **fields: Any) -> None:
+    if logger.isEnabledFor(level):
+        logger.log(level, json.dumps({"event": event, **fields}, default=str, sort_keys=True))
+
+
+@contextmanager
+def timed(stage: str, **labels: str) -> Iterator[None]:
+    """Time a block (or, used as ``@timed(stage)``, every call of a function).
+
+    ``labels`` (such as the storage backend) go to the JSON log line and observers;
+    the in-process registry aggregates per stage.
+    """
+    if not instrumentation_enabled():
+        yield
+        return
+    started = time.perf_counter()
+    ok = False
+    try:
+        yield
+        ok = True
+    finally:
+        elapsed = time.perf_counter() - started
+        registry.observe(stage, elapsed, ok=ok)
+        for observer in _timing_observers:
+            observer(stage, elapsed, ok, labels)
+        _emit("stage_timing", stage=stage, duration_ms=round(elapsed * 1000, 3), ok=ok, **labels)
+
+
+def increment(name: str, value: float = 1) -> None:
+    if instrumentation_enabled():
+        registry.increment(name, value)
+        for observer in _counter_observers:
+            observer(name, value)
+
+
+def instrument_methods(prefix: str) -> Callable[[type[_T]], type[_T]]:
+    """Class decorator timing every public method as ``<prefix>.<method name>``.
+
+    Instances may set a ``metric_labels`` dict, which is attached to each timing.
+    """
+
+    def wrap(method: Callable[..., Any], stage: str) -> Callable[..., Any]:
+        @functools.wraps(method)
+        def wrapper(self: Any, *args: Any, **kwargs: Any) -> Any:
+            with timed(stage, **getattr(self, "metric_labels", {})):
+                return method(self, *args, **kwargs)
+
+        return wrapper
+
+    def decorate(cls: type[_T]) -> type[_T]:
+        for name, member in list(vars(cls).items()):
+            if name.startswith("_") or not inspect.isfunction(member):
+                continue
+            setattr(cls, name, wrap(member, f"{prefix}.{name}"))
+        return cls
+
+    return decorate
+
+
+def format_summary_table(snapshot: dict[str, Any] | None = None) -> str:
+    snapshot = registry.snapshot() if snapshot is None else snapshot
+    header = f"{'stage':<36} {'count':>6} {'errors':>6} {'total s':>9} {'mean ms':>9} {'max ms':>9}"
+    lines = [header, "-" * len(header)]
+    for stage, stats in snapshot["stages"].items():
+        lines.append(
+            f"{stage:<36} {stats['count']:>6} {stats['errors']:>6} {stats['total_s']:>9.3f} "
+            f"{stats['mean_s'] * 1000:>9.1f} {stats['max_s'] * 1000:>9.1f}"
+        )
+    for name, value in snapshot["counters"].items():
+        lines.append(f"{name:<36} {value:>6g}")
+    return "\n".join(lines)
+
+
+def _ensure_log_handler() -> None:
+    """Scripts configure no logging; give the JSON lines somewhere to go."""
+    if logger.handlers or logging.getLogger().handlers:
+        return
+    handler = logging.StreamHandler(sys.stderr)
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    logger.addHandler(handler)
+    logger.setLevel(os.getenv("INSTRUMENTATION_LOG_LEVEL", "INFO").upper())
+
+
+@contextmanager
+def report_run(name: str) -> Iterator[None]:
+    """Wrap an ingestion run: log its stage histograms as JSON and print a summary table."""
+    _ensure_log_handler()
+    registry.reset()
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        if instrumentation_enabled():
+            snapshot = registry.snapshot()
+            elapsed = round(time.perf_counter() - started, 3)
+            _emit("run_summary", logging.INFO, run=name, duration_s=elapsed, **snapshot)
+            print(f"\n--- Timing summary: {name} ({elapsed:.1f}s) ---")
+            print(format_summary_table(snapshot))
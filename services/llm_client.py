@@ -0,0 +1,372 @@
+"""Shared Gemini client wrapper: rate limiting, retries with backoff, and a circuit breaker.
+
+``ResilientLLMClient`` wraps a ``google.genai.Client`` and keeps its
+``client.models.generate_content(...)`` interface, so the summarizers take either one.
+Every call first takes a request and its estimated prompt tokens from two token buckets
+(requests/min and tokens/min), so concurrent workers together stay under the quota
+instead of finding it through 429s. If a 429 arrives anyway the configured quota is too
+high. Both buckets are emptied and their refill rate is halved. The rate climbs back to
+the configured one over GEMINI_RATE_RECOVERY_SECONDS, so every worker slows down, not
+just the one that was refused. Retryable failures (429, 5xx, dropped connections)
+are retried with exponential backoff and full jitter. Enough consecutive failures open
+the circuit breaker, and every caller then waits out the cool-down instead of adding to
+the failure storm. That pauses the whole ingestion pipeline while Gemini is down.
+"""
+from __future__ import annotations
+
+import os
+import random
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, Callable, Iterator
+
+from services.instrumentation import increment
+
+SUMMARY_MODEL = "gemini-flash-latest"
+DEFAULT_REQUESTS_PER_MINUTE = 60
+DEFAULT_TOKENS_PER_MINUTE = 1_000_000
+DEFAULT_MAX_RETRIES = 5
+DEFAULT_BACKOFF_BASE_S = 1.0
+DEFAULT_BACKOFF_MAX_S = 60.0
+DEFAULT_BREAKER_THRESHOLD = 5
+DEFAULT_BREAKER_RESET_S = 60.0
+DEFAULT_RATE_RECOVERY_S = 120.0
+# Each 429 halves the refill rate, down to a tenth of the configured quota.
+RATE_LIMIT_SLOWDOWN = 0.5
+MIN_RATE_FRACTION = 0.1
+# Rough Gemini tokenizer ratio for English prose; usage metadata corrects it after each call.
+CHARS_PER_TOKEN = 4
+RETRYABLE_STATUS_CODES = frozenset({408, 429, 500, 502, 503, 504})
+
+
+class LLMUnavailableError(RuntimeError):
+    """A Gemini call still failed after every retry."""
+
+
+@dataclass
+class TokenUsage:
+    """Tokens used by the calls made inside one ``track_usage()`` block."""
+
+    calls: int = 0
+    prompt_tokens: int = 0
+    output_tokens: int = 0
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+
+    def add(self, prompt_tokens: int, output_tokens: int) -> None:
+        with self._lock:
+            self.calls += 1
+            self.prompt_tokens += prompt_tokens
+            self.output_tokens += output_tokens
+
+
+_usage: ContextVar[TokenUsage | None] = ContextVar("llm_usage", default=None)
+
+
+@contextmanager
+def track_usage() -> Iterator[TokenUsage]:
+    """Total the tokens of every call made in this block, e.g. for one article.
+
+    Work handed to other threads is counted too when it runs in a copy of this context
+    (``contextvars.copy_context().run``).
+    """
+    usage = TokenUsage()
+    token = _usage.set(usage)
+    try:
+        yield usage
+    finally:
+        _usage.reset(token)
+
+
+def _env_number(name: str, default: float) -> float:
+    raw_value = os.getenv(name, "").strip()
+    return max(0.0, float(raw_value)) if raw_value else default
+
+
+def resolve_requests_per_minute() -> float:
+    return _env_number("GEMINI_REQUESTS_PER_MINUTE", DEFAULT_REQUESTS_PER_MINUTE)
+
+
+def resolve_tokens_per_minute() -> float:
+    return _env_number("GEMINI_TOKENS_PER_MINUTE", DEFAULT_TOKENS_PER_MINUTE)
+
+
+def resolve_max_retries() -> int:
+    return int(_env_number("GEMINI_MAX_RETRIES", DEFAULT_MAX_RETRIES))
+
+
+def resolve_breaker_threshold() -> int:
+    return max(1, int(_env_number("GEMINI_BREAKER_THRESHOLD", DEFAULT_BREAKER_THRESHOLD)))
+
+
+def resolve_breaker_reset_seconds() -> float:
+    return _env_number("GEMINI_BREAKER_RESET_SECONDS", DEFAULT_BREAKER_RESET_S)
+
+
+def resolve_rate_recovery_seconds() -> float:
+    return _env_number("GEMINI_RATE_RECOVERY_SECONDS", DEFAULT_RATE_RECOVERY_S)
+
+
+def estimate_tokens(text: str) -> int:
+    return max(1, len(text) // CHARS_PER_TOKEN)
+
+
+def _status_code(exc: BaseException) -> int | None:
+    code = getattr(exc, "code", None) or getattr(exc, "status_code", None)
+    return code if isinstance(code, int) else None
+
+
+def is_retryable(exc: BaseException) -> bool:
+    """Rate limits, server errors and transport failures; not bad requests or auth errors."""
+    code = _status_code(exc)
+    if code is not None:
+        return code in RETRYABLE_STATUS_CODES
+    if isinstance(exc, (ConnectionError, TimeoutError)):
+        return True
+    try:
+        import httpx
+    except ImportError:  # pragma: no cover - google-genai depends on httpx
+        return False
+    return isinstance(exc, httpx.TransportError)
+
+
+class TokenBucket:
+    """Refills ``per_minute`` units a minute, holding at most one minute's worth.
+
+    A rate of 0 disables the bucket. :meth:`slow_down` lowers the refill rate, which then
+    climbs back to ``per_minute`` over ``recovery_seconds``.
+    """
+
+    def __init__(
+        self,
+        per_minute: float,
+        *,
+        recovery_seconds: float | None = None,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        self.capacity = float(per_minute)
+        self.base_rate = per_minute / 60.0
+        self.rate = self.base_rate
+        self.recovery_seconds = resolve_rate_recovery_seconds() if recovery_seconds is None else recovery_seconds
+        self._tokens = self.capacity
+        self._clock = clock
+        self._sleep = sleep
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def _refill(self) -> None:
+        now = self._clock()
+        elapsed = now - self._updated
+        self._tokens = min(self.capacity, self._tokens + elapsed * self.rate)
+        if self.rate < self.base_rate:
+            recovered = elapsed * self.base_rate / self.recovery_seconds if self.recovery_seconds else self.base_rate
+            self.rate = min(self.base_rate, self.rate + recovered)
+        self._updated = now
+
+    def acquire(self, amount: float = 1) -> float:
+        """Block until ``amount`` units are available, take them, and return the seconds waited."""
+        if not self.base_rate:
+            return 0.0
+        # A request larger than the bucket would never fit; let it through on a full bucket.
+        amount = min(amount, self.capacity)
+        waited = 0.0
+        while True:
+            with self._lock:
+                self._refill()
+                if self._tokens >= amount:
+                    self._tokens -= amount
+                    return waited
+                delay = (amount - self._tokens) / self.rate
+            self._sleep(delay)
+            waited += delay
+
+    def debit(self, amount: float) -> None:
+        """Take units without waiting (the bucket may go negative), e.g. to correct an estimate."""
+        if not self.base_rate:
+            return
+        with self._lock:
+            self._refill()
+            self._tokens -= amount
+
+    def slow_down(self, factor: float = RATE_LIMIT_SLOWDOWN) -> None:
+        """React to a rate-limit response: empty the bucket and cut the refill rate."""
+        if not self.base_rate:
+            return
+        with self._lock:
+            self._refill()
+            self._tokens = min(self._tokens, 0.0)
+            self.rate = max(self.base_rate * MIN_RATE_FRACTION, self.rate * factor)
+
+
+class CircuitBreaker:
+    """Opens after ``failure_threshold`` consecutive failures; callers then wait.
+
+    After ``reset_seconds`` one caller is let through as a probe. Its success closes the
+    circuit. Its failure reopens it for another cool-down.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int | None = None,
+        reset_seconds: float | None = None,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        self.failure_threshold = failure_threshold or resolve_breaker_threshold()
+        self.reset_seconds = resolve_breaker_reset_seconds() if reset_seconds is None else reset_seconds
+        self._clock = clock
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        self._failures = 0
+        self._opened_at: float | None = None
+        self._probing = False
+
+    @property
+    def is_open(self) -> bool:
+        with self._lock:
+            return self._opened_at is not None
+
+    def wait(self) -> float:
+        """Block while the circuit is open; returns the seconds waited."""
+        waited = 0.0
+        while True:
+            with self._lock:
+                if self._opened_at is None:
+                    return waited
+                remaining = self._opened_at + self.reset_seconds - self._clock()
+                if remaining <= 0 and not self._probing:
+                    self._probing = True
+                    return waited
+                delay = remaining if remaining > 0 else min(1.0, self.reset_seconds or 1.0)
+            self._sleep(delay)
+            waited += delay
+
+    def record_success(self) -> None:
+        with self._lock:
+            if self._opened_at is not None:
+                increment("llm.circuit_closed")
+            self._failures = 0
+            self._opened_at = None
+            self._probing = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            if self._probing or (self._opened_at is None and self._failures >= self.failure_threshold):
+                self._opened_at = self._clock()
+                self._probing = False
+                increment("llm.circuit_opened")
+
+
+class _Models:
+    def __init__(self, client: "ResilientLLMClient"):
+        self._client = client
+
+    def generate_content(self, *, model: str, contents: Any, config: Any = None) -> Any:
+        return self._client.generate_content(model=model, contents=contents, config=config)
+
+
+class ResilientLLMClient:
+    """Rate-limited, retrying, circuit-broken view of a ``google.genai.Client``.
+
+    Share one instance between threads: the buckets and the breaker are what keep the
+    workers' combined traffic in check. Attributes other than ``models`` come from the
+    wrapped client.
+    """
+
+    def __init__(
+        self,
+        client: Any,
+        *,
+        requests_per_minute: float | None = None,
+        tokens_per_minute: float | None = None,
+        max_retries: int | None = None,
+        backoff_base_s: float = DEFAULT_BACKOFF_BASE_S,
+        backoff_max_s: float = DEFAULT_BACKOFF_MAX_S,
+        breaker: CircuitBreaker | None = None,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        self.client = client
+        self.requests = TokenBucket(
+            resolve_requests_per_minute() if requests_per_minute is None else requests_per_minute,
+            clock=clock,
+            sleep=sleep,
+        )
+        self.tokens = TokenBucket(
+            resolve_tokens_per_minute() if tokens_per_minute is None else tokens_per_minute,
+            clock=clock,
+            sleep=sleep,
+        )
+        self.max_retries = resolve_max_retries() if max_retries is None else max_retries
+        self.backoff_base_s = backoff_base_s
+        self.backoff_max_s = backoff_max_s
+        self.breaker = breaker or CircuitBreaker(clock=clock, sleep=sleep)
+        self._sleep = sleep
+        self.models = _Models(self)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.client, name)
+
+    def _backoff(self, attempt: int) -> float:
+        return random.uniform(0, min(self.backoff_max_s, self.backoff_base_s * 2**attempt))
+
+    def generate_content(self, *, model: str, contents: Any, config: Any = None) -> Any:
+        estimate = estimate_tokens(str(contents))
+        for attempt in range(self.max_retries + 1):
+            paused = self.breaker.wait()
+            throttled = self.requests.acquire(1) + self.tokens.acquire(estimate)
+            if paused:
+                increment("llm.circuit_wait_s", paused)
+            if throttled:
+                increment("llm.throttled_s", throttled)
+            increment("llm.requests")
+            try:
+                if config is None:
+                    response = self.client.models.generate_content(model=model, contents=contents)
+                else:
+                    response = self.client.models.generate_content(model=model, contents=contents, config=config)
+            except Exception as exc:
+                if not is_retryable(exc):
+                    # Gemini answered, so it is up; a bad request must not hold the circuit open.
+                    self.breaker.record_success()
+                    increment("llm.failures")
+                    raise
+                self.breaker.record_failure()
+                if _status_code(exc) == 429:
+                    # The quota is lower than configured; hold back every worker, not just this one.
+                    self.requests.slow_down()
+                    self.tokens.slow_down()
+                    increment("llm.rate_limited")
+                if attempt == self.max_retries:
+                    increment("llm.failures")
+                    raise LLMUnavailableError(f"Gemini call failed after {attempt + 1} attempts: {exc}") from exc
+                increment("llm.retries")
+                self._sleep(self._backoff(attempt))
+                continue
+            self.breaker.record_success()
+            self._record_usage(response, estimate)
+            return response
+        raise AssertionError("unreachable")  # pragma: no cover
+
+    def _record_usage(self, response: Any, estimate: int) -> None:
+        usage = getattr(response, "usage_metadata", None)
+        prompt_tokens = getattr(usage, "prompt_token_count", None) or estimate
+        output_tokens = getattr(usage, "candidates_token_count", None) or 0
+        increment("llm.prompt_tokens", prompt_tokens)
+        increment("llm.output_tokens", output_tokens)
+        usage_scope = _usage.get()
+        if usage_scope is not None:
+            usage_scope.add(prompt_tokens, output_tokens)
+        # The bucket was charged the estimate up front; charge what the call really used.
+        self.tokens.debit(prompt_tokens + output_tokens - estimate)
+
+
+def create_llm_client(api_key: str, **kwargs: Any) -> ResilientLLMClient:
+    from google import genai
+
+    return ResilientLLMClient(genai.Client(api_key=api_key), **kwargs)
@@ -0,0 +1,161 @@
+from __future__ import annotations
+
+import hashlib
+import os
+import random
+import re
+from datetime import datetime, timedelta, timezone
+from typing import Any, Iterable
+
+
+MINHASH_PERMUTATIONS = 128
+LSH_BANDS = 16
+SHINGLE_SIZE = 5
+DEFAULT_NEAR_DUPLICATE_THRESHOLD = 0.85
+# Reprints and cross-posts show up within weeks of the original.
+DEFAULT_NEAR_DUPLICATE_WINDOW_DAYS = 90
+
+_MERSENNE_PRIME = (1 << 61) - 1
+_MAX_HASH = (1 << 32) - 1
+_TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+
+
+def _permutations(count: int, *, seed: int = 1) -> tuple[tuple[int, int], ...]:
+    # Fixed seed so signatures stored in the DB stay comparable across runs.
+    rng = random.Random(seed)
+    return tuple(
+        (rng.randint(1, _MERSENNE_PRIME - 1), rng.randint(0, _MERSENNE_PRIME - 1))
+        for _ in range(count)
+    )
+
+
+_PERMUTATIONS = _permutations(MINHASH_PERMUTATIONS)
+
+
+def near_duplicate_detection_enabled() -> bool:
+    return os.getenv("NEAR_DUPLICATE_DETECTION", "1") != "0"
+
+
+def resolve_near_duplicate_threshold() -> float:
+    raw_value = os.getenv("NEAR_DUPLICATE_THRESHOLD", "").strip()
+    if not raw_value:
+        return DEFAULT_NEAR_DUPLICATE_THRESHOLD
+    return float(raw_value)
+
+
+def resolve_near_duplicate_window_days() -> int:
+    raw_value = os.getenv("NEAR_DUPLICATE_WINDOW_DAYS", "").strip()
+    return int(raw_value) if raw_value else DEFAULT_NEAR_DUPLICATE_WINDOW_DAYS
+
+
+def _shingle_hashes(text: str, *, size: int = SHINGLE_SIZE) -> set[int]:
+    tokens = _TOKEN_RE.findall(text.lower())
+    if not tokens:
+        return set()
+    if len(tokens) < size:
+        windows: Iterable[str] = [" ".join(tokens)]
+    else:
+        windows = (" ".join(tokens[index : index + size]) for index in range(len(tokens) - size + 1))
+    return {
+        int.from_bytes(hashlib.blake2b(window.encode("utf-8"), digest_size=4).digest(), "little")
+        for window in windows
+    }
+
+
+def minhash_signature(text: str | None) -> tuple[int, ...]:
+    """Return a MinHash signature over word shingles, or () for empty text."""
+    shingles = _shingle_hashes(text or "")
+    if not shingles:
+        return ()
+    return tuple(
+        min(((a * shingle + b) % _MERSENNE_PRIME) & _MAX_HASH for shingle in shingles)
+        for a, b in _PERMUTATIONS
+    )
+
+
+def encode_signature(signature: tuple[int, ...]) -> str | None:
+    if not signature:
+        return None
+    return "".join(f"{value:08x}" for value in signature)
+
+
+def decode_signature(value: Any) -> tuple[int, ...]:
+    text_value = str(value or "").strip()
+    if not text_value or len(text_value) % 8:
+        return ()
+    return tuple(int(text_value[index : index + 8], 16) for index in range(0, len(text_value), 8))
+
+
+def estimate_similarity(left: tuple[int, ...], right: tuple[int, ...]) -> float:
+    if not left or len(left) != len(right):
+        return 0.0
+    matches = sum(1 for a, b in zip(left, right) if a == b)
+    return matches / len(left)
+
+
+class MinHashLSHIndex:
+    """Banded LSH index so near-duplicate lookups only compare bucket collisions."""
+
+    def __init__(self, *, threshold: float = DEFAULT_NEAR_DUPLICATE_THRESHOLD, bands: int = LSH_BANDS):
+        if MINHASH_PERMUTATIONS % bands:
+            raise ValueError("bands must evenly divide the MinHash signature length.")
+        self.threshold = threshold
+        self.bands = bands
+        self._rows = MINHASH_PERMUTATIONS // bands
+        self._buckets: dict[tuple[int, tuple[int, ...]], set[str]] = {}
+        self._signatures: dict[str, tuple[int, ...]] = {}
+
+    def __len__(self) -> int:
+        return len(self._signatures)
+
+    def _band_keys(self, signature: tuple[int, ...]) -> list[tuple[int, tuple[int, ...]]]:
+        return [
+            (band, signature[band * self._rows : (band + 1) * self._rows])
+            for band in range(self.bands)
+        ]
+
+    def add(self, key: str, signature: tuple[int, ...]) -> None:
+        if len(signature) != MINHASH_PERMUTATIONS:
+            return
+        self._signatures[key] = signature
+        for band_key in self._band_keys(signature):
+            self._buckets.setdefault(band_key, set()).add(key)
+
+    def query(self, signature: tuple[int, ...], *, exclude: str | None = None) -> tuple[str, float] | None:
+        """Return the most similar indexed key at or above the threshold."""
+        if len(signature) != MINHASH_PERMUTATIONS:
+            return None
+        candidates: set[str] = set()
+        for band_key in self._band_keys(signature):
+            candidates.update(self._buckets.get(band_key, ()))
+        candidates.discard(exclude)
+
+        best: tuple[str, float] | None = None
+        for candidate in candidates:
+            similarity = estimate_similarity(signature, self._signatures[candidate])
+            if similarity < self.threshold:
+                continue
+            if best is None or similarity > best[1]:
+                best = (candidate, similarity)
+        return best
+
+
+def load_near_duplicate_index(
+    repo: Any,
+    *,
+    threshold: float | None = None,
+    window_days: int | None = None,
+) -> MinHashLSHIndex:
+    """Build an LSH index from the signatures of articles added in the last ``window_days``.
+
+    The window keeps start-up cost proportional to recent volume rather than the whole
+    table; ``window_days=0`` loads every stored signature.
+    """
+    index = MinHashLSHIndex(
+        threshold=resolve_near_duplicate_threshold() if threshold is None else threshold
+    )
+    days = resolve_near_duplicate_window_days() if window_days is None else window_days
+    since = datetime.now(timezone.utc) - timedelta(days=days) if days > 0 else None
+    for row in repo.list_minhash_signatures(since):
+        index.add(str(row["url"]), decode_signature(row.get("minhash_signature")))
+    return index
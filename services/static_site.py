@@ -0,0 +1,150 @@
+from __future__ import annotations
+
+import gzip
+import json
+import mimetypes
+import os
+import shutil
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from jinja2 import Environment, FileSystemLoader, select_autoescape
+
+from models.sources import ArticleSource
+from services.card_fragments import render_cards
+from services.feed_snapshot import atomic_write_bytes
+from template_utils import safe_date
+
+
+DEFAULT_PAGE_SIZE = 20
+DEFAULT_STATIC_SITE_ARTICLES = 200
+API_ARTICLES_LIMIT = 20
+TEMPLATES_DIR = Path(__file__).resolve().parents[1] / "templates"
+SOURCE_SLUGS = {
+    ArticleSource.FOREIGN_AFFAIRS.value: "foreign-affairs",
+    ArticleSource.FOREIGN_POLICY.value: "foreign-policy",
+}
+# URL path -> file inside the export directory, for paths that are not directory indexes.
+_ROUTE_FILES = {"/api/articles": "api/articles.json"}
+
+
+def static_site_dir() -> str | None:
+    """Where ingestion writes the static site (STATIC_SITE_DIR); None disables the export."""
+    return os.getenv("STATIC_SITE_DIR", "").strip() or None
+
+
+def static_site_serving_enabled() -> bool:
+    """Both servers answer page and API requests from the export when STATIC_SITE_SERVE=1."""
+    return os.getenv("STATIC_SITE_SERVE", "0") == "1" and static_site_dir() is not None
+
+
+def resolve_static_site_size() -> int:
+    raw_value = os.getenv("STATIC_SITE_ARTICLES", "").strip()
+    return int(raw_value) if raw_value else DEFAULT_STATIC_SITE_ARTICLES
+
+
+def _brotli_module():
+    try:
+        import brotli
+    except Exception:
+        return None
+    return brotli
+
+
+def _template_environment() -> Environment:
+    env = Environment(loader=FileSystemLoader(TEMPLATES_DIR), autoescape=select_autoescape(["html"]))
+    env.filters["safe_date"] = safe_date
+    env.globals["static_url"] = lambda path: f"/static/{path}"
+    return env
+
+
+def _write_variants(output_dir: Path, relative_path: str, data: bytes) -> list[str]:
+    """Write a file plus its .gz and (when brotli is installed) .br siblings."""
+    target = output_dir / relative_path
+    atomic_write_bytes(target, data)
+    # mtime=0 keeps the gzip bytes identical across exports of unchanged content.
+    atomic_write_bytes(target.with_name(target.name + ".gz"), gzip.compress(data, compresslevel=9, mtime=0))
+    written = [relative_path, relative_path + ".gz"]
+    brotli = _brotli_module()
+    if brotli is not None:
+        atomic_write_bytes(target.with_name(target.name + ".br"), brotli.compress(data, quality=11))
+        written.append(relative_path + ".br")
+    return written
+
+
+def export_static_site(
+    articles: list[dict[str, Any]],
+    output_dir: str | Path,
+    *,
+    page_size: int = DEFAULT_PAGE_SIZE,
+) -> dict[str, Any]:
+    """Render the card deck, its paginated and per-source variants, and the API JSON.
+
+    ``articles`` are API-shaped dicts (newest first), as returned by the Flask app's
+    get_latest_articles(). Returns a summary of the files written.
+    """
+    root = Path(output_dir)
+    template = _template_environment().get_template("index.html")
+    written: list[str] = []
+
+    def render(relative_path: str, page_articles: list[dict[str, Any]]) -> None:
+        html = template.render(articles=page_articles, cards=render_cards(page_articles))
+        written.extend(_write_variants(root, relative_path, html.encode("utf-8")))
+
+    api_articles = json.dumps(articles[:API_ARTICLES_LIMIT], ensure_ascii=False).encode("utf-8")
+    written.extend(_write_variants(root, _ROUTE_FILES["/api/articles"], api_articles))
+
+    render("index.html", articles[:page_size])
+    page_count = max(1, -(-len(articles) // page_size))
+    for page in range(2, page_count + 1):
+        render(f"page/{page}/index.html", articles[(page - 1) * page_size : page * page_size])
+    # Drop pages left over from a larger previous export.
+    pages_dir = root / "page"
+    if pages_dir.is_dir():
+        for stale in pages_dir.iterdir():
+            if stale.is_dir() and (not stale.name.isdigit() or not 2 <= int(stale.name) <= page_count):
+                shutil.rmtree(stale)
+
+    for source, slug in SOURCE_SLUGS.items():
+        render(f"source/{slug}/index.html", [article for article in articles if article.get("source") == source][:page_size])
+
+    return {"path": str(root), "articles": len(articles), "pages": page_count, "files": len(written)}
+
+
+@dataclass(frozen=True)
+class StaticFile:
+    path: Path
+    media_type: str
+    headers: dict[str, str] = field(default_factory=dict)
+
+
+def _accepted_encodings(accept_encoding: str) -> set[str]:
+    accepted = set()
+    for part in accept_encoding.split(","):
+        name, _, params = part.strip().partition(";")
+        if name and params.replace(" ", "") not in {"q=0", "q=0.0"}:
+            accepted.add(name.lower())
+    return accepted
+
+
+def resolve_static_file(root: str | Path, request_path: str, accept_encoding: str = "") -> StaticFile | None:
+    """Map a request path to an exported file, preferring a precompressed variant."""
+    base = Path(root).resolve()
+    relative = _ROUTE_FILES.get(request_path.rstrip("/") or "/")
+    if relative is None:
+        relative = f"{request_path.strip('/')}/index.html".lstrip("/")
+    target = (base / relative).resolve()
+    if not target.is_relative_to(base) or not target.is_file():
+        return None
+
+    media_type = mimetypes.guess_type(target.name)[0] or "application/octet-stream"
+    if media_type.startswith("text/"):
+        media_type += "; charset=utf-8"
+    headers = {"Vary": "Accept-Encoding"}
+    accepted = _accepted_encodings(accept_encoding)
+    for encoding, suffix in (("br", ".br"), ("gzip", ".gz")):
+        variant = target.with_name(target.name + suffix)
+        if encoding in accepted and variant.is_file():
+            return StaticFile(variant, media_type, {**headers, "Content-Encoding": encoding})
+    return StaticFile(target, media_type, headers)
@@ -0,0 +1,160 @@
+"""Token budgeting for summary prompts: strip boilerplate, then map-reduce long articles.
+
+Prompts used to embed ``article['text']`` whatever its size. ``SummaryBudget.prepare()``
+returns the article the summarizers should see instead. Paragraphs that are nothing but
+page furniture (subscribe prompts, bylines, copyright lines) are dropped, along with
+repeated paragraphs. If the text is still over the threshold, it is split into chunks
+on paragraph boundaries. Each chunk is condensed into notes by its own Gemini call,
+and those calls run in parallel. The summarizers then prompt on the joined notes
+(map-reduce), so an essay of any length costs about one chunk's latency plus the
+usual three calls. The stored article keeps its full text either way.
+"""
+from __future__ import annotations
+
+import contextvars
+import math
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+from services.instrumentation import increment, timed
+from services.llm_client import CHARS_PER_TOKEN, SUMMARY_MODEL, estimate_tokens
+
+DEFAULT_MAP_REDUCE_THRESHOLD_TOKENS = 12_000
+DEFAULT_CHUNK_TOKENS = 4_000
+DEFAULT_MAX_CHUNKS = 12
+DEFAULT_MAP_WORKERS = 4
+# Patterns match a whole paragraph, so prose that merely mentions a newsletter, a
+# podcast or signing up to an accord is kept; only paragraphs this short are checked.
+BOILERPLATE_MAX_CHARS = 300
+BOILERPLATE_PATTERNS = tuple(
+    re.compile(pattern, re.IGNORECASE)
+    for pattern in (
+        r"^subscribe( now| today| here)?[.!]?$",
+        r"^(subscribe to|sign up for|get) (our|the) [\w' -]{0,60}\bnewsletters?[.!]?$",
+        r"^sign (up|in)( now| here| today)?[.!]?$",
+        r"^(listen to|subscribe to) (our|the) [\w' -]{0,60}\bpodcast[.!]?$",
+        r"^advertisement$",
+        r"^(read more|most read|related|continue reading)(:.{0,160})?$",
+        r"^(©|copyright\b)\s*©?\s*(19|20)\d\d\b.{0,120}$",
+        r"^all rights reserved\.?$",
+        r"^follow (us|him|her|them) on \w+[.!]?$",
+        r"^(loading|share|print|save)( this( article| story)?)?(\.\.\.|…|[.!:])?$",
+        r"^[^.]{0,80}\bis (a|an) [^.]{0,80}\bat (foreign policy|foreign affairs)\.?$",
+    )
+)
+
+
+def _env_int(name: str, default: int) -> int:
+    raw_value = os.getenv(name, "").strip()
+    return max(1, int(raw_value)) if raw_value else default
+
+
+def resolve_map_reduce_threshold_tokens() -> int:
+    return _env_int("SUMMARY_MAP_REDUCE_THRESHOLD_TOKENS", DEFAULT_MAP_REDUCE_THRESHOLD_TOKENS)
+
+
+def resolve_chunk_tokens() -> int:
+    return _env_int("SUMMARY_CHUNK_TOKENS", DEFAULT_CHUNK_TOKENS)
+
+
+def resolve_map_workers() -> int:
+    return _env_int("SUMMARY_MAP_WORKERS", DEFAULT_MAP_WORKERS)
+
+
+def _paragraphs(text: str) -> list[str]:
+    """Blank-line separated paragraphs, as both scrapers join them; single newlines stay inside."""
+    return [paragraph.strip() for paragraph in re.split(r"\n\s*\n", text or "") if paragraph.strip()]
+
+
+def is_boilerplate(paragraph: str) -> bool:
+    return len(paragraph) <= BOILERPLATE_MAX_CHARS and any(
+        pattern.match(paragraph) for pattern in BOILERPLATE_PATTERNS
+    )
+
+
+def strip_boilerplate(text: str) -> str:
+    """Drop boilerplate and repeated paragraphs; paragraphs stay separated by blank lines."""
+    seen: set[str] = set()
+    kept = []
+    for paragraph in _paragraphs(text):
+        if paragraph in seen or is_boilerplate(paragraph):
+            continue
+        seen.add(paragraph)
+        kept.append(paragraph)
+    return "\n\n".join(kept)
+
+
+def split_chunks(text: str, chunk_tokens: int) -> list[str]:
+    """Pack whole paragraphs into chunks of about ``chunk_tokens``; longer paragraphs are cut."""
+    limit = chunk_tokens * CHARS_PER_TOKEN
+    pieces = []
+    for paragraph in _paragraphs(text):
+        pieces += [paragraph[start : start + limit] for start in range(0, len(paragraph), limit)]
+    chunks: list[str] = []
+    current: list[str] = []
+    size = 0
+    for piece in pieces:
+        if current and size + len(piece) > limit:
+            chunks.append("\n\n".join(current))
+            current, size = [], 0
+        current.append(piece)
+        size += len(piece) + 2
+    if current:
+        chunks.append("\n\n".join(current))
+    return chunks
+
+
+@timed("llm.chunk_notes")
+def summarize_chunk(client: Any, article: dict[str, Any], chunk: str, index: int, total: int) -> str:
+    prompt = f"""
+Task: Condense part {index} of {total} of the article below into dense notes. Keep every
+claim, argument step, figure and statistic, and copy the most important quotes verbatim
+in quotation marks. Output only the notes.
+Title: {article['title']}
+Author: {article['author']}
+Text: {chunk}
+"""
+    return client.models.generate_content(model=SUMMARY_MODEL, contents=prompt).text.strip()
+
+
+class SummaryBudget:
+    """Fits an article's text to the prompt budget before the summarizers see it."""
+
+    def __init__(
+        self,
+        *,
+        threshold_tokens: int | None = None,
+        chunk_tokens: int | None = None,
+        max_chunks: int = DEFAULT_MAX_CHUNKS,
+        map_workers: int | None = None,
+    ):
+        self.threshold_tokens = threshold_tokens or resolve_map_reduce_threshold_tokens()
+        self.chunk_tokens = chunk_tokens or resolve_chunk_tokens()
+        self.max_chunks = max_chunks
+        self.map_workers = map_workers or resolve_map_workers()
+
+    def prepare(self, client: Any, article: dict[str, Any]) -> dict[str, Any]:
+        """A copy of ``article`` whose ``text`` is what the summary prompts should embed."""
+        text = strip_boilerplate(article.get("text") or "")
+        tokens = estimate_tokens(text)
+        increment("summary_budget.input_tokens", tokens)
+        if tokens <= self.threshold_tokens:
+            return {**article, "text": text}
+
+        # Grow the chunks rather than the number of calls, so latency stays bounded.
+        chunk_tokens = max(self.chunk_tokens, math.ceil(tokens / self.max_chunks))
+        chunks = split_chunks(text, chunk_tokens)
+        increment("summary_budget.map_reduce_articles")
+        increment("summary_budget.chunks", len(chunks))
+        with ThreadPoolExecutor(max_workers=min(self.map_workers, len(chunks))) as executor:
+            # Each call runs in a copy of this context so track_usage() still sees it.
+            futures = [
+                executor.submit(
+                    contextvars.copy_context().run, summarize_chunk, client, article, chunk, index, len(chunks)
+                )
+                for index, chunk in enumerate(chunks, start=1)
+            ]
+            notes = [future.result() for future in futures]
+        return {**article, "text": "\n\n".join(notes)}
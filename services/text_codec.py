@@ -0,0 +1,158 @@
+from __future__ import annotations
+
+import base64
+import os
+import zlib
+from collections.abc import Callable, Iterator, MutableMapping
+from functools import partial
+from typing import Any
+
+
+CODEC_NONE = "none"
+CODEC_ZLIB = "zlib"
+CODEC_ZSTD = "zstd"
+SUPPORTED_CODECS = (CODEC_NONE, CODEC_ZLIB, CODEC_ZSTD)
+
+SUMMARY_FIELDS = ("core_thesis", "detailed_abstract", "supporting_data_quotes")
+COMPRESSIBLE_FIELDS = ("article_text", *SUMMARY_FIELDS)
+_SUMMARIES_SUFFIX = "+summaries"
+
+
+def resolve_text_codec() -> str:
+    """Return the storage codec for new rows (ARTICLE_TEXT_CODEC, default none)."""
+    codec = os.getenv("ARTICLE_TEXT_CODEC", CODEC_NONE).strip().lower() or CODEC_NONE
+    if codec not in SUPPORTED_CODECS:
+        raise ValueError(f"Unsupported ARTICLE_TEXT_CODEC '{codec}'. Allowed: {list(SUPPORTED_CODECS)}.")
+    return codec
+
+
+def compress_summaries_enabled() -> bool:
+    return os.getenv("ARTICLE_COMPRESS_SUMMARIES", "0") == "1"
+
+
+def _zstd_module():
+    try:
+        import zstandard
+    except Exception:
+        return None
+    return zstandard
+
+
+def effective_codec(codec: str) -> str:
+    """Fall back to zlib when zstd is requested but the zstandard package is missing."""
+    if codec == CODEC_ZSTD and _zstd_module() is None:
+        return CODEC_ZLIB
+    return codec
+
+
+def codec_marker(codec: str, *, include_summaries: bool = False) -> str | None:
+    """Return the per-row marker stored next to compressed fields, or None for plain rows."""
+    codec = effective_codec(codec)
+    if codec == CODEC_NONE:
+        return None
+    return codec + (_SUMMARIES_SUFFIX if include_summaries else "")
+
+
+def parse_codec_marker(marker: str | None) -> tuple[str, tuple[str, ...]]:
+    """Return (codec, compressed field names) for a stored row marker."""
+    if not marker:
+        return CODEC_NONE, ()
+    if marker.endswith(_SUMMARIES_SUFFIX):
+        return marker[: -len(_SUMMARIES_SUFFIX)], COMPRESSIBLE_FIELDS
+    return marker, ("article_text",)
+
+
+def encode_text(value: str, codec: str) -> str:
+    raw = value.encode("utf-8")
+    if codec == CODEC_NONE:
+        return value
+    if codec == CODEC_ZLIB:
+        compressed = zlib.compress(raw, 9)
+    elif codec == CODEC_ZSTD:
+        zstandard = _zstd_module()
+        if zstandard is None:
+            raise RuntimeError("zstd storage requires the 'zstandard' package.")
+        compressed = zstandard.ZstdCompressor(level=19).compress(raw)
+    else:
+        raise ValueError(f"Unsupported text codec '{codec}'.")
+    # Columns are Text in every backend, so compressed bytes travel as base64.
+    return base64.b64encode(compressed).decode("ascii")
+
+
+def decode_text(value: Any, codec: str) -> Any:
+    if value is None or codec == CODEC_NONE:
+        return value
+    compressed = base64.b64decode(value)
+    if codec == CODEC_ZLIB:
+        return zlib.decompress(compressed).decode("utf-8")
+    if codec == CODEC_ZSTD:
+        zstandard = _zstd_module()
+        if zstandard is None:
+            raise RuntimeError("Reading zstd-compressed rows requires the 'zstandard' package.")
+        return zstandard.ZstdDecompressor().decompress(compressed).decode("utf-8")
+    raise ValueError(f"Unsupported text codec '{codec}'.")
+
+
+def encode_fields(values: dict[str, Any], marker: str | None) -> dict[str, Any]:
+    """Return a copy of ``values`` with the marker's fields compressed."""
+    codec, fields = parse_codec_marker(marker)
+    encoded = dict(values)
+    for field in fields:
+        if encoded.get(field) is not None:
+            encoded[field] = encode_text(str(encoded[field]), codec)
+    return encoded
+
+
+class LazyDecodedRow(MutableMapping):
+    """Article row that decompresses (or fetches) stored fields only when they are read."""
+
+    def __init__(
+        self,
+        data: dict[str, Any],
+        marker: str | None = None,
+        *,
+        loaders: dict[str, Callable[[], Any]] | None = None,
+    ):
+        self._data = data
+        codec, fields = parse_codec_marker(marker)
+        self._loaders: dict[str, Callable[[], Any]] = {
+            field: partial(decode_text, data[field], codec) for field in fields if field in data
+        }
+        self._loaders.update(loaders or {})
+        for field in self._loaders:
+            self._data.setdefault(field, None)
+
+    def __getitem__(self, key: str) -> Any:
+        loader = self._loaders.pop(key, None)
+        if loader is not None:
+            self._data[key] = loader()
+        return self._data[key]
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        self._loaders.pop(key, None)
+        self._data[key] = value
+
+    def __delitem__(self, key: str) -> None:
+        self._loaders.pop(key, None)
+        del self._data[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._data)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __repr__(self) -> str:
+        return f"LazyDecodedRow({dict(self)!r})"
+
+
+def decoded_row(
+    data: dict[str, Any],
+    marker: str | None,
+    *,
+    loaders: dict[str, Callable[[], Any]] | None = None,
+) -> dict[str, Any] | LazyDecodedRow:
+    """Wrap compressed or deferred rows for lazy access; plain rows are returned unchanged."""
+    if not marker and not loaders:
+        return data
+    return LazyDecodedRow(data, marker, loaders=loaders)
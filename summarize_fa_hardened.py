@@ -26,11 +26,21 @@ from typing import List, Dict
 
 from bs4 import BeautifulSoup
 import requests
-from google import genai  #  → works exactly as in the original script
 
 from models.sources import ArticleSource
 from services.article_repository import ArticleRepository, resolve_articles_db_path
+from services.article_urls import canonicalize_url, url_key
+from services.feed_exports import run_post_ingestion_exports
+from services.ingestion_pipeline import SourceAdapter
+from services.instrumentation import increment, report_run, timed
+from services.llm_client import SUMMARY_MODEL, ResilientLLMClient, create_llm_client, track_usage
+from services.near_duplicates import (
+    load_near_duplicate_index,
+    minhash_signature,
+    near_duplicate_detection_enabled,
+)
 from services.publication_dates import extract_publication_date_from_soup
+from services.summary_budget import SummaryBudget
 
 # --------------------------------------------------------------------------------------
 # Constants & configuration
@@ -38,6 +48,9 @@ from services.publication_dates import extract_publication_date_from_soup
 START_URL = "https://www.foreignaffairs.com/most-recent"
 MAX_RETRIES = 3  # Hard‑cap on Cloudflare / navigation retries
 REQUEST_TIMEOUT = 20
+# Stored with each summary; bump when the summary prompts change so
+# scripts/backfill_summaries.py can find rows written with the old ones.
+PROMPT_VERSION = "fa-1"
 USER_AGENT = (
     "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
     "AppleWebKit/537.36 (KHTML, like Gecko) "
@@ -67,8 +80,12 @@ def insert_article(
     detailed_abstract,
     supporting_data_quotes,
     publication_date=None,
+    prompt_tokens=None,
+    output_tokens=None,
+    prompt_version=PROMPT_VERSION,
+    minhash_signature=None,
 ):
-    repo.insert_article(
+    return repo.insert_article(
         source=source,
         url=url,
         title=title,
@@ -78,6 +95,10 @@ def insert_article(
         detailed_abstract=detailed_abstract,
         supporting_data_quotes=supporting_data_quotes,
         publication_date=publication_date,
+        prompt_tokens=prompt_tokens,
+        output_tokens=output_tokens,
+        prompt_version=prompt_version,
+        minhash_signature=minhash_signature,
     )
 
 
@@ -103,6 +124,7 @@ def _cloudflare_blocked(html: str) -> bool:
     return "Attention Required" in html or "cf-chl" in html
 
 
+@timed("fetch.http")
 def _fetch_html_via_requests(url: str, max_retries: int) -> str | None:
     session = requests.Session()
     headers = {
@@ -117,13 +139,16 @@ def _fetch_html_via_requests(url: str, max_retries: int) -> str | None:
             response.raise_for_status()
             html = response.text
             if _cloudflare_blocked(html):
+                increment("fetch.http.cloudflare_blocked")
                 continue
             return html
         except requests.RequestException:
+            increment("fetch.http.failures")
             continue
     return None
 
 
+@timed("fetch.playwright")
 def _fetch_html_via_playwright(url: str, max_retries: int) -> str | None:
     """
     Optional fallback used only when direct HTTP requests fail or are blocked.
@@ -161,6 +186,7 @@ def _fetch_html_via_playwright(url: str, max_retries: int) -> str | None:
         return None
 
 
+@timed("fetch.html")
 def fetch_html(url: str, max_retries: int = MAX_RETRIES) -> str | None:
     """
     Return HTML for a URL.
@@ -182,10 +208,12 @@ def extract_latest_article_urls(num_links: int = 3) -> List[str]:
     html = fetch_html(START_URL)
     if not html:
         return []
-    soup = BeautifulSoup(html, "html.parser")
-    article_cards = soup.find_all("div", class_="card--large")
+    with timed("parse.listing"):
+        soup = BeautifulSoup(html, "html.parser")
+        article_cards = soup.find_all("div", class_="card--large")
 
     urls: List[str] = []
+    seen_keys: set[str] = set()
     for card in article_cards:
         if len(urls) >= num_links:
             break
@@ -193,9 +221,11 @@ def extract_latest_article_urls(num_links: int = 3) -> List[str]:
         if h_link:
             anchor = h_link.find("a")
             if anchor and anchor.has_attr("href"):
-                url = "https://www.foreignaffairs.com" + anchor["href"]
-                if "podcast" not in url.lower():
-                    urls.append(url)
+                url = canonicalize_url(anchor["href"], base_url=START_URL)
+                if "podcast" in url.lower() or url_key(url) in seen_keys:
+                    continue
+                seen_keys.add(url_key(url))
+                urls.append(url)
     return urls
 
 
@@ -203,7 +233,11 @@ def extract_foreign_affairs_article(url: str) -> Dict[str, str] | None:
     html = fetch_html(url)
     if not html:
         return None
-    soup = BeautifulSoup(html, "html.parser")
+    with timed("parse.article"):
+        return _parse_foreign_affairs_article(BeautifulSoup(html, "html.parser"), url)
+
+
+def _parse_foreign_affairs_article(soup: BeautifulSoup, url: str) -> Dict[str, str]:
 
     title_tag = soup.find("h1", class_="topper__title")
     title = title_tag.get_text(strip=True) if title_tag else "Title Not Found"
@@ -237,38 +271,66 @@ def extract_foreign_affairs_article(url: str) -> Dict[str, str] | None:
 # Gemini helpers (unchanged) –––––––––––––––––––––––––––––––––––––––––––––––––––––––––––-
 # --------------------------------------------------------------------------------------
 
-def create_client(api_key: str) -> genai.Client:  # type: ignore
-    return genai.Client(api_key=api_key)
+def create_client(api_key: str) -> ResilientLLMClient:
+    return create_llm_client(api_key)
 
 
-def generate_core_thesis(client, article):
-    prompt = f"""
+def build_core_thesis_prompt(article):
+    return f"""
 Task: Write 1‑2 dense sentences capturing the main conclusion or central argument.
 Title: {article['title']}
 Author: {article['author']}
 Text: {article['text']}
 """
-    return client.models.generate_content(model="gemini-flash-latest", contents=prompt).text.strip()
 
 
-def generate_detailed_abstract(client, article):
-    prompt = f"""
+def build_detailed_abstract_prompt(article):
+    return f"""
 Task: Provide two dense paragraphs summarising the article.
 Title: {article['title']}
 Author: {article['author']}
 Text: {article['text']}
 """
-    return client.models.generate_content(model="gemini-flash-latest", contents=prompt).text.strip()
 
 
-def generate_supporting_data_quotes(client, article):
-    prompt = f"""
+def build_supporting_data_quotes_prompt(article):
+    return f"""
 Task: List key data points and 2‑3 direct quotes.
 Title: {article['title']}
 Author: {article['author']}
 Text: {article['text']}
 """
-    return client.models.generate_content(model="gemini-flash-latest", contents=prompt).text.strip()
+
+
+@timed("llm.core_thesis")
+def generate_core_thesis(client, article):
+    prompt = build_core_thesis_prompt(article)
+    return client.models.generate_content(model=SUMMARY_MODEL, contents=prompt).text.strip()
+
+
+@timed("llm.detailed_abstract")
+def generate_detailed_abstract(client, article):
+    prompt = build_detailed_abstract_prompt(article)
+    return client.models.generate_content(model=SUMMARY_MODEL, contents=prompt).text.strip()
+
+
+@timed("llm.supporting_data_quotes")
+def generate_supporting_data_quotes(client, article):
+    prompt = build_supporting_data_quotes_prompt(article)
+    return client.models.generate_content(model=SUMMARY_MODEL, contents=prompt).text.strip()
+
+
+def fa_adapter() -> SourceAdapter:
+    """Foreign Affairs as an ingestion pipeline source."""
+    return SourceAdapter(
+        name="fa",
+        source=ArticleSource.FOREIGN_AFFAIRS.value,
+        discover=extract_latest_article_urls,
+        fetch=extract_foreign_affairs_article,
+        summarizers=(generate_core_thesis, generate_detailed_abstract, generate_supporting_data_quotes),
+        prompts=(build_core_thesis_prompt, build_detailed_abstract_prompt, build_supporting_data_quotes_prompt),
+        prompt_version=PROMPT_VERSION,
+    )
 
 
 # --------------------------------------------------------------------------------------
@@ -276,6 +338,11 @@ Text: {article['text']}
 # --------------------------------------------------------------------------------------
 
 def main():
+    with report_run("summarize_fa"):
+        _run()
+
+
+def _run():
     num_to_fetch = int(sys.argv[1]) if len(sys.argv) > 1 else 3
     conn = init_db()
 
@@ -291,7 +358,12 @@ def main():
         print("[ERROR] GEMINI_API_KEY env var not set.")
         sys.exit(1)
     client = create_client(api_key)
+    budget = SummaryBudget()
+    near_duplicate_index = (
+        load_near_duplicate_index(conn) if near_duplicate_detection_enabled() else None
+    )
 
+    stored_count = 0
     for url in urls:
         cached = get_article_by_url(conn, url)
         if cached:
@@ -304,11 +376,27 @@ def main():
             print(f"[WARN] Failed to fetch article at {url}")
             continue
 
-        core = generate_core_thesis(client, article)
-        abstract = generate_detailed_abstract(client, article)
-        quotes = generate_supporting_data_quotes(client, article)
+        signature = None
+        if near_duplicate_index is not None:
+            signature = minhash_signature(article["text"])
+            match = near_duplicate_index.query(signature, exclude=url)
+            if match:
+                print(f"[SKIP] Near-duplicate of {match[0]} (similarity {match[1]:.2f}): {url}")
+                continue
+            near_duplicate_index.add(url, signature)
+
+        try:
+            with track_usage() as usage:
+                prompt_article = budget.prepare(client, article)
+                core = generate_core_thesis(client, prompt_article)
+                abstract = generate_detailed_abstract(client, prompt_article)
+                quotes = generate_supporting_data_quotes(client, prompt_article)
+        except Exception as exc:  # noqa: BLE001
+            # Left unstored so the next run retries it.
+            print(f"[WARN] Summarisation failed for {url}: {exc}")
+            continue
 
-        insert_article(
+        stored = insert_article(
             conn,
             source=ArticleSource.FOREIGN_AFFAIRS.value,
             url=article["url"],
@@ -319,9 +407,17 @@ def main():
             detailed_abstract=abstract,
             supporting_data_quotes=quotes,
             publication_date=article.get("publication_date"),
+            prompt_tokens=usage.prompt_tokens if usage.calls else None,
+            output_tokens=usage.output_tokens if usage.calls else None,
+            minhash_signature=signature,
         )
         print(f"[OK] Stored summary for {article['title']}")
+        if stored:
+            stored_count += 1
 
+    if stored_count:
+        for name, result in run_post_ingestion_exports(conn).items():
+            print(f"[INFO] Refreshed feed {name}: {result}")
     conn.close()
 
 
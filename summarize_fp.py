@@ -8,10 +8,26 @@ import os
 
 from models.sources import ArticleSource
 from services.article_repository import ArticleRepository, resolve_articles_db_path
+from services.article_urls import canonicalize_url, url_key
+from services.feed_exports import run_post_ingestion_exports
+from services.ingestion_pipeline import SourceAdapter
+from services.instrumentation import increment, report_run, timed
+from services.llm_client import SUMMARY_MODEL, ResilientLLMClient, create_llm_client, track_usage
+from services.near_duplicates import (
+    MinHashLSHIndex,
+    load_near_duplicate_index,
+    minhash_signature,
+    near_duplicate_detection_enabled,
+)
 from services.publication_dates import extract_publication_date_from_soup
+from services.summary_budget import SummaryBudget
 
 # ======= DATABASE IMPORTS AND FUNCTIONS (MINIMAL ADDITION) =======
 ALLOW_TRUNCATED_CONTENT = os.getenv("ALLOW_TRUNCATED_CONTENT", "0") == "1"
+FP_LISTING_URL = "https://foreignpolicy.com/category/latest/"
+# Stored with each summary; bump when the prompts below change so scripts/backfill_summaries.py
+# can find rows written with the old ones.
+PROMPT_VERSION = "fp-1"
 
 def init_db(db_path=None):
     """
@@ -24,7 +40,9 @@ def init_db(db_path=None):
     return ArticleRepository(database_url=database_url, sqlite_path=resolved_path)
 
 def insert_article(repo, source, url, title, author, article_text,
-                   core_thesis, detailed_abstract, supporting_data_quotes, publication_date=None):
+                   core_thesis, detailed_abstract, supporting_data_quotes, publication_date=None,
+                   prompt_tokens=None, output_tokens=None, prompt_version=PROMPT_VERSION,
+                   minhash_signature=None):
     """
     Inserts an article into the database table 'articles'.
     Skips if the URL is already present (UNIQUE constraint).
@@ -39,9 +57,14 @@ def insert_article(repo, source, url, title, author, article_text,
         detailed_abstract=detailed_abstract,
         supporting_data_quotes=supporting_data_quotes,
         publication_date=publication_date,
+        prompt_tokens=prompt_tokens,
+        output_tokens=output_tokens,
+        prompt_version=prompt_version,
+        minhash_signature=minhash_signature,
     )
     if inserted:
         print(f"Inserted article into DB: {title}")
+    return inserted
 
 def get_article_by_url(repo, url):
     """
@@ -119,6 +142,7 @@ def _extract_fp_article_body(soup: BeautifulSoup) -> str:
     return "\n\n".join(fallback_paragraphs)
 
 
+@timed("fetch.playwright")
 def _fetch_html_via_playwright(url: str) -> str | None:
     """Optional JS-rendered fallback for pages where requests returns truncated HTML."""
     try:
@@ -154,10 +178,18 @@ def _candidate_fetch_count(target_count: int) -> int:
     return max(target_count * 3, 10)
 
 
-def collect_eligible_articles(article_urls: list[str], desired_count: int) -> tuple[list[dict], int, int]:
+def collect_eligible_articles(
+    article_urls: list[str],
+    desired_count: int,
+    near_duplicate_index: MinHashLSHIndex | None = None,
+) -> tuple[list[dict], int, int]:
     """
     Scrape candidate URLs and keep up to the requested number of eligible articles.
 
+    When a near-duplicate index is given, articles whose text matches an already
+    stored (or already selected) article under a different URL are skipped so the
+    same piece is not summarized twice.
+
     Returns:
         (eligible_articles, skipped_for_truncation, scrape_failures)
     """
@@ -181,6 +213,15 @@ def collect_eligible_articles(article_urls: list[str], desired_count: int) -> tu
                 print(f"[SKIP] Skipping potentially truncated article: {url}")
                 continue
 
+        if near_duplicate_index is not None:
+            signature = minhash_signature(article_data.get("text"))
+            match = near_duplicate_index.query(signature, exclude=url)
+            if match:
+                print(f"[SKIP] Near-duplicate of {match[0]} (similarity {match[1]:.2f}): {url}")
+                continue
+            near_duplicate_index.add(url, signature)
+            article_data["minhash_signature"] = signature
+
         articles_data.append(article_data)
         if len(articles_data) >= desired_count:
             break
@@ -198,6 +239,7 @@ Description:
     - Summarizes each article using Gemini API.
 """
 
+@timed("scrape.article")
 def scrape_foreignpolicy_article(url):
     """
     Fetch the Foreign Policy article, remove paywall references,
@@ -211,17 +253,40 @@ def scrape_foreignpolicy_article(url):
         )
     }
     try:
-        response = requests.get(url, headers=headers, timeout=10)
-        response.raise_for_status()
-        html = response.text
+        with timed("fetch.http"):
+            response = requests.get(url, headers=headers, timeout=10)
+            response.raise_for_status()
+            html = response.text
     except requests.exceptions.RequestException as e:
+        increment("fetch.http.failures")
         print(f"Error fetching URL {url}: {e}")
         return None
 
-    html = re.sub(r'<script[^>]+(?:piano\\.io|cxense\\.com)[^>]+></script>', '', html)
+    with timed("parse.article"):
+        html = re.sub(r'<script[^>]+(?:piano\\.io|cxense\\.com)[^>]+></script>', '', html)
+        soup = BeautifulSoup(html, "html.parser")
+        title, author, article_body = _parse_fp_article(soup)
+        publication_date = extract_publication_date_from_soup(soup, url=url)
+
+    if _is_likely_truncated(article_body):
+        rendered_html = _fetch_html_via_playwright(url)
+        if rendered_html:
+            with timed("parse.article_rendered"):
+                rendered_soup = BeautifulSoup(rendered_html, "html.parser")
+                rendered_body = _extract_fp_article_body(rendered_soup)
+            if len(rendered_body) > len(article_body):
+                article_body = rendered_body
+
+    return {
+        "title": title,
+        "author": author,
+        "text": article_body,
+        "publication_date": publication_date,
+        "content_warning": "possibly_truncated" if _is_likely_truncated(article_body) else None,
+    }
 
-    soup = BeautifulSoup(html, "html.parser")
 
+def _parse_fp_article(soup: BeautifulSoup) -> tuple[str, str, str]:
     title_elem = soup.select_one("div.hed-heading h1.hed")
     title = title_elem.get_text(strip=True) if title_elem else "No Title Found"
 
@@ -236,31 +301,13 @@ def scrape_foreignpolicy_article(url):
         else:
             author = "No Author Found"
 
-    article_body = _extract_fp_article_body(soup)
-
-    if _is_likely_truncated(article_body):
-        rendered_html = _fetch_html_via_playwright(url)
-        if rendered_html:
-            rendered_soup = BeautifulSoup(rendered_html, "html.parser")
-            rendered_body = _extract_fp_article_body(rendered_soup)
-            if len(rendered_body) > len(article_body):
-                article_body = rendered_body
-
-    publication_date = extract_publication_date_from_soup(soup, url=url)
-
-    return {
-        "title": title,
-        "author": author,
-        "text": article_body,
-        "publication_date": publication_date,
-        "content_warning": "possibly_truncated" if _is_likely_truncated(article_body) else None,
-    }
+    return title, author, _extract_fp_article_body(soup)
 
 def scrape_foreignpolicy_article_list(num_links=3):
     """
     Fetches a Foreign Policy listing page and extracts article URLs.
     """
-    url = "https://foreignpolicy.com/category/latest/"
+    url = FP_LISTING_URL
     headers = {
         "User-Agent": (
             "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
@@ -269,41 +316,44 @@ def scrape_foreignpolicy_article_list(num_links=3):
         )
     }
     try:
-        response = requests.get(url, headers=headers, timeout=10)
-        response.raise_for_status()
-        html_content = response.text
+        with timed("fetch.listing"):
+            response = requests.get(url, headers=headers, timeout=10)
+            response.raise_for_status()
+            html_content = response.text
     except requests.exceptions.RequestException as e:
+        increment("fetch.listing.failures")
         print(f"Error fetching article list: {e}")
         return []
 
-    html_content = re.sub(r'<script[^>]+(?:piano\.io|cxense\\.com)[^>]+></script>', '', html_content)
-    soup = BeautifulSoup(html_content, 'html.parser')
+    with timed("parse.listing"):
+        html_content = re.sub(r'<script[^>]+(?:piano\.io|cxense\\.com)[^>]+></script>', '', html_content)
+        soup = BeautifulSoup(html_content, 'html.parser')
+        article_containers = soup.find_all('div', class_='blog-list-layout')
 
     article_urls = []
-    article_containers = soup.find_all('div', class_='blog-list-layout')
+    seen_keys = set()
     for container in article_containers:
         figure_tag = container.find('figure', class_='figure-image')
         if figure_tag:
             link_tag = figure_tag.find('a')
             if link_tag and 'href' in link_tag.attrs:
-                article_url = link_tag['href']
+                article_url = canonicalize_url(link_tag['href'], base_url=url)
+                if url_key(article_url) in seen_keys:
+                    continue
+                seen_keys.add(url_key(article_url))
                 article_urls.append(article_url)
                 if len(article_urls) >= num_links:
                     break
     return article_urls
 
-def create_client(api_key: str) -> genai.Client:
+def create_client(api_key: str) -> ResilientLLMClient:
     """
-    Creates a Gemini Developer API client.
+    Creates a Gemini Developer API client behind the shared rate limiter and retries.
     """
-    client = genai.Client(api_key=api_key)
-    return client
+    return create_llm_client(api_key)
 
-def generate_core_thesis(client: genai.Client, article: dict) -> str:
-    """
-    Generates the Core Thesis in 1-2 sentences.
-    """
-    prompt = f"""
+def build_core_thesis_prompt(article: dict) -> str:
+    return f"""
     Task: Write 1-2 dense sentences capturing the main conclusion or central argument
     of the above article, focusing only on the primary claim or takeaway without supporting details.
     
@@ -312,21 +362,9 @@ def generate_core_thesis(client: genai.Client, article: dict) -> str:
     Text: {article['text']}
     """
 
-    try:
-        response = client.models.generate_content(
-            model='gemini-flash-latest',
-            contents=prompt
-        )
-        return response.text.strip()
-    except Exception as e:
-        print(f"Error generating core thesis: {e}")
-        return "Summary generation failed."
 
-def generate_detailed_abstract(client: genai.Client, article: dict) -> str:
-    """
-    Generates an abstract that expands on the core thesis.
-    """
-    prompt = f"""
+def build_detailed_abstract_prompt(article: dict) -> str:
+    return f"""
     Task: Provide 1-2 dense paragraphs summarizing the main arguments and points
     of the article. Include essential background, the progression of ideas, and explain
     any important concepts the article uses to develop its case.
@@ -336,22 +374,10 @@ def generate_detailed_abstract(client: genai.Client, article: dict) -> str:
     Author: {article['author']}
     Text: {article['text']}
     """
-    try:
-        response = client.models.generate_content(
-            model='gemini-flash-latest',
-            contents=prompt
-        )
-        return response.text.strip()
-    except Exception as e:
-        print(f"Error generating detailed abstract: {e}")
-        return "Summary generation failed."
 
 
-def generate_supporting_data_quotes(client: genai.Client, article: dict) -> str:
-    """
-    Highlights critical data points and direct quotes from the article.
-    """
-    prompt = f"""
+def build_supporting_data_quotes_prompt(article: dict) -> str:
+    return f"""
     Task: Extract and list:
     - The most important factual data points or statistics from the article.
     - 2-3 key direct quotes verbatim, capturing the article's ethos or perspective.
@@ -362,18 +388,64 @@ def generate_supporting_data_quotes(client: genai.Client, article: dict) -> str:
     Author: {article['author']}
     Text: {article['text']}
     """
-    try:
-        response = client.models.generate_content(
-            model='gemini-flash-latest',
-            contents=prompt
-        )
-        return response.text.strip()
-    except Exception as e:
-        print(f"Error generating supporting data/quotes: {e}")
-        return "Summary generation failed."
+
+
+@timed("llm.core_thesis")
+def generate_core_thesis(client: genai.Client, article: dict) -> str:
+    """
+    Generates the Core Thesis in 1-2 sentences.
+    """
+    response = client.models.generate_content(
+        model=SUMMARY_MODEL,
+        contents=build_core_thesis_prompt(article)
+    )
+    return response.text.strip()
+
+@timed("llm.detailed_abstract")
+def generate_detailed_abstract(client: genai.Client, article: dict) -> str:
+    """
+    Generates an abstract that expands on the core thesis.
+    """
+    response = client.models.generate_content(
+        model=SUMMARY_MODEL,
+        contents=build_detailed_abstract_prompt(article)
+    )
+    return response.text.strip()
+
+
+@timed("llm.supporting_data_quotes")
+def generate_supporting_data_quotes(client: genai.Client, article: dict) -> str:
+    """
+    Highlights critical data points and direct quotes from the article.
+    """
+    response = client.models.generate_content(
+        model=SUMMARY_MODEL,
+        contents=build_supporting_data_quotes_prompt(article)
+    )
+    return response.text.strip()
+
+
+def fp_adapter() -> SourceAdapter:
+    """Foreign Policy as an ingestion pipeline source."""
+    return SourceAdapter(
+        name="fp",
+        source=ArticleSource.FOREIGN_POLICY.value,
+        discover=scrape_foreignpolicy_article_list,
+        fetch=scrape_foreignpolicy_article,
+        summarizers=(generate_core_thesis, generate_detailed_abstract, generate_supporting_data_quotes),
+        prompts=(build_core_thesis_prompt, build_detailed_abstract_prompt, build_supporting_data_quotes_prompt),
+        prompt_version=PROMPT_VERSION,
+        candidate_count=_candidate_fetch_count,
+        allow_truncated=ALLOW_TRUNCATED_CONTENT,
+    )
 
 
 def main():
+    with report_run("summarize_fp"):
+        _run()
+
+
+def _run():
     if len(sys.argv) < 2:
         num_articles_to_summarize = 10
     else:
@@ -398,9 +470,13 @@ def main():
     # === Initialize Database (MINIMAL ADDITION) ===
     conn = init_db(resolve_articles_db_path())
 
+    near_duplicate_index = (
+        load_near_duplicate_index(conn) if near_duplicate_detection_enabled() else None
+    )
     articles_data, truncated_skips, scrape_failures = collect_eligible_articles(
         article_urls,
         num_articles_to_summarize,
+        near_duplicate_index=near_duplicate_index,
     )
 
     if not articles_data:
@@ -430,8 +506,10 @@ def main():
         sys.exit(1)
 
     client = create_client(api_key)
+    budget = SummaryBudget()
 
     print("\n--- Article Summaries ---")
+    stored_count = 0
     for article in articles_data:
         # Check if article already in DB
         existing_record = get_article_by_url(conn, article["url"])
@@ -449,9 +527,16 @@ def main():
         else:
             # Summarize and insert
             print(f"\n--- ARTICLE: {article['title']} by {article['author']} ---")
-            core_thesis = generate_core_thesis(client, article)
-            detailed_abstract = generate_detailed_abstract(client, article)
-            supporting_data_quotes = generate_supporting_data_quotes(client, article)
+            try:
+                with track_usage() as usage:
+                    prompt_article = budget.prepare(client, article)
+                    core_thesis = generate_core_thesis(client, prompt_article)
+                    detailed_abstract = generate_detailed_abstract(client, prompt_article)
+                    supporting_data_quotes = generate_supporting_data_quotes(client, prompt_article)
+            except Exception as e:
+                # Not stored, so the next run retries it instead of keeping a failed summary.
+                print(f"Error generating summaries, skipping {article['url']}: {e}")
+                continue
 
             print("\n=== CORE THESIS ===")
             print(core_thesis)
@@ -462,7 +547,7 @@ def main():
             print("-" * 50)
 
             # Store in DB
-            insert_article(
+            if insert_article(
                 conn,
                 source=ArticleSource.FOREIGN_POLICY.value,
                 url=article["url"],
@@ -473,8 +558,15 @@ def main():
                 detailed_abstract=detailed_abstract,
                 supporting_data_quotes=supporting_data_quotes,
                 publication_date=article.get("publication_date"),
-            )
-
+                prompt_tokens=usage.prompt_tokens if usage.calls else None,
+                output_tokens=usage.output_tokens if usage.calls else None,
+                minhash_signature=article.get("minhash_signature"),
+            ):
+                stored_count += 1
+
+    if stored_count:
+        for name, result in run_post_ingestion_exports(conn).items():
+            print(f"[INFO] Refreshed feed {name}: {result}")
     conn.close()
 
 if __name__ == "__main__":
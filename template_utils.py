@@ -1,5 +1,5 @@
 from datetime import datetime
-from typing import Optional
+from typing import Iterable, Optional
 
 
 UNKNOWN_DATE_TEXT = "Unknown date"
@@ -22,3 +22,11 @@ def safe_date(value: Optional[str]) -> str:
         return UNKNOWN_DATE_TEXT
 
     return f"{parsed_date.strftime('%B')} {parsed_date.day}"
+
+
+def split_quotes(value: Optional[str | Iterable[str]]) -> list[str]:
+    """Split the '*'-delimited supporting quotes into trimmed, non-empty items."""
+    if not value:
+        return []
+    parts = value.split("*") if isinstance(value, str) else value
+    return [quote.strip() for quote in parts if quote and quote.strip()]
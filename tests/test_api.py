@@ -15,6 +15,7 @@ REQUIRED_ARTICLE_KEYS = {
     "core_thesis",
     "detailed_abstract",
     "supporting_data_quotes",
+    "supporting_quotes",
     "publication_date",
     "date_added",
 }
@@ -80,6 +81,7 @@ def test_flask_api_articles_contract(flask_client_with_db):
     assert isinstance(data, list)
     assert data, "Expected fixture-seeded results, got empty list"
     assert REQUIRED_ARTICLE_KEYS.issubset(data[0].keys())
+    assert data[0]["supporting_quotes"] == ["Quotes"]
 
 
 def test_flask_api_articles_order_and_source_normalization(flask_client_with_db):
@@ -141,7 +143,7 @@ def test_flask_home_page_date_rendering(client, monkeypatch, date_added, expecte
         }
     ]
 
-    monkeypatch.setattr("app.get_latest_articles", lambda limit=20: sample_articles)
+    monkeypatch.setattr("app.get_latest_articles", lambda limit=20, **_: sample_articles)
 
     response = client.get("/")
     assert response.status_code == 200
@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+
+from services.api_metrics import render_metrics
+
+
+def _insert(repo, index: int) -> None:
+    repo.insert_article(
+        source="Foreign Policy",
+        url=f"https://fp.com/metrics-{index}",
+        title=f"Metrics {index}",
+        author="Author",
+        article_text="Body",
+        core_thesis="Core",
+        detailed_abstract="Abstract",
+        supporting_data_quotes="*Quote",
+        date_added=f"2024-01-0{index} 00:00:00",
+    )
+
+
+@pytest.fixture
+def seeded_db(tmp_path, monkeypatch):
+    from services.article_repository import ArticleRepository
+
+    db_path = tmp_path / "metrics.db"
+    repo = ArticleRepository(sqlite_path=str(db_path))
+    _insert(repo, 1)
+    repo.close()
+    monkeypatch.delenv("DATABASE_URL", raising=False)
+    monkeypatch.setenv("ARTICLES_DB_PATH", str(db_path))
+    return db_path
+
+
+def _sample(text: str, name: str, **labels: str) -> float:
+    for line in text.splitlines():
+        if line.startswith(name + "{") and all(f'{key}="{value}"' in line for key, value in labels.items()):
+            return float(line.rsplit(" ", 1)[1])
+    return 0.0
+
+
+def test_flask_metrics_cover_routes_repository_and_card_cache(client, seeded_db):
+    before = client.get("/metrics").get_data(as_text=True)
+    client.get("/")
+    client.get("/")
+    api = client.get("/api/articles")
+    client.get("/no-such-page")
+    after = client.get("/metrics")
+    text = after.get_data(as_text=True)
+
+    def delta(name: str, **labels: str) -> float:
+        return _sample(text, name, **labels) - _sample(before, name, **labels)
+
+    assert after.status_code == 200
+    assert after.content_type.startswith("text/plain")
+    assert delta("fpfa_http_request_duration_seconds_count", app="flask", route="/", status="200") == 2
+    assert delta("fpfa_http_request_duration_seconds_count", app="flask", route="<unmatched>", status="404") == 1
+    assert delta("fpfa_http_response_bytes_sum", app="flask", route="/api/articles") == len(api.data)
+    assert delta("fpfa_repository_query_duration_seconds_count", backend="sqlite", operation="get_latest_articles") == 3
+    assert delta("fpfa_cache_requests_total", cache="card_fragments", result="hit") >= 1
+    assert 'route="/metrics"' not in text
+
+
+@pytest.mark.asyncio
+async def test_fastapi_metrics_label_routes(seeded_db):
+    from main import app
+
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as ac:
+        before = (await ac.get("/metrics")).text
+        await ac.get("/api/articles")
+        response = await ac.get("/metrics")
+
+    def delta(name: str, **labels: str) -> float:
+        return _sample(response.text, name, **labels) - _sample(before, name, **labels)
+
+    assert response.status_code == 200
+    assert delta("fpfa_http_request_duration_seconds_count", app="fastapi", route="/api/articles", status="200") == 1
+    assert delta("fpfa_repository_query_duration_seconds_count", backend="sqlite", operation="get_latest_articles") == 1
+
+
+def test_multiprocess_mode_aggregates_from_the_shared_directory(tmp_path, monkeypatch):
+    monkeypatch.setenv("PROMETHEUS_MULTIPROC_DIR", str(tmp_path))
+
+    body, content_type = render_metrics()
+
+    # Nothing has been written by worker processes in this directory yet.
+    assert body == b""
+    assert content_type.startswith("text/plain")
+
+
+def test_metrics_endpoint_can_be_disabled(client, monkeypatch):
+    monkeypatch.setenv("METRICS_ENABLED", "0")
+
+    assert client.get("/metrics").status_code == 404
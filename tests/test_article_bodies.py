@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+from sqlalchemy import insert, select
+
+from services.article_repository import ArticleRepository, article_bodies_table, articles_table
+from services.text_codec import CODEC_ZLIB, codec_marker, encode_text
+
+
+def _insert_legacy_row(repo: ArticleRepository, url: str, article_text: str, text_codec: str | None = None) -> None:
+    with repo.engine.begin() as conn:
+        conn.execute(
+            insert(articles_table).values(
+                source="Foreign Affairs",
+                url=url,
+                title="Legacy",
+                author="Author",
+                article_text=article_text,
+                core_thesis="Core",
+                detailed_abstract="Abstract",
+                supporting_data_quotes="Quote",
+                text_codec=text_codec,
+            )
+        )
+
+
+def test_insert_keeps_articles_row_narrow_and_body_loads_on_demand(tmp_path):
+    repo = ArticleRepository(sqlite_path=str(tmp_path / "repo.db"))
+    try:
+        repo.insert_article(
+            source="Foreign Policy",
+            url="https://fp.com/body",
+            title="Body",
+            author="Author",
+            article_text="Full article body",
+            core_thesis="Core",
+            detailed_abstract="Abstract",
+            supporting_data_quotes="Quote",
+        )
+        with repo.engine.connect() as conn:
+            inline_text = conn.execute(select(articles_table.c.article_text)).scalar_one()
+            body_text = conn.execute(select(article_bodies_table.c.article_text)).scalar_one()
+        feed = repo.get_latest_articles(limit=5, include_text=False)
+        full = repo.get_latest_articles(limit=5)
+        row = repo.get_article_by_url("https://fp.com/body")
+    finally:
+        repo.close()
+
+    assert inline_text == ""
+    assert body_text == "Full article body"
+    assert "article_text" not in feed[0]
+    assert dict(full[0])["article_text"] == "Full article body"
+    assert row is not None
+    assert row["article_text"] == "Full article body"
+
+
+def test_move_article_bodies_migrates_legacy_rows_in_batches(tmp_path):
+    repo = ArticleRepository(sqlite_path=str(tmp_path / "repo.db"))
+    try:
+        _insert_legacy_row(repo, "https://fa.com/plain", "Plain legacy text")
+        _insert_legacy_row(
+            repo,
+            "https://fa.com/compressed",
+            encode_text("Compressed legacy text", CODEC_ZLIB),
+            text_codec=codec_marker(CODEC_ZLIB),
+        )
+        before = repo.get_article_by_url("https://fa.com/plain")["article_text"]
+        moved = repo.move_article_bodies(batch_size=1)
+        moved_again = repo.move_article_bodies()
+        plain = repo.get_article_by_url("https://fa.com/plain")
+        compressed = repo.get_article_by_url("https://fa.com/compressed")
+        latest = {dict(item)["url"]: dict(item)["article_text"] for item in repo.get_latest_articles(limit=5)}
+    finally:
+        repo.close()
+
+    assert before == "Plain legacy text"
+    assert moved == 2
+    assert moved_again == 0
+    assert plain["article_text"] == "Plain legacy text"
+    assert compressed["article_text"] == "Compressed legacy text"
+    assert latest == {
+        "https://fa.com/plain": "Plain legacy text",
+        "https://fa.com/compressed": "Compressed legacy text",
+    }
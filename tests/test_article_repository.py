@@ -3,7 +3,7 @@ from __future__ import annotations
 from dataclasses import dataclass
 from datetime import datetime, timezone
 
-from sqlalchemy import insert
+from sqlalchemy import insert, inspect, select
 
 from services.article_repository import ArticleRepository, normalize_database_url, resolve_database_url
 from services.article_repository import articles_table
@@ -205,6 +205,54 @@ def test_repository_normalizes_legacy_publication_dates_on_read(tmp_path):
     assert row["publication_date"] == "2024-01-02"
 
 
+def test_repository_stores_quote_list_and_backfills_legacy_rows(tmp_path):
+    repo = ArticleRepository(sqlite_path=str(tmp_path / "repo.db"))
+    try:
+        repo.insert_article(
+            source="Foreign Policy",
+            url="https://fp.com/quotes",
+            title="Quotes",
+            author="Author",
+            article_text="Text",
+            core_thesis="Core",
+            detailed_abstract="Abstract",
+            supporting_data_quotes="* First * Second*",
+        )
+        with repo.engine.begin() as conn:
+            conn.execute(
+                insert(articles_table).values(
+                    source="Foreign Affairs",
+                    url="https://fa.com/legacy-quotes",
+                    title="Legacy",
+                    author="Author",
+                    article_text="Text",
+                    core_thesis="Core",
+                    detailed_abstract="Abstract",
+                    supporting_data_quotes="*Old one*Old two",
+                )
+            )
+        before = repo.get_article_by_url("https://fa.com/legacy-quotes")
+        backfilled = repo.backfill_supporting_quotes(batch_size=1)
+        backfilled_again = repo.backfill_supporting_quotes()
+        with repo.engine.connect() as conn:
+            stored = dict(conn.execute(select(articles_table.c.url, articles_table.c.supporting_quotes)).all())
+        latest = repo.get_latest_articles(limit=5, include_text=False)
+    finally:
+        repo.close()
+
+    assert before is not None and before["supporting_quotes"] == ["Old one", "Old two"]
+    assert backfilled == 1
+    assert backfilled_again == 0
+    assert stored == {
+        "https://fp.com/quotes": '["First", "Second"]',
+        "https://fa.com/legacy-quotes": '["Old one", "Old two"]',
+    }
+    assert {item["url"]: item["supporting_quotes"] for item in latest} == {
+        "https://fp.com/quotes": ["First", "Second"],
+        "https://fa.com/legacy-quotes": ["Old one", "Old two"],
+    }
+
+
 @dataclass
 class _FakeSnapshot:
     payload: dict[str, object] | None
@@ -214,6 +262,10 @@ class _FakeSnapshot:
     def exists(self) -> bool:
         return self.payload is not None
 
+    @property
+    def id(self) -> str | None:
+        return self.reference._document_id if self.reference else None
+
     def to_dict(self) -> dict[str, object]:
         return dict(self.payload or {})
 
@@ -223,7 +275,13 @@ class _FakeDocumentReference:
         self._storage = storage
         self._document_id = document_id
 
-    def get(self) -> _FakeSnapshot:
+    @property
+    def id(self) -> str:
+        return self._document_id
+
+    def get(self, transaction: "_FakeTransaction | None" = None) -> _FakeSnapshot:
+        if transaction is not None:
+            transaction.reads.append(self._document_id)
         return _FakeSnapshot(self._storage.get(self._document_id), reference=self)
 
     def create(self, payload: dict[str, object]) -> None:
@@ -231,6 +289,9 @@ class _FakeDocumentReference:
             raise FileExistsError
         self._storage[self._document_id] = dict(payload)
 
+    def set(self, payload: dict[str, object]) -> None:
+        self._storage[self._document_id] = dict(payload)
+
     def update(self, payload: dict[str, object]) -> None:
         if self._document_id not in self._storage:
             self._storage[self._document_id] = {}
@@ -238,30 +299,72 @@ class _FakeDocumentReference:
 
 
 class _FakeQuery:
-    def __init__(self, collection: "_FakeCollection", rows: list[dict[str, object]] | None = None):
+    def __init__(
+        self,
+        collection: "_FakeCollection",
+        rows: list[dict[str, object]] | None = None,
+        fields: list[str] | None = None,
+        orders: tuple[str, ...] = (),
+    ):
         self._collection = collection
         self._rows = rows
+        self._fields = fields
+        self._orders = orders
+
+    def _copy(self, rows: list[dict[str, object]] | None, **changes) -> "_FakeQuery":
+        return _FakeQuery(
+            self._collection,
+            rows,
+            changes.get("fields", self._fields),
+            changes.get("orders", self._orders),
+        )
 
     def where(self, field: str, op: str, value: object) -> "_FakeQuery":
-        assert op == "=="
-        rows = [row for row in self._iter_rows() if row.get(field) == value]
-        return _FakeQuery(self._collection, rows)
+        self._collection.wheres.append((field, op, value))
+        if op == "==":
+            rows = [row for row in self._iter_rows() if row.get(field) == value]
+        elif op == "in":
+            rows = [row for row in self._iter_rows() if row.get(field) in value]
+        else:
+            assert op == ">"
+            rows = [
+                row
+                for row in self._iter_rows()
+                if isinstance(row.get(field), type(value)) and row[field] > value
+            ]
+        return self._copy(rows)
 
     def order_by(self, field: str, direction: str | None = None) -> "_FakeQuery":
         reverse = direction == _FakeFirestoreModule.Query.DESCENDING
+        orders = (*self._orders, field)
         rows = sorted(
             self._iter_rows(),
-            key=lambda row: row.get(field) or datetime.min.replace(tzinfo=timezone.utc),
+            key=lambda row: tuple(
+                row.get(name) or datetime.min.replace(tzinfo=timezone.utc) for name in orders
+            ),
             reverse=reverse,
         )
-        return _FakeQuery(self._collection, rows)
+        return self._copy(rows, orders=orders)
 
     def limit(self, value: int) -> "_FakeQuery":
-        return _FakeQuery(self._collection, self._iter_rows()[:value])
+        return self._copy(self._iter_rows()[:value])
+
+    def start_after(self, cursor: dict[str, object]) -> "_FakeQuery":
+        position = tuple(cursor[name] for name in self._orders)
+        rows = [
+            row for row in self._iter_rows() if tuple(row.get(name) for name in self._orders) > position
+        ]
+        return self._copy(rows)
+
+    def select(self, fields: list[str]) -> "_FakeQuery":
+        self._collection.selects.append(list(fields))
+        return self._copy(self._rows, fields=list(fields))
 
     def stream(self) -> list[_FakeSnapshot]:
         snapshots: list[_FakeSnapshot] = []
         for document_id, row in self._collection._items(self._rows):
+            if self._fields is not None:
+                row = {field: value for field, value in row.items() if field in self._fields}
             snapshots.append(
                 _FakeSnapshot(
                     row,
@@ -277,6 +380,8 @@ class _FakeQuery:
 class _FakeCollection(_FakeQuery):
     def __init__(self):
         self._storage: dict[str, dict[str, object]] = {}
+        self.selects: list[list[str]] = []
+        self.wheres: list[tuple[str, str, object]] = []
         super().__init__(self)
 
     def document(self, document_id: str) -> _FakeDocumentReference:
@@ -303,19 +408,71 @@ class _FakeCollection(_FakeQuery):
 class _FakeFirestoreClient:
     def __init__(self):
         self._collections: dict[str, _FakeCollection] = {}
+        self.transactions: list[_FakeTransaction] = []
 
     def collection(self, name: str) -> _FakeCollection:
         if name not in self._collections:
             self._collections[name] = _FakeCollection()
         return self._collections[name]
 
+    def get_all(self, references: list[_FakeDocumentReference]) -> list[_FakeSnapshot]:
+        return [reference.get() for reference in references]
+
+    def batch(self) -> "_FakeWriteBatch":
+        return _FakeWriteBatch()
+
+    def transaction(self) -> "_FakeTransaction":
+        transaction = _FakeTransaction()
+        self.transactions.append(transaction)
+        return transaction
+
+
+class _FakeWriteBatch:
+    """Applies all writes on commit, or none if any create() collides."""
+
+    def __init__(self):
+        self._writes: list[tuple[str, _FakeDocumentReference, dict[str, object]]] = []
+        self.commits = 0
+
+    def create(self, reference: _FakeDocumentReference, payload: dict[str, object]) -> None:
+        self._writes.append(("create", reference, payload))
+
+    def set(self, reference: _FakeDocumentReference, payload: dict[str, object]) -> None:
+        self._writes.append(("set", reference, payload))
+
+    def update(self, reference: _FakeDocumentReference, payload: dict[str, object]) -> None:
+        self._writes.append(("update", reference, payload))
+
+    def commit(self) -> None:
+        if any(op == "create" and reference.get().exists for op, reference, _ in self._writes):
+            raise FileExistsError
+        for op, reference, payload in self._writes:
+            getattr(reference, op)(payload)
+
+
+class _FakeTransaction(_FakeWriteBatch):
+    """Buffers writes like a batch; firestore.transactional commits it when the function returns."""
+
+    def __init__(self):
+        super().__init__()
+        self.reads: list[str] = []
+
 
 class _FakeFirestoreModule:
     class Query:
         DESCENDING = "DESCENDING"
 
+    @staticmethod
+    def transactional(function):
+        def run(transaction, *args, **kwargs):
+            result = function(transaction, *args, **kwargs)
+            transaction.commit()
+            return result
 
-def test_repository_supports_firestore_backend(monkeypatch):
+        return run
+
+
+def _use_fake_firestore(monkeypatch) -> _FakeFirestoreClient:
     fake_client = _FakeFirestoreClient()
 
     monkeypatch.delenv("DATABASE_URL", raising=False)
@@ -330,6 +487,11 @@ def test_repository_supports_firestore_backend(monkeypatch):
         "services.article_repository._get_firestore_already_exists_exception",
         lambda: FileExistsError,
     )
+    return fake_client
+
+
+def test_repository_supports_firestore_backend(monkeypatch):
+    fake_client = _use_fake_firestore(monkeypatch)
 
     repo = ArticleRepository()
     try:
@@ -369,11 +531,16 @@ def test_repository_supports_firestore_backend(monkeypatch):
             date_added="2024-01-03 03:04:05",
         )
         latest = repo.get_latest_articles(limit=10)
+        selects = fake_client.collection("articles").selects
+        latest_select, select_count = selects[-1], len(selects)
+        feed = repo.get_latest_articles(limit=10, include_text=False)
+        feed_select_count = len(selects)
         row = repo.get_article_by_url("https://fa.com/firestore-one")
         assert row is not None
         repo.update_article_publication_date(int(row["id"]), "2024-02-02")
         repo.update_article_date_added_by_url("https://fa.com/firestore-one", "2024-02-03 04:05:06")
         updated = repo.get_article_by_url("https://fa.com/firestore-one")
+        refreshed_feed = repo.get_latest_articles(limit=10, include_text=False)
     finally:
         repo.close()
 
@@ -381,8 +548,356 @@ def test_repository_supports_firestore_backend(monkeypatch):
     assert inserted is True
     assert duplicate is False
     assert [item["title"] for item in latest] == ["Two", "One"]
+    assert latest[1]["article_text"] == "Text"
+    assert "article_text" not in fake_client.collection("articles")._storage[
+        next(iter(fake_client.collection("articles")._storage))
+    ]
+    assert "article_text" in latest_select
+    assert [item["title"] for item in feed] == ["Two", "One"]
+    assert "article_text" not in feed[0]
+    # The list view came from the denormalized feed document, not a collection query.
+    assert feed_select_count == select_count
+    feed_doc = fake_client.collection("articles_feed")._storage["latest"]
+    assert [entry["title"] for entry in feed_doc["articles"]] == ["One", "Two"]
+    assert feed_doc["articles"][0]["supporting_quotes"] == ["Quote"]
+    assert [item["title"] for item in refreshed_feed] == ["One", "Two"]
+    assert refreshed_feed[0]["publication_date"] == "2024-02-02"
     assert row is not None
     assert row["publication_date"] == "2024-01-01"
     assert updated is not None
     assert updated["publication_date"] == "2024-02-02"
     assert updated["date_added"] == "2024-02-03 04:05:06"
+
+
+def test_firestore_id_lookups_use_mapping_and_listing_pages(monkeypatch):
+    fake_client = _use_fake_firestore(monkeypatch)
+    articles = fake_client.collection("articles")
+
+    repo = ArticleRepository()
+    for index, publication_date in enumerate(["2024-03-01", None, "2024-01-01", "2024-02-01"]):
+        repo.insert_article(
+            source="Foreign Affairs",
+            url=f"https://fa.com/paged-{index}",
+            title=f"Paged {index}",
+            author="Author",
+            article_text="Text",
+            core_thesis="Core",
+            detailed_abstract="Abstract",
+            supporting_data_quotes="Quote",
+            publication_date=publication_date,
+        )
+    # A document written before the id mapping existed.
+    articles.document("legacy-doc").create({"id": 42, "url": "https://fa.com/legacy", "title": "Legacy"})
+
+    rows = list(repo._backend.list_articles_with_publication_dates(page_size=2))
+    target = repo.get_article_by_url("https://fa.com/paged-0")
+    assert target is not None
+    articles.wheres.clear()
+    repo.update_article_publication_date(int(target["id"]), "2024-03-05")
+    mapped_wheres = list(articles.wheres)
+    repo.update_article_publication_date(42, "2023-12-31")
+    repo.update_article_publication_date(42, "2024-01-15")
+    repo.close()
+
+    # Id order, like the SQL backend; undated documents are skipped.
+    assert [row["id"] for row in rows] == sorted(row["id"] for row in rows)
+    assert sorted(row["title"] for row in rows) == ["Paged 0", "Paged 2", "Paged 3"]
+    assert mapped_wheres == []
+    assert articles.wheres == [("id", "==", 42)]
+    assert articles._storage["legacy-doc"]["publication_date"] == "2024-01-15"
+    assert fake_client.collection("articles_ids")._storage["42"] == {"document_id": "legacy-doc"}
+
+
+def _bulk_article(index: int, **overrides) -> dict[str, object]:
+    return {
+        "source": "Foreign Policy",
+        "url": f"https://fp.com/bulk-{index}",
+        "title": f"Bulk {index}",
+        "author": "Author",
+        "article_text": f"Body {index}",
+        "core_thesis": "Core",
+        "detailed_abstract": "Abstract",
+        "supporting_data_quotes": "*One *Two",
+        "date_added": f"2024-01-{index + 1:02d} 00:00:00",
+        **overrides,
+    }
+
+
+def test_insert_articles_writes_batches_and_skips_duplicates(tmp_path):
+    repo = ArticleRepository(sqlite_path=str(tmp_path / "bulk.db"))
+    try:
+        repo.insert_article(**_bulk_article(3))
+        inserted = repo.insert_articles((_bulk_article(index) for index in range(5)), batch_size=2)
+        undated = repo.insert_articles([_bulk_article(9, date_added=None)])
+        latest = repo.get_latest_articles(limit=10)
+    finally:
+        repo.close()
+
+    # The batch holding the existing bulk-3 fell back to row-by-row and still stored bulk-2.
+    assert inserted == 4
+    assert undated == 1
+    assert [item["title"] for item in latest] == ["Bulk 9", "Bulk 4", "Bulk 3", "Bulk 2", "Bulk 1", "Bulk 0"]
+    assert latest[1]["article_text"] == "Body 4"
+    assert latest[1]["supporting_quotes"] == ["One", "Two"]
+
+
+def test_firestore_insert_articles_uses_write_batches(monkeypatch):
+    fake_client = _use_fake_firestore(monkeypatch)
+
+    repo = ArticleRepository()
+    repo.insert_article(**_bulk_article(1))
+    inserted = repo.insert_articles([_bulk_article(index) for index in range(3)])
+    latest = repo.get_latest_articles(limit=10)
+    repo.close()
+
+    assert inserted == 2
+    assert [item["title"] for item in latest] == ["Bulk 2", "Bulk 1", "Bulk 0"]
+    assert latest[0]["article_text"] == "Body 2"
+    feed = fake_client.collection("articles_feed")._storage["latest"]["articles"]
+    assert [entry["title"] for entry in feed] == ["Bulk 2", "Bulk 1", "Bulk 0"]
+    assert len(fake_client.collection("articles_ids")._storage) == 3
+
+
+def test_repository_routes_reads_to_replica_after_read_your_writes_window(tmp_path, monkeypatch):
+    primary_path = tmp_path / "primary.db"
+    replica_path = tmp_path / "replica.db"
+    # The "replica" is a separate file that never receives the write, standing in for lag.
+    ArticleRepository(sqlite_path=str(replica_path)).close()
+    monkeypatch.setenv("DB_READ_YOUR_WRITES_SECONDS", "60")
+
+    repo = ArticleRepository(
+        database_url=f"sqlite:///{primary_path}",
+        read_database_url=f"sqlite:///{replica_path}",
+    )
+    try:
+        before_write = repo.get_latest_articles(limit=5)
+        repo.insert_article(
+            source="Foreign Affairs",
+            url="https://fa.com/replica",
+            title="Replica",
+            author="Author",
+            article_text="Text",
+            core_thesis="Core",
+            detailed_abstract="Abstract",
+            supporting_data_quotes="Quote",
+        )
+        pinned = repo.get_latest_articles(limit=5)
+        repo._backend.read_your_writes_window = 0
+        from_replica = repo.get_latest_articles(limit=5)
+        stats = repo.get_pool_stats()
+    finally:
+        repo.close()
+
+    assert before_write == []
+    assert [row["title"] for row in pinned] == ["Replica"]
+    assert from_replica == []
+    assert stats["read"]["checkouts"] >= 2
+
+
+def _new_summary(index: int) -> dict[str, object]:
+    return {
+        "url": f"https://fp.com/bulk-{index}",
+        "core_thesis": f"New core {index}",
+        "detailed_abstract": f"New abstract {index}",
+        "supporting_data_quotes": "*Three *Four",
+        "prompt_tokens": 900,
+        "output_tokens": 120,
+    }
+
+
+def test_update_article_summaries_rewrites_summaries_in_the_rows_codec(tmp_path):
+    plain = ArticleRepository(sqlite_path=str(tmp_path / "summaries.db"))
+    plain.insert_articles([_bulk_article(0), _bulk_article(1)])
+    plain.close()
+    repo = ArticleRepository(sqlite_path=str(tmp_path / "summaries.db"), text_codec="zlib", compress_summaries=True)
+    try:
+        repo.insert_article(**_bulk_article(2))
+        updated = repo.update_article_summaries(
+            [_new_summary(0), _new_summary(2), _new_summary(7)], batch_size=2
+        )
+        with repo.engine.connect() as conn:
+            stored = dict(
+                conn.execute(select(articles_table.c.url, articles_table.c.core_thesis)).all()
+            )
+        rows = {index: repo.get_article_by_url(f"https://fp.com/bulk-{index}") for index in range(3)}
+    finally:
+        repo.close()
+
+    assert updated == 2
+    assert stored["https://fp.com/bulk-0"] == "New core 0"
+    assert stored["https://fp.com/bulk-2"] != "New core 2"  # compressed like the rest of that row
+    assert rows[2]["core_thesis"] == "New core 2"
+    assert rows[2]["supporting_quotes"] == ["Three", "Four"]
+    assert (rows[0]["prompt_tokens"], rows[0]["output_tokens"]) == (900, 120)
+    assert rows[1]["core_thesis"] == "Core"
+
+
+def test_firestore_update_article_summaries_batches_writes_and_refreshes_the_feed(monkeypatch):
+    fake_client = _use_fake_firestore(monkeypatch)
+
+    repo = ArticleRepository()
+    repo.insert_articles([_bulk_article(index) for index in range(2)])
+    updated = repo.update_article_summaries([_new_summary(1), _new_summary(5)])
+    article = repo.get_article_by_url("https://fp.com/bulk-1")
+    repo.close()
+
+    assert updated == 1
+    assert article["detailed_abstract"] == "New abstract 1"
+    assert article["prompt_tokens"] == 900
+    feed = fake_client.collection("articles_feed")._storage["latest"]["articles"]
+    assert [entry["core_thesis"] for entry in feed] == ["New core 1", "Core"]
+
+
+def test_list_articles_to_resummarize_finds_failed_and_stale_rows_by_index(tmp_path):
+    failed = "Summary generation failed."
+    repo = ArticleRepository(sqlite_path=str(tmp_path / "stale.db"), text_codec="zlib", compress_summaries=True)
+    try:
+        repo.insert_articles(
+            [
+                _bulk_article(0, core_thesis=failed, prompt_version="fp-1"),
+                _bulk_article(1, prompt_version="fp-0"),
+                _bulk_article(2, prompt_version="fp-1"),
+                _bulk_article(3),
+            ]
+        )
+        with repo.engine.begin() as conn:
+            conn.execute(
+                insert(articles_table).values(
+                    source="Foreign Policy",
+                    url="https://fp.com/bulk-4",
+                    title="Legacy",
+                    author="Author",
+                    article_text="Legacy body",
+                    core_thesis=failed,
+                    detailed_abstract=failed,
+                    supporting_data_quotes=failed,
+                )
+            )
+
+        def urls(**kwargs) -> list[str]:
+            return [row["url"] for row in repo.list_articles_to_resummarize(**kwargs)]
+
+        before_backfill = urls()
+        backfilled = repo.backfill_summary_status(batch_size=2)
+        backfilled_again = repo.backfill_summary_status()
+        failed_rows = repo.list_articles_to_resummarize()
+        stale = urls(failed=False, prompt_versions=("fp-0", None))
+        first_page = repo.list_articles_to_resummarize(limit=1)
+        second_page = urls(after_id=first_page[0]["id"], limit=1)
+        repo.update_article_summaries([{**_new_summary(0), "prompt_version": "fp-2"}])
+        after_update = urls(prompt_versions=("fp-2",))
+        index_names = {index["name"] for index in inspect(repo.engine).get_indexes("articles")}
+    finally:
+        repo.close()
+
+    assert before_backfill == ["https://fp.com/bulk-0"]  # compressed, but tagged at write time
+    assert (backfilled, backfilled_again) == (1, 0)
+    assert [row["url"] for row in failed_rows] == ["https://fp.com/bulk-0", "https://fp.com/bulk-4"]
+    assert failed_rows[0]["article_text"] == "Body 0"
+    assert failed_rows[1]["article_text"] == "Legacy body"
+    assert stale == ["https://fp.com/bulk-1", "https://fp.com/bulk-3", "https://fp.com/bulk-4"]
+    assert second_page == ["https://fp.com/bulk-4"]
+    assert after_update == ["https://fp.com/bulk-0", "https://fp.com/bulk-4"]
+    assert {"idx_articles_summary_status", "idx_articles_prompt_version"} <= index_names
+
+
+def test_firestore_summary_status_backfill_and_resummarize_queries(monkeypatch):
+    fake_client = _use_fake_firestore(monkeypatch)
+    failed = "Summary generation failed."
+
+    repo = ArticleRepository()
+    repo.insert_articles(
+        [
+            _bulk_article(0, detailed_abstract=failed, prompt_version="fp-1"),
+            _bulk_article(1, prompt_version="fp-0"),
+            _bulk_article(2, core_thesis=failed),
+        ]
+    )
+    storage = fake_client.collection("articles")._storage
+    legacy = next(doc for doc in storage.values() if doc["url"] == "https://fp.com/bulk-2")
+    del legacy["summary_status"], legacy["prompt_version"]
+    backfilled = repo.backfill_summary_status()
+    failed_rows = repo.list_articles_to_resummarize()
+    stale = repo.list_articles_to_resummarize(failed=False, prompt_versions=("fp-0", None))
+    both = repo.list_articles_to_resummarize(prompt_versions=("fp-0",), limit=2)
+    repo.close()
+
+    assert backfilled == 1
+    assert legacy["summary_status"] == "failed"
+    assert "prompt_version" in legacy and legacy["prompt_version"] is None
+    ids = {doc["url"]: doc["id"] for doc in storage.values()}
+    assert [row["url"] for row in failed_rows] == sorted(
+        ["https://fp.com/bulk-0", "https://fp.com/bulk-2"], key=ids.get
+    )
+    assert failed_rows[0]["article_text"] in {"Body 0", "Body 2"}
+    assert sorted(row["url"] for row in stale) == ["https://fp.com/bulk-1", "https://fp.com/bulk-2"]
+    assert len(both) == 2 and [row["id"] for row in both] == sorted(row["id"] for row in both)
+
+
+def test_firestore_insert_article_writes_document_mapping_and_body_atomically(monkeypatch):
+    fake_client = _use_fake_firestore(monkeypatch)
+    repo = ArticleRepository()
+
+    def crash(self) -> None:
+        raise ConnectionError("deadline exceeded")
+
+    with monkeypatch.context() as patch:
+        patch.setattr(_FakeWriteBatch, "commit", crash)
+        try:
+            repo.insert_article(**_bulk_article(0))
+        except ConnectionError:
+            pass
+    leftovers = {name: dict(collection._storage) for name, collection in fake_client._collections.items()}
+    retried = repo.insert_article(**_bulk_article(0))
+    article = repo.get_article_by_url("https://fp.com/bulk-0")
+    repo.close()
+
+    assert all(not storage for name, storage in leftovers.items() if name != "articles_feed")
+    assert retried is True
+    assert article["article_text"] == "Body 0"
+
+
+def test_firestore_feed_merge_reads_and_writes_the_feed_in_a_transaction(monkeypatch):
+    fake_client = _use_fake_firestore(monkeypatch)
+    repo = ArticleRepository()
+
+    repo.insert_article(**_bulk_article(0))  # no feed yet: rebuilt from the collection
+    repo.insert_article(**_bulk_article(1))
+    repo.close()
+
+    assert [transaction.reads for transaction in fake_client.transactions] == [["latest"], ["latest"]]
+    feed = fake_client.collection("articles_feed")._storage["latest"]["articles"]
+    assert [entry["url"] for entry in feed] == ["https://fp.com/bulk-1", "https://fp.com/bulk-0"]
+
+
+def test_firestore_bulk_date_repairs_can_defer_the_feed_rebuild(monkeypatch):
+    fake_client = _use_fake_firestore(monkeypatch)
+    repo = ArticleRepository()
+    repo.insert_articles([_bulk_article(index) for index in range(3)])
+    feed_storage = fake_client.collection("articles_feed")._storage
+    feed_storage.clear()
+
+    for index in range(3):
+        row = repo.get_article_by_url(f"https://fp.com/bulk-{index}")
+        repo.update_article_publication_date(int(row["id"]), "2024-05-01", refresh_feed=False)
+        repo.update_article_date_added_by_url(row["url"], f"2024-06-0{index + 1} 00:00:00", refresh_feed=False)
+    deferred = dict(feed_storage)
+    repo.refresh_latest_feed()
+    repo.close()
+
+    assert deferred == {}
+    assert [entry["url"] for entry in feed_storage["latest"]["articles"]] == [
+        f"https://fp.com/bulk-{index}" for index in (2, 1, 0)
+    ]
+
+
+def test_sql_dated_articles_come_in_id_order_a_page_at_a_time(tmp_path):
+    repo = ArticleRepository(sqlite_path=str(tmp_path / "dated.db"))
+    repo.insert_articles(
+        [_bulk_article(index, publication_date=None if index == 1 else f"2024-0{5 - index}-01") for index in range(5)]
+    )
+
+    rows = list(repo._backend.list_articles_with_publication_dates(page_size=2))
+    repo.close()
+
+    assert [row["title"] for row in rows] == ["Bulk 0", "Bulk 2", "Bulk 3", "Bulk 4"]
@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+import sqlite3
+
+import pytest
+from sqlalchemy import inspect
+
+from services.article_repository import ArticleRepository
+from services.article_urls import canonicalize_url, url_key
+
+
+@pytest.mark.parametrize(
+    "raw_url, expected",
+    [
+        (
+            "http://ForeignPolicy.com/2024/01/02/story/?utm_source=rss&utm_medium=feed#comments",
+            "https://foreignpolicy.com/2024/01/02/story/",
+        ),
+        (
+            "https://www.foreignaffairs.com:443/world/story?b=2&fbclid=abc&a=1",
+            "https://www.foreignaffairs.com/world/story?a=1&b=2",
+        ),
+        ("https://fa.com//world///story", "https://fa.com/world/story"),
+        ("mailto:editor@example.com", "mailto:editor@example.com"),
+    ],
+)
+def test_canonicalize_url(raw_url, expected):
+    assert canonicalize_url(raw_url) == expected
+
+
+def test_canonicalize_url_resolves_relative_hrefs():
+    assert (
+        canonicalize_url("/united-states/story", base_url="https://www.foreignaffairs.com/most-recent")
+        == "https://www.foreignaffairs.com/united-states/story"
+    )
+
+
+def test_url_key_collapses_spelling_variants_to_fixed_width_key():
+    variants = [
+        "https://foreignpolicy.com/2024/01/02/story/",
+        "http://www.foreignpolicy.com/2024/01/02/story",
+        "https://foreignpolicy.com/2024/01/02/story/?utm_campaign=x",
+    ]
+    keys = {url_key(variant) for variant in variants}
+
+    assert len(keys) == 1
+    assert len(keys.pop()) == 64
+    assert url_key("https://foreignpolicy.com/2024/01/02/other/") != url_key(variants[0])
+
+
+def test_repository_dedupes_and_looks_up_by_url_key(tmp_path):
+    repo = ArticleRepository(sqlite_path=str(tmp_path / "repo.db"))
+    article = {
+        "source": "Foreign Policy",
+        "title": "Story",
+        "author": "Author",
+        "article_text": "Text",
+        "core_thesis": "Core",
+        "detailed_abstract": "Abstract",
+        "supporting_data_quotes": "Quote",
+    }
+    try:
+        first = repo.insert_article(url="https://foreignpolicy.com/2024/01/02/story/?utm_source=rss", **article)
+        duplicate = repo.insert_article(url="http://www.foreignpolicy.com/2024/01/02/story", **article)
+        row = repo.get_article_by_url("https://foreignpolicy.com/2024/01/02/story")
+    finally:
+        repo.close()
+
+    assert first is True
+    assert duplicate is False
+    assert row is not None
+    assert row["url"] == "https://foreignpolicy.com/2024/01/02/story/"
+
+
+def test_repository_backfills_url_key_for_legacy_tables(tmp_path):
+    db_path = tmp_path / "legacy.db"
+    conn = sqlite3.connect(db_path)
+    conn.execute(
+        """
+        CREATE TABLE articles (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            source TEXT NOT NULL,
+            url TEXT NOT NULL UNIQUE,
+            title TEXT NOT NULL,
+            author TEXT NOT NULL,
+            article_text TEXT NOT NULL,
+            core_thesis TEXT NOT NULL,
+            detailed_abstract TEXT NOT NULL,
+            supporting_data_quotes TEXT NOT NULL,
+            date_added TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+        """
+    )
+    conn.executemany(
+        """
+        INSERT INTO articles (
+            source, url, title, author, article_text, core_thesis, detailed_abstract, supporting_data_quotes
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+        """,
+        [
+            ("Foreign Policy", "https://fp.com/a/", "A", "X", "T", "C", "D", "Q"),
+            ("Foreign Policy", "https://fp.com/a?utm_source=x", "A copy", "X", "T", "C", "D", "Q"),
+        ],
+    )
+    conn.commit()
+    conn.close()
+
+    repo = ArticleRepository(sqlite_path=str(db_path))
+    try:
+        index_names = {index["name"] for index in inspect(repo.engine).get_indexes("articles")}
+        row = repo.get_article_by_url("https://fp.com/a")
+    finally:
+        repo.close()
+
+    assert "uq_articles_url_key" in index_names
+    assert row is not None
+    assert row["title"] == "A"
@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+import pytest
+
+from services.article_repository import ArticleRepository
+from services.async_article_repository import AsyncArticleRepository, async_database_url
+from test_article_repository import _use_fake_firestore
+
+
+def _insert(repo: ArticleRepository, index: int) -> None:
+    repo.insert_article(
+        source="Foreign Affairs",
+        url=f"https://fa.com/async-{index}",
+        title=f"Async {index}",
+        author="Author",
+        article_text=f"Body {index}",
+        core_thesis="Core",
+        detailed_abstract="Abstract",
+        supporting_data_quotes="Quote",
+        publication_date="2024-01-01",
+        date_added=f"2024-01-0{index} 00:00:00",
+    )
+
+
+def test_async_database_url_maps_drivers_and_skips_sql_server():
+    pytest.importorskip("aiosqlite")
+    assert async_database_url("sqlite:////tmp/articles.db") == "sqlite+aiosqlite:////tmp/articles.db"
+    assert async_database_url("mssql+pymssql://user:pw@host:1433/db") is None
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("offload", [False, True])
+async def test_async_repository_matches_sync_reads(tmp_path, monkeypatch, offload):
+    db_path = tmp_path / "articles.db"
+    sync_repo = ArticleRepository(sqlite_path=str(db_path), text_codec="zlib", compress_summaries=True)
+    for index in (1, 2, 3):
+        _insert(sync_repo, index)
+    expected = [dict(row) for row in sync_repo.get_latest_articles(limit=2)]
+    sync_repo.close()
+
+    if offload:
+        monkeypatch.setattr("services.async_article_repository.async_database_url", lambda url: None)
+    else:
+        pytest.importorskip("aiosqlite")
+        pytest.importorskip("greenlet")
+
+    repo = AsyncArticleRepository(sqlite_path=str(db_path))
+    try:
+        latest = [dict(row) for row in await repo.get_latest_articles(limit=2)]
+        cards = [dict(row) for row in await repo.get_latest_articles(limit=2, include_text=False)]
+    finally:
+        await repo.aclose()
+
+    assert repo.mode == ("thread" if offload else "async")
+    assert latest == expected
+    assert [row["article_text"] for row in latest] == ["Body 3", "Body 2"]
+    assert all("article_text" not in row for row in cards)
+    assert [row["core_thesis"] for row in cards] == ["Core", "Core"]
+
+
+class _AsyncQuery:
+    def __init__(self, query):
+        self._query = query
+
+    def __getattr__(self, name):
+        method = getattr(self._query, name)
+        return lambda *args, **kwargs: _AsyncQuery(method(*args, **kwargs))
+
+    async def stream(self):
+        for snapshot in self._query.stream():
+            yield snapshot
+
+
+class _AsyncDocumentReference:
+    def __init__(self, reference):
+        self._reference = reference
+
+    async def get(self):
+        return self._reference.get()
+
+
+class _AsyncCollection(_AsyncQuery):
+    def document(self, document_id: str) -> _AsyncDocumentReference:
+        return _AsyncDocumentReference(self._query.document(document_id))
+
+
+class _AsyncFirestoreClient:
+    def __init__(self, client):
+        self._client = client
+        self.closed = False
+
+    def collection(self, name: str) -> _AsyncCollection:
+        return _AsyncCollection(self._client.collection(name))
+
+    async def get_all(self, references):
+        for reference in references:
+            yield reference._reference.get()
+
+    def close(self) -> None:
+        self.closed = True
+
+
+@pytest.mark.asyncio
+async def test_async_repository_reads_firestore_through_async_client(monkeypatch):
+    fake_client = _use_fake_firestore(monkeypatch)
+    async_client = _AsyncFirestoreClient(fake_client)
+    monkeypatch.setattr(
+        "services.async_article_repository._create_firestore_async_client",
+        lambda project_id: async_client,
+    )
+
+    repo = AsyncArticleRepository()
+    for index in (1, 2):
+        _insert(repo._sync, index)
+    latest = await repo.get_latest_articles(limit=5)
+    cards = await repo.get_latest_articles(limit=5, include_text=False)
+    await repo.aclose()
+
+    assert repo.mode == "firestore"
+    assert [row["title"] for row in latest] == ["Async 2", "Async 1"]
+    assert [row["article_text"] for row in latest] == ["Body 2", "Body 1"]
+    assert [row["title"] for row in cards] == ["Async 2", "Async 1"]
+    assert "article_text" not in cards[0]
+    assert async_client.closed is True
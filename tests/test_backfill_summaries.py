@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+import summarize_fa_hardened
+import summarize_fp
+from benchmarks.fake_genai import FakeGenAIClient
+from scripts.backfill_summaries import backfill, iter_candidates
+from scripts.batch_resummarize import source_adapters
+from services.article_repository import ArticleRepository
+from services.llm_client import ResilientLLMClient
+
+FAILED = "Summary generation failed."
+
+
+def _seed(repo: ArticleRepository) -> None:
+    sources = ["Foreign Policy", "Foreign Affairs", "Foreign Policy", "Unknown"]
+    repo.insert_articles(
+        [
+            {
+                "source": source,
+                "url": f"https://example.com/essay-{index}",
+                "title": f"Essay {index}",
+                "author": "Author",
+                "article_text": f"Essay {index} argues for restraint in the Pacific.",
+                "core_thesis": FAILED,
+                "detailed_abstract": "Abstract",
+                "supporting_data_quotes": FAILED,
+            }
+            for index, source in enumerate(sources)
+        ]
+        + [
+            {
+                "source": "Foreign Policy",
+                "url": "https://example.com/fine",
+                "title": "Fine",
+                "author": "Author",
+                "article_text": "Fine text.",
+                "core_thesis": "Core",
+                "detailed_abstract": "Abstract",
+                "supporting_data_quotes": "*Quote",
+                "prompt_version": summarize_fp.PROMPT_VERSION,
+            }
+        ]
+    )
+
+
+def test_backfill_resummarizes_failed_rows_from_stored_text_in_batches(tmp_path):
+    repo = ArticleRepository(sqlite_path=str(tmp_path / "articles.db"))
+    _seed(repo)
+    fake = FakeGenAIClient()
+    client = ResilientLLMClient(fake, requests_per_minute=0, tokens_per_minute=0)
+    logs: list[str] = []
+
+    run = backfill(
+        repo,
+        client,
+        iter_candidates(repo, page_size=2),
+        adapters=source_adapters(),
+        workers=3,
+        batch_size=2,
+        log=logs.append,
+    )
+
+    assert (run.candidates, run.updated) == (4, 3)
+    assert run.failed == ["https://example.com/essay-3"]
+    assert fake.calls == 9
+    assert sum("so far" in line for line in logs) == 2
+    fp_row = repo.get_article_by_url("https://example.com/essay-0")
+    fa_row = repo.get_article_by_url("https://example.com/essay-1")
+    assert FAILED not in (fp_row["core_thesis"], fp_row["supporting_data_quotes"])
+    assert fp_row["prompt_version"] == summarize_fp.PROMPT_VERSION
+    assert fa_row["prompt_version"] == summarize_fa_hardened.PROMPT_VERSION
+    assert fp_row["summary_status"] == "ok" and fp_row["prompt_tokens"] > 0
+    assert fp_row["article_text"] == "Essay 0 argues for restraint in the Pacific."
+    assert repo.get_article_by_url("https://example.com/fine")["core_thesis"] == "Core"
+    # Only the article with no summarizers is still waiting.
+    assert [row["url"] for row in iter_candidates(repo)] == ["https://example.com/essay-3"]
+    repo.close()
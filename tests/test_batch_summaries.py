@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+import pytest
+
+import summarize_fa_hardened
+import summarize_fp
+from benchmarks.fake_genai import FakeGenAIClient
+from services.article_repository import ArticleRepository
+from services.batch_summaries import BatchJobError, BatchSummarizer
+
+PROMPTS = {
+    adapter.source: adapter.prompts for adapter in (summarize_fp.fp_adapter(), summarize_fa_hardened.fa_adapter())
+}
+
+
+def _seed(repo: ArticleRepository, count: int) -> list[dict]:
+    for index in range(count):
+        repo.insert_article(
+            source="Foreign Policy" if index % 2 else "Foreign Affairs",
+            url=f"https://example.com/essay-{index}",
+            title=f"Essay {index}",
+            author="Author",
+            article_text=f"Essay {index} argues for restraint.\n\nSign up for our newsletter",
+            core_thesis="Summary generation failed.",
+            detailed_abstract="Summary generation failed.",
+            supporting_data_quotes="Summary generation failed.",
+        )
+    return [dict(repo.get_article_by_url(f"https://example.com/essay-{index}")) for index in range(count)]
+
+
+def _summarizer(client, **kwargs) -> BatchSummarizer:
+    sleeps: list[float] = []
+    kwargs.setdefault("poll_interval_s", 5)
+    summarizer = BatchSummarizer(
+        client, lambda article: PROMPTS.get(article["source"]), sleep=sleeps.append, log=lambda _: None, **kwargs
+    )
+    summarizer.sleeps = sleeps
+    return summarizer
+
+
+def test_batch_mode_sends_every_prompt_in_one_job_and_bulk_writes_the_results(tmp_path):
+    repo = ArticleRepository(sqlite_path=str(tmp_path / "articles.db"))
+    articles = _seed(repo, 4)
+    client = FakeGenAIClient(batch_polls=3)
+    summarizer = _summarizer(client)
+
+    run = summarizer.run(articles + [{**articles[0], "source": "Unknown"}], repo)
+
+    assert run.jobs == ["batches/fake-1"] and run.requested == 4 and run.updated == 4 and run.failed == []
+    job = client.batches.jobs["batches/fake-1"]
+    assert len(job.src) == 12
+    assert job.src[0]["metadata"] == {"url": "https://example.com/essay-0", "field": "core_thesis"}
+    prompt = job.src[0]["contents"][0]["parts"][0]["text"]
+    assert prompt == summarize_fa_hardened.build_core_thesis_prompt(
+        {"title": "Essay 0", "author": "Author", "text": "Essay 0 argues for restraint."}
+    )
+    assert summarizer.sleeps == [5, 5]
+    stored = repo.get_article_by_url("https://example.com/essay-1")
+    assert stored["core_thesis"] != "Summary generation failed."
+    assert stored["supporting_quotes"]
+    assert stored["prompt_tokens"] > 0 and stored["output_tokens"] > 0
+    repo.close()
+
+
+def test_articles_with_a_failed_request_keep_their_old_summaries(tmp_path):
+    repo = ArticleRepository(sqlite_path=str(tmp_path / "articles.db"))
+    articles = _seed(repo, 3)
+    client = FakeGenAIClient(
+        batch_polls=1, batch_error=lambda prompt: "RESOURCE_EXHAUSTED" if "Essay 2" in prompt else None
+    )
+    # A tiny payload limit puts each article in its own job.
+    run = _summarizer(client, max_job_bytes=1).run(articles, repo)
+
+    assert len(run.jobs) == 3
+    assert run.updated == 2
+    assert run.failed == ["https://example.com/essay-2"]
+    assert repo.get_article_by_url("https://example.com/essay-2")["core_thesis"] == "Summary generation failed."
+    repo.close()
+
+
+def test_wait_raises_when_a_job_fails_or_times_out():
+    client = FakeGenAIClient(batch_polls=10)
+    summarizer = _summarizer(client, timeout_s=0)
+    name = client.batches.create(model="m", src=[]).name
+
+    with pytest.raises(BatchJobError, match="still JOB_STATE_RUNNING"):
+        summarizer.wait(name)
+    client.batches.jobs[name].state = "JOB_STATE_FAILED"
+    with pytest.raises(BatchJobError, match="ended in JOB_STATE_FAILED"):
+        summarizer.wait(name)
@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+import asyncio
+
+from benchmarks.bench_ingestion import run_benchmarks as run_ingestion_benchmarks
+from benchmarks.bench_parsing import compare_to_baseline, run_benchmarks
+from benchmarks.fake_genai import FakeGenAIClient
+from benchmarks.load_test import drive, percentile, seed_database, server_environment
+from benchmarks.stub_server import FixtureServer
+from services.article_repository import ArticleRepository
+
+
+def test_parsing_benchmark_runs_offline_against_fixtures():
+    results = run_benchmarks(iterations=1)
+
+    assert set(results) == {
+        "fp.listing",
+        "fp.article_body",
+        "fa.listing",
+        "fa.article",
+        "publication_date.fp",
+        "publication_date.fa",
+    }
+    assert all(result["min_s"] > 0 and result["peak_kib"] > 0 for result in results.values())
+
+
+def test_compare_to_baseline_flags_growth_beyond_tolerance_and_noise():
+    baseline = {
+        "slow": {"min_s": 0.010, "peak_kib": 100.0},
+        "noisy": {"min_s": 0.0002, "peak_kib": 10.0},
+        "fat": {"min_s": 0.010, "peak_kib": 100.0},
+    }
+    results = {
+        "slow": {"min_s": 0.020, "peak_kib": 100.0},
+        "noisy": {"min_s": 0.0006, "peak_kib": 10.0},
+        "fat": {"min_s": 0.010, "peak_kib": 200.0},
+        "new": {"min_s": 1.0, "peak_kib": 1.0},
+    }
+
+    regressions = compare_to_baseline(results, baseline, tolerance=0.3)
+
+    assert [message.split(":")[0] for message in regressions] == ["slow", "fat"]
+    assert "min_s" in regressions[0] and "peak_kib" in regressions[1]
+
+
+def test_seed_database_writes_synthetic_articles_and_feed_snapshot(tmp_path):
+    db_path = tmp_path / "load.db"
+
+    inserted = seed_database(db_path, 5, chunk_size=2)
+
+    repo = ArticleRepository(sqlite_path=str(db_path))
+    latest = repo.get_latest_articles(limit=10)
+    repo.close()
+    assert inserted == 5
+    assert len(latest) == 5
+    assert latest[0]["date_added"] > latest[-1]["date_added"]
+    assert all(len(item["article_text"]) > 5_000 and item["supporting_quotes"] for item in latest)
+    assert db_path.with_suffix(".feed.json").is_file()
+    env = server_environment(db_path, "feed-snapshot", str(tmp_path))
+    assert env["ARTICLES_DB_PATH"] == str(db_path)
+    assert env["FEED_SNAPSHOT_PATH"] == str(db_path.with_suffix(".feed.json"))
+    assert "DATABASE_URL" not in env
+
+
+def test_drive_reports_throughput_latency_and_errors():
+    with FixtureServer({"/ok": b"[]"}) as server:
+        ok = asyncio.run(drive(server.base_url, "/ok", requests=20, concurrency=4))
+        missing = asyncio.run(drive(server.base_url, "/missing", requests=5, concurrency=2))
+
+    assert ok["requests"] == 20 and ok["errors"] == 0
+    assert ok["rps"] > 0 and 0 < ok["p50_ms"] <= ok["p99_ms"] <= ok["max_ms"]
+    assert missing["errors"] == 5
+    assert percentile([3.0, 1.0, 2.0, 4.0], 0.5) == 2.0
+    assert percentile([3.0, 1.0, 2.0, 4.0], 0.99) == 4.0
+
+
+def test_ingestion_benchmark_runs_both_summarizers_and_the_pipeline_offline():
+    results = run_ingestion_benchmarks(2)
+
+    assert [result["flow"] for result in results] == ["fp", "fa", "pipeline"]
+    for result, sources in zip(results, (1, 1, 2)):
+        assert result["exit_code"] == 0
+        # Distinct page text per URL, so near-duplicate detection keeps every article.
+        assert result["stored"] == 2 * sources
+        assert result["llm_calls"] == 6 * sources
+        assert result["bytes_fetched"] > 0 and result["http_requests"] >= 3 * sources
+        assert result["db_round_trips"] >= 4 * sources
+        assert result["stages"]["fetch"]["count"] >= 3 * sources
+
+
+def test_fake_genai_client_is_deterministic_and_counts_tokens():
+    client = FakeGenAIClient(latency_s=0.0)
+
+    first = client.models.generate_content(model="m", contents="Task: List key quotes.\nTitle: A\nText: body")
+    again = client.models.generate_content(model="m", contents="Task: List key quotes.\nTitle: A\nText: body")
+
+    assert first.text == again.text and first.text.startswith("* ")
+    assert client.calls == 2
+    assert client.output_tokens == 2 * first.usage_metadata.candidates_token_count
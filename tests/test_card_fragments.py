@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+from models.article import Article
+from services.card_fragments import CardFragmentCache, card_cache_key
+
+
+def _article(**overrides) -> dict:
+    article = {
+        "id": 1,
+        "source": "Foreign Policy",
+        "url": "https://fp.com/card",
+        "title": "Card title",
+        "author": "Author",
+        "article_text": "Body",
+        "core_thesis": "Core",
+        "detailed_abstract": "Abstract",
+        "supporting_data_quotes": "* First quote * *Second quote",
+        "publication_date": "2024-03-05",
+        "date_added": "2024-03-06 00:00:00",
+    }
+    article.update(overrides)
+    return article
+
+
+def test_repeat_render_is_served_from_cache():
+    cache = CardFragmentCache(max_entries=8)
+
+    first = cache.render(_article())
+    second = cache.render(_article(article_text="Different body"))
+
+    assert second is first
+    assert (cache.hits, cache.misses) == (1, 1)
+    assert 'class="card-title-container fp-title"' in first
+    assert first.count("<h2 class=\"card-title\">Card title</h2>") == 2
+    assert "<li>First quote</li>" in first and "<li>Second quote</li>" in first
+    assert "March 5" in first
+    assert "read on foreignpolicy.com" in first
+
+
+def test_content_change_invalidates_fragment_and_lru_evicts():
+    cache = CardFragmentCache(max_entries=2)
+
+    original = cache.render(_article())
+    edited = cache.render(_article(title="Edited title"))
+    cache.render(_article(id=2))
+
+    assert card_cache_key(_article())[1] != card_cache_key(_article(title="Edited title"))[1]
+    assert "Edited title" in edited and "Edited title" not in original
+    assert len(cache) == 2
+    assert card_cache_key(_article()) not in cache._fragments
+
+
+def test_article_models_and_dicts_render_identically_and_escape():
+    cache = CardFragmentCache(max_entries=8)
+    payload = _article(title="<script>alert(1)</script>", source="Foreign Affairs")
+
+    from_dict = cache.render(payload)
+    from_model = CardFragmentCache(max_entries=8).render(Article(**payload))
+
+    assert from_dict == from_model
+    assert "<script>" not in from_dict
+    assert "&lt;script&gt;" in from_dict
+    assert "fa-title" in from_dict and "read on foreignaffairs.com" in from_dict
+
+
+def test_article_display_properties_are_not_serialized():
+    article = Article(**_article(publication_date=None))
+
+    assert article.display_date == "March 6"
+    assert article.supporting_quotes == ["First quote", "Second quote"]
+    assert "display_date" not in article.model_dump()
@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.pool import StaticPool
+
+from services.article_repository import ArticleRepository
+from services.database_engine import (
+    DEFAULT_MSSQL_POOL_RECYCLE,
+    PoolSettings,
+    create_article_engine,
+    engine_options,
+    resolve_pool_settings,
+    sqlite_read_only_url,
+)
+
+
+def test_resolve_pool_settings_reads_environment(monkeypatch):
+    monkeypatch.setenv("DB_POOL_SIZE", "8")
+    monkeypatch.setenv("DB_MAX_OVERFLOW", "4")
+    monkeypatch.setenv("DB_POOL_TIMEOUT", "2.5")
+    monkeypatch.setenv("DB_POOL_PRE_PING", "0")
+
+    settings = resolve_pool_settings("mssql+pymssql://user:pw@host:1433/db")
+
+    assert settings == PoolSettings(
+        pool_size=8,
+        max_overflow=4,
+        pool_timeout=2.5,
+        pool_recycle=DEFAULT_MSSQL_POOL_RECYCLE,
+        pre_ping=False,
+    )
+    assert resolve_pool_settings("sqlite:///articles.db").pool_recycle == -1
+
+
+def test_engine_options_share_one_connection_for_memory_sqlite():
+    options = engine_options("sqlite://", PoolSettings())
+
+    assert options["poolclass"] is StaticPool
+    assert options["connect_args"] == {"check_same_thread": False}
+    assert "pool_size" not in options
+
+
+def test_file_sqlite_engine_uses_wal_and_counts_pool_activity(tmp_path):
+    engine, stats = create_article_engine(
+        f"sqlite:///{tmp_path / 'articles.db'}",
+        PoolSettings(pool_size=1, max_overflow=1, pre_ping=False),
+    )
+    try:
+        with engine.connect() as first, engine.connect() as second:
+            journal_mode = first.execute(text("PRAGMA journal_mode")).scalar()
+            second.execute(text("SELECT 1"))
+            during = stats.snapshot()
+        after = stats.snapshot()
+    finally:
+        engine.dispose()
+
+    assert journal_mode == "wal"
+    assert during["checked_out"] == 2
+    assert during["overflow_checkouts"] == 1
+    assert during["saturated_checkouts"] == 1
+    assert after["checkouts"] == 2
+    assert after["checked_out"] == 0
+    assert after["peak_checked_out"] == 2
+    assert after["pool_size"] == 1
+
+
+def test_repository_exposes_pool_stats(tmp_path):
+    repo = ArticleRepository(sqlite_path=str(tmp_path / "articles.db"))
+    try:
+        repo.get_latest_articles(limit=1)
+        stats = repo.get_pool_stats()
+    finally:
+        repo.close()
+
+    assert stats["checkouts"] >= 1
+    assert stats["pool_class"] == "QueuePool"
+
+
+def test_sqlite_profile_pragmas_apply_on_connect(tmp_path, monkeypatch):
+    monkeypatch.setenv("SQLITE_CACHE_SIZE_KB", "2048")
+    engine, _ = create_article_engine(f"sqlite:///{tmp_path / 'articles.db'}", PoolSettings())
+    try:
+        with engine.connect() as conn:
+            synchronous = conn.execute(text("PRAGMA synchronous")).scalar()
+            cache_size = conn.execute(text("PRAGMA cache_size")).scalar()
+            temp_store = conn.execute(text("PRAGMA temp_store")).scalar()
+    finally:
+        engine.dispose()
+
+    assert synchronous == 1  # NORMAL
+    assert cache_size == -2048
+    assert temp_store == 2  # MEMORY
+
+
+def test_read_only_repository_serves_reads_and_rejects_writes(tmp_path):
+    db_path = tmp_path / "articles.db"
+    writer = ArticleRepository(sqlite_path=str(db_path))
+    article = {
+        "source": "Foreign Affairs",
+        "url": "https://fa.com/read-only",
+        "title": "Read only",
+        "author": "Author",
+        "article_text": "Body",
+        "core_thesis": "Core",
+        "detailed_abstract": "Abstract",
+        "supporting_data_quotes": "Quote",
+    }
+    writer.insert_article(**article)
+    writer.close()
+
+    reader = ArticleRepository(sqlite_path=str(db_path), read_only=True)
+    try:
+        titles = [row["title"] for row in reader.get_latest_articles(limit=5)]
+        with pytest.raises(OperationalError):
+            reader.insert_article(**{**article, "url": "https://fa.com/read-only-2"})
+    finally:
+        reader.close()
+
+    assert reader.database_url == sqlite_read_only_url(f"sqlite:///{db_path}")
+    assert "mode=ro" in reader.database_url
+    assert titles == ["Read only"]
@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from services.article_repository import ArticleRepository
+from services.article_service import ArticleService, AsyncArticleService
+from services.feed_exports import run_post_ingestion_exports
+from services.feed_snapshot import SNAPSHOT_FORMAT_VERSION, FeedSnapshot, write_feed_snapshot
+
+
+def _insert(repo: ArticleRepository, index: int) -> None:
+    repo.insert_article(
+        source="Foreign Policy",
+        url=f"https://fp.com/snapshot-{index}",
+        title=f"Snapshot {index}",
+        author="Author",
+        article_text=f"Body {index}",
+        core_thesis="Core",
+        detailed_abstract="Abstract",
+        supporting_data_quotes="Quote",
+        publication_date="2024-01-01",
+        date_added=f"2024-01-0{index} 00:00:00",
+    )
+
+
+@pytest.fixture
+def repo(tmp_path):
+    repository = ArticleRepository(sqlite_path=str(tmp_path / "articles.db"))
+    yield repository
+    repository.close()
+
+
+def test_snapshot_round_trips_feed_and_hot_reloads(repo, tmp_path):
+    snapshot_path = tmp_path / "feed" / "latest.json"
+    _insert(repo, 1)
+    header = write_feed_snapshot(repo, snapshot_path)
+
+    snapshot = FeedSnapshot(snapshot_path, check_interval=0)
+    first = snapshot.get_latest_articles(limit=5)
+    cards = snapshot.get_latest_articles(limit=5, include_text=False)
+
+    _insert(repo, 2)
+    write_feed_snapshot(repo, snapshot_path)
+    second = snapshot.get_latest_articles(limit=5)
+
+    assert header["format_version"] == SNAPSHOT_FORMAT_VERSION
+    assert header["count"] == 1
+    assert [row["title"] for row in first] == ["Snapshot 1"]
+    assert first[0]["article_text"] == "Body 1"
+    assert "article_text" not in cards[0]
+    assert [row["title"] for row in second] == ["Snapshot 2", "Snapshot 1"]
+    assert snapshot.header["content_hash"] != header["content_hash"]
+    assert list(snapshot_path.parent.iterdir()) == [snapshot_path]
+
+
+def test_missing_snapshot_serves_empty_feed(tmp_path):
+    assert FeedSnapshot(tmp_path / "missing.json").get_latest_articles() == []
+
+
+def test_post_ingestion_exports_write_configured_artifacts(repo, tmp_path, monkeypatch):
+    snapshot_path = tmp_path / "latest.json"
+    monkeypatch.setenv("FEED_SNAPSHOT_PATH", str(snapshot_path))
+    monkeypatch.setenv("STATIC_SITE_DIR", str(tmp_path / "site"))
+    _insert(repo, 1)
+
+    results = run_post_ingestion_exports(repo)
+
+    assert results["snapshot"]["count"] == 1
+    assert results["static_site"]["articles"] == 1
+    assert "Snapshot 1" in (tmp_path / "site" / "index.html").read_text()
+    assert json.loads(snapshot_path.read_text())["articles"][0]["url"] == "https://fp.com/snapshot-1"
+
+
+@pytest.mark.asyncio
+async def test_services_serve_from_snapshot_without_a_database(repo, tmp_path, monkeypatch):
+    snapshot_path = tmp_path / "latest.json"
+    _insert(repo, 1)
+    write_feed_snapshot(repo, snapshot_path)
+    missing_db = tmp_path / "never-created.db"
+    monkeypatch.setenv("FEED_SNAPSHOT_PATH", str(snapshot_path))
+    monkeypatch.setenv("FEED_SNAPSHOT_SERVE", "1")
+
+    sync_articles = ArticleService(db_path=str(missing_db)).get_latest_articles(limit=5)
+    async_articles = await AsyncArticleService(db_path=str(missing_db)).get_latest_articles(
+        limit=5,
+        include_text=False,
+    )
+
+    assert [article.title for article in sync_articles] == ["Snapshot 1"]
+    assert [article.title for article in async_articles] == ["Snapshot 1"]
+    assert async_articles[0].article_text == ""
+    assert not missing_db.exists()
@@ -0,0 +1,178 @@
+from __future__ import annotations
+
+import pytest
+from test_article_repository import _use_fake_firestore
+
+from services.article_repository import ArticleRepository
+from services.database_engine import create_article_engine
+from services.ingestion_jobs import (
+    DISCOVERED,
+    FAILED,
+    FETCHED,
+    STORED,
+    SUMMARIZED,
+    FirestoreIngestionJobStore,
+    IngestionJobStore,
+)
+from services.ingestion_pipeline import IngestionPipeline, SourceAdapter
+
+
+def _engine(tmp_path):
+    engine, _ = create_article_engine(f"sqlite:///{tmp_path / 'jobs.db'}")
+    return engine
+
+
+def test_claim_leases_each_job_to_one_worker_until_it_expires(tmp_path):
+    engine = _engine(tmp_path)
+    first = IngestionJobStore(engine, worker_id="first")
+    second = IngestionJobStore(engine, worker_id="second")
+    urls = ["https://fp.com/a", "https://fp.com/b"]
+
+    assert first.enqueue("fp", urls) == 2
+    assert second.enqueue("fp", urls + ["https://fp.com/c"]) == 1
+
+    claimed = first.claim("fp", urls=urls)
+    assert [job.url for job in claimed] == urls
+    assert second.claim("fp", urls=urls) == []
+    # Writes need the lease.
+    assert not second.advance(claimed[0], FETCHED, article={"title": "A"})
+    assert first.advance(claimed[0], FETCHED, article={"title": "A"})
+
+    assert first.release_all() == 2
+    resumed = second.claim("fp", urls=["https://fp.com/b"])
+    # Fetched work is resumed even when the listing no longer shows it, and comes first.
+    assert [(job.url, job.state) for job in resumed] == [
+        ("https://fp.com/a", FETCHED),
+        ("https://fp.com/b", DISCOVERED),
+    ]
+    assert resumed[0].article == {"title": "A"}
+
+    expired = IngestionJobStore(engine, worker_id="expired", lease_seconds=0)
+    [job] = expired.claim("fp", urls=["https://fp.com/c"])
+    assert [stolen.url for stolen in first.claim("fp", urls=["https://fp.com/c"])] == ["https://fp.com/c"]
+    assert not expired.save_summary(job, {"core_thesis": "late"})
+
+
+def test_firestore_jobs_live_next_to_the_articles_and_lease_in_transactions(monkeypatch):
+    fake_client = _use_fake_firestore(monkeypatch)
+    repo = ArticleRepository()
+    first = IngestionJobStore.for_repository(repo, worker_id="first")
+    second = IngestionJobStore.for_repository(repo, worker_id="second")
+    assert isinstance(first, FirestoreIngestionJobStore)
+    assert repo.firestore_handle.collection_name == "articles"
+    urls = ["https://fp.com/a", "https://fp.com/b"]
+
+    assert first.enqueue("fp", urls) == 2
+    assert second.enqueue("fp", urls) == 0
+    claimed = first.claim("fp", urls=urls)
+    assert [job.url for job in claimed] == urls
+    # Each lease was re-read inside the transaction that took it.
+    assert [transaction.reads for transaction in fake_client.transactions] == [[job.id] for job in claimed]
+    assert second.claim("fp", urls=urls) == []
+    assert not second.advance(claimed[0], FETCHED, article={"title": "A"})
+    assert first.advance(claimed[0], FETCHED, article={"title": "A"})
+
+    assert first.release_all() == 2
+    resumed = second.claim("fp", urls=[])
+    assert [(job.url, job.state, job.article) for job in resumed] == [("https://fp.com/a", FETCHED, {"title": "A"})]
+    second.finish(resumed[0])
+    assert second.counts("fp") == {STORED: 1, DISCOVERED: 1}
+    assert set(fake_client.collection("articles_ingestion_jobs")._storage) == {job.id for job in claimed}
+    repo.close()
+
+
+def test_failed_jobs_are_retried_until_max_attempts(tmp_path):
+    store = IngestionJobStore(_engine(tmp_path), worker_id="worker", max_attempts=2)
+    store.enqueue("fa", ["https://fa.com/flaky"])
+
+    [job] = store.claim("fa", urls=["https://fa.com/flaky"])
+    store.fail(job, "timeout")
+    [job] = store.claim("fa", urls=["https://fa.com/flaky"])
+    assert job.attempts == 1
+    store.fail(job, "timeout")
+
+    assert store.claim("fa", urls=["https://fa.com/flaky"]) == []
+    assert store.counts("fa") == {FAILED: 1}
+
+
+@pytest.mark.parametrize("crash_after", ["core_thesis", "detailed_abstract"])
+def test_pipeline_resumes_a_crashed_run_without_refetching_or_reprompting(tmp_path, crash_after):
+    repo = ArticleRepository(sqlite_path=str(tmp_path / "articles.db"))
+    fetched: list[str] = []
+    prompted: list[str] = []
+    crash = {"armed": True}
+
+    def fetch(url):
+        fetched.append(url)
+        return {"title": url.rsplit("/", 1)[-1], "author": "Author", "text": f"Body of {url}"}
+
+    def summarizer(field):
+        def summarize(client, article):
+            prompted.append(f"{field} {article['url']}")
+            if crash["armed"] and prompted[-1] == f"{crash_after} https://fp.com/b":
+                raise RuntimeError("Gemini unavailable")
+            return f"{field} of {article['title']}"
+
+        return summarize
+
+    adapter = SourceAdapter(
+        name="fp",
+        source="Foreign Policy",
+        discover=lambda count: ["https://fp.com/a", "https://fp.com/b"],
+        fetch=fetch,
+        summarizers=tuple(summarizer(field) for field in ("core_thesis", "detailed_abstract", "quotes")),
+    )
+    jobs = IngestionJobStore(repo.engine, worker_id="cron")
+
+    def run():
+        pipeline = IngestionPipeline(
+            [adapter], repo, client=object(), jobs=jobs, fetch_workers=1, summarize_workers=1, log=lambda _: None
+        )
+        return pipeline.run(2)["fp"]
+
+    first = run()
+    assert first["stored"] == 1 and first["summarize_errors"] == 1
+    assert jobs.counts("fp") == {STORED: 1, FETCHED: 1}
+
+    crash["armed"] = False
+    fetched.clear()
+    prompted.clear()
+    second = run()
+
+    assert second["resumed"] == 1 and second["stored"] == 1 and second["cached"] == 1
+    assert fetched == []
+    # Summaries saved before the crash are reused; only the rest are requested.
+    finished = ["core_thesis"] if crash_after == "detailed_abstract" else []
+    assert prompted == [
+        f"{field} https://fp.com/b" for field in ("core_thesis", "detailed_abstract", "quotes") if field not in finished
+    ]
+    assert jobs.counts("fp") == {STORED: 2}
+    stored = repo.get_article_by_url("https://fp.com/b")
+    assert stored["core_thesis"] == "core_thesis of b"
+    repo.close()
+
+
+def test_summarized_jobs_resume_straight_to_storage(tmp_path):
+    repo = ArticleRepository(sqlite_path=str(tmp_path / "articles.db"))
+    jobs = IngestionJobStore(repo.engine, worker_id="cron")
+    jobs.enqueue("fa", ["https://fa.com/done"])
+    [job] = jobs.claim("fa", urls=["https://fa.com/done"])
+    jobs.advance(job, FETCHED, article={"url": job.url, "title": "Done", "author": "A", "text": "Body"})
+    jobs.advance(
+        job,
+        SUMMARIZED,
+        summary={"core_thesis": "Core", "detailed_abstract": "Abstract", "supporting_data_quotes": "*Quote"},
+    )
+    jobs.release_all()
+
+    def unexpected(*args):
+        raise AssertionError("resumed job repeated finished work")
+
+    adapter = SourceAdapter(
+        name="fa", source="Foreign Affairs", discover=lambda count: [], fetch=unexpected, summarizers=(unexpected,) * 3
+    )
+    counts = IngestionPipeline([adapter], repo, client=object(), jobs=jobs, log=lambda _: None).run(1)["fa"]
+
+    assert counts == {"discovered": 0, "resumed": 1, "stored": 1}
+    assert repo.get_article_by_url("https://fa.com/done")["detailed_abstract"] == "Abstract"
+    repo.close()
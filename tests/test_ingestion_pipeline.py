@@ -0,0 +1,162 @@
+from __future__ import annotations
+
+import time
+
+from services.article_repository import ArticleRepository
+from services.ingestion_pipeline import IngestionPipeline, SourceAdapter
+from services.near_duplicates import MinHashLSHIndex
+
+
+def _body(seed: int) -> str:
+    return " ".join(f"word{seed}-{index} on alliances and deterrence" for index in range(200))
+
+
+def _adapter(name: str, pages: dict[str, dict | None], events: list[str] | None = None, **overrides) -> SourceAdapter:
+    def fetch(url: str) -> dict | None:
+        if events is not None:
+            events.append(f"fetch {url}")
+        page = pages[url]
+        return dict(page) if page else None
+
+    def summarizer(label: str):
+        def summarize(client, article):
+            if events is not None:
+                events.append(f"summarize {article['url']}")
+            time.sleep(0.01)
+            return f"{label} for {article['title']}"
+
+        return summarize
+
+    return SourceAdapter(
+        name=name,
+        source=f"Source {name}",
+        discover=lambda count: list(pages)[:count],
+        fetch=fetch,
+        summarizers=(summarizer("thesis"), summarizer("abstract"), summarizer("*quote")),
+        **overrides,
+    )
+
+
+def _page(title: str, seed: int, **extra) -> dict:
+    return {"title": title, "author": "Author", "text": _body(seed), "publication_date": "2024-01-01", **extra}
+
+
+def test_pipeline_ingests_sources_concurrently_and_skips_known_or_rejected_articles(tmp_path, monkeypatch):
+    repo = ArticleRepository(sqlite_path=str(tmp_path / "pipeline.db"))
+    repo.insert_article(
+        source="Source fp",
+        url="https://fp.com/known",
+        title="Known",
+        author="Author",
+        article_text=_body(99),
+        core_thesis="Core",
+        detailed_abstract="Abstract",
+        supporting_data_quotes="*Quote",
+    )
+    fp = _adapter(
+        "fp",
+        {
+            "https://fp.com/known": _page("Known", 99),
+            "https://fp.com/short": _page("Short", 1, content_warning="possibly_truncated"),
+            "https://fp.com/broken": None,
+            "https://fp.com/one": _page("FP one", 2),
+            "https://fp.com/two": _page("FP two", 3),
+            "https://fp.com/three": _page("FP three", 4),
+        },
+        candidate_count=lambda target: target * 3,
+    )
+    fa = _adapter(
+        "fa",
+        {
+            "https://fa.com/reprint": _page("Reprint", 2),
+            "https://fa.com/one": _page("FA one", 5),
+        },
+    )
+    logged: list[str] = []
+    rehashed: list[str] = []
+    # The persist stage should store the signature the dedupe check computed.
+    monkeypatch.setattr("services.article_repository.minhash_signature", rehashed.append)
+
+    pipeline = IngestionPipeline(
+        [fp, fa],
+        repo,
+        client=object(),
+        near_duplicate_index=MinHashLSHIndex(threshold=0.8),
+        fetch_workers=1,
+        summarize_workers=2,
+        queue_size=1,
+        log=logged.append,
+    )
+    results = pipeline.run({"fp": 2, "fa": 2})
+    stored = {row["url"]: row for row in repo.get_latest_articles(limit=20)}
+    repo.close()
+
+    assert rehashed == []
+    assert results["fp"]["cached"] == 1
+    assert results["fp"]["truncated"] == 1
+    assert results["fp"]["fetch_failures"] == 1
+    assert results["fp"]["stored"] == 2
+    # "FP one" and the FA reprint share a body; whichever is fetched second is dropped.
+    assert results["fp"].get("near_duplicates", 0) + results["fa"].get("near_duplicates", 0) == 1
+    assert ("https://fp.com/one" in stored) != ("https://fa.com/reprint" in stored)
+    assert len(stored) == 1 + results["fp"]["stored"] + results["fa"]["stored"]
+    assert stored["https://fp.com/two"]["core_thesis"] == "thesis for FP two"
+    assert stored["https://fp.com/two"]["supporting_quotes"] == ["quote for FP two"]
+    assert stored["https://fa.com/one"]["source"] == "Source fa"
+
+
+def test_pipeline_overlaps_fetching_with_summarizing():
+    events: list[str] = []
+    pages = {f"https://fp.com/{index}": _page(f"Article {index}", index) for index in range(3)}
+    adapter = _adapter("fp", pages, events)
+
+    class Repo:
+        def get_article_by_url(self, url):
+            return None
+
+        def insert_article(self, **kwargs):
+            return True
+
+    results = IngestionPipeline([adapter], Repo(), client=None, fetch_workers=1, summarize_workers=1).run(3)
+
+    assert results["fp"]["stored"] == 3
+    # The second page was fetched before the first article's last LLM call started.
+    last_summary_call = max(index for index, event in enumerate(events) if event == "summarize https://fp.com/0")
+    assert events.index("fetch https://fp.com/1") < last_summary_call
+
+
+def test_a_failed_summary_gives_its_slot_to_the_next_candidate():
+    pages = {f"https://fp.com/{index}": _page(f"Article {index}", index) for index in range(5)}
+    adapter = _adapter("fp", pages, candidate_count=lambda target: target * 3)
+    failing = adapter.summarizers[0]
+
+    def flaky(client, article):
+        if article["url"] == "https://fp.com/0":
+            raise RuntimeError("Gemini 500")
+        return failing(client, article)
+
+    stored: list[str] = []
+
+    class Repo:
+        def get_article_by_url(self, url):
+            return None
+
+        def insert_article(self, **kwargs):
+            # The second article is a duplicate by the time it is written.
+            stored.append(kwargs["url"])
+            return kwargs["url"] != "https://fp.com/1"
+
+    pipeline = IngestionPipeline(
+        [SourceAdapter(**{**adapter.__dict__, "summarizers": (flaky, *adapter.summarizers[1:])})],
+        Repo(),
+        client=None,
+        fetch_workers=4,
+        summarize_workers=2,
+        log=lambda _: None,
+    )
+    results = pipeline.run(2)
+
+    assert results["fp"]["summarize_errors"] == 1
+    assert results["fp"]["stored"] == 2
+    assert "https://fp.com/0" not in stored
+    assert len(stored) == 3 and "https://fp.com/1" in stored
@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+import json
+import logging
+
+import pytest
+
+from services import instrumentation
+from services.article_repository import ArticleRepository
+from services.instrumentation import format_summary_table, increment, registry, report_run, timed
+
+
+@pytest.fixture(autouse=True)
+def clean_registry():
+    registry.reset()
+    yield
+    registry.reset()
+
+
+def test_timed_works_as_context_manager_and_decorator():
+    @timed("stage.decorated")
+    def work(value: int) -> int:
+        return value * 2
+
+    @timed("stage.failing")
+    def fail() -> None:
+        raise RuntimeError("boom")
+
+    with timed("stage.block"):
+        pass
+    assert work(3) == 6
+    assert work(4) == 8
+    with pytest.raises(RuntimeError):
+        fail()
+    increment("stage.items", 2)
+
+    snapshot = registry.snapshot()
+
+    assert snapshot["stages"]["stage.decorated"]["count"] == 2
+    assert snapshot["stages"]["stage.decorated"]["histogram"]["+Inf"] == 2
+    assert snapshot["stages"]["stage.block"]["errors"] == 0
+    assert snapshot["stages"]["stage.failing"]["errors"] == 1
+    assert snapshot["counters"] == {"stage.items": 2}
+    assert work.__name__ == "work"
+
+
+def test_histogram_buckets_are_cumulative():
+    registry.observe("stage", 0.002)
+    registry.observe("stage", 0.3)
+    registry.observe("stage", 120.0)
+
+    histogram = registry.snapshot()["stages"]["stage"]["histogram"]
+
+    assert histogram["0.001"] == 0
+    assert histogram["0.005"] == 1
+    assert histogram["0.5"] == 2
+    assert histogram["60"] == 2
+    assert histogram["+Inf"] == 3
+
+
+def test_disabled_instrumentation_records_nothing(monkeypatch):
+    monkeypatch.setenv("INSTRUMENTATION", "0")
+
+    with timed("stage"):
+        increment("counter")
+
+    assert registry.snapshot() == {"stages": {}, "counters": {}}
+
+
+def test_repository_methods_are_timed(tmp_path):
+    repo = ArticleRepository(sqlite_path=str(tmp_path / "repo.db"))
+    try:
+        repo.get_latest_articles(limit=5)
+        repo.get_article_by_url("https://fp.com/missing")
+    finally:
+        repo.close()
+
+    stages = registry.snapshot()["stages"]
+
+    assert stages["db.get_latest_articles"]["count"] == 1
+    assert stages["db.get_article_by_url"]["count"] == 1
+    assert stages["db.close"]["count"] == 1
+
+
+def test_report_run_logs_json_summary_and_prints_table(capsys, caplog):
+    caplog.set_level(logging.INFO, logger=instrumentation.logger.name)
+
+    with report_run("unit"):
+        with timed("fetch.http"):
+            pass
+
+    summary = json.loads(caplog.records[-1].getMessage())
+    table = capsys.readouterr().out
+
+    assert summary["event"] == "run_summary"
+    assert summary["run"] == "unit"
+    assert summary["stages"]["fetch.http"]["count"] == 1
+    assert "Timing summary: unit" in table
+    assert "fetch.http" in format_summary_table(summary)
@@ -1,4 +1,3 @@
-import os
 import sqlite3
 
 import pytest
@@ -6,17 +5,17 @@ from httpx import ASGITransport, AsyncClient
 
 from main import app, get_article_service
 from models.sources import ArticleSource
-from services.article_service import ArticleService
+from services.article_service import AsyncArticleService
 
-TEST_DB = "integration_test_articles.db"
+@pytest.fixture
+def test_db(tmp_path):
+    # A per-test file keeps SQLite's WAL side files out of the working tree.
+    return str(tmp_path / "integration_test_articles.db")
 
 
 @pytest.fixture
-def integration_service():
-    if os.path.exists(TEST_DB):
-        os.remove(TEST_DB)
-
-    conn = sqlite3.connect(TEST_DB)
+def integration_service(test_db):
+    conn = sqlite3.connect(test_db)
     conn.execute(
         """
         CREATE TABLE articles (
@@ -36,12 +35,12 @@ def integration_service():
     conn.commit()
     conn.close()
 
-    return ArticleService(db_path=TEST_DB)
+    return AsyncArticleService(db_path=test_db)
 
 
 @pytest.mark.asyncio
-async def test_full_flow_scraper_to_api(integration_service):
-    conn = sqlite3.connect(TEST_DB)
+async def test_full_flow_scraper_to_api(integration_service, test_db):
+    conn = sqlite3.connect(test_db)
     conn.execute(
         """
         INSERT INTO articles (
@@ -84,5 +83,3 @@ async def test_full_flow_scraper_to_api(integration_service):
     assert data[0]["source"] == ArticleSource.FOREIGN_AFFAIRS.value
 
     app.dependency_overrides.clear()
-    if os.path.exists(TEST_DB):
-        os.remove(TEST_DB)
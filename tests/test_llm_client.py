@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+import pytest
+
+from services.instrumentation import registry
+from services.llm_client import CircuitBreaker, LLMUnavailableError, ResilientLLMClient, TokenBucket
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps: list[float] = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+class StatusError(Exception):
+    def __init__(self, code: int):
+        super().__init__(f"{code} error")
+        self.code = code
+
+
+class ScriptedGenAI:
+    """generate_content raises or answers according to ``script``, one entry per call."""
+
+    def __init__(self, script):
+        self.script = list(script)
+        self.calls = 0
+        self.models = self
+
+    def generate_content(self, *, model, contents, config=None):
+        self.calls += 1
+        outcome = self.script.pop(0) if self.script else "ok"
+        if isinstance(outcome, Exception):
+            raise outcome
+        usage = SimpleNamespace(prompt_token_count=len(contents) // 4, candidates_token_count=50)
+        return SimpleNamespace(text=f"summary of {contents}", usage_metadata=usage)
+
+
+@pytest.fixture(autouse=True)
+def clean_registry():
+    registry.reset()
+    yield
+    registry.reset()
+
+
+def _client(script, clock, **kwargs):
+    kwargs.setdefault("requests_per_minute", 0)
+    kwargs.setdefault("tokens_per_minute", 0)
+    kwargs.setdefault("breaker", CircuitBreaker(3, 30, clock=clock, sleep=clock.sleep))
+    return ResilientLLMClient(ScriptedGenAI(script), clock=clock, sleep=clock.sleep, **kwargs)
+
+
+def test_token_buckets_hold_requests_and_tokens_to_the_per_minute_quota():
+    clock = FakeClock()
+    bucket = TokenBucket(60, clock=clock, sleep=clock.sleep)
+
+    assert [bucket.acquire() for _ in range(60)] == [0.0] * 60
+    assert bucket.acquire() == pytest.approx(1.0)
+    bucket.debit(30)
+    assert bucket.acquire() == pytest.approx(31.0)
+
+    client = _client([], clock, tokens_per_minute=1200)
+    client.models.generate_content(model="m", contents="x" * 4000)  # ~1000 tokens + 50 output
+    started = clock.now
+    client.models.generate_content(model="m", contents="x" * 4000)
+    # 1050 used of 1200, so the next 1000 wait for 850 more at 20 tokens/s.
+    assert clock.now - started == pytest.approx(42.5)
+    assert registry.snapshot()["counters"]["llm.prompt_tokens"] == 2000
+
+
+def test_retryable_errors_back_off_and_other_errors_raise_at_once():
+    clock = FakeClock()
+    client = _client([StatusError(429), StatusError(503), "ok"], clock, backoff_base_s=2)
+
+    response = client.models.generate_content(model="m", contents="prompt")
+
+    assert response.text == "summary of prompt"
+    assert client.client.calls == 3
+    assert len(clock.sleeps) == 2
+    assert 0 <= clock.sleeps[0] <= 2 and 0 <= clock.sleeps[1] <= 4
+
+    with pytest.raises(StatusError):
+        _client([StatusError(400)], clock).models.generate_content(model="m", contents="prompt")
+
+    failing = _client([StatusError(500)] * 3, clock, max_retries=2)
+    with pytest.raises(LLMUnavailableError):
+        failing.models.generate_content(model="m", contents="prompt")
+    counters = registry.snapshot()["counters"]
+    assert counters["llm.retries"] == 4
+    assert counters["llm.failures"] == 2
+
+
+def test_circuit_breaker_pauses_callers_during_an_outage_then_probes():
+    clock = FakeClock()
+    breaker = CircuitBreaker(3, 30, clock=clock, sleep=clock.sleep)
+    client = _client([ConnectionError("reset")] * 4, clock, breaker=breaker, max_retries=5, backoff_base_s=0)
+
+    response = client.models.generate_content(model="m", contents="prompt")
+
+    # Failures 1-3 open the circuit; the caller waits 30 s, probes, fails (reopens),
+    # waits again, and the second probe succeeds and closes it.
+    assert response.text == "summary of prompt"
+    assert client.client.calls == 5
+    assert clock.sleeps.count(30) == 2
+    assert not breaker.is_open
+    counters = registry.snapshot()["counters"]
+    assert counters["llm.circuit_opened"] == 2
+    assert counters["llm.circuit_closed"] == 1
+
+
+def test_a_rate_limit_slows_every_caller_until_the_rate_recovers():
+    clock = FakeClock()
+    client = _client([StatusError(429)], clock, requests_per_minute=60, backoff_base_s=0)
+    client.requests.recovery_seconds = 120
+
+    client.models.generate_content(model="m", contents="refused once")
+    started = clock.now
+    client.models.generate_content(model="m", contents="another worker")
+
+    # Without the 429 the bucket still held 58 requests; now it is empty and refills at
+    # about half of one request a second.
+    assert clock.now - started == pytest.approx(1.94, abs=0.01)
+    assert client.requests.rate < client.requests.base_rate
+    assert registry.snapshot()["counters"]["llm.rate_limited"] == 1
+
+    clock.now += 120
+    client.requests.acquire()
+    assert client.requests.rate == client.requests.base_rate
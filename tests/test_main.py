@@ -1,4 +1,4 @@
-from unittest.mock import MagicMock
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 from httpx import ASGITransport, AsyncClient
@@ -18,6 +18,7 @@ async def test_health_check():
 @pytest.mark.asyncio
 async def test_get_articles_endpoint_ordering():
     mock_service = MagicMock()
+    mock_service.get_latest_articles = AsyncMock()
     mock_articles = [
         Article(
             id=2,
@@ -65,6 +66,7 @@ async def test_get_articles_endpoint_ordering():
 @pytest.mark.asyncio
 async def test_root_html_top_card_uses_first_article():
     mock_service = MagicMock()
+    mock_service.get_latest_articles = AsyncMock()
     mock_articles = [
         Article(
             id=2,
@@ -134,6 +136,7 @@ async def test_docs_accessible():
 )
 async def test_root_html_date_rendering(date_added, expected_display):
     mock_service = MagicMock()
+    mock_service.get_latest_articles = AsyncMock()
     mock_service.get_latest_articles.return_value = [
         Article(
             id=1, source="Foreign Policy", url="https://test.com", title="Title 1", author="Author 1",
@@ -127,3 +127,60 @@ def test_migrate_rows_preserves_date_added(tmp_path):
 
     assert migrated is not None
     assert migrated["date_added"] == "2024-03-04 05:06:07"
+
+
+def test_read_sqlite_rows_reads_split_and_compressed_bodies(tmp_path):
+    source_db = tmp_path / "source.db"
+    source_repo = ArticleRepository(sqlite_path=str(source_db), text_codec="zlib")
+    try:
+        source_repo.insert_article(
+            source="Foreign Policy",
+            url="https://fp.com/split",
+            title="Split",
+            author="Author",
+            article_text="Body kept in article_bodies",
+            core_thesis="Core",
+            detailed_abstract="Abstract",
+            supporting_data_quotes="Quotes",
+        )
+    finally:
+        source_repo.close()
+
+    rows = read_sqlite_rows(str(source_db))
+
+    assert rows[0]["article_text"] == "Body kept in article_bodies"
+    assert "body_text" not in rows[0]
+
+
+def test_migrate_rows_keeps_prompt_version_and_token_usage(tmp_path):
+    source_db = tmp_path / "source.db"
+    target_db = tmp_path / "target.db"
+    source_repo = ArticleRepository(sqlite_path=str(source_db))
+    try:
+        source_repo.insert_article(
+            source="Foreign Policy",
+            url="https://fp.com/tagged",
+            title="Tagged",
+            author="Author",
+            article_text="Body",
+            core_thesis="Core",
+            detailed_abstract="Abstract",
+            supporting_data_quotes="*Quote",
+            prompt_tokens=1200,
+            output_tokens=340,
+            prompt_version="fp-1",
+        )
+    finally:
+        source_repo.close()
+
+    rows = read_sqlite_rows(str(source_db))
+    repo = ArticleRepository(sqlite_path=str(target_db))
+    try:
+        migrate_rows(rows, repo)
+        migrated = repo.get_article_by_url("https://fp.com/tagged")
+        untagged = repo.list_articles_to_resummarize(failed=False, prompt_versions=(None,))
+    finally:
+        repo.close()
+
+    assert (migrated["prompt_version"], migrated["prompt_tokens"], migrated["output_tokens"]) == ("fp-1", 1200, 340)
+    assert untagged == []
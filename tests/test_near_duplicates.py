@@ -0,0 +1,125 @@
+from __future__ import annotations
+
+from services.article_repository import ArticleRepository
+from services.near_duplicates import (
+    MinHashLSHIndex,
+    decode_signature,
+    encode_signature,
+    estimate_similarity,
+    load_near_duplicate_index,
+    minhash_signature,
+)
+
+
+BASE_TEXT = " ".join(
+    f"Sentence {index} discusses alliance politics, deterrence and trade policy in Asia."
+    for index in range(60)
+)
+
+
+def test_minhash_signature_is_deterministic_and_round_trips():
+    signature = minhash_signature(BASE_TEXT)
+
+    assert signature == minhash_signature(BASE_TEXT)
+    assert decode_signature(encode_signature(signature)) == signature
+    assert minhash_signature("") == ()
+    assert encode_signature(()) is None
+
+
+def test_estimate_similarity_separates_near_duplicates_from_unrelated_text():
+    syndicated = BASE_TEXT + " Reprinted with permission from Foreign Policy."
+    unrelated = " ".join(f"Paragraph {index} covers monetary policy and bond markets." for index in range(60))
+
+    assert estimate_similarity(minhash_signature(BASE_TEXT), minhash_signature(syndicated)) > 0.9
+    assert estimate_similarity(minhash_signature(BASE_TEXT), minhash_signature(unrelated)) < 0.2
+
+
+def test_lsh_index_returns_best_match_above_threshold_and_honours_exclude():
+    index = MinHashLSHIndex(threshold=0.8)
+    index.add("https://fp.com/original", minhash_signature(BASE_TEXT))
+
+    match = index.query(minhash_signature(BASE_TEXT + " Updated."))
+    assert match is not None
+    assert match[0] == "https://fp.com/original"
+
+    assert index.query(minhash_signature(BASE_TEXT), exclude="https://fp.com/original") is None
+    assert index.query(minhash_signature("Completely different short text about elections.")) is None
+
+
+def test_load_near_duplicate_index_reads_signatures_stored_on_insert(tmp_path):
+    repo = ArticleRepository(sqlite_path=str(tmp_path / "repo.db"))
+    try:
+        repo.insert_article(
+            source="Foreign Policy",
+            url="https://fp.com/original",
+            title="Original",
+            author="Author",
+            article_text=BASE_TEXT,
+            core_thesis="Core",
+            detailed_abstract="Abstract",
+            supporting_data_quotes="Quote",
+        )
+        index = load_near_duplicate_index(repo, threshold=0.8)
+    finally:
+        repo.close()
+
+    assert len(index) == 1
+    match = index.query(minhash_signature(BASE_TEXT + " Reprint."))
+    assert match is not None
+    assert match[0] == "https://fp.com/original"
+
+
+def test_load_near_duplicate_index_only_reads_the_recent_window(tmp_path):
+    repo = ArticleRepository(sqlite_path=str(tmp_path / "repo.db"))
+    try:
+        for url, date_added in (
+            ("https://fp.com/archived", "2001-01-01 00:00:00"),
+            ("https://fp.com/recent", None),
+        ):
+            repo.insert_article(
+                source="Foreign Policy",
+                url=url,
+                title="Title",
+                author="Author",
+                article_text=f"{BASE_TEXT} {url}",
+                core_thesis="Core",
+                detailed_abstract="Abstract",
+                supporting_data_quotes="Quote",
+                date_added=date_added,
+            )
+        recent = load_near_duplicate_index(repo, threshold=0.8, window_days=30)
+        everything = load_near_duplicate_index(repo, threshold=0.8, window_days=0)
+    finally:
+        repo.close()
+
+    assert len(recent) == 1
+    assert recent.query(minhash_signature(BASE_TEXT))[0] == "https://fp.com/recent"
+    assert len(everything) == 2
+
+
+def test_insert_reuses_a_precomputed_signature_and_skips_hashing_when_disabled(tmp_path, monkeypatch):
+    def unexpected(text):
+        raise AssertionError("the body was hashed again")
+
+    signature = minhash_signature(BASE_TEXT)
+    monkeypatch.setattr("services.article_repository.minhash_signature", unexpected)
+    repo = ArticleRepository(sqlite_path=str(tmp_path / "repo.db"))
+    try:
+        for url, precomputed in (("https://fp.com/checked", signature), ("https://fp.com/unchecked", None)):
+            monkeypatch.setenv("NEAR_DUPLICATE_DETECTION", "1" if precomputed else "0")
+            repo.insert_article(
+                source="Foreign Policy",
+                url=url,
+                title="Title",
+                author="Author",
+                article_text=BASE_TEXT,
+                core_thesis="Core",
+                detailed_abstract="Abstract",
+                supporting_data_quotes="Quote",
+                minhash_signature=precomputed,
+            )
+        stored = {row["url"]: row["minhash_signature"] for row in repo.list_minhash_signatures()}
+    finally:
+        repo.close()
+
+    assert stored == {"https://fp.com/checked": encode_signature(signature)}
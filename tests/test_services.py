@@ -1,4 +1,3 @@
-import os
 import sqlite3
 
 import pytest
@@ -7,15 +6,15 @@ from models.article import Article
 from models.sources import ArticleSource
 from services.article_service import ArticleService
 
-TEST_DB = "test_articles.db"
+@pytest.fixture
+def test_db(tmp_path):
+    # A per-test file keeps SQLite's WAL side files out of the working tree.
+    return str(tmp_path / "test_articles.db")
 
 
 @pytest.fixture
-def article_service():
-    if os.path.exists(TEST_DB):
-        os.remove(TEST_DB)
-
-    conn = sqlite3.connect(TEST_DB)
+def article_service(test_db):
+    conn = sqlite3.connect(test_db)
     conn.execute(
         """
         CREATE TABLE articles (
@@ -78,11 +77,7 @@ def article_service():
     conn.commit()
     conn.close()
 
-    service = ArticleService(db_path=TEST_DB)
-    yield service
-
-    if os.path.exists(TEST_DB):
-        os.remove(TEST_DB)
+    return ArticleService(db_path=test_db)
 
 
 def test_get_latest_articles(article_service):
@@ -95,16 +90,8 @@ def test_get_latest_articles(article_service):
     assert [article.title for article in articles] == ["Title 2", "Title 1"]
 
 
-def test_get_latest_articles_empty_db():
-    if os.path.exists(TEST_DB):
-        os.remove(TEST_DB)
-
-    conn = sqlite3.connect(TEST_DB)
-    conn.execute("CREATE TABLE articles (id int)")
-    conn.close()
-
-    os.remove(TEST_DB)
-    service = ArticleService(db_path=TEST_DB)
+def test_get_latest_articles_empty_db(test_db):
+    service = ArticleService(db_path=test_db)
     articles = service.get_latest_articles()
     assert articles == []
 
@@ -31,6 +31,7 @@ def test_run_smoke_happy_path(monkeypatch):
                     "core_thesis": "Core",
                     "detailed_abstract": "Abstract",
                     "supporting_data_quotes": "Quotes",
+                    "supporting_quotes": ["Quotes"],
                     "publication_date": None,
                     "date_added": "2024-01-01 00:00:00",
                 }
@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+import gzip
+import json
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+
+from services.static_site import export_static_site, resolve_static_file
+
+
+def _article(index: int, source: str) -> dict:
+    return {
+        "id": index,
+        "source": source,
+        "url": f"https://example.com/{index}",
+        "title": f"Static title {index}",
+        "author": "Author",
+        "article_text": "Body",
+        "core_thesis": "Core",
+        "detailed_abstract": "Abstract",
+        "supporting_data_quotes": "*One*Two",
+        "publication_date": "2024-01-02",
+        "date_added": "2024-01-03 00:00:00",
+    }
+
+
+@pytest.fixture
+def site_dir(tmp_path):
+    articles = [
+        _article(index, "Foreign Affairs" if index % 2 else "Foreign Policy") for index in range(5, 0, -1)
+    ]
+    export_static_site(articles, tmp_path / "site", page_size=2)
+    return tmp_path / "site"
+
+
+def test_export_writes_pages_sources_and_compressed_variants(site_dir):
+    index_html = (site_dir / "index.html").read_text()
+
+    assert "Static title 5" in index_html and "Static title 3" not in index_html
+    assert "/static/styles.css" in index_html
+    assert "Static title 3" in (site_dir / "page" / "2" / "index.html").read_text()
+    assert (site_dir / "page" / "3" / "index.html").is_file()
+    assert not (site_dir / "page" / "4").exists()
+    assert "Static title 4" in (site_dir / "source" / "foreign-policy" / "index.html").read_text()
+    assert gzip.decompress((site_dir / "index.html.gz").read_bytes()).decode() == index_html
+    api_articles = json.loads((site_dir / "api" / "articles.json").read_text())
+    assert [article["id"] for article in api_articles] == [5, 4, 3, 2, 1]
+
+
+def test_reexport_removes_stale_pages(site_dir):
+    export_static_site([_article(1, "Foreign Affairs")], site_dir, page_size=2)
+
+    assert not (site_dir / "page" / "2").exists()
+    assert not (site_dir / "page" / "3").exists()
+
+
+def test_resolve_static_file_prefers_precompressed_variants(site_dir):
+    plain = resolve_static_file(site_dir, "/", "")
+    gzipped = resolve_static_file(site_dir, "/page/2/", "gzip, deflate")
+    api = resolve_static_file(site_dir, "/api/articles", "br;q=0, gzip")
+
+    assert plain is not None and plain.path == site_dir / "index.html"
+    assert plain.media_type == "text/html; charset=utf-8"
+    assert gzipped is not None and gzipped.headers["Content-Encoding"] == "gzip"
+    assert api is not None and api.media_type == "application/json"
+    assert api.path.name == "articles.json.gz"
+    assert resolve_static_file(site_dir, "/../secrets", "") is None
+    assert resolve_static_file(site_dir, "/health", "") is None
+
+
+def test_flask_serves_exported_site_without_the_database(site_dir, client, monkeypatch):
+    monkeypatch.setenv("STATIC_SITE_DIR", str(site_dir))
+    monkeypatch.setenv("STATIC_SITE_SERVE", "1")
+
+    def fail(*args, **kwargs):
+        raise AssertionError("static mode must not query the database")
+
+    monkeypatch.setattr("app.get_cached_article_service", fail)
+
+    page = client.get("/", headers={"Accept-Encoding": "gzip"})
+    api = client.get("/api/articles")
+
+    assert page.status_code == 200
+    assert page.headers["Content-Encoding"] == "gzip"
+    assert "Static title 5" in gzip.decompress(page.data).decode()
+    assert api.is_json and api.get_json()[0]["title"] == "Static title 5"
+
+
+@pytest.mark.asyncio
+async def test_fastapi_serves_exported_site(site_dir, monkeypatch):
+    from main import app
+
+    monkeypatch.setenv("STATIC_SITE_DIR", str(site_dir))
+    monkeypatch.setenv("STATIC_SITE_SERVE", "1")
+
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as ac:
+        page = await ac.get("/source/foreign-affairs/")
+        health = await ac.get("/health")
+
+    assert page.status_code == 200
+    assert page.headers["vary"] == "Accept-Encoding"
+    assert "Static title 5" in page.text
+    assert health.json() == {"status": "healthy"}
@@ -201,6 +201,23 @@ class TestSummarizeFP(unittest.TestCase):
         self.assertEqual(scrape_failures, 0)
         self.assertEqual(mock_scrape_article.call_count, 3)
 
+    @patch("summarize_fp.scrape_foreignpolicy_article")
+    def test_collect_eligible_articles_skips_near_duplicates(self, mock_scrape_article):
+        body = " ".join(f"Sentence {index} on alliances and deterrence in Asia." for index in range(80))
+        mock_scrape_article.side_effect = [
+            {"title": "Original", "author": "A", "text": body, "content_warning": None},
+            {"title": "Reprint", "author": "A", "text": body + " Reprinted.", "content_warning": None},
+            {"title": "Other", "author": "B", "text": "C" * 1200, "content_warning": None},
+        ]
+
+        articles, _, _ = summarize_fp.collect_eligible_articles(
+            ["url-1", "url-1?utm_source=x", "url-3"],
+            desired_count=3,
+            near_duplicate_index=summarize_fp.MinHashLSHIndex(threshold=0.8),
+        )
+
+        self.assertEqual([article["url"] for article in articles], ["url-1", "url-3"])
+
     @patch("summarize_fp.resolve_articles_db_path", return_value=":memory:")
     @patch("summarize_fp.init_db")
     @patch("summarize_fp.scrape_foreignpolicy_article")
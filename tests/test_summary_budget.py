@@ -0,0 +1,145 @@
+from __future__ import annotations
+
+import threading
+
+import summarize_fp
+from benchmarks.fake_genai import FakeGenAIClient
+from services.article_repository import ArticleRepository
+from services.ingestion_pipeline import IngestionPipeline, SourceAdapter
+from services.llm_client import ResilientLLMClient, track_usage
+from services.summary_budget import SummaryBudget, split_chunks, strip_boilerplate
+
+
+def _essay(paragraphs: int) -> str:
+    return "\n\n".join(
+        " ".join([f"Paragraph {index} argues that deterrence and alliances shape the region's security."] * 8)
+        for index in range(paragraphs)
+    )
+
+
+class ConcurrencyProbe(FakeGenAIClient):
+    """Fake Gemini that remembers how many calls were in flight at once."""
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.in_flight = 0
+        self.peak = 0
+        self.prompts: list[str] = []
+        self._probe_lock = threading.Lock()
+
+    def _generate(self, model, prompt):
+        with self._probe_lock:
+            self.in_flight += 1
+            self.peak = max(self.peak, self.in_flight)
+            self.prompts.append(prompt)
+        try:
+            return super()._generate(model, prompt)
+        finally:
+            with self._probe_lock:
+                self.in_flight -= 1
+
+
+def _client(fake: FakeGenAIClient) -> ResilientLLMClient:
+    return ResilientLLMClient(fake, requests_per_minute=0, tokens_per_minute=0)
+
+
+def test_strip_boilerplate_drops_page_furniture_and_repeats_but_keeps_real_paragraphs():
+    long_paragraph = "Analysts discussed the podcast economy and newsletter subscriptions at length. " * 6
+    text = "\n\n".join(
+        [
+            "The sanctions regime has failed to change Moscow's calculus.",
+            "Sign up for our daily newsletter",
+            "© 2024 Foreign Affairs. All rights reserved.",
+            "The sanctions regime has failed to change Moscow's calculus.",
+            "Jane Doe is a senior fellow at Foreign Affairs.",
+            long_paragraph.strip(),
+            "",
+            "Loading...",
+        ]
+    )
+
+    assert strip_boilerplate(text) == "\n\n".join(
+        ["The sanctions regime has failed to change Moscow's calculus.", long_paragraph.strip()]
+    )
+
+
+def test_strip_boilerplate_keeps_prose_that_mentions_furniture_words():
+    prose = [
+        "Beijing refused to sign up to the accord.",
+        "\u201cWe will not subscribe to that view,\u201d the minister said.",
+        "Her podcast drew critics from both parties.",
+        "Share prices fell.",
+        "Advertisement revenue collapsed after the sanctions.",
+        "The copyright dispute dragged on for years.",
+        "* Europe signed up.\n* Japan read more of the fine print than expected.",
+    ]
+    text = "\n\n".join([*prose, "Advertisement", "Subscribe now", "Related: Why Sanctions Fail"])
+
+    assert strip_boilerplate(text) == "\n\n".join(prose)
+
+
+def test_split_chunks_packs_whole_paragraphs_under_the_limit():
+    text = _essay(10)
+    chunks = split_chunks(text, chunk_tokens=300)
+
+    assert len(chunks) > 1
+    assert all(len(chunk) <= 300 * 4 for chunk in chunks)
+    assert "\n\n".join(chunks) == text
+    assert [len(piece) for piece in split_chunks("x" * 2500, chunk_tokens=250)] == [1000, 1000, 500]
+
+
+def test_short_articles_skip_map_reduce_and_long_ones_fan_out_in_parallel():
+    fake = ConcurrencyProbe(latency_s=0.05)
+    client = _client(fake)
+    budget = SummaryBudget(threshold_tokens=1000, chunk_tokens=400, map_workers=4)
+    short = {"title": "Short", "author": "A", "text": _essay(2) + "\n\nSubscribe now"}
+
+    assert budget.prepare(client, short)["text"] == _essay(2)
+    assert fake.calls == 0
+
+    long_article = {"title": "Long", "author": "A", "text": _essay(20)}
+    with track_usage() as usage:
+        prepared = budget.prepare(client, long_article)
+
+    assert fake.calls == len(split_chunks(long_article["text"], 400)) > 4
+    assert fake.peak == 4
+    assert all("Task: Condense part" in prompt for prompt in fake.prompts)
+    assert prepared["text"].count("\n\n") == fake.calls - 1
+    assert len(prepared["text"]) < len(long_article["text"])
+    assert long_article["text"] == _essay(20)
+    # Chunk calls ran on executor threads but are charged to this article.
+    assert usage.calls == fake.calls and usage.prompt_tokens == fake.prompt_tokens
+
+
+def test_pipeline_prompts_on_the_budgeted_text_and_stores_token_usage(tmp_path):
+    repo = ArticleRepository(sqlite_path=str(tmp_path / "articles.db"))
+    fake = ConcurrencyProbe()
+    url = "https://foreignpolicy.com/long-read"
+    adapter = SourceAdapter(
+        name="fp",
+        source="Foreign Policy",
+        discover=lambda count: [url],
+        fetch=lambda _: {"title": "Long read", "author": "Author", "text": _essay(20)},
+        summarizers=(
+            summarize_fp.generate_core_thesis,
+            summarize_fp.generate_detailed_abstract,
+            summarize_fp.generate_supporting_data_quotes,
+        ),
+    )
+    pipeline = IngestionPipeline(
+        [adapter],
+        repo,
+        _client(fake),
+        budget=SummaryBudget(threshold_tokens=1000, chunk_tokens=1000),
+        log=lambda _: None,
+    )
+
+    assert pipeline.run(1)["fp"]["stored"] == 1
+
+    summary_prompts = [prompt for prompt in fake.prompts if "Condense part" not in prompt]
+    assert len(summary_prompts) == 3
+    assert all("Paragraph 0 argues" not in prompt for prompt in summary_prompts)
+    stored = repo.get_article_by_url(url)
+    assert stored["article_text"] == _essay(20)
+    assert (stored["prompt_tokens"], stored["output_tokens"]) == (fake.prompt_tokens, fake.output_tokens)
+    repo.close()
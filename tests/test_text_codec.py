@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+import pytest
+from sqlalchemy import select
+
+from services.article_repository import ArticleRepository, article_bodies_table, articles_table
+from services.text_codec import (
+    CODEC_ZLIB,
+    CODEC_ZSTD,
+    LazyDecodedRow,
+    codec_marker,
+    decode_text,
+    encode_text,
+    parse_codec_marker,
+)
+
+
+ARTICLE = {
+    "source": "Foreign Affairs",
+    "url": "https://fa.com/compressed",
+    "title": "Compressed",
+    "author": "Author",
+    "article_text": "The long essay body. " * 200,
+    "core_thesis": "Core thesis",
+    "detailed_abstract": "Detailed abstract",
+    "supporting_data_quotes": "* Quote one * Quote two",
+}
+
+
+@pytest.mark.parametrize("codec", [CODEC_ZLIB, CODEC_ZSTD])
+def test_encode_decode_round_trip(codec):
+    if codec == CODEC_ZSTD:
+        pytest.importorskip("zstandard")
+    encoded = encode_text(ARTICLE["article_text"], codec)
+
+    assert len(encoded) < len(ARTICLE["article_text"])
+    assert decode_text(encoded, codec) == ARTICLE["article_text"]
+
+
+def test_codec_marker_records_compressed_fields():
+    assert codec_marker("none") is None
+    assert parse_codec_marker(codec_marker(CODEC_ZLIB)) == (CODEC_ZLIB, ("article_text",))
+    codec, fields = parse_codec_marker(codec_marker(CODEC_ZLIB, include_summaries=True))
+    assert codec == CODEC_ZLIB
+    assert "core_thesis" in fields
+
+
+def test_lazy_row_decodes_only_accessed_fields():
+    row = LazyDecodedRow(
+        {"title": "T", "article_text": encode_text("body", CODEC_ZLIB)},
+        codec_marker(CODEC_ZLIB),
+    )
+
+    assert row["title"] == "T"
+    assert set(row._loaders) == {"article_text"}
+    assert dict(row) == {"title": "T", "article_text": "body"}
+
+
+def test_repository_stores_compressed_text_and_reads_it_back(tmp_path):
+    repo = ArticleRepository(sqlite_path=str(tmp_path / "repo.db"), text_codec=CODEC_ZLIB)
+    try:
+        repo.insert_article(**ARTICLE)
+        with repo.engine.connect() as conn:
+            stored = conn.execute(
+                select(article_bodies_table.c.article_text, article_bodies_table.c.text_codec)
+            ).mappings().one()
+        row = repo.get_article_by_url(ARTICLE["url"])
+        latest = repo.get_latest_articles(limit=1)
+    finally:
+        repo.close()
+
+    assert stored["text_codec"] == CODEC_ZLIB
+    assert len(stored["article_text"]) < len(ARTICLE["article_text"])
+    assert row is not None
+    assert row["article_text"] == ARTICLE["article_text"]
+    assert "text_codec" not in row
+    assert dict(latest[0])["article_text"] == ARTICLE["article_text"]
+
+
+def test_recompress_articles_rewrites_existing_rows(tmp_path):
+    repo = ArticleRepository(sqlite_path=str(tmp_path / "repo.db"))
+    try:
+        repo.insert_article(**ARTICLE)
+        rewritten = repo.recompress_articles(CODEC_ZLIB, compress_summaries=True, batch_size=1)
+        again = repo.recompress_articles(CODEC_ZLIB, compress_summaries=True)
+        with repo.engine.connect() as conn:
+            stored = conn.execute(
+                select(articles_table.c.core_thesis, articles_table.c.text_codec)
+            ).mappings().one()
+        row = repo.get_article_by_url(ARTICLE["url"])
+    finally:
+        repo.close()
+
+    assert rewritten == 1
+    assert again == 0
+    assert stored["text_codec"] == codec_marker(CODEC_ZLIB, include_summaries=True)
+    assert stored["core_thesis"] != ARTICLE["core_thesis"]
+    assert row["core_thesis"] == ARTICLE["core_thesis"]
+    assert row["article_text"] == ARTICLE["article_text"]